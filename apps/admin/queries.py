@@ -18,12 +18,14 @@ from apps.experiments.models import Experiment, ExperimentSession, Participant
 from apps.teams.metadata import get_team_metadata_fields
 from apps.teams.models import Team
 from apps.trace.models import Trace
+from apps.utils.db_routing import reporting_reads
 
 _ZERO = Decimal(0)
 _COST_FIELD = DecimalField(max_digits=14, decimal_places=8)
 _QUANTITY_FIELD = DecimalField(max_digits=18, decimal_places=4)
 
 
+@reporting_reads("admin_reports")
 def get_message_stats(start: datetime, end: datetime):
     data = (
         ChatMessage.objects.filter(created_at__gte=start, created_at__lt=end)
@@ -33,9 +35,11 @@ def get_message_stats(start: datetime, end: datetime):
         .annotate(count=Count("id"))
         .order_by("date")
     )
-    return data
+    # Evaluated here so the query runs inside the reporting context
+    return list(data)
 
 
+@reporting_reads("admin_reports")
 def get_participant_stats(start: datetime, end: datetime):
     data = (
         Participant.objects.filter(created_at__gte=start, created_at__lt=end)
@@ -45,9 +49,10 @@ def get_participant_stats(start: datetime, end: datetime):
         .annotate(count=Count("id"))
         .order_by("date")
     )
-    return data
+    return list(data)
 
 
+@reporting_reads("admin_reports")
 def usage_to_csv(start: datetime, end: datetime):
     metadata_fields = get_team_metadata_fields()
     headers = ["Team", "Total Tokens"] + [field["label"] for field in metadata_fields]
@@ -102,6 +107,7 @@ def get_cost_usage_by_team(start: datetime, end: datetime):
     )
 
 
+@reporting_reads("admin_reports")
 def build_usage_report(start: datetime, end: datetime) -> dict:
     """Cross-team usage: per-team token + cost totals with per-model detail, all from
     UsageRecord.
@@ -169,6 +175,7 @@ def build_usage_report(start: datetime, end: datetime) -> dict:
     }
 
 
+@reporting_reads("admin_reports")
 def build_tracing_volume_report(start: datetime, end: datetime) -> dict:
     """Per-team tracing volume: how many traces each team recorded, and how many LLM
     turns and tool calls happened inside them.
@@ -221,6 +228,7 @@ def build_tracing_volume_report(start: datetime, end: datetime) -> dict:
     return {"start": start.isoformat(), "end": end.isoformat(), "teams": result}
 
 
+@reporting_reads("admin_reports")
 def get_whatsapp_numbers():
     return _write_data_to_csv(
         ["Team", "Chatbot", "Messaging Provider", "Account", "Number", "Channel Active"], get_whatsapp_number_data()
@@ -270,6 +278,7 @@ def get_whatsapp_number_data():
         )
 
 
+@reporting_reads("admin_reports")
 def get_whatsapp_message_stats(start: datetime, end: datetime):
     rows = (
         ChatMessage.objects.filter(
@@ -330,6 +339,7 @@ def get_whatsapp_message_stats(start: datetime, end: datetime):
     return results
 
 
+@reporting_reads("admin_reports")
 def get_top_teams(start: datetime, end: datetime, limit: int = 10):
     msg_data = (
         ChatMessage.objects.filter(created_at__gte=start, created_at__lt=end)
@@ -363,6 +373,7 @@ def get_top_teams(start: datetime, end: datetime, limit: int = 10):
     ]
 
 
+@reporting_reads("admin_reports")
 def get_team_stats(team: Team) -> dict[str, int]:
     """All-time resource counts for a single team, for the admin team detail page.
 
@@ -394,6 +405,7 @@ def get_team_stats(team: Team) -> dict[str, int]:
     }
 
 
+@reporting_reads("admin_reports")
 def get_platform_breakdown(start: datetime, end: datetime):
     rows = (
         ExperimentSession.objects.filter(created_at__gte=start, created_at__lt=end)
@@ -424,6 +436,7 @@ def get_platform_breakdown(start: datetime, end: datetime):
     return result
 
 
+@reporting_reads("admin_reports")
 def get_team_activity_summary(start: datetime, end: datetime):
     active_team_ids = set(
         ChatMessage.objects.filter(created_at__gte=start, created_at__lt=end)
@@ -443,6 +456,7 @@ def get_team_activity_summary(start: datetime, end: datetime):
     }
 
 
+@reporting_reads("admin_reports")
 def get_period_totals(start: datetime, end: datetime):
     return {
         "messages": (
@@ -463,6 +477,7 @@ def get_period_totals(start: datetime, end: datetime):
     }
 
 
+@reporting_reads("admin_reports")
 def get_top_experiments(start: datetime, end: datetime, limit: int = 10):
     rows = (
         ChatMessage.objects.filter(created_at__gte=start, created_at__lt=end)
@@ -492,6 +507,7 @@ def get_top_experiments(start: datetime, end: datetime, limit: int = 10):
     ]
 
 
+@reporting_reads("admin_reports")
 def top_teams_to_csv(start: datetime, end: datetime):
     metadata_fields = get_team_metadata_fields()
     data = get_top_teams(start, end)
@@ -517,18 +533,21 @@ def get_all_teams_metadata():
         yield (team["name"], team["slug"], *(metadata.get(field["key"], "") for field in metadata_fields))
 
 
+@reporting_reads("admin_reports")
 def team_metadata_to_csv():
     metadata_fields = get_team_metadata_fields()
     headers = ["Team", "Slug"] + [field["label"] for field in metadata_fields]
     return _write_data_to_csv(headers, get_all_teams_metadata())
 
 
+@reporting_reads("admin_reports")
 def top_experiments_to_csv(start: datetime, end: datetime):
     data = get_top_experiments(start, end)
     rows = ((d["team"], d["experiment"], d["msg_count"], d["session_count"]) for d in data)
     return _write_data_to_csv(["Team", "Chatbot", "Messages", "Sessions"], rows)
 
 
+@reporting_reads("admin_reports")
 def whatsapp_message_stats_to_csv(start: datetime, end: datetime):
     stats = get_whatsapp_message_stats(start, end)
     rows = (
@@ -0,0 +1,110 @@
+"""Answering an analysis's queries about a transcript.
+
+All of the queries are answered with one structured output call per session when they fit in the
+model's context, rather than one call per query that each repeat the transcript. The transcript is
+sent first, in a system message of its own, so that when the queries are answered one at a time (they
+don't fit together, or the combined call failed) the calls share a prefix the provider can cache.
+"""
+
+import json
+import logging
+
+import tiktoken
+from langchain_core.messages import HumanMessage, SystemMessage
+from pydantic import BaseModel, Field, create_model
+
+from apps.service_providers.llm_service.default_models import get_model_parameters
+from apps.service_providers.llm_service.retry import with_llm_retry
+
+logger = logging.getLogger("ocs.analysis")
+
+# Tokens set aside for each answer when deciding whether the queries fit in one call
+ANSWER_TOKEN_ALLOWANCE = 500
+
+TRANSCRIPT_PROMPT = """Analyze the following conversation transcript according to the queries you are given.
+
+TRANSCRIPT as CSV:
+{transcript}
+
+Please provide concise, objective responses to the queries based only on the transcript content."""
+
+
+class AnalysisLlm:
+    """The model an analysis's queries are answered with."""
+
+    def __init__(self, llm_service, chat_model, max_token_limit: int):
+        self.llm_service = llm_service
+        self.chat_model = chat_model
+        self.max_token_limit = max_token_limit
+
+    @classmethod
+    def for_analysis(cls, analysis) -> "AnalysisLlm":
+        llm_service = analysis.llm_provider.get_llm_service()
+        model = analysis.llm_provider_model
+        params = get_model_parameters(model.name, temperature=0.1)  # Low temperature for analysis
+        return cls(llm_service, llm_service.get_chat_model(model.name, **params), model.max_token_limit)
+
+    def answer_queries(self, transcript: str, queries: list) -> list[str]:
+        """One answer per query, in order. A query that can't be answered gets an ``ERROR:`` answer."""
+        transcript_message = self.llm_service.mark_cacheable_prefix(
+            SystemMessage(TRANSCRIPT_PROMPT.format(transcript=transcript))
+        )
+        if len(queries) > 1:
+            answers_model = get_answers_model(queries)
+            combined_message = HumanMessage(format_queries(queries))
+            if self._fits([transcript_message, combined_message], answers_model, len(queries)):
+                try:
+                    llm = with_llm_retry(self.chat_model.with_structured_output(answers_model))
+                    answers = llm.invoke([transcript_message, combined_message])
+                    return [getattr(answers, f"answer_{index}") for index in range(1, len(queries) + 1)]
+                except Exception:
+                    logger.exception("Error answering the queries together, answering them one at a time")
+
+        llm = with_llm_retry(self.chat_model)
+        answers = []
+        for query in queries:
+            try:
+                response = llm.invoke([transcript_message, HumanMessage(format_query(query))])
+                answers.append(response.text)
+            except Exception as e:
+                logger.exception(f"Error processing query {query.id}: {e}")
+                answers.append(f"ERROR: {str(e)}")
+        return answers
+
+    def _fits(self, messages: list, answers_model: type[BaseModel], query_count: int) -> bool:
+        text = "".join(message.text for message in messages) + json.dumps(answers_model.model_json_schema())
+        return self._count_tokens(text) + ANSWER_TOKEN_ALLOWANCE * query_count <= self.max_token_limit
+
+    def _count_tokens(self, text: str) -> int:
+        # An estimate: counting with the provider's own tokenizer can take an API call
+        try:
+            encoding = tiktoken.encoding_for_model(self.chat_model_name)
+        except KeyError:
+            encoding = tiktoken.get_encoding("cl100k_base")
+        return len(encoding.encode(text, disallowed_special=()))
+
+    @property
+    def chat_model_name(self) -> str:
+        return getattr(self.chat_model, "model_name", None) or getattr(self.chat_model, "model", "")
+
+
+def format_query(query) -> str:
+    prompt = f"QUERY: {query.prompt}"
+    if query.output_format:
+        prompt += f"\n\nFormat your response as: {query.output_format}"
+    return prompt
+
+
+def format_queries(queries: list) -> str:
+    parts = [f"Answer each of these {len(queries)} queries, answer_N being the response to query N."]
+    for index, query in enumerate(queries, start=1):
+        parts.append(f"{index}. {format_query(query)}")
+    return "\n\n".join(parts)
+
+
+def get_answers_model(queries: list) -> type[BaseModel]:
+    fields = {
+        f"answer_{index}": (str, Field(description=f"The response to query {index}"))
+        for index in range(1, len(queries) + 1)
+    }
+    return create_model("AnalysisAnswers", **fields)
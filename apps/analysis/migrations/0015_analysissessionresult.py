@@ -0,0 +1,29 @@
+# Generated by Django 5.2.16 on 2026-10-18 23:00
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('analysis', '0014_transcriptanalysis_translation_language_and_more'),
+        ('experiments', '0150_backfill_session_activity_counters'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='AnalysisSessionResult',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('answers', models.JSONField(help_text='One answer per query, in query order. Null for an empty transcript', null=True)),
+                ('fingerprint', models.CharField(help_text='Identifies the queries and settings the answers are for', max_length=64)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('analysis', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='session_results', to='analysis.transcriptanalysis')),
+                ('session', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='+', to='experiments.experimentsession')),
+            ],
+            options={
+                'constraints': [models.UniqueConstraint(fields=('analysis', 'session'), name='unique_analysis_session_result')],
+            },
+        ),
+    ]
@@ -105,3 +105,26 @@ class AnalysisQuery(models.Model):
         if self.name:
             return self.name
         return f"{self.prompt[:50]}..."
+
+
+class AnalysisSessionResult(models.Model):
+    """
+    The answers to an analysis's queries for one session, saved as soon as the session is analysed so that
+    an interrupted run resumes where it stopped.
+    """
+
+    analysis = models.ForeignKey(TranscriptAnalysis, on_delete=models.CASCADE, related_name="session_results")
+    session = models.ForeignKey(ExperimentSession, on_delete=models.CASCADE, related_name="+")
+    answers = models.JSONField(
+        null=True, help_text="One answer per query, in query order. Null for an empty transcript"
+    )
+    fingerprint = models.CharField(max_length=64, help_text="Identifies the queries and settings the answers are for")
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=["analysis", "session"], name="unique_analysis_session_result"),
+        ]
+
+    def __str__(self):
+        return f"{self.analysis_id}: {self.session_id}"
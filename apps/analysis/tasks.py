@@ -1,168 +1,246 @@
+"""Transcript analysis runs.
+
+`process_transcript_analysis` starts (or resumes) a run: it splits the sessions that don't have results
+yet into chunks and runs them as `analyze_transcript_chunk` tasks in ``ANALYSIS_CONCURRENCY`` chains, so
+at most that many chunks of an analysis are processed at once. Each session's answers are saved as an
+`AnalysisSessionResult` as soon as it has been analysed, so a run that is interrupted (a recycled
+worker has its chunk redelivered, a failed run can be started again) picks up where it stopped. Once
+every session has a result, `finalize_transcript_analysis` streams the results into the CSV file.
+
+Progress is published under the run's job ID, which the analysis page polls.
+"""
+
 import csv
+import hashlib
 import io
+import json
+import tempfile
 from io import StringIO
 
-from celery import shared_task
+from celery import chain, current_app, shared_task
 from celery.utils.log import get_task_logger
-from celery_progress.backend import ProgressRecorder
-from django.core.files.base import ContentFile
+from celery_progress.backend import PROGRESS_STATE
+from django.core.files import File
+from django.db import transaction
 
-from apps.service_providers.llm_service.default_models import get_model_parameters
-from apps.service_providers.llm_service.retry import with_llm_retry
+from apps.experiments.models import ExperimentSession
 from apps.teams.utils import current_team
 from apps.utils.celery import Queues
 
-from .models import AnalysisStatus, TranscriptAnalysis
+from .llm import AnalysisLlm
+from .models import AnalysisSessionResult, AnalysisStatus, TranscriptAnalysis
 from .translation import get_message_content, translate_messages_with_llm
 
 logger = get_task_logger("ocs.analysis")
 
+ANALYSIS_CONCURRENCY = 4  # chunks of an analysis processed at once
+CHUNK_SIZE = 10  # sessions per chunk task
+_SPOOLED_MAX_BYTES = 10 * 1024 * 1024  # results files larger than this are spooled to disk
 
-@shared_task(bind=True, queue=Queues.BACKGROUND)
-def process_transcript_analysis(self, analysis_id):
-    progress_recorder = ProgressRecorder(self)
 
+@shared_task(bind=True, ignore_result=True, queue=Queues.BACKGROUND)
+def process_transcript_analysis(self, analysis_id):
+    # The result is ignored so that this task finishing doesn't read as the analysis finishing to the
+    # progress poller; the run's progress is published under this task's ID until it completes.
+    job_id = self.request.id or ""
     try:
-        analysis = TranscriptAnalysis.objects.select_related("experiment", "created_by").get(id=analysis_id)
-
-        # Update status to processing
+        analysis = TranscriptAnalysis.objects.get(id=analysis_id)
         analysis.status = AnalysisStatus.PROCESSING
-        analysis.save(update_fields=["status"])
-
-        progress_recorder.set_progress(0, 100, description="Starting analysis...")
-
-        with current_team(analysis.team):
-            # Get the appropriate LLM provider based on the model's type
-            # Use the first available provider of the right type
-            llm_service = analysis.llm_provider.get_llm_service()
+        analysis.error_message = ""
+        analysis.save(update_fields=["status", "error_message"])
+
+        # Answers to queries that have since been edited can't be reused
+        analysis.session_results.exclude(fingerprint=get_analysis_fingerprint(analysis)).delete()
+        pending = list(_pending_sessions(analysis).order_by("id").values_list("id", flat=True))
+        _publish_progress(job_id, *_get_progress(analysis))
+
+        if not pending:
+            finalize_transcript_analysis.delay(analysis_id, job_id)
+            return
+
+        chunks = [pending[i : i + CHUNK_SIZE] for i in range(0, len(pending), CHUNK_SIZE)]
+        for lane in range(min(ANALYSIS_CONCURRENCY, len(chunks))):
+            tasks = [
+                analyze_transcript_chunk.si(analysis_id, chunk, job_id) for chunk in chunks[lane::ANALYSIS_CONCURRENCY]
+            ]
+            chain(*tasks).apply_async()
+    except Exception as e:
+        logger.exception(f"Error processing transcript analysis {analysis_id}: {e}")
+        _fail_analysis(analysis_id, job_id, e)
 
-            # Get model using the selected provider model
-            model_name = analysis.llm_provider_model.name
-            params = get_model_parameters(model_name, temperature=0.1)  # Low temperature for analysis
-            llm = with_llm_retry(llm_service.get_chat_model(model_name, **params))
 
-            translation_language = analysis.translation_language
-            translation_llm_provider = analysis.translation_llm_provider
-            translation_llm_provider_model = analysis.translation_llm_provider_model
+@shared_task(acks_late=True, ignore_result=True, queue=Queues.BACKGROUND)
+def analyze_transcript_chunk(analysis_id, session_ids, job_id=""):
+    """Analyse a chunk of an analysis's sessions, saving the answers for each session as it is done.
 
-            # Prepare results container
-            results = []
-            header_row = ["Session ID", "Participant"]
+    acks_late means a worker killed mid-chunk has the chunk redelivered; the sessions that already have
+    results are skipped. The last chunk to finish hands over to `finalize_transcript_analysis`.
+    """
+    try:
+        analysis = (
+            TranscriptAnalysis.objects.select_related(
+                "team",
+                "llm_provider",
+                "llm_provider_model",
+                "translation_llm_provider",
+                "translation_llm_provider_model",
+            )
+            .filter(id=analysis_id, status=AnalysisStatus.PROCESSING)
+            .first()
+        )
+        if analysis is None:
+            logger.info("Transcript analysis %s is no longer processing; dropping chunk", analysis_id)
+            return
 
-            # Get all the queries first
+        with current_team(analysis.team):
+            fingerprint = get_analysis_fingerprint(analysis)
             queries = list(analysis.queries.all().order_by("order"))
+            llm = _get_analysis_llm(analysis)
+            sessions = (
+                ExperimentSession.objects.filter(id__in=session_ids)
+                .exclude(id__in=analysis.session_results.values("session_id"))
+                .select_related("chat")
+                .order_by("id")
+            )
+            for session in sessions:
+                answers = analyze_session(analysis, session, queries, llm)
+                AnalysisSessionResult.objects.update_or_create(
+                    analysis=analysis, session=session, defaults={"answers": answers, "fingerprint": fingerprint}
+                )
+                _publish_progress(job_id, *_get_progress(analysis))
 
-            # Add query names to header
-            for query in queries:
-                header_row.append(query.name or query.prompt[:50])
-
-            # Add header row to results
-            results.append(header_row)
+        if not _pending_sessions(analysis).exists():
+            finalize_transcript_analysis.delay(analysis_id, job_id)
+    except Exception as e:
+        # Left processing, nothing would ever finish the analysis and `run_analysis` would refuse to resume it
+        logger.exception(f"Error processing transcript analysis {analysis_id}: {e}")
+        _fail_analysis(analysis_id, job_id, e)
 
-            # Process each session
-            sessions = analysis.sessions.all().prefetch_related("chat__messages")
-            total_sessions = sessions.count()
 
-            progress_recorder.set_progress(0, 100, description=f"Processing {total_sessions} sessions...")
+@shared_task(ignore_result=True, queue=Queues.BACKGROUND)
+def finalize_transcript_analysis(analysis_id, job_id=""):
+    """Write the results file of an analysis whose sessions have all been analysed.
 
-            for index, session in enumerate(sessions):
-                progress_value = int((index / total_sessions) * 100)
-                progress_recorder.set_progress(
-                    progress_value, 100, description=f"Processing session {index + 1}/{total_sessions}"
-                )
-                messages_queryset = session.chat.messages.all().order_by("created_at")
-                if translation_language and translation_llm_provider:
-                    progress_recorder.set_progress(
-                        progress_value, 100, description=f"Translating session {index + 1}/{total_sessions}"
-                    )
-                    messages = list(messages_queryset)
-                    messages = translate_messages_with_llm(
-                        messages,
-                        translation_language,
-                        translation_llm_provider,
-                        translation_llm_provider_model,
-                    )
-                else:
-                    messages = messages_queryset.iterator(chunk_size=100)
-                out = StringIO()
-                writer = csv.writer(out)
-                for message in messages:
-                    content = get_message_content(message, translation_language)
-                    writer.writerow([f"{message.created_at:%Y-%m-%d %H:%M}", message.role, content])
-
-                transcript = out.getvalue().strip()
-
-                # Skip empty transcripts
-                if not transcript:
-                    continue
-
-                # Start row with session info
-                session_row = [session.external_id, str(session.participant) if session.participant else "Anonymous"]
-
-                # Process each query
-                for q_index, query in enumerate(queries):
-                    progress_recorder.set_progress(
-                        progress_value,
-                        100,
-                        description=f"Session {index + 1}/{total_sessions}: Query {q_index + 1}/{len(queries)}",
-                    )
-
-                    sanitized_query = query.prompt.replace("{", "{{").replace("}", "}}")
-
-                    prompt = f"""
-                    Analyze the following conversation transcript according to this query:
-
-                    QUERY: {sanitized_query}
-
-                    TRANSCRIPT as CSV:
-                    {transcript}
-
-                    Please provide a concise, objective response to the query based only on the transcript content.
-                    """
-
-                    if query.output_format:
-                        prompt += f"\n\nFormat your response as: {query.output_format}"
-
-                    try:
-                        # Process with LLM
-                        response = llm.invoke(prompt)
-                        answer = response.text
-
-                        # Add to row
-                        session_row.append(answer)
-                    except Exception as e:
-                        logger.exception(f"Error processing query for session {session.id}: {e}")
-                        session_row.append(f"ERROR: {str(e)}")
-
-                # Add completed row to results
-                results.append(session_row)
-
-            # Create CSV file from results
-            progress_recorder.set_progress(100, 100, description="Creating CSV file...")
-
-            csv_buffer = io.StringIO()
-            writer = csv.writer(csv_buffer)
-            for row in results:
-                writer.writerow(row)
-
-            # Save the result file
-            progress_recorder.set_progress(100, 100, description="Saving results...")
-
-            filename = f"{analysis.name}_results.csv"
-            analysis.result_file.save(filename, ContentFile(csv_buffer.getvalue().encode("utf-8")), save=False)
+    More than one chunk can see that it finished last, so the analysis is locked and only completed once.
+    """
+    try:
+        with transaction.atomic():
+            analysis = (
+                TranscriptAnalysis.objects.select_for_update(skip_locked=True)
+                .filter(id=analysis_id, status=AnalysisStatus.PROCESSING)
+                .first()
+            )
+            if analysis is None or _pending_sessions(analysis).exists():
+                return
+
+            with write_results_csv(analysis) as results_file:
+                analysis.result_file.save(f"{analysis.name}_results.csv", File(results_file), save=False)
             analysis.status = AnalysisStatus.COMPLETED
             analysis.job_id = ""
             analysis.save()
-
-            progress_recorder.set_progress(100, 100, description="Analysis complete")
     except Exception as e:
-        logger.exception(f"Error processing transcript analysis {analysis_id}: {e}")
-        try:
-            analysis = TranscriptAnalysis.objects.get(id=analysis_id)
-            analysis.status = AnalysisStatus.FAILED
-            analysis.error_message = str(e)
-            analysis.job_id = ""
-            analysis.save()
-            progress_recorder.set_progress(100, 100, description=f"Analysis failed: {str(e)}")
-        except:  # noqa E722
-            pass
+        logger.exception(f"Error saving the results of transcript analysis {analysis_id}: {e}")
+        _fail_analysis(analysis_id, job_id, e)
+        return
+
+    done, total = _get_progress(analysis)
+    _publish_progress(job_id, done, total, stop=True)
+
+
+def analyze_session(analysis, session, queries, llm: AnalysisLlm) -> list[str] | None:
+    """The answers to each of the queries for the session's transcript, or None if it is empty."""
+    translation_language = analysis.translation_language
+    messages_queryset = session.chat.messages.all().order_by("created_at")
+    if translation_language and analysis.translation_llm_provider:
+        messages = translate_messages_with_llm(
+            list(messages_queryset),
+            translation_language,
+            analysis.translation_llm_provider,
+            analysis.translation_llm_provider_model,
+        )
+    else:
+        messages = messages_queryset.iterator(chunk_size=100)
+    out = StringIO()
+    writer = csv.writer(out)
+    for message in messages:
+        content = get_message_content(message, translation_language)
+        writer.writerow([f"{message.created_at:%Y-%m-%d %H:%M}", message.role, content])
+
+    transcript = out.getvalue().strip()
+    if not transcript:
+        return None
+    return llm.answer_queries(transcript, queries)
+
+
+def write_results_csv(analysis) -> tempfile.SpooledTemporaryFile:
+    """Stream the saved results of the analysis, one row per session, into a temporary CSV file."""
+    queries = list(analysis.queries.all().order_by("order"))
+    tmp = tempfile.SpooledTemporaryFile(max_size=_SPOOLED_MAX_BYTES, mode="wb+")  # noqa: SIM115
+    text_wrapper = io.TextIOWrapper(tmp, encoding="utf-8", newline="")
+    writer = csv.writer(text_wrapper)
+    writer.writerow(["Session ID", "Participant", *(query.name or query.prompt[:50] for query in queries)])
+
+    results = (
+        analysis.session_results.filter(answers__isnull=False)
+        .select_related("session__participant")
+        .order_by("session_id")
+    )
+    for result in results.iterator(chunk_size=500):
+        session = result.session
+        participant = str(session.participant) if session.participant else "Anonymous"
+        writer.writerow([session.external_id, participant, *result.answers])
+
+    text_wrapper.flush()
+    text_wrapper.detach()
+    tmp.seek(0)
+    return tmp
+
+
+def get_analysis_fingerprint(analysis) -> str:
+    """Identifies what the answers of a session depend on: the queries, the model and the translation."""
+    queries = analysis.queries.all().order_by("order").values_list("id", "prompt", "output_format")
+    data = [
+        analysis.llm_provider_model_id,
+        analysis.translation_language,
+        analysis.translation_llm_provider_model_id,
+        [list(query) for query in queries],
+    ]
+    return hashlib.sha256(json.dumps(data).encode()).hexdigest()
+
+
+def _get_analysis_llm(analysis) -> AnalysisLlm:
+    return AnalysisLlm.for_analysis(analysis)
+
+
+def _pending_sessions(analysis):
+    return analysis.sessions.exclude(id__in=analysis.session_results.values("session_id"))
+
+
+def _get_progress(analysis) -> tuple[int, int]:
+    return analysis.session_results.count(), analysis.sessions.count()
+
+
+def _fail_analysis(analysis_id, job_id, error):
+    TranscriptAnalysis.objects.filter(id=analysis_id).update(
+        status=AnalysisStatus.FAILED, error_message=str(error), job_id=""
+    )
+    _publish_progress(job_id, 0, 0, stop=True, description=f"Analysis failed: {str(error)}")
+
+
+def _publish_progress(job_id: str, current: int, total: int, *, stop: bool = False, description: str = ""):
+    """Publish the progress of a run to the Celery result backend under `job_id`, which the analysis page
+    polls. `stop=True` writes a SUCCESS state, so the page stops polling and reloads."""
+    if not job_id:
+        return
+    percent = float(round((current / total) * 100, 2)) if total else 100.0
+    meta = {
+        "pending": False,
+        "current": current,
+        "total": total,
+        "percent": percent,
+        "description": description or f"Analysed {current} of {total} sessions",
+    }
+    try:
+        current_app.backend.store_result(job_id, meta, "SUCCESS" if stop else PROGRESS_STATE)
+    except Exception:
+        logger.exception("Failed to publish transcript analysis progress for %s", job_id)
@@ -0,0 +1,81 @@
+from unittest import mock
+
+import pytest
+from langchain_core.messages import AIMessage, SystemMessage
+from langchain_core.runnables import RunnableLambda
+
+from apps.analysis.llm import AnalysisLlm
+from apps.analysis.models import AnalysisQuery
+from apps.service_providers.llm_service.main import AnthropicLlmService, LlmService
+
+QUERIES = [
+    AnalysisQuery(id=1, prompt="Summarise the conversation"),
+    AnalysisQuery(id=2, prompt="What was the sentiment?", output_format="positive or negative"),
+]
+
+
+class FakeChatModel(RunnableLambda):
+    def __init__(self, combined_error=None):
+        super().__init__(self._respond)
+        self.calls = []
+        self.combined_calls = []
+        self.combined_error = combined_error
+
+    def _respond(self, messages):
+        self.calls.append(messages)
+        return AIMessage(f"answer {len(self.calls)}")
+
+    def with_structured_output(self, schema):
+        def respond(messages):
+            self.combined_calls.append(messages)
+            if self.combined_error:
+                raise self.combined_error
+            return schema(answer_1="summary", answer_2="positive")
+
+        return RunnableLambda(respond)
+
+
+def _llm(chat_model, max_token_limit=8192):
+    return AnalysisLlm(LlmService(), chat_model, max_token_limit)
+
+
+@pytest.fixture(autouse=True)
+def _count_characters():
+    with mock.patch.object(AnalysisLlm, "_count_tokens", lambda self, text: len(text)):
+        yield
+
+
+def test_queries_are_answered_together():
+    chat_model = FakeChatModel()
+
+    assert _llm(chat_model).answer_queries("transcript", QUERIES) == ["summary", "positive"]
+    assert len(chat_model.combined_calls) == 1
+    assert chat_model.calls == []
+
+
+def test_queries_are_answered_one_at_a_time_when_they_dont_fit():
+    chat_model = FakeChatModel()
+
+    assert _llm(chat_model, max_token_limit=1000).answer_queries("transcript", QUERIES) == ["answer 1", "answer 2"]
+    assert chat_model.combined_calls == []
+    # The transcript is the same first message of each call, so that the provider can cache it
+    first, second = chat_model.calls
+    assert first[0] == second[0]
+    assert "positive or negative" in second[1].content
+
+
+def test_queries_are_answered_one_at_a_time_when_the_combined_answer_fails():
+    chat_model = FakeChatModel(combined_error=ValueError("invalid JSON"))
+
+    assert _llm(chat_model).answer_queries("transcript", QUERIES) == ["answer 1", "answer 2"]
+    assert len(chat_model.combined_calls) == 1
+
+
+def test_anthropic_caches_the_transcript():
+    service = AnthropicLlmService(anthropic_api_key="key", anthropic_api_base="https://api.anthropic.com")
+
+    message = service.mark_cacheable_prefix(SystemMessage("transcript"))
+
+    assert message.content == [
+        {"type": "text", "text": "transcript", "cache_control": {"type": "ephemeral", "ttl": "5m"}}
+    ]
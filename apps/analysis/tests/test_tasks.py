@@ -0,0 +1,112 @@
+import csv
+import io
+from unittest import mock
+
+import pytest
+from django.test import override_settings
+
+from apps.analysis.models import AnalysisSessionResult, AnalysisStatus
+from apps.analysis.tasks import get_analysis_fingerprint, process_transcript_analysis
+from apps.chat.models import ChatMessage, ChatMessageType
+from apps.utils.factories.analysis import AnalysisQueryFactory, TranscriptAnalysisFactory
+from apps.utils.factories.experiment import ExperimentSessionFactory
+
+
+class FakeLlm:
+    def __init__(self):
+        self.transcripts = []
+
+    def answer_queries(self, transcript, queries):
+        self.transcripts.append(transcript)
+        return [f"answer {index}" for index, _query in enumerate(queries)]
+
+
+@pytest.fixture()
+def llm():
+    llm = FakeLlm()
+    with (
+        mock.patch("apps.analysis.tasks._get_analysis_llm", return_value=llm),
+        mock.patch("apps.analysis.tasks._publish_progress"),
+        override_settings(CELERY_TASK_ALWAYS_EAGER=True),
+    ):
+        yield llm
+
+
+@pytest.fixture()
+def analysis():
+    analysis = TranscriptAnalysisFactory()
+    AnalysisQueryFactory(analysis=analysis, name="Summary", order=0)
+    AnalysisQueryFactory(analysis=analysis, name="Sentiment", order=1)
+    for content in ["Hello", "My order is late", None]:
+        session = ExperimentSessionFactory(team=analysis.team, experiment=analysis.experiment)
+        if content:
+            ChatMessage.objects.create(chat=session.chat, content=content, message_type=ChatMessageType.HUMAN)
+        analysis.sessions.add(session)
+    return analysis
+
+
+def _read_results(analysis):
+    with analysis.result_file.open("r") as file:
+        return list(csv.reader(io.StringIO(file.read())))
+
+
+@pytest.mark.django_db()
+def test_sessions_are_analysed_and_written_to_the_results_file(analysis, llm):
+    process_transcript_analysis.delay(analysis.id)
+
+    analysis.refresh_from_db()
+    assert analysis.status == AnalysisStatus.COMPLETED
+    rows = _read_results(analysis)
+    assert rows[0] == ["Session ID", "Participant", "Summary", "Sentiment"]
+    # The session without messages has no row
+    assert len(rows) == 3
+    assert len(llm.transcripts) == 2
+    assert analysis.session_results.count() == 3
+
+
+@pytest.mark.django_db()
+def test_a_run_resumes_from_the_saved_results(analysis, llm):
+    done = analysis.sessions.order_by("id").first()
+    AnalysisSessionResult.objects.create(
+        analysis=analysis, session=done, answers=["saved", "saved"], fingerprint=get_analysis_fingerprint(analysis)
+    )
+
+    process_transcript_analysis.delay(analysis.id)
+
+    analysis.refresh_from_db()
+    assert analysis.status == AnalysisStatus.COMPLETED
+    assert len(llm.transcripts) == 1
+    assert ["saved", "saved"] in [row[2:] for row in _read_results(analysis)]
+
+
+@pytest.mark.django_db()
+def test_results_for_edited_queries_are_not_reused(analysis, llm):
+    session = analysis.sessions.order_by("id").first()
+    AnalysisSessionResult.objects.create(analysis=analysis, session=session, answers=["stale"], fingerprint="old")
+
+    process_transcript_analysis.delay(analysis.id)
+
+    analysis.refresh_from_db()
+    assert len(llm.transcripts) == 2
+    assert ["stale"] not in [row[2:] for row in _read_results(analysis)]
+
+
+@pytest.mark.django_db()
+def test_the_analysis_fails_when_a_session_cant_be_analysed(analysis, llm):
+    with mock.patch("apps.analysis.tasks.analyze_session", side_effect=ValueError("no provider")):
+        process_transcript_analysis.delay(analysis.id)
+
+    analysis.refresh_from_db()
+    assert analysis.status == AnalysisStatus.FAILED
+    assert analysis.error_message == "no provider"
+    assert not analysis.result_file
+
+
+@pytest.mark.django_db()
+def test_the_analysis_fails_when_the_last_chunk_cant_hand_over(analysis, llm):
+    with mock.patch("apps.analysis.tasks.finalize_transcript_analysis.delay", side_effect=ConnectionError("broker")):
+        process_transcript_analysis.delay(analysis.id)
+
+    analysis.refresh_from_db()
+    assert analysis.status == AnalysisStatus.FAILED
+    assert analysis.error_message == "broker"
@@ -134,6 +134,11 @@ def run_analysis(request, team_slug, pk):
         messages.error(request, "Analysis has already been completed or is in progress.")
         return HttpResponseClientRedirect(analysis.get_absolute_url())
 
+    if analysis.is_complete:
+        # Running a completed analysis again starts over, whereas a failed one resumes from the sessions
+        # it had already analysed
+        analysis.session_results.all().delete()
+
     task = process_transcript_analysis.delay(analysis.id)
     analysis.job_id = task.id
     analysis.save(update_fields=["job_id"])
@@ -5,3 +5,6 @@ class AnnotationsConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "apps.annotations"
     label = "annotations"
+
+    def ready(self):
+        from . import signals  # noqa: F401, PLC0415 - lazy: signal registration belongs in ready()
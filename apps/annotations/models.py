@@ -1,12 +1,16 @@
 import json
 import logging
+import uuid
+from collections.abc import Iterable
 from functools import cached_property
-from typing import ClassVar
+from typing import ClassVar, cast
 
 from django.contrib.contenttypes.fields import GenericForeignKey, GenericRelation
 from django.contrib.contenttypes.models import ContentType
+from django.core.cache import cache
 from django.core.exceptions import FieldDoesNotExist
 from django.db import models, transaction
+from django.db.models import Q
 from django.urls import reverse
 from django.utils.translation import gettext_lazy as _
 from django.utils.translation import pgettext_lazy
@@ -20,6 +24,8 @@ from apps.users.models import CustomUser
 
 logger = logging.getLogger("ocs.annotations")
 
+TAG_ID_CACHE_TIMEOUT = 24 * 60 * 60
+
 
 class TagCategories(models.TextChoices):
     BOT_RESPONSE = "bot_response", _("Bot Response")
@@ -56,6 +62,97 @@ class Tag(TagBase, BaseTeamModel):
         return TagCategories(self.category).label if self.category else "User Defined"
 
 
+def get_tag_ids(
+    team: Team, tags: Iterable[tuple[str, str]], created_by: CustomUser | None = None
+) -> dict[tuple[str, str], int]:
+    """The IDs of the team's tags with the given ``(name, category)``, creating the ones that don't exist.
+
+    Tags with a category are system tags. The IDs are cached per team, so when every tag has been
+    seen before no query is made at all. Tags that aren't cached are looked up with one query; the
+    few that don't exist yet are created one at a time, since `Tag.save` is what gives a tag a slug
+    that is unique across all teams. Saving or deleting any of the team's tags invalidates its
+    cached IDs (see `apps.annotations.signals`).
+    """
+    generation = _get_tag_cache_generation(team.id)
+    cache_keys = {tag: _tag_cache_key(team.id, generation, tag) for tag in dict.fromkeys(tags)}
+    cached = cast(dict[str, int], cache.get_many(list(cache_keys.values())))
+    tag_ids = {tag: cached[cache_key] for tag, cache_key in cache_keys.items() if cache_key in cached}
+
+    missing = [tag for tag in cache_keys if tag not in tag_ids]
+    if not missing:
+        return tag_ids
+
+    query = Q()
+    for name, category in missing:
+        query |= Q(name=name, category=category, is_system_tag=bool(category))
+    found = {
+        (name, category): tag_id
+        for tag_id, name, category in Tag.objects.filter(query, team=team).values_list("id", "name", "category")
+    }
+    for name, category in missing:
+        if (name, category) not in found:
+            tag, _ = Tag.objects.get_or_create(
+                name=name,
+                team=team,
+                is_system_tag=bool(category),
+                category=category,
+                defaults={"created_by": created_by},
+            )
+            found[(name, category)] = tag.id
+
+    new_entries = {cache_keys[tag]: found[tag] for tag in missing}
+    # Cached once committed, so the ID of a tag created in a transaction that rolls back is never served.
+    # A tag created here changes the generation, which only costs its entry a lookup next time.
+    transaction.on_commit(lambda: cache.set_many(new_entries, TAG_ID_CACHE_TIMEOUT))
+    return tag_ids | {tag: found[tag] for tag in missing}
+
+
+def find_tag_ids(team_id: int, names: Iterable[str], category: str | None = None) -> list[int]:
+    """The IDs of the team's existing tags with any of the given names, in any category unless one is given.
+
+    Unlike `get_tag_ids` this never creates tags, and names that match no tag are cached too, so that
+    filters applied over and over by name resolve them without a query. The entries share the team's
+    cache generation with `get_tag_ids`.
+    """
+    generation = _get_tag_cache_generation(team_id)
+    cache_keys = {name: _tag_cache_key(team_id, generation, ("name", name, category)) for name in dict.fromkeys(names)}
+    cached = cast(dict[str, list[int]], cache.get_many(list(cache_keys.values())))
+    tag_ids = {name: cached[cache_key] for name, cache_key in cache_keys.items() if cache_key in cached}
+
+    if missing := [name for name in cache_keys if name not in tag_ids]:
+        found: dict[str, list[int]] = {name: [] for name in missing}
+        tags = Tag.objects.filter(team_id=team_id, name__in=missing)
+        if category is not None:
+            tags = tags.filter(category=category)
+        for tag_id, name in tags.order_by("id").values_list("id", "name"):
+            found[name].append(tag_id)
+        cache.set_many({cache_keys[name]: found[name] for name in missing}, TAG_ID_CACHE_TIMEOUT)
+        tag_ids |= found
+    return [tag_id for name in cache_keys for tag_id in tag_ids[name]]
+
+
+def invalidate_tag_cache(team_id: int):
+    """Stop serving cached tag IDs for the team. Called whenever one of its tags is saved or deleted."""
+    cache.set(_tag_cache_generation_key(team_id), uuid.uuid4().hex, timeout=None)
+
+
+def _get_tag_cache_generation(team_id: int) -> str:
+    # A generation that has been evicted is replaced rather than assumed, so eviction only causes misses
+    key = _tag_cache_generation_key(team_id)
+    if generation := cache.get(key):
+        return generation
+    cache.add(key, uuid.uuid4().hex, timeout=None)
+    return cache.get(key)
+
+
+def _tag_cache_generation_key(team_id: int) -> str:
+    return f"tag-ids-generation:{team_id}"
+
+
+def _tag_cache_key(team_id: int, generation: str, tag: tuple) -> str:
+    return f"tag-id:{team_id}:{generation}:{json.dumps(tag)}"
+
+
 @audit_fields(
     "user",
     "team",
@@ -109,13 +206,29 @@ class TaggedModelMixin(models.Model, AnnotationMixin):
             self.add_tag(tag, team, added_by)
 
     def create_and_add_tag(self, tag: str, team: Team, tag_category: TagCategories, added_by: CustomUser | None = None):
-        tag, _ = Tag.objects.get_or_create(
-            name=tag,
-            team=team,
-            is_system_tag=bool(tag_category),
-            category=tag_category or "",
+        self.create_and_add_tags([(tag, tag_category)], team, added_by=added_by)
+
+    def create_and_add_tags(self, tags: Iterable[tuple[str, str]], team: Team, added_by: CustomUser | None = None):
+        """Add each ``(name, category)`` tag. Tags that don't exist yet are created, attributed to `added_by`.
+
+        The tags already on the object are found with one query and only the others are added. They are
+        saved one at a time rather than bulk created, since `save` is what records their audit events.
+        """
+        tags = [(name, category or "") for name, category in tags]
+        tag_ids = list(dict.fromkeys(get_tag_ids(team, tags, created_by=added_by).values()))
+        if not tag_ids:
+            return
+        content_type = ContentType.objects.get_for_model(type(self))
+        existing = set(
+            CustomTaggedItem.objects.filter(
+                content_type=content_type, object_id=self.pk, tag_id__in=tag_ids
+            ).values_list("tag_id", flat=True)
         )
-        self.add_tag(tag, team=team, added_by=added_by)
+        for tag_id in tag_ids:
+            if tag_id not in existing:
+                CustomTaggedItem.objects.create(
+                    content_type=content_type, object_id=self.pk, tag_id=tag_id, team=team, user=added_by
+                )
 
     def add_tag(self, tag: Tag, team: Team, added_by: CustomUser | None = None):
         self.tags.add(tag, through_defaults={"team": team, "user": added_by})
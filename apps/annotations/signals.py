@@ -0,0 +1,14 @@
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from apps.annotations.models import Tag, invalidate_tag_cache
+
+
+@receiver(post_save, sender=Tag)
+@receiver(post_delete, sender=Tag)
+def invalidate_cached_tag_ids(sender, instance: Tag, **kwargs):
+    team_id = instance.team_id
+    invalidate_tag_cache(team_id)
+    # Again once committed, in case another process cached the team's tags as they were before the change
+    transaction.on_commit(lambda: invalidate_tag_cache(team_id))
@@ -3,8 +3,10 @@ import unicodedata
 
 import pytest
 from django.urls import reverse
+from field_audit import enable_audit
+from field_audit.models import AuditEvent
 
-from apps.annotations.models import CustomTaggedItem, Tag
+from apps.annotations.models import CustomTaggedItem, Tag, TagCategories, get_tag_ids
 from apps.chat.models import Chat
 from apps.evaluations.models import AppliedTag, EvaluatorTagRule
 from apps.utils.factories.evaluations import (
@@ -248,3 +250,49 @@ def test_unicode_normalization_prevents_duplicates(client):
     assert "A tag with this name already exists" in response.content.decode()
 
     assert Tag.objects.filter(name=unicodedata.normalize("NFC", "café"), team=team).count() == 1
+
+
+@pytest.mark.django_db()
+def test_create_and_add_tags(chat, tag):
+    tags = [("testing", ""), ("new-tag", None), ("v1", TagCategories.EXPERIMENT_VERSION), ("testing", "")]
+    chat.create_and_add_tags(tags, chat.team)
+    chat.create_and_add_tags(tags, chat.team)
+
+    assert sorted(chat.tags.values_list("name", "category")) == [
+        ("new-tag", ""),
+        ("testing", ""),
+        ("v1", TagCategories.EXPERIMENT_VERSION),
+    ]
+    assert Tag.objects.get(name="v1").is_system_tag
+
+
+@pytest.mark.django_db()
+def test_create_and_add_tags_is_audited(chat, tag):
+    with enable_audit():
+        chat.create_and_add_tags([("testing", ""), ("new-tag", "")], chat.team)
+
+    item_ids = list(CustomTaggedItem.objects.filter(object_id=chat.id).values_list("id", flat=True))
+    events = AuditEvent.objects.by_model(CustomTaggedItem).filter(object_pk__in=item_ids)
+    assert events.count() == 2
+
+
+@pytest.mark.django_db()
+def test_tag_ids_are_cached(tag, django_assert_num_queries, django_capture_on_commit_callbacks):
+    with django_capture_on_commit_callbacks(execute=True):
+        assert get_tag_ids(tag.team, [("testing", "")]) == {("testing", ""): tag.id}
+
+    with django_assert_num_queries(0):
+        assert get_tag_ids(tag.team, [("testing", "")]) == {("testing", ""): tag.id}
+
+
+@pytest.mark.django_db()
+def test_changing_a_tag_invalidates_the_cached_ids(tag, django_capture_on_commit_callbacks):
+    with django_capture_on_commit_callbacks(execute=True):
+        get_tag_ids(tag.team, [("testing", "")])
+
+    tag.name = "renamed"
+    tag.save()
+
+    new_id = get_tag_ids(tag.team, [("testing", "")])[("testing", "")]
+    assert new_id != tag.id
+    assert Tag.objects.get(id=new_id).name == "testing"
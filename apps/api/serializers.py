@@ -7,11 +7,12 @@ from rest_framework.exceptions import NotFound
 from taggit.serializers import TaggitSerializer, TagListSerializerField
 
 from apps.channels.models import ChannelPlatform, ExperimentChannel
-from apps.chat.models import ChatMessage, ChatMessageMetadataKeys, ChatMessageType
+from apps.chat.models import Chat, ChatMessage, ChatMessageMetadataKeys, ChatMessageType
 from apps.cost_tracking.services.reporting import session_usage
 from apps.experiments.models import Experiment, ExperimentSession, Participant, ParticipantData
 from apps.files.models import File
 from apps.teams.models import Team
+from apps.teams.utils import get_message_search_language
 
 
 class ApiUrlField(serializers.HyperlinkedIdentityField):
@@ -274,7 +275,11 @@ class ExperimentSessionCreateSerializer(serializers.ModelSerializer):
         messages = validated_data.pop("messages", [])
         instance = super().create(validated_data)
         if messages:
-            ChatMessage.objects.bulk_create([ChatMessage(chat=instance.chat, **message) for message in messages])
+            search_language = get_message_search_language(request.team.id)
+            ChatMessage.objects.bulk_create(
+                [ChatMessage(chat=instance.chat, search_language=search_language, **message) for message in messages]
+            )
+            Chat.objects.refresh_message_counters([instance.chat_id])
         return instance
 
 
@@ -33,6 +33,7 @@ from apps.usage_metrics.metrics import (
     bucket_date,
     message_counts_from_row,
 )
+from apps.utils.db_routing import reporting_reads
 
 # Metric identifiers. Later slices extend SUPPORTED_METRICS; the param serializer validates against it.
 METRIC_MESSAGES = "messages"
@@ -233,6 +234,7 @@ _GROUP_SPECS = {
 }
 
 
+@reporting_reads("usage_api")
 def resolve_query_filters(query: UsageQuery) -> UsageQuery:
     """Resolve the participant/chatbot request handles to DB ids **once**, returning a new query that
     carries them. Every metric then filters on the FK-id columns (``participant_id``/``experiment_id``)
@@ -262,6 +264,7 @@ def resolve_query_filters(query: UsageQuery) -> UsageQuery:
     return replace(query, participant_ids=participant_ids, experiment_ids=experiment_ids, filter_is_empty=is_empty)
 
 
+@reporting_reads("usage_api")
 def usage_query(query: UsageQuery) -> UsageResult:
     results = _aggregate(query) if query.granularity == GRANULARITY_TOTAL else _bucketed(query)
     return UsageResult(
@@ -281,6 +284,7 @@ def group_entities(query: UsageQuery) -> QuerySet:
     return _GROUP_SPECS[query.group_by].entities(query)
 
 
+@reporting_reads("usage_api")
 def group_rows(query: UsageQuery, page: list) -> list[dict]:
     """Serialisable breakdown rows for one page of :func:`group_entities`. At ``total`` granularity each
     group yields one row; at a finer granularity each group is expanded to one flat row per time bucket
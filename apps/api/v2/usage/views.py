@@ -15,6 +15,7 @@ from apps.api.v2.usage.serializers import (
 )
 from apps.api.v2.usage.services import GROUP_PLATFORM, UsageQuery, usage_query
 from apps.oauth.permissions import TokenHasOAuthResourceScope
+from apps.utils.db_routing import reporting_reads
 
 
 class PlatformCursorPagination(CursorPagination):
@@ -207,7 +208,8 @@ class UsageView(APIView):
         cap = services.grouped_page_size_cap(query)
         paginator.max_page_size = min(paginator.max_page_size, cap)
         paginator.page_size = min(paginator.page_size, cap)
-        page = paginator.paginate_queryset(services.group_entities(query), request, view=self)
+        with reporting_reads("usage_api"):
+            page = paginator.paginate_queryset(services.group_entities(query), request, view=self)
         rows = services.group_rows(query, page)
         response = paginator.get_paginated_response(GroupedUsageRowSerializer(rows, many=True).data)
         response.data["period"] = UsagePeriodSerializer(
@@ -276,15 +276,7 @@ class ExperimentSessionViewSet(mixins.ListModelMixin, mixins.RetrieveModelMixin,
             # Machine (client-credentials) tokens have no user to attribute the tag to.
             acting_user = request.user if request.user.is_authenticated else None
             # Add tags - create if they don't exist
-            for tag_name in tag_names:
-                tag, _ = Tag.objects.get_or_create(
-                    name=tag_name,
-                    team=request.team,
-                    is_system_tag=False,
-                    category="",
-                    defaults={"created_by": acting_user},
-                )
-                session.chat.add_tag(tag, request.team, added_by=acting_user)
+            session.chat.create_and_add_tags([(name, "") for name in tag_names], request.team, added_by=acting_user)
         elif request.method == "DELETE":
             # Remove tags (only user tags, not system tags)
             tags_to_remove = Tag.objects.filter(name__in=tag_names, team=request.team, is_system_tag=False)
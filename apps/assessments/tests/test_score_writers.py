@@ -406,7 +406,7 @@ def test_write_scores_from_annotation_non_authoritative_still_writes(db):
 @pytest.mark.django_db()
 def test_annotation_save_survives_score_writer_failure(annotation_on_session, caplog, monkeypatch):
     """If write_scores_from_annotation raises, the annotation still saves and the
-    failure is logged. Mirrors the recompute_queue_aggregates resilience pattern."""
+    failure is logged. Mirrors the update_queue_aggregates resilience pattern."""
     caplog.set_level(logging.ERROR, logger="ocs.human_annotations")
 
     team, session, _existing_annotation, reviewer = annotation_on_session
@@ -1,19 +1,220 @@
+"""Voice note transcoding.
+
+Audio is streamed through an ``ffmpeg`` subprocess over stdin/stdout pipes instead of being decoded into
+an in-memory PCM buffer, so a voice note costs roughly its encoded size in worker memory rather than its
+decoded size. Conversion is skipped entirely when the consumer accepts the source format as-is (see
+:func:`prepare_audio_for_transcription`), and the size / duration caps are checked against the encoded
+bytes before anything is decoded.
+"""
+
+import logging
+import struct
+import subprocess
+import tempfile
+from collections.abc import Collection
+from contextlib import ExitStack
 from io import BytesIO
+from pathlib import PurePath
+from typing import IO
+
+from django.conf import settings
+
+from apps.chat.exceptions import UserReportableError
+
+logger = logging.getLogger("ocs.channels.audio")
+
+# Formats whose demuxers need to seek (e.g. the MP4 `moov` atom is usually written at the end of the file),
+# so they can't be read from a pipe and are spooled to a temporary file instead.
+_SEEKABLE_INPUT_FORMATS = {"mp4", "m4a", "mov", "3gp", "3gpp"}
+
+# Aliases for MIME subtypes and codec names that don't match an ffmpeg muxer / file extension.
+_FORMAT_ALIASES = {
+    "mpeg": "mp3",
+    "mpga": "mp3",
+    "x-wav": "wav",
+    "wave": "wav",
+    "vnd.wave": "wav",
+    "opus": "ogg",
+    "x-m4a": "m4a",
+    "aac": "m4a",
+    "3gpp": "3gp",
+}
+
+
+class AudioConversionError(Exception):
+    pass
+
 
-from pydub import AudioSegment
+class AudioLimitExceeded(UserReportableError):
+    """The voice note is larger or longer than we are willing to process"""
 
 
-def convert_audio(audio: BytesIO, target_format: str, source_format="ogg", codec=None) -> BytesIO:
-    audio = AudioSegment.from_file(audio, format=source_format)
-    # Convert to mono
-    audio = audio.set_channels(1)
+def normalize_audio_format(source_format: str) -> str:
+    """Map a MIME subtype (e.g. ``ogg; codecs=opus``, ``mpeg``) to the file extension used by ffmpeg and
+    the transcription providers."""
+    audio_format = source_format.split(";", 1)[0].strip().lower()
+    return _FORMAT_ALIASES.get(audio_format, audio_format)
 
-    convertion_kwargs = {}
-    if codec:
-        convertion_kwargs["codec"] = codec
 
-    new_audio = BytesIO()
-    audio.export(new_audio, format=target_format, **convertion_kwargs)
-    new_audio.seek(0)
+def convert_audio(
+    audio: BytesIO, target_format: str, source_format="ogg", codec=None, max_seconds: int | None = None
+) -> BytesIO:
+    """Convert `audio` to mono `target_format` by piping it through ffmpeg.
+
+    Nothing is decoded in this process: ffmpeg reads the encoded input from stdin and writes the encoded
+    output to stdout, so peak memory is the size of the two encoded buffers. `max_seconds` stops reading
+    the input after that much audio.
+    """
+    source_format = normalize_audio_format(source_format)
+    command = ["ffmpeg", "-hide_banner", "-nostdin", "-loglevel", "error"]
+    if max_seconds:
+        command += ["-t", str(max_seconds)]
+
+    audio.seek(0)
+    with ExitStack() as stack:
+        if source_format in _SEEKABLE_INPUT_FORMATS:
+            spool = stack.enter_context(tempfile.NamedTemporaryFile(suffix=f".{source_format}"))
+            spool.write(audio.read())
+            spool.flush()
+            command += ["-i", spool.name]
+            input_bytes = None
+        else:
+            command += ["-i", "pipe:0"]
+            input_bytes = audio.read()
+
+        command += ["-vn", "-ac", "1"]
+        if codec:
+            command += ["-c:a", codec]
+        command += ["-f", target_format, "pipe:1"]
+
+        try:
+            result = subprocess.run(command, input=input_bytes, capture_output=True, check=False)
+        except FileNotFoundError as e:
+            raise AudioConversionError("ffmpeg is not installed") from e
+
+    if result.returncode != 0:
+        stderr = result.stderr.decode(errors="replace").strip()
+        raise AudioConversionError(f"Unable to convert audio from {source_format} to {target_format}: {stderr}")
+
+    output = result.stdout
+    if target_format == "wav":
+        output = _fix_wav_header(output)
+
+    new_audio = BytesIO(output)
     new_audio.name = f"some_name.{target_format}"
     return new_audio
+
+
+def prepare_audio_for_transcription(
+    audio: IO[bytes], accepted_formats: Collection[str], target_format: str = "wav"
+) -> IO[bytes]:
+    """Return audio that a transcription provider accepting `accepted_formats` can consume.
+
+    The source format is taken from the file name (see :func:`named_audio`); unnamed audio is assumed to
+    be WAV. The size and duration caps are enforced first. If the provider accepts the source format the
+    original bytes are passed through untouched, otherwise they are transcoded to `target_format`.
+    """
+    source_format = normalize_audio_format(PurePath(getattr(audio, "name", "") or "").suffix[1:] or "wav")
+    audio.seek(0)
+    data = audio.read()
+    audio.seek(0)
+    check_audio_limits(data, source_format)
+    if source_format in accepted_formats:
+        return audio
+    # Containers that don't expose their duration up front are bounded by the decode itself.
+    return convert_audio(
+        BytesIO(data),
+        target_format=target_format,
+        source_format=source_format,
+        max_seconds=settings.VOICE_NOTE_MAX_DURATION_SECONDS,
+    )
+
+
+def named_audio(data: bytes, source_format: str) -> BytesIO:
+    """Wrap raw audio bytes in a file object whose name carries the format, which is how both
+    :func:`prepare_audio_for_transcription` and the provider SDKs detect it."""
+    audio = BytesIO(data)
+    audio.name = f"audio.{normalize_audio_format(source_format)}"
+    return audio
+
+
+def check_audio_limits(data: bytes, source_format: str):
+    """Raise `AudioLimitExceeded` if the encoded audio is over the configured size or duration caps.
+
+    The duration is read from the container (Ogg granule positions, WAV header) without decoding. Formats
+    that don't expose it cheaply are only bounded by size here.
+    """
+    if (max_bytes := settings.VOICE_NOTE_MAX_BYTES) and len(data) > max_bytes:
+        raise AudioLimitExceeded(f"Voice note is too large ({len(data) // 1024} KB)")
+
+    if max_seconds := settings.VOICE_NOTE_MAX_DURATION_SECONDS:
+        duration = get_audio_duration(data, source_format)
+        if duration is not None and duration > max_seconds:
+            raise AudioLimitExceeded(f"Voice note is too long ({duration:.0f} seconds)")
+
+
+def get_audio_duration(data: bytes, source_format: str) -> float | None:
+    """Read the duration in seconds from the container metadata, or ``None`` if it isn't available."""
+    try:
+        match normalize_audio_format(source_format):
+            case "ogg":
+                return _ogg_duration(data)
+            case "wav":
+                return _wav_duration(data)
+    except (struct.error, ValueError, ZeroDivisionError):
+        logger.warning("Unable to read %s audio duration from container", source_format)
+    return None
+
+
+def _ogg_duration(data: bytes) -> float | None:
+    """Duration from the granule position of the last Ogg page.
+
+    Opus granules are always counted at 48kHz (less the pre-skip from the `OpusHead` packet), Vorbis
+    granules at the stream's sample rate from its identification header.
+    """
+    if not data.startswith(b"OggS"):
+        return None
+
+    if (head := data.find(b"OpusHead", 0, 512)) != -1:
+        sample_rate = 48000
+        pre_skip = struct.unpack_from("<H", data, head + 10)[0]
+    elif (head := data.find(b"\x01vorbis", 0, 512)) != -1:
+        sample_rate = struct.unpack_from("<I", data, head + 12)[0]
+        pre_skip = 0
+    else:
+        return None
+
+    last_page = data.rfind(b"OggS")
+    granule = struct.unpack_from("<q", data, last_page + 6)[0]
+    if granule < 0:
+        return None
+    return max(granule - pre_skip, 0) / sample_rate
+
+
+def _wav_duration(data: bytes) -> float | None:
+    if data[:4] != b"RIFF" or data[8:12] != b"WAVE":
+        return None
+    byte_rate = None
+    offset = 12
+    while offset + 8 <= len(data):
+        chunk_id = data[offset : offset + 4]
+        chunk_size = struct.unpack_from("<I", data, offset + 4)[0]
+        if chunk_id == b"fmt ":
+            byte_rate = struct.unpack_from("<I", data, offset + 16)[0]
+        elif chunk_id == b"data" and byte_rate:
+            # Streamed WAVs carry a placeholder size; fall back to what's actually there.
+            available = len(data) - offset - 8
+            return min(chunk_size, available) / byte_rate
+        offset += 8 + chunk_size + (chunk_size & 1)
+    return None
+
+
+def _fix_wav_header(data: bytes) -> bytes:
+    """ffmpeg can't seek back to fill in the RIFF and data chunk sizes when writing to a pipe, which some
+    consumers (e.g. the Azure speech SDK) reject. Patch them now that the full output is known."""
+    if data[:4] != b"RIFF" or (data_chunk := data.find(b"data", 12)) == -1:
+        return data
+    patched = bytearray(data)
+    struct.pack_into("<I", patched, 4, len(data) - 8)
+    struct.pack_into("<I", patched, data_chunk + 4, len(data) - data_chunk - 8)
+    return bytes(patched)
@@ -31,6 +31,6 @@ class ChannelCallbacks:
         """Called before LLM invocation (e.g. show 'typing' indicator)."""
 
     def get_message_audio(self, message: BaseMessage) -> BytesIO:
-        """Retrieve audio content from the inbound message. Must be overridden
-        by channels that support voice."""
+        """Retrieve audio content from the inbound message, untranscoded and named with its format
+        (see `apps.channels.audio.named_audio`). Must be overridden by channels that support voice."""
         raise NotImplementedError("Channel must implement audio retrieval")
@@ -0,0 +1,158 @@
+"""Cached resolution of inbound messages to the channel and chatbot version that handle them.
+
+Every webhook delivery and every inbound message task resolves the same thing: the `ExperimentChannel` the
+message was addressed to (often through an unindexed ``extra_data`` lookup) and the chatbot version that
+should answer it. The result rarely changes, so the IDs it resolves to are cached in two tiers: a small
+per-process LRU in front of the shared Django cache. The channel itself, with its team and messaging
+provider, is always loaded from the database by primary key: the provider's config holds credentials, which
+must not end up in the cache, and nothing cached can go stale when the team or provider changes.
+
+Entries are versioned per channel by a random token. Channel and chatbot saves replace the token of every
+affected channel (see `apps.channels.signals`), which orphans the cached entries in both tiers at once. The
+token is checked on every lookup, so a process never serves a resolution from its local tier after another
+process has invalidated it.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import threading
+import uuid
+from collections import OrderedDict
+from dataclasses import dataclass
+
+from django.core.cache import cache
+
+from apps.channels.models import ExperimentChannel
+from apps.chatbots.version_resolver import resolve_published_or_working
+from apps.experiments.models import Experiment
+
+CACHE_KEY_VERSION = 2
+RESOLUTION_CACHE_TTL = 600
+LOCAL_CACHE_SIZE = 256
+
+
+@dataclass(frozen=True)
+class ChannelResolution:
+    channel: ExperimentChannel
+    # The chatbot version that handles messages sent to the channel
+    experiment: Experiment
+
+
+@dataclass(frozen=True)
+class _ResolvedIds:
+    channel_id: int
+    experiment_id: int
+
+
+class _LocalCache:
+    """Per-process LRU of resolved IDs."""
+
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        self._entries: OrderedDict[int, tuple[str, _ResolvedIds]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, channel_id: int, token: str) -> _ResolvedIds | None:
+        with self._lock:
+            entry = self._entries.get(channel_id)
+            if not entry or entry[0] != token:
+                return None
+            self._entries.move_to_end(channel_id)
+        return entry[1]
+
+    def set(self, channel_id: int, token: str, resolved: _ResolvedIds):
+        with self._lock:
+            self._entries[channel_id] = (token, resolved)
+            self._entries.move_to_end(channel_id)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+
+_local_cache = _LocalCache(LOCAL_CACHE_SIZE)
+
+
+def resolve_channel(**lookup) -> ChannelResolution | None:
+    """Return the (non-archived) channel matching the `lookup` filters and the chatbot version that should
+    handle its messages, or None if there is no such channel."""
+    lookup_key = _get_lookup_cache_key(lookup)
+    cached_channel_id = cache.get(lookup_key)
+    token = None
+    if cached_channel_id is not None:
+        # Read the token before the database so that an invalidation racing with this lookup can't leave
+        # a stale resolution behind under the new token.
+        token = _get_token(cached_channel_id)
+        if (resolved := _get_cached_ids(cached_channel_id, token)) and (resolution := _load(resolved)):
+            return resolution
+
+    channel = _channels().filter(**lookup, experiment__is_archived=False).first()
+    if not channel:
+        return None
+
+    resolution = ChannelResolution(channel=channel, experiment=resolve_published_or_working(channel.experiment))
+    to_cache = {lookup_key: channel.id}
+    # The first time through for a lookup only the channel it maps to is remembered. The resolution is
+    # cached on the next lookup, once the channel's token has been read ahead of the query.
+    if token and channel.id == cached_channel_id:
+        resolved = _ResolvedIds(channel_id=channel.id, experiment_id=resolution.experiment.id)
+        to_cache[_get_resolution_cache_key(channel.id, token)] = resolved
+        _local_cache.set(channel.id, token, resolved)
+    cache.set_many(to_cache, RESOLUTION_CACHE_TTL)
+    return resolution
+
+
+def invalidate_channels(channel_ids):
+    """Orphan the cached resolutions of the given channels."""
+    cache.set_many({_get_token_cache_key(channel_id): uuid.uuid4().hex for channel_id in channel_ids}, None)
+
+
+def _get_cached_ids(channel_id: int, token: str) -> _ResolvedIds | None:
+    if resolved := _local_cache.get(channel_id, token):
+        return resolved
+    if resolved := cache.get(_get_resolution_cache_key(channel_id, token)):
+        _local_cache.set(channel_id, token, resolved)
+    return resolved
+
+
+def _load(resolved: _ResolvedIds) -> ChannelResolution | None:
+    """The channel and chatbot version with the cached IDs, or None if the channel is gone."""
+    channel = _channels().filter(id=resolved.channel_id).first()
+    if not channel:
+        return None
+    if resolved.experiment_id == channel.experiment_id:
+        experiment = channel.experiment
+    else:
+        experiment = Experiment.objects.filter(id=resolved.experiment_id).first()
+    if not experiment:
+        return None
+    return ChannelResolution(channel=channel, experiment=experiment)
+
+
+def _channels():
+    return ExperimentChannel.objects.select_related("experiment", "team", "messaging_provider")
+
+
+def _get_token(channel_id: int) -> str:
+    key = _get_token_cache_key(channel_id)
+    if token := cache.get(key):
+        return token
+    cache.add(key, uuid.uuid4().hex, None)
+    return cache.get(key)
+
+
+def _get_lookup_cache_key(lookup: dict) -> str:
+    lookup_hash = hashlib.sha256(json.dumps(lookup, sort_keys=True, default=str).encode()).hexdigest()
+    return f"CHANNEL_RESOLUTION:{CACHE_KEY_VERSION}:lookup:{lookup_hash}"
+
+
+def _get_token_cache_key(channel_id: int) -> str:
+    return f"CHANNEL_RESOLUTION:{CACHE_KEY_VERSION}:token:{channel_id}"
+
+
+def _get_resolution_cache_key(channel_id: int, token: str) -> str:
+    return f"CHANNEL_RESOLUTION:{CACHE_KEY_VERSION}:{channel_id}:{token}"
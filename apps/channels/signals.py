@@ -1,10 +1,14 @@
-from django.db.models.signals import post_save, pre_save
+from django.db import transaction
+from django.db.models import F
+from django.db.models.signals import post_delete, post_save, pre_save
 from django.dispatch import receiver
 from django.utils import timezone
 
+from apps.channels.models import ExperimentChannel
+from apps.channels.resolution import invalidate_channels
 from apps.channels.utils import delete_experiment_session_cached
-from apps.chat.models import ChatMessage, ChatMessageType
-from apps.experiments.models import ExperimentSession
+from apps.chat.models import Chat, ChatMessage, ChatMessageType
+from apps.experiments.models import Experiment, ExperimentSession
 
 
 @receiver(pre_save, sender=ExperimentSession)
@@ -33,3 +37,36 @@ def update_session_last_activity(sender, instance: ChatMessage, created, **kwarg
     except ExperimentSession.DoesNotExist:
         # No experiment session associated with this chat
         pass
+
+
+@receiver(post_save, sender=ChatMessage)
+def update_chat_message_counters(sender, instance: ChatMessage, created, **kwargs):
+    """Keep the denormalized message count on `Chat` current, with an atomic update."""
+    if not created:
+        return
+
+    Chat.objects.filter(id=instance.chat_id).update(message_count=F("message_count") + 1)
+
+
+@receiver(post_save, sender=ExperimentChannel)
+@receiver(post_delete, sender=ExperimentChannel)
+def invalidate_channel_resolution(sender, instance: ExperimentChannel, **kwargs):
+    _invalidate_channel_resolutions([instance.id])
+
+
+@receiver(post_save, sender=Experiment)
+def invalidate_chatbot_channel_resolutions(sender, instance: Experiment, **kwargs):
+    """Editing, publishing or archiving any version of a chatbot can change what its channels resolve to."""
+    family_id = instance.working_version_id or instance.id
+    _invalidate_channel_resolutions(
+        ExperimentChannel.objects.get_unfiltered_queryset().filter(experiment_id=family_id).values_list("id", flat=True)
+    )
+
+
+def _invalidate_channel_resolutions(channel_ids):
+    channel_ids = list(channel_ids)
+    if not channel_ids:
+        return
+    invalidate_channels(channel_ids)
+    # Again once committed, in case another worker re-cached the old state in the meantime
+    transaction.on_commit(lambda: invalidate_channels(channel_ids))
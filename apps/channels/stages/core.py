@@ -33,6 +33,7 @@ from apps.ocs_notifications.notifications import (
     audio_synthesis_failure_notification,
     audio_transcription_failure_notification,
 )
+from apps.service_providers import speech_cache
 from apps.service_providers.llm_service.history_managers import ExperimentHistoryManager
 from apps.service_providers.tracing import TraceInfo
 from apps.service_providers.tracing.base import SpanNotificationConfig
@@ -813,8 +814,7 @@ class ResponseFormattingStage(ProcessingStage):
             bot_voice = ctx.bot.get_synthetic_voice()
             if bot_voice:
                 synthetic_voice = bot_voice
-        speech_service = voice_provider.get_speech_service()
-        return speech_service.synthesize_voice(text, synthetic_voice)
+        return speech_cache.synthesize_voice(voice_provider, synthetic_voice, text)
 
     def _format_reference_section(self, text: str, files: list, ctx: MessageProcessingContext):
         """Processes markdown-style file references. Same logic as current
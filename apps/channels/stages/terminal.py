@@ -285,8 +285,7 @@ class PersistenceStage(ProcessingStage):
     def process(self, ctx: MessageProcessingContext) -> None:
         # 1. Apply human message tags set by earlier stages
         if ctx.human_message and ctx.human_message_tags:
-            for tag_name, tag_category in ctx.human_message_tags:
-                ctx.human_message.create_and_add_tag(tag_name, ctx.experiment.team, tag_category)
+            ctx.human_message.create_and_add_tags(ctx.human_message_tags, ctx.experiment.team)
 
         # 2. Persist early exit response to chat history.
         #    Skip when ctx.bot_response exists -- bot.process_input() already
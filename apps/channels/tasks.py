@@ -24,6 +24,7 @@ from apps.channels.datamodels import EmailMessage as EmailMessageDatamodel
 from apps.channels.evaluation_channel import EvaluationChannel
 from apps.channels.facebook_channel import FacebookMessengerChannel
 from apps.channels.models import ChannelPlatform, CredentialMode, ExperimentChannel
+from apps.channels.resolution import resolve_channel
 from apps.channels.sureadhere_channel import SureAdhereChannel
 from apps.channels.telegram_channel import TelegramChannel
 from apps.channels.whatsapp_channel import WhatsappChannel
@@ -42,8 +43,8 @@ log = get_task_logger("ocs.channels")
 
 @shared_task(bind=True, base=TaskbadgerTask, ignore_result=True, queue=Queues.CHAT)
 def handle_telegram_message(self, message_data: str, channel_external_id: uuid):
-    experiment_channel = get_experiment_channel(ChannelPlatform.TELEGRAM, external_id=channel_external_id)
-    if not experiment_channel:
+    resolution = resolve_channel(platform=ChannelPlatform.TELEGRAM, external_id=channel_external_id)
+    if not resolution:
         log.info(f"No experiment channel found for external_id: {channel_external_id}")
         return
 
@@ -58,7 +59,7 @@ def handle_telegram_message(self, message_data: str, channel_external_id: uuid):
         return
 
     message = TelegramMessage.parse(update)
-    message_handler = TelegramChannel(resolve_published_or_working(experiment_channel.experiment), experiment_channel)
+    message_handler = TelegramChannel(resolution.experiment, resolution.channel)
     update_taskbadger_data(self, message_handler, message)
 
     message_handler.new_user_message(message)
@@ -70,18 +71,16 @@ def handle_twilio_message(self, message_data: dict):
 
     ChannelClass, channel_id_key = get_twilio_channel_class_and_key(message)
 
-    experiment_channel = get_experiment_channel(
-        message.platform,
+    resolution = resolve_channel(
+        platform=message.platform,
         extra_data__contains={channel_id_key: message.to},
         messaging_provider__type=MessagingProviderType.twilio,
     )
-    if not experiment_channel:
+    if not resolution:
         log.info(f"No experiment channel found for {channel_id_key}: {message.to}")
         return
 
-    message_handler = ChannelClass(
-        resolve_published_or_working(experiment_channel.experiment), experiment_channel=experiment_channel
-    )
+    message_handler = ChannelClass(resolution.experiment, experiment_channel=resolution.channel)
     update_taskbadger_data(self, message_handler, message)
 
     message_handler.new_user_message(message)
@@ -113,15 +112,15 @@ def validate_twillio_request(experiment_channel, raw_data, request_uri, signatur
 @shared_task(bind=True, base=TaskbadgerTask, queue=Queues.CHAT)
 def handle_sureadhere_message(self, sureadhere_tenant_id: str, message_data: dict):
     message = SureAdhereMessage.parse(message_data)
-    experiment_channel = get_experiment_channel(
-        ChannelPlatform.SUREADHERE,
+    resolution = resolve_channel(
+        platform=ChannelPlatform.SUREADHERE,
         extra_data__sureadhere_tenant_id=sureadhere_tenant_id,
         messaging_provider__type=MessagingProviderType.sureadhere,
     )
-    if not experiment_channel:
+    if not resolution:
         log.info(f"No experiment channel found for SureAdhere tenant ID: {sureadhere_tenant_id}")
         return
-    channel = SureAdhereChannel(resolve_published_or_working(experiment_channel.experiment), experiment_channel)
+    channel = SureAdhereChannel(resolution.experiment, resolution.channel)
     update_taskbadger_data(self, channel, message)
     channel.new_user_message(message)
 
@@ -129,16 +128,16 @@ def handle_sureadhere_message(self, sureadhere_tenant_id: str, message_data: dic
 @shared_task(bind=True, base=TaskbadgerTask, ignore_result=True, queue=Queues.CHAT)
 def handle_turn_message(self, experiment_id: uuid, message_data: dict):
     message = WhatsAppMessage.parse(message_data)
-    experiment_channel = get_experiment_channel(
-        ChannelPlatform.WHATSAPP,
+    resolution = resolve_channel(
+        platform=ChannelPlatform.WHATSAPP,
         experiment__public_id=experiment_id,
         messaging_provider__type=MessagingProviderType.turnio,
     )
-    if not experiment_channel:
+    if not resolution:
         log.info(f"No experiment channel found for experiment_id: {experiment_id}")
         return
-    set_current_team(experiment_channel.team)
-    channel = WhatsappChannel(resolve_published_or_working(experiment_channel.experiment), experiment_channel)
+    set_current_team(resolution.channel.team)
+    channel = WhatsappChannel(resolution.experiment, resolution.channel)
     update_taskbadger_data(self, channel, message)
     channel.new_user_message(message)
 
@@ -185,8 +184,8 @@ def handle_evaluation_message(
 @shared_task(bind=True, base=TaskbadgerTask, ignore_result=True, queue=Queues.CHAT)
 def handle_commcare_connect_message(self, experiment_id: int, participant_data_id: int, messages: list[Message]):
     participant_data = ParticipantData.objects.prefetch_related("participant").get(id=participant_data_id)
-    experiment_channel = get_experiment_channel(ChannelPlatform.COMMCARE_CONNECT, experiment_id=experiment_id)
-    if not experiment_channel:
+    resolution = resolve_channel(platform=ChannelPlatform.COMMCARE_CONNECT, experiment_id=experiment_id)
+    if not resolution:
         log.info(f"No experiment channel found for experiment_id: {experiment_id}")
         return
 
@@ -199,43 +198,27 @@ def handle_commcare_connect_message(self, experiment_id: int, participant_data_i
     user_message = "\n\n".join(decrypted_messages)
 
     message = BaseMessage(participant_id=participant_data.participant.identifier, message_text=user_message)
-    channel = CommCareConnectChannel(
-        experiment=resolve_published_or_working(experiment_channel.experiment), experiment_channel=experiment_channel
-    )
+    channel = CommCareConnectChannel(experiment=resolution.experiment, experiment_channel=resolution.channel)
 
     update_taskbadger_data(self, channel, message)
     channel.new_user_message(message)
 
 
 def get_experiment_channel(platform, **query_kwargs):
-    query = get_experiment_channel_base_query(platform, **query_kwargs)
-    return query.select_related("experiment", "team", "messaging_provider").first()
-
-
-def get_experiment_channel_base_query(platform, **query_kwargs):
-    return ExperimentChannel.objects.filter(
-        platform=platform,
-        **query_kwargs,
-    ).filter(experiment__is_archived=False)
+    resolution = resolve_channel(platform=platform, **query_kwargs)
+    return resolution.channel if resolution else None
 
 
 @shared_task(bind=True, base=TaskbadgerTask, ignore_result=True, queue=Queues.CHAT)
 def handle_meta_cloud_api_message(self, channel_id: int, team_slug: str, message_data: dict):
     message = WhatsAppMessage.parse(message_data)
-    experiment_channel = (
-        ExperimentChannel.objects.filter(
-            id=channel_id,
-            experiment__is_archived=False,
-        )
-        .select_related("experiment", "team", "messaging_provider")
-        .first()
-    )
-    if not experiment_channel:
+    resolution = resolve_channel(id=channel_id)
+    if not resolution:
         log.info("No experiment channel found for channel_id=%s team=%s", channel_id, team_slug)
         return
 
-    set_current_team(experiment_channel.team)
-    channel = WhatsappChannel(resolve_published_or_working(experiment_channel.experiment), experiment_channel)
+    set_current_team(resolution.channel.team)
+    channel = WhatsappChannel(resolution.experiment, resolution.channel)
     update_taskbadger_data(self, channel, message)
     channel.new_user_message(message)
 
@@ -61,8 +61,7 @@ class TelegramCallbacks(ChannelCallbacks):
         file_url = self.telegram_bot.get_file_url(message.media_id)
         response = httpx.get(file_url, timeout=30.0)
         response.raise_for_status()
-        ogg_audio = BytesIO(response.content)
-        return audio.convert_audio(ogg_audio, target_format="wav", source_format="ogg")
+        return audio.named_audio(response.content, source_format="ogg")
 
 
 class TelegramSender(ChannelSender):
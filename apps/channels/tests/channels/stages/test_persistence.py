@@ -42,6 +42,18 @@ class TestPersistenceStageShould:
             self.stage(ctx)
             mock_objects.create.assert_not_called()
 
+    def test_human_message_tags_are_added_together(self):
+        human_message = MagicMock()
+        tags = [("unsupported_message_type", "error"), ("other", "")]
+        ctx = make_context(
+            early_exit_response=None, voice_audio=None, human_message=human_message, human_message_tags=tags
+        )
+
+        self.stage.process(ctx)
+
+        human_message.create_and_add_tags.assert_called_once_with(tags, ctx.experiment.team)
+        human_message.create_and_add_tag.assert_not_called()
+
 
 @pytest.mark.django_db()
 class TestPersistenceStageDB:
@@ -1,5 +1,7 @@
 from unittest.mock import MagicMock, patch
 
+import pytest
+
 from apps.channels.stages.core import ResponseFormattingStage
 from apps.channels.tests.channels.conftest import make_capabilities, make_context
 from apps.channels.tests.message_examples.base_messages import audio_message, text_message
@@ -8,6 +10,10 @@ from apps.experiments.models import VoiceResponseBehaviours
 
 
 class TestResponseFormattingStage:
+    @pytest.fixture(autouse=True)
+    def _disable_tts_cache(self, settings):
+        settings.TTS_CACHE_ENABLED = False
+
     def setup_method(self):
         self.stage = ResponseFormattingStage()
 
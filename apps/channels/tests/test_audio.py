@@ -0,0 +1,141 @@
+import struct
+from io import BytesIO
+from unittest.mock import patch
+
+import pytest
+from django.test import override_settings
+
+from apps.channels import audio
+
+
+def _ogg_page(granule: int, payload: bytes = b"") -> bytes:
+    # capture pattern, version, header type, granule position, then the rest of the page
+    return b"OggS" + b"\x00\x00" + struct.pack("<q", granule) + b"\x00" * 13 + payload
+
+
+def _opus_ogg(duration_seconds: float, pre_skip: int = 312) -> bytes:
+    opus_head = b"OpusHead" + b"\x01\x01" + struct.pack("<H", pre_skip) + b"\x00" * 7
+    return _ogg_page(0, opus_head) + b"\x00" * 100 + _ogg_page(int(duration_seconds * 48000) + pre_skip)
+
+
+def _wav(duration_seconds: float, byte_rate: int = 32000) -> bytes:
+    data_size = int(duration_seconds * byte_rate)
+    fmt = struct.pack("<HHIIHH", 1, 1, 16000, byte_rate, 2, 16)
+    return (
+        b"RIFF"
+        + struct.pack("<I", 36 + data_size)
+        + b"WAVE"
+        + b"fmt "
+        + struct.pack("<I", len(fmt))
+        + fmt
+        + b"data"
+        + struct.pack("<I", data_size)
+        + b"\x00" * data_size
+    )
+
+
+@pytest.mark.parametrize(
+    ("source_format", "expected"),
+    [("ogg", "ogg"), ("ogg; codecs=opus", "ogg"), ("mpeg", "mp3"), ("x-wav", "wav"), ("OGG", "ogg")],
+)
+def test_normalize_audio_format(source_format, expected):
+    assert audio.normalize_audio_format(source_format) == expected
+
+
+def test_ogg_duration():
+    assert audio.get_audio_duration(_opus_ogg(12.5), "ogg") == pytest.approx(12.5)
+
+
+def test_wav_duration():
+    assert audio.get_audio_duration(_wav(2), "wav") == pytest.approx(2)
+
+
+def test_duration_unknown_for_other_formats():
+    assert audio.get_audio_duration(b"ID3...", "mp3") is None
+
+
+def test_duration_of_corrupt_container_is_unknown():
+    assert audio.get_audio_duration(b"OggS" + b"OpusHead", "ogg") is None
+
+
+@override_settings(VOICE_NOTE_MAX_BYTES=100, VOICE_NOTE_MAX_DURATION_SECONDS=0)
+def test_size_limit():
+    with pytest.raises(audio.AudioLimitExceeded, match="too large"):
+        audio.check_audio_limits(b"\x00" * 101, "ogg")
+
+
+@override_settings(VOICE_NOTE_MAX_BYTES=0, VOICE_NOTE_MAX_DURATION_SECONDS=60)
+def test_duration_limit():
+    audio.check_audio_limits(_opus_ogg(59), "ogg")
+    with pytest.raises(audio.AudioLimitExceeded, match="too long"):
+        audio.check_audio_limits(_opus_ogg(61), "ogg")
+
+
+@override_settings(VOICE_NOTE_MAX_BYTES=0, VOICE_NOTE_MAX_DURATION_SECONDS=60)
+def test_duration_limit_checked_before_conversion():
+    with patch("apps.channels.audio.subprocess.run") as run, pytest.raises(audio.AudioLimitExceeded):
+        audio.prepare_audio_for_transcription(audio.named_audio(_opus_ogg(61), "ogg"), accepted_formats={"wav"})
+    run.assert_not_called()
+
+
+def test_accepted_format_is_passed_through():
+    voice_note = audio.named_audio(_opus_ogg(5), "ogg; codecs=opus")
+    with patch("apps.channels.audio.subprocess.run") as run:
+        result = audio.prepare_audio_for_transcription(voice_note, accepted_formats={"ogg", "mp3"})
+    run.assert_not_called()
+    assert result is voice_note
+
+
+@override_settings(VOICE_NOTE_MAX_DURATION_SECONDS=60)
+def test_unaccepted_format_is_converted():
+    voice_note = audio.named_audio(_opus_ogg(5), "ogg")
+    with patch("apps.channels.audio.subprocess.run") as run:
+        run.return_value.returncode = 0
+        run.return_value.stdout = _wav(1)
+        result = audio.prepare_audio_for_transcription(voice_note, accepted_formats={"wav"})
+
+    command = run.call_args.args[0]
+    assert command[command.index("-t") + 1] == "60"
+    assert command[command.index("-i") + 1] == "pipe:0"
+    assert command[-3:] == ["-f", "wav", "pipe:1"]
+    assert run.call_args.kwargs["input"] == voice_note.getvalue()
+    assert result.name.endswith(".wav")
+
+
+def test_unnamed_audio_is_treated_as_wav():
+    voice_note = BytesIO(_wav(1))
+    with patch("apps.channels.audio.subprocess.run") as run:
+        assert audio.prepare_audio_for_transcription(voice_note, accepted_formats={"wav"}) is voice_note
+    run.assert_not_called()
+
+
+def test_convert_audio_spools_formats_that_need_seeking():
+    with patch("apps.channels.audio.subprocess.run") as run:
+        run.return_value.returncode = 0
+        run.return_value.stdout = b"ogg"
+        audio.convert_audio(BytesIO(b"m4a"), target_format="ogg", source_format="mp4", codec="libopus")
+
+    command = run.call_args.args[0]
+    assert command[command.index("-i") + 1].endswith(".mp4")
+    assert command[command.index("-c:a") + 1] == "libopus"
+    assert "-t" not in command
+    assert run.call_args.kwargs["input"] is None
+
+
+def test_convert_audio_raises_on_ffmpeg_failure():
+    with patch("apps.channels.audio.subprocess.run") as run:
+        run.return_value.returncode = 1
+        run.return_value.stderr = b"Invalid data found when processing input"
+        with pytest.raises(audio.AudioConversionError, match="Invalid data"):
+            audio.convert_audio(BytesIO(b"junk"), target_format="wav")
+
+
+def test_streamed_wav_header_sizes_are_fixed():
+    streamed = bytearray(_wav(1))
+    struct.pack_into("<I", streamed, 4, 0xFFFFFFFF)
+    struct.pack_into("<I", streamed, 40, 0xFFFFFFFF)
+
+    fixed = audio._fix_wav_header(bytes(streamed))
+
+    assert struct.unpack_from("<I", fixed, 4)[0] == len(fixed) - 8
+    assert struct.unpack_from("<I", fixed, 40)[0] == 32000
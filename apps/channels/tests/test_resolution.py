@@ -0,0 +1,114 @@
+import uuid
+
+import pytest
+from django.core.cache import cache
+from field_audit.models import AuditAction
+
+from apps.channels.models import ChannelPlatform
+from apps.channels.resolution import (
+    _get_resolution_cache_key,
+    _get_token,
+    _LocalCache,
+    _ResolvedIds,
+    resolve_channel,
+)
+from apps.teams.models import Team
+from apps.utils.factories.channels import ExperimentChannelFactory
+
+
+@pytest.fixture()
+def channel(db):
+    return ExperimentChannelFactory(platform=ChannelPlatform.TELEGRAM)
+
+
+def _resolve(channel):
+    return resolve_channel(platform=ChannelPlatform.TELEGRAM, external_id=channel.external_id)
+
+
+@pytest.mark.django_db()
+def test_repeated_lookups_are_served_from_cache(channel, django_assert_num_queries):
+    _resolve(channel)
+    _resolve(channel)
+
+    # Only the channel itself is loaded, by primary key
+    with django_assert_num_queries(1):
+        resolution = _resolve(channel)
+
+    assert resolution.channel == channel
+    assert resolution.experiment == channel.experiment
+
+
+@pytest.mark.django_db()
+def test_missing_channel():
+    assert resolve_channel(platform=ChannelPlatform.TELEGRAM, external_id=uuid.uuid4()) is None
+
+
+@pytest.mark.django_db()
+def test_channel_save_invalidates(channel):
+    _resolve(channel)
+    _resolve(channel)
+
+    channel.name = "Renamed"
+    channel.save()
+
+    assert _resolve(channel).channel.name == "Renamed"
+
+
+@pytest.mark.django_db()
+def test_publishing_a_version_invalidates(channel):
+    assert _resolve(channel).experiment == channel.experiment
+    _resolve(channel)
+
+    version = channel.experiment.create_new_version(make_default=True)
+
+    assert _resolve(channel).experiment == version
+
+
+@pytest.mark.django_db()
+def test_archived_chatbot_is_not_resolved(channel):
+    _resolve(channel)
+    _resolve(channel)
+
+    channel.experiment.archive()
+
+    assert _resolve(channel) is None
+
+
+@pytest.mark.django_db()
+def test_cached_resolution_holds_no_channel_config(channel):
+    _resolve(channel)
+    _resolve(channel)
+
+    token = _get_token(channel.id)
+    assert cache.get(_get_resolution_cache_key(channel.id, token)) == _ResolvedIds(
+        channel_id=channel.id, experiment_id=channel.experiment_id
+    )
+
+
+@pytest.mark.django_db()
+def test_team_changes_are_not_cached(channel):
+    _resolve(channel)
+    _resolve(channel)
+
+    Team.objects.filter(id=channel.team_id).update(name="Renamed", audit_action=AuditAction.IGNORE)
+
+    assert _resolve(channel).channel.team.name == "Renamed"
+
+
+def test_local_cache_is_keyed_on_token():
+    local_cache = _LocalCache(maxsize=1)
+    resolved = _ResolvedIds(channel_id=1, experiment_id=2)
+    local_cache.set(1, "token", resolved)
+
+    assert local_cache.get(1, "token") == resolved
+    assert local_cache.get(1, "other-token") is None
+
+
+def test_local_cache_evicts_least_recently_used():
+    local_cache = _LocalCache(maxsize=1)
+    resolved = _ResolvedIds(channel_id=1, experiment_id=2)
+    local_cache.set(1, "token", resolved)
+    local_cache.set(2, "token", resolved)
+
+    assert local_cache.get(1, "token") is None
+    assert local_cache.get(2, "token") is not None
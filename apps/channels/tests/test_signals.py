@@ -57,3 +57,28 @@ def test_signal_human_activity_on_chat_messages():
 
     # last_activity_at should update to the last human message time
     assert session.last_activity_at == second_time
+
+
+@pytest.mark.django_db()
+def test_chat_message_count_is_maintained():
+    session = ExperimentSessionFactory.create()
+    ChatMessage.objects.create(chat=session.chat, content="Hi", message_type=ChatMessageType.HUMAN)
+    ChatMessage.objects.create(chat=session.chat, content="Hello", message_type=ChatMessageType.AI)
+
+    chat = session.chat
+    chat.refresh_from_db()
+    assert chat.message_count == 2
+
+
+@pytest.mark.django_db()
+def test_saving_a_stale_chat_keeps_its_counters():
+    session = ExperimentSessionFactory.create()
+    chat = session.chat
+    ChatMessage.objects.create(chat=chat, content="Hi", message_type=ChatMessageType.HUMAN)
+
+    chat.name = "Renamed"
+    chat.save()
+
+    chat.refresh_from_db()
+    assert chat.name == "Renamed"
+    assert chat.message_count == 1
@@ -88,7 +88,6 @@ def test_handle_telegram_message_processes_normal_message():
         patch("apps.channels.tasks.TelegramMessage.parse") as parse,
         patch("apps.channels.tasks.TelegramChannel") as telegram_channel,
         patch("apps.channels.tasks.update_taskbadger_data"),
-        patch("apps.channels.tasks.resolve_published_or_working"),
     ):
         handle_telegram_message(message_data, channel_external_id=experiment_channel.external_id)
 
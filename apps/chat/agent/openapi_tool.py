@@ -1,10 +1,16 @@
+import contextlib
 import enum
+import hashlib
+import json
 import logging
+import os
 import pathlib
 import tempfile
+import threading
 import uuid
-from collections import defaultdict
+from collections import OrderedDict, defaultdict
 from email.message import Message
+from http.cookiejar import CookieJar
 from typing import TYPE_CHECKING, Any, cast
 from urllib.parse import urljoin
 
@@ -29,6 +35,9 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger("ocs.tools")
 
+FUNCTION_DEF_CACHE_SIZE = 1024
+HTTP_CLIENT_POOL_SIZE = 256
+
 
 class ToolArtifact(BaseModel):
     name: str
@@ -96,7 +105,7 @@ class OpenAPIOperationExecutor:
         kwargs = {k: v.model_dump() if isinstance(v, BaseModel) else v for k, v in kwargs.items()}
 
         url = self._get_url(path_params)
-        with self.auth_service.get_http_client() as client:
+        with self._get_http_client() as client:
             try:
                 return self.auth_service.call_with_retries(self._make_request, client, url, method, **kwargs)
             except httpx.HTTPStatusError as e:
@@ -122,6 +131,12 @@ class OpenAPIOperationExecutor:
             custom_action_unexpected_error_notification(self.custom_action, self.function_def, e)
             raise
 
+    def _get_http_client(self):
+        if self.custom_action is None:
+            return self.auth_service.get_http_client()
+        # Pooled clients are shared by later calls, so they are not closed after use
+        return contextlib.nullcontext(_http_client_pool.get(self.custom_action.id, self.auth_service))
+
     def _make_request(
         self, http_client: httpx.Client, url: str, method: str, **kwargs
     ) -> tuple[str, ToolArtifact | None]:
@@ -182,6 +197,99 @@ class OpenAPIOperationExecutor:
         return url
 
 
+class _BoundedCache:
+    """A thread-safe, least recently used cache private to the process."""
+
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self._pid = os.getpid()
+
+    def get(self, key, default=None):
+        with self._lock:
+            if self._pid != os.getpid():
+                # Entries inherited from a parent process (e.g. HTTP clients with open sockets) aren't reused
+                self._entries.clear()
+                self._pid = os.getpid()
+            if key not in self._entries:
+                return default
+            self._entries.move_to_end(key)
+            return self._entries[key]
+
+    def set(self, key, value):
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                # Evicted HTTP clients are not closed: another thread may still be using them
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+
+_function_defs = _BoundedCache(FUNCTION_DEF_CACHE_SIZE)
+_NO_FUNCTION_DEF = object()
+
+
+def get_function_def_for_operation(operation_id: int, operation_schema: dict) -> FunctionDef | None:
+    """Return the function definition of a custom action operation, or None if its schema has no paths.
+
+    Building the definition generates pydantic models for the operation's arguments, which is slow, so
+    definitions are cached per process on the operation and a hash of its schema.
+    """
+    schema_hash = hashlib.sha256(json.dumps(operation_schema, sort_keys=True).encode()).hexdigest()
+    key = (operation_id, schema_hash)
+    function_def = _function_defs.get(key)
+    if function_def is None:
+        spec = OpenAPISpec.from_spec_dict(operation_schema)
+        if spec.paths:
+            path = list(spec.paths)[0]
+            method = spec.get_methods_for_path(path)[0]
+            function_def = openapi_spec_op_to_function_def(spec, path, method)
+        else:
+            function_def = _NO_FUNCTION_DEF
+        _function_defs.set(key, function_def)
+    return function_def if isinstance(function_def, FunctionDef) else None
+
+
+class _DiscardingCookieJar(CookieJar):
+    """A cookie jar that ignores the cookies set by responses. A pooled client serves the calls of every
+    participant and session, so a cookie one of them is given must not be sent with the others' calls."""
+
+    def extract_cookies(self, response, request):
+        pass
+
+
+class _HttpClientPool:
+    """HTTP clients shared by the calls to each custom action, so that connections to its server are reused."""
+
+    # Per client, so generous enough that concurrent calls to one action don't wait for a connection
+    limits = httpx.Limits(max_keepalive_connections=10, max_connections=50)
+
+    def __init__(self, maxsize: int):
+        self._clients = _BoundedCache(maxsize)
+        self._lock = threading.Lock()
+
+    def get(self, custom_action_id: int, auth_service: AuthService) -> httpx.Client:
+        # Keyed on the credentials too, so that updated or refreshed credentials get a new client
+        key = (custom_action_id, auth_service.get_fingerprint())
+        client = self._clients.get(key)
+        if client is None:
+            with self._lock:
+                client = self._clients.get(key)
+                if client is None:
+                    client = auth_service.get_http_client(limits=self.limits)
+                    client.cookies = _DiscardingCookieJar()
+                    self._clients.set(key, client)
+        return client
+
+
+_http_client_pool = _HttpClientPool(HTTP_CLIENT_POOL_SIZE)
+
+
 def openapi_spec_op_to_function_def(spec: OpenAPISpec, path: str, method: str) -> FunctionDef:
     """
     Converts an OpenAPI operation to a Pydantic model.
@@ -90,9 +90,10 @@ class SearchIndexSchema(BaseModel):
 
 
 class MultiSearchIndexSchema(BaseModel):
-    collection_index_id: int = Field(
-        description="The collection index ID to search. "
-        "Multiple collections can be searched by making multiple tool calls with different collection_ids."
+    collection_index_ids: list[int] = Field(
+        description="The IDs of the collection indexes to search. "
+        "Pass every collection that may hold the answer: they are all searched at once.",
+        min_length=1,
     )
     query: str = Field(
         description="A natural language query to search for relevant information in the documents. "
@@ -1,3 +1,4 @@
+import contextlib
 import functools
 import json
 import logging
@@ -12,7 +13,7 @@ from xml.sax.saxutils import escape
 from asgiref.sync import async_to_sync
 from django.conf import settings
 from django.db import transaction, utils
-from langchain_community.utilities.openapi import OpenAPISpec
+from langchain_core.callbacks import dispatch_custom_event
 from langchain_core.messages import ToolMessage
 from langchain_core.tools import BaseTool, StructuredTool
 from langgraph.types import Command
@@ -20,10 +21,10 @@ from langgraph.types import Command
 from apps.channels.models import ChannelPlatform
 from apps.chat.agent import schemas
 from apps.chat.agent.calculator import calculate
-from apps.chat.agent.openapi_tool import openapi_spec_op_to_function_def
+from apps.chat.agent.openapi_tool import get_function_def_for_operation
 from apps.chat.models import ChatAttachment
 from apps.documents.models import Collection
-from apps.documents.retrieval import search_collection
+from apps.documents.search_cache import search_collections_cached
 from apps.events.forms import ScheduledMessageConfigForm
 from apps.events.models import ScheduledMessage, TimePeriod
 from apps.experiments.models import AgentTools, Experiment, ExperimentSession
@@ -33,6 +34,7 @@ from apps.pipelines.models import Node
 from apps.pipelines.nodes.base import Intents
 from apps.pipelines.nodes.tool_callbacks import ToolCallbacks
 from apps.service_providers.llm_service.prompt_context import ParticipantDataProxy
+from apps.service_providers.tracing.const import RETRIEVAL_CACHE_EVENT
 from apps.teams.models import Team
 from apps.teams.utils import get_current_team, get_slug_for_team
 from apps.utils.time import pretty_date
@@ -166,20 +168,36 @@ def _perform_collection_search(
     Returns:
         Formatted search results string
     """
-    embeddings = search_collection(collection=collection, query=query, top_k=max_results)
+    return _perform_collections_search([collection], query, max_results, generate_citations, include_collection_info)
 
-    if not embeddings:
-        if include_collection_info:
-            return (
-                f"\nThe semantic search did not return any results from "
-                f"collection '{collection.name}' (ID: {collection.id})."
+
+def _perform_collections_search(
+    collections: list, query: str, max_results: int, generate_citations: bool, include_collection_info: bool
+) -> str:
+    """Search each of the collections for its `max_results` most relevant chunks, in a single batch."""
+    results, cache_hits = search_collections_cached(collections, query, top_k=max_results)
+    for collection in collections:
+        with contextlib.suppress(RuntimeError):
+            # Counted by the trace's metrics; raises outside a traced run
+            dispatch_custom_event(
+                RETRIEVAL_CACHE_EVENT, {"collection_id": collection.id, "hit": collection.id in cache_hits}
             )
+
+    if not any(results.values()):
+        if include_collection_info:
+            searched = ", ".join(f"'{collection.name}' (ID: {collection.id})" for collection in collections)
+            noun = "collection" if len(collections) == 1 else "collections"
+            return f"\nThe semantic search did not return any results from {noun} {searched}."
         return "\nThe semantic search did not return any results."
 
     # Format results
     if include_collection_info:
         retrieved_chunks = "\n".join(
-            [_format_result_with_collection(embedding, collection) for embedding in embeddings]
+            [
+                _format_result_with_collection(embedding, collection)
+                for collection in collections
+                for embedding in results[collection.id]
+            ]
         )
     else:
         retrieved_chunks = "\n".join(
@@ -190,7 +208,8 @@ def _perform_collection_search(
                     metadata=_format_metadata_block(embedding.file.metadata),
                     chunk=embedding.text,
                 ).strip()
-                for embedding in embeddings
+                for collection in collections
+                for embedding in results[collection.id]
             ]
         )
 
@@ -550,10 +569,10 @@ class SearchIndexTool(CustomBaseTool):
 class SearchCollectionByIdTool(CustomBaseTool):
     name: str = AgentTools.SEARCH_INDEX_BY_ID
     description: str = (
-        "Performs semantic search on a specific document collection using natural language queries. "
-        "This tool analyzes the content of the specified collection to find relevant information, quotes, "
+        "Performs semantic search on one or more document collections using natural language queries. "
+        "This tool analyzes the content of the specified collections to find relevant information, quotes, "
         "and passages that best match your query. Results indicate which collection they came from. "
-        "To search multiple collections, make multiple tool calls with different collection_ids."
+        "To search multiple collections for the same query, pass all of their IDs in a single call."
     )
     requires_session: bool = False
     args_schema: type[schemas.MultiSearchIndexSchema] = schemas.MultiSearchIndexSchema
@@ -561,27 +580,37 @@ class SearchCollectionByIdTool(CustomBaseTool):
     generate_citations: bool = True
     allowed_collection_ids: list[int]
 
-    def action(self, collection_index_id: int, query: str) -> str:
+    def action(self, collection_index_ids: list[int], query: str) -> str:
         """
-        Search a specific collection index for the most relevant file chunks based on the query.
+        Search the given collection indexes for the most relevant file chunks of each based on the query.
         """
-
-        not_found = f"Collection index with ID {collection_index_id} not found."
-        if collection_index_id not in self.allowed_collection_ids:
-            return not_found
-
-        try:
-            collection = Collection.objects.get(id=collection_index_id, is_index=True)
-        except Collection.DoesNotExist:
-            return not_found
-
-        return _perform_collection_search(
-            collection=collection,
-            query=query,
+        requested_ids = list(dict.fromkeys(collection_index_ids))
+        allowed_ids = set(requested_ids) & set(self.allowed_collection_ids)
+        collections_by_id = Collection.objects.filter(id__in=allowed_ids, is_index=True).in_bulk()
+        collections = [
+            collections_by_id[collection_id] for collection_id in requested_ids if collection_id in collections_by_id
+        ]
+
+        not_found = [collection_id for collection_id in requested_ids if collection_id not in collections_by_id]
+        if not collections:
+            return _collections_not_found(not_found)
+
+        response = _perform_collections_search(
+            collections,
+            query,
             max_results=self.max_results,
             generate_citations=self.generate_citations,
             include_collection_info=True,
         )
+        if not_found:
+            response += f"\n{_collections_not_found(not_found)}"
+        return response
+
+
+def _collections_not_found(collection_ids: list[int]) -> str:
+    if len(collection_ids) == 1:
+        return f"Collection index with ID {collection_ids[0]} not found."
+    return f"Collection indexes with IDs {', '.join(map(str, collection_ids))} not found."
 
 
 def _move_datetime_to_new_weekday_and_time(date: datetime, new_weekday: int, new_hour: int, new_minute: int):
@@ -809,8 +838,7 @@ def get_mcp_tool_instances(node: Node, team: Team):
 
     final_tool_instances = []
     for server in team.mcpserver_set.filter(id__in=server_tools.keys()):
-        remote_tools = server.fetch_tools()
-        tool_instances = [_convert_to_sync_tool(tool) for tool in remote_tools if tool.name in server_tools[server.id]]
+        tool_instances = [_convert_to_sync_tool(tool) for tool in server.get_tools(server_tools[server.id])]
         final_tool_instances.extend(tool_instances)
 
     return final_tool_instances
@@ -834,16 +862,12 @@ def get_custom_action_tools(action_holder: Union[Experiment, "OpenAiAssistant",
 
 
 def get_tool_for_custom_action_operation(custom_action_operation) -> BaseTool | None:
-    custom_action = custom_action_operation.custom_action
-    spec = OpenAPISpec.from_spec_dict(custom_action_operation.operation_schema)
-    if not spec.paths:
+    function_def = get_function_def_for_operation(custom_action_operation.id, custom_action_operation.operation_schema)
+    if not function_def:
         return
 
-    auth_service = custom_action.get_auth_service()
-    path = list(spec.paths)[0]
-    method = spec.get_methods_for_path(path)[0]
-    function_def = openapi_spec_op_to_function_def(spec, path, method)
-    return function_def.build_tool(auth_service, custom_action)
+    custom_action = custom_action_operation.custom_action
+    return function_def.build_tool(custom_action.get_auth_service(), custom_action)
 
 
 def _convert_to_sync_tool(tool: StructuredTool) -> StructuredTool:
@@ -189,17 +189,17 @@ class PipelineBot:
                 human_message.save(update_fields=["metadata"])
 
         output_tags = output.get("output_message_tags")
+        version_tag = ChatMessage.get_version_tag(
+            version_number=self.experiment.version_number, is_a_version=self.experiment.is_a_version
+        )
         ai_message = self._save_message_to_history(
             output["messages"][-1],
             ChatMessageType.AI,
             metadata=output_metadata,
-            tags=output_tags,
+            tags=[*(output_tags or []), version_tag],
         )
         if self.trace_service:
             self.trace_service.set_output_message_id(ai_message.id)
-        ai_message.add_version_tag(
-            version_number=self.experiment.version_number, is_a_version=self.experiment.is_a_version
-        )
         if self.trace_service and output_tags:
             flat_tags = [f"{category}:{tag}" if category else tag for tag, category in output_tags]
             self.trace_service.add_output_message_tags_to_trace(flat_tags)
@@ -210,8 +210,7 @@ class PipelineBot:
         """Persist pipeline state changes (participant data, session state, tags) to the database."""
 
         if session_tags := output.get("session_tags"):
-            for tag, category in session_tags:
-                self.session.chat.create_and_add_tag(tag, self.session.team, tag_category=category)
+            self.session.chat.create_and_add_tags(session_tags, self.session.team)
 
         out_pd = output.get("participant_data", None)
         if out_pd is not None and out_pd != input_state.get("participant_data"):
@@ -245,8 +244,7 @@ class PipelineBot:
         )
 
         if tags:
-            for tag_value, category in tags:
-                chat_message.create_and_add_tag(tag_value, self.session.team, category or "")
+            chat_message.create_and_add_tags(tags, self.session.team)
         return chat_message
 
     def get_synthetic_voice(self) -> SyntheticVoice | None:
@@ -0,0 +1,32 @@
+from django.core.management.base import BaseCommand
+
+from apps.chat.retention import delete_expired_chat_history, get_chat_history_policies
+from apps.teams.models import Team
+
+
+class Command(BaseCommand):
+    help = "Delete the chat messages and traces that are older than their team's chat history retention period."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--team", help="Only delete the history of the team with this slug")
+        parser.add_argument(
+            "--time-budget", type=float, help="Seconds to spend deleting (default: RETENTION_TIME_BUDGET_SECONDS)"
+        )
+        parser.add_argument("--dry-run", action="store_true", help="Report how many rows would be deleted")
+
+    def handle(self, *args, team=None, time_budget=None, dry_run=False, **options):
+        teams = Team.objects.filter(chat_history_retention_days__isnull=False).order_by("slug")
+        if team:
+            teams = teams.filter(slug=team)
+
+        if dry_run:
+            for team_obj in teams:
+                for policy in get_chat_history_policies(team_obj):
+                    self.stdout.write(f"{policy.name}: {policy.get_queryset().count()} row(s) to delete")
+            return
+
+        results = delete_expired_chat_history(teams, time_budget=time_budget)
+        for result in results:
+            status = "done" if result.complete else "incomplete"
+            self.stdout.write(f"{result.policy}: deleted {result.total_deleted} row(s) ({status})")
+        self.stdout.write(self.style.SUCCESS(f"Deleted {sum(r.total_deleted for r in results)} row(s)."))
@@ -0,0 +1,31 @@
+# Generated by Django 5.2.16 on 2026-10-18 22:40
+
+import django.contrib.postgres.search
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    """Add the generated search vector of message content.
+
+    Adding a stored generated column rewrites the table, which holds an exclusive lock on it until the
+    rewrite finishes. Run this in a quiet window on large installations. The indexes are built
+    concurrently in the next migration.
+    """
+
+    dependencies = [
+        ('annotations', '0009_alter_tag_category'),
+        ('chat', '0026_chat_message_counters'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='chatmessage',
+            name='search_language',
+            field=models.CharField(blank=True, choices=[('simple', 'Simple (no stemming, exact tokens)'), ('arabic', 'Arabic'), ('armenian', 'Armenian'), ('basque', 'Basque'), ('catalan', 'Catalan'), ('danish', 'Danish'), ('dutch', 'Dutch'), ('english', 'English'), ('finnish', 'Finnish'), ('french', 'French'), ('german', 'German'), ('greek', 'Greek'), ('hindi', 'Hindi'), ('hungarian', 'Hungarian'), ('indonesian', 'Indonesian'), ('irish', 'Irish'), ('italian', 'Italian'), ('lithuanian', 'Lithuanian'), ('nepali', 'Nepali'), ('norwegian', 'Norwegian'), ('portuguese', 'Portuguese'), ('romanian', 'Romanian'), ('russian', 'Russian'), ('serbian', 'Serbian'), ('spanish', 'Spanish'), ('swedish', 'Swedish'), ('tamil', 'Tamil'), ('turkish', 'Turkish'), ('yiddish', 'Yiddish')], default='', help_text="The text search configuration the content is indexed with. Defaults to the team's on creation.", max_length=32),
+        ),
+        migrations.AddField(
+            model_name='chatmessage',
+            name='search_vector',
+            field=models.GeneratedField(db_persist=True, expression=models.Case(models.When(search_language='arabic', then=django.contrib.postgres.search.SearchVector('content', config='arabic')), models.When(search_language='armenian', then=django.contrib.postgres.search.SearchVector('content', config='armenian')), models.When(search_language='basque', then=django.contrib.postgres.search.SearchVector('content', config='basque')), models.When(search_language='catalan', then=django.contrib.postgres.search.SearchVector('content', config='catalan')), models.When(search_language='danish', then=django.contrib.postgres.search.SearchVector('content', config='danish')), models.When(search_language='dutch', then=django.contrib.postgres.search.SearchVector('content', config='dutch')), models.When(search_language='english', then=django.contrib.postgres.search.SearchVector('content', config='english')), models.When(search_language='finnish', then=django.contrib.postgres.search.SearchVector('content', config='finnish')), models.When(search_language='french', then=django.contrib.postgres.search.SearchVector('content', config='french')), models.When(search_language='german', then=django.contrib.postgres.search.SearchVector('content', config='german')), models.When(search_language='greek', then=django.contrib.postgres.search.SearchVector('content', config='greek')), models.When(search_language='hindi', then=django.contrib.postgres.search.SearchVector('content', config='hindi')), models.When(search_language='hungarian', then=django.contrib.postgres.search.SearchVector('content', config='hungarian')), models.When(search_language='indonesian', then=django.contrib.postgres.search.SearchVector('content', config='indonesian')), models.When(search_language='irish', then=django.contrib.postgres.search.SearchVector('content', config='irish')), models.When(search_language='italian', then=django.contrib.postgres.search.SearchVector('content', config='italian')), models.When(search_language='lithuanian', then=django.contrib.postgres.search.SearchVector('content', config='lithuanian')), models.When(search_language='nepali', then=django.contrib.postgres.search.SearchVector('content', config='nepali')), models.When(search_language='norwegian', then=django.contrib.postgres.search.SearchVector('content', config='norwegian')), models.When(search_language='portuguese', then=django.contrib.postgres.search.SearchVector('content', config='portuguese')), models.When(search_language='romanian', then=django.contrib.postgres.search.SearchVector('content', config='romanian')), models.When(search_language='russian', then=django.contrib.postgres.search.SearchVector('content', config='russian')), models.When(search_language='serbian', then=django.contrib.postgres.search.SearchVector('content', config='serbian')), models.When(search_language='spanish', then=django.contrib.postgres.search.SearchVector('content', config='spanish')), models.When(search_language='swedish', then=django.contrib.postgres.search.SearchVector('content', config='swedish')), models.When(search_language='tamil', then=django.contrib.postgres.search.SearchVector('content', config='tamil')), models.When(search_language='turkish', then=django.contrib.postgres.search.SearchVector('content', config='turkish')), models.When(search_language='yiddish', then=django.contrib.postgres.search.SearchVector('content', config='yiddish')), default=django.contrib.postgres.search.SearchVector('content', config='simple')), output_field=django.contrib.postgres.search.SearchVectorField()),
+        ),
+    ]
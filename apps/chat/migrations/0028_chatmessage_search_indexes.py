@@ -0,0 +1,36 @@
+import django.contrib.postgres.indexes
+import django.db.models.functions.text
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+    """Build the GIN indexes backing message search: full-text on the search vector and trigram on the
+    upper-cased content, which is what case-insensitive substring search compares.
+
+    ``CREATE INDEX CONCURRENTLY`` does not take a write lock, so messages keep being saved while the
+    indexes build. A concurrent build that fails leaves an INVALID index behind; drop it with
+    ``DROP INDEX CONCURRENTLY`` before re-running.
+    """
+
+    atomic = False
+
+    dependencies = [
+        ("chat", "0027_chatmessage_search_vector"),
+        # pg_trgm, for the gin_trgm_ops operator class
+        ("web", "0002_auto_20241129_1504"),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name='chatmessage',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['search_vector'], name='chatmessage_search_vector_idx'),
+        ),
+        AddIndexConcurrently(
+            model_name='chatmessage',
+            index=django.contrib.postgres.indexes.GinIndex(
+                django.contrib.postgres.indexes.OpClass(django.db.models.functions.text.Upper('content'), name='gin_trgm_ops'),
+                name='chatmessage_upper_trgm_idx',
+            ),
+        ),
+    ]
@@ -2,8 +2,11 @@ from enum import StrEnum
 from urllib.parse import quote
 
 from django.contrib.postgres.fields import ArrayField
+from django.contrib.postgres.indexes import GinIndex, OpClass
+from django.contrib.postgres.search import SearchVector, SearchVectorField
 from django.db import models
-from django.db.models import Q
+from django.db.models import Case, Count, OuterRef, Q, Subquery, Value, When
+from django.db.models.functions import Coalesce, Upper
 from django.urls import reverse
 from django.utils import timezone
 from django.utils.functional import classproperty
@@ -13,17 +16,40 @@ from apps.annotations.models import Tag, TagCategories, TaggedModelMixin, UserCo
 from apps.chat.utils import safe_link_url
 from apps.files.models import File
 from apps.teams.models import BaseTeamModel
-from apps.teams.utils import get_slug_for_team
+from apps.teams.utils import get_message_search_language, get_slug_for_team
 from apps.utils.fields import SanitizedJSONField
 from apps.utils.llm_messages import ensure_non_empty_text
-from apps.utils.models import BaseModel
+from apps.utils.models import BaseModel, DenormalizedCountersMixin
+from apps.utils.search import SearchLanguage
 
 
-class Chat(BaseTeamModel, TaggedModelMixin, UserCommentsMixin):
+class ChatQuerySet(models.QuerySet):
+    def refresh_message_counters(self) -> int:
+        """Recompute the message counters of these chats from their messages, e.g. after a bulk insert."""
+        messages = ChatMessage.objects.filter(chat_id=OuterRef("id")).order_by().values("chat_id")
+        return self.update(
+            message_count=Coalesce(Subquery(messages.annotate(count=Count("id")).values("count")), Value(0))
+        )
+
+
+class ChatObjectManager(models.Manager):
+    def get_queryset(self):
+        return ChatQuerySet(self.model, using=self._db)
+
+    def refresh_message_counters(self, chat_ids) -> int:
+        return self.get_queryset().filter(id__in=chat_ids).refresh_message_counters()
+
+
+class Chat(DenormalizedCountersMixin, BaseTeamModel, TaggedModelMixin, UserCommentsMixin):
     """
     A chat instance.
     """
 
+    objects = ChatObjectManager()
+    # Maintained as messages are created (see `apps.channels.signals`) so that the session tables don't
+    # have to count messages. Bulk inserts must call `Chat.objects.refresh_message_counters`.
+    counter_fields = ("message_count",)
+
     class MetadataKeys(StrEnum):
         OPENAI_THREAD_ID = "openai_thread_id"
         EXPERIMENT_VERSION = "experiment_version"
@@ -39,6 +65,7 @@ class Chat(BaseTeamModel, TaggedModelMixin, UserCommentsMixin):
         help_text="List of language codes for which translated text is available",
     )
     metadata = SanitizedJSONField(default=dict)
+    message_count = models.PositiveIntegerField(default=0)
 
     @property
     def embed_source(self):
@@ -153,6 +180,22 @@ class ChatMessageMetadataKeys(StrEnum):
         return frozenset({cls.OPENAI_FILE_IDS, cls.OCS_ATTACHMENT_FILE_IDS, cls.CITED_FILES, cls.GENERATED_FILES})
 
 
+def _content_search_vector():
+    """The `tsvector` of a message's content under the message's own `search_language`.
+
+    A generated column can only use immutable expressions, which rules out casting the language column to
+    a `regconfig`, so each configuration is spelled out as a literal.
+    """
+    return Case(
+        *[
+            When(search_language=language, then=SearchVector("content", config=language))
+            for language in SearchLanguage.values
+            if language != SearchLanguage.SIMPLE
+        ],
+        default=SearchVector("content", config=SearchLanguage.SIMPLE),
+    )
+
+
 class ChatMessage(BaseModel, TaggedModelMixin, UserCommentsMixin):
     """
     A message in a chat. Analogous to the BaseMessage class in langchain.
@@ -171,6 +214,18 @@ class ChatMessage(BaseModel, TaggedModelMixin, UserCommentsMixin):
         default=dict, help_text="Dictionary of translated text keyed by the language code"
     )
     metadata = SanitizedJSONField(default=dict)
+    search_language = models.CharField(
+        max_length=32,
+        choices=SearchLanguage.choices,
+        blank=True,
+        default="",
+        help_text="The text search configuration the content is indexed with. Defaults to the team's on creation.",
+    )
+    search_vector = models.GeneratedField(
+        expression=_content_search_vector(),
+        output_field=SearchVectorField(),
+        db_persist=True,
+    )
 
     class Meta:
         ordering = ["created_at"]
@@ -180,6 +235,10 @@ class ChatMessage(BaseModel, TaggedModelMixin, UserCommentsMixin):
             # Supports the global (cross-team) date-range scans in the admin dashboard,
             # which filter created_at without a chat/team prefix.
             models.Index(fields=["created_at"], name="chatmessage_created_at_idx"),
+            # Full-text and substring search over message content (see `apps.chat.search`)
+            GinIndex(fields=["search_vector"], name="chatmessage_search_vector_idx"),
+            # On the upper-cased content, since that is what `icontains` compares
+            GinIndex(OpClass(Upper("content"), name="gin_trgm_ops"), name="chatmessage_upper_trgm_idx"),
         ]
 
     @classmethod
@@ -257,6 +316,8 @@ class ChatMessage(BaseModel, TaggedModelMixin, UserCommentsMixin):
     def save(self, *args, **kwargs):
         if self.is_summary:
             raise ValueError("Cannot save a summary message")
+        if self._state.adding and not self.search_language and self.chat_id:
+            self.search_language = get_message_search_language(self.chat.team_id)
         super().save(*args, **kwargs)
 
     def get_summary_message(self):
@@ -322,10 +383,16 @@ class ChatMessage(BaseModel, TaggedModelMixin, UserCommentsMixin):
             self.save(update_fields=["metadata"])
 
     def add_version_tag(self, version_number: int, is_a_version: bool):
+        tag, category = self.get_version_tag(version_number, is_a_version)
+        self.create_and_add_tag(tag, self.chat.team, category)
+
+    @staticmethod
+    def get_version_tag(version_number: int, is_a_version: bool) -> tuple[str, TagCategories]:
+        """The ``(name, category)`` of the tag marking the experiment version that produced a message."""
         tag = f"v{version_number}"
         if not is_a_version:
             tag = f"{tag}-unreleased"
-        self.create_and_add_tag(tag, self.chat.team, TagCategories.EXPERIMENT_VERSION)
+        return tag, TagCategories.EXPERIMENT_VERSION
 
     def add_rating(self, tag: str):
         tag, _ = Tag.objects.get_or_create(
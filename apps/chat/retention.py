@@ -0,0 +1,74 @@
+"""Per-team retention of chat history.
+
+A team that sets ``Team.chat_history_retention_days`` has its traces and chat messages deleted once they
+are older than that. Only the history itself is removed: sessions and chats are kept (their message
+counters are refreshed), so participants and their session lists stay intact.
+
+Deletion goes through `apps.utils.retention`, so it is batched and bounded by the housekeeping time
+budget, which is shared by all teams in a run. Teams are visited in random order so that one team's
+backlog can't hold up the others from one run to the next.
+"""
+
+import time
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import transaction
+from django.utils import timezone
+
+from apps.chat.models import Chat, ChatMessage
+from apps.human_annotations.aggregation import schedule_queue_reconcile
+from apps.human_annotations.models import AnnotationItem
+from apps.teams.models import Team
+from apps.trace.models import Trace
+from apps.utils.retention import RetentionPolicy, RetentionResult, run_retention_policy
+
+
+def get_chat_history_policies(team: Team) -> list[RetentionPolicy]:
+    """The policies that delete a team's expired chat history, in the order they should run. Traces go
+    first so that deleting the messages doesn't have to null out the traces' references to them."""
+    if not team.chat_history_retention_days:
+        return []
+
+    def get_cutoff():
+        return timezone.now() - timedelta(days=team.chat_history_retention_days)
+
+    return [
+        RetentionPolicy(
+            name=f"chat_history_traces:{team.slug}",
+            get_queryset=lambda: Trace.objects.filter(team=team, timestamp__lt=get_cutoff()),
+        ),
+        RetentionPolicy(
+            name=f"chat_history_messages:{team.slug}",
+            get_queryset=lambda: ChatMessage.objects.filter(chat__team=team, created_at__lt=get_cutoff()),
+            before_delete=_before_messages_deleted,
+        ),
+    ]
+
+
+def delete_expired_chat_history(teams=None, time_budget: float | None = None) -> list[RetentionResult]:
+    """Run the chat history policies of the given teams (default: all teams with a retention period)
+    until they are done or the time budget is used up."""
+    if time_budget is None:
+        time_budget = settings.RETENTION_TIME_BUDGET_SECONDS
+    if teams is None:
+        teams = Team.objects.filter(chat_history_retention_days__isnull=False).order_by("?")
+
+    deadline = time.monotonic() + time_budget
+    results = []
+    for team in teams:
+        for policy in get_chat_history_policies(team):
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return results
+            results.append(run_retention_policy(policy, time_budget=remaining))
+    return results
+
+
+def _before_messages_deleted(batch):
+    chat_ids = set(batch.values_list("chat_id", flat=True))
+    # The messages' annotation items are deleted with them, which the queues' aggregates have to catch up on
+    queue_ids = set(AnnotationItem.objects.filter(message__in=batch).values_list("queue_id", flat=True))
+    for queue_id in queue_ids:
+        schedule_queue_reconcile(queue_id)
+    transaction.on_commit(lambda: Chat.objects.refresh_message_counters(chat_ids))
@@ -0,0 +1,127 @@
+"""Full-text and substring search over the content of chat messages.
+
+Postgres indexes every message twice. `ChatMessage.search_vector` is a generated `tsvector` of the
+content, built with the message's `search_language` (the team's `message_search_language` when the
+message was saved), and the upper-cased `content` has a trigram index, which is what the
+case-insensitive `icontains` lookup compares. A search matches messages whose words match the query,
+stemmed under a language configuration, or whose content contains the query in any case. Both
+conditions are answered from GIN indexes, so neither scans the table.
+
+A message indexed under a different language than the query is parsed with (e.g. one saved before the
+team changed its language) can only be found by the substring match until it is re-indexed.
+"""
+
+import re
+
+from django.contrib.postgres.search import SearchHeadline, SearchQuery, SearchRank  # ty: ignore[unresolved-import]
+from django.db.models import F, FloatField, Q, QuerySet
+from django.db.models.functions import Cast
+from django.utils.html import escape
+from django.utils.safestring import SafeString, mark_safe
+
+from apps.chat.models import ChatMessage
+
+# pg_trgm can't use its index for patterns shorter than a trigram
+MIN_SUBSTRING_QUERY_LENGTH = 3
+SNIPPET_MAX_WORDS = 30
+REINDEX_BATCH_SIZE = 1000
+# Private use characters delimit the highlighted words in headlines, since the content itself is not HTML
+_HIGHLIGHT_START = "\ue000"
+_HIGHLIGHT_STOP = "\ue001"
+
+
+def get_search_query(query: str, language: str) -> SearchQuery | None:
+    """Parse `query` as a web search (quoted phrases, ``or`` and ``-exclusions``). Returns None if it is
+    blank."""
+    query = query.strip()
+    if not query:
+        return None
+    return SearchQuery(query, config=language, search_type="websearch")
+
+
+def message_search_filter(query: str, language: str) -> Q | None:
+    """A filter matching the messages whose content matches `query`, or None if there is nothing to search for."""
+    search_query = get_search_query(query, language)
+    if search_query is None:
+        return None
+    condition = Q(search_vector=search_query)
+    query = query.strip()
+    if len(query) >= MIN_SUBSTRING_QUERY_LENGTH:
+        condition |= Q(content__icontains=query)
+    return condition
+
+
+def search_messages(team, query: str) -> QuerySet:
+    """The team's session messages matching `query`, best match first.
+
+    Each message is annotated with its `rank`, which is cast to double precision so that it survives the
+    round trip through a pagination cursor exactly. Messages that only match as a substring rank 0.
+    """
+    condition = message_search_filter(query, team.message_search_language)
+    if condition is None:
+        return ChatMessage.objects.none()
+    search_query = get_search_query(query, team.message_search_language)
+    return (
+        ChatMessage.objects.filter(condition, chat__team=team, chat__experiment_session__isnull=False)
+        .annotate(rank=Cast(SearchRank(F("search_vector"), search_query), FloatField()))
+        .select_related("chat__experiment_session__experiment", "chat__experiment_session__participant")
+        .order_by("-rank", "-id")
+    )
+
+
+def attach_snippets(messages: list[ChatMessage], query: str, language: str):
+    """Set `snippet` on each message: the part of its content that best matches `query`, as HTML with the
+    matches highlighted.
+
+    Headlines are expensive to generate, so this is done for a page of messages at a time rather than
+    as an annotation of the search queryset.
+    """
+    search_query = get_search_query(query, language)
+    if not messages or search_query is None:
+        return
+
+    headlines = dict(
+        ChatMessage.objects.filter(id__in=[message.id for message in messages])
+        .annotate(
+            headline=SearchHeadline(
+                "content",
+                search_query,
+                config=language,
+                start_sel=_HIGHLIGHT_START,
+                stop_sel=_HIGHLIGHT_STOP,
+                max_words=SNIPPET_MAX_WORDS,
+                min_words=SNIPPET_MAX_WORDS // 2,
+            )
+        )
+        .values_list("id", "headline")
+    )
+    for message in messages:
+        message.snippet = highlight_snippet(headlines.get(message.id, ""), query)
+
+
+def highlight_snippet(headline: str, query: str) -> SafeString:
+    """Render a headline as HTML. If the full-text search found nothing to highlight, the message matched
+    as a substring, so the occurrences of the query are highlighted instead."""
+    if _HIGHLIGHT_START not in headline and (query := query.strip()):
+        headline = re.sub(
+            re.escape(query), lambda match: f"{_HIGHLIGHT_START}{match[0]}{_HIGHLIGHT_STOP}", headline, flags=re.I
+        )
+    html = escape(headline).replace(_HIGHLIGHT_START, "<mark>").replace(_HIGHLIGHT_STOP, "</mark>")
+    return mark_safe(html)  # noqa: S308 - the content is escaped above
+
+
+def reindex_team_messages(team_id: int, language: str) -> int:
+    """Re-index the team's messages under `language`, e.g. after the team's language was changed.
+
+    Postgres regenerates the search vector of each updated row. The messages are updated in batches so
+    that a large team's messages are not all locked by one statement.
+    """
+    messages = ChatMessage.objects.filter(chat__team_id=team_id).exclude(search_language=language)
+    updated = 0
+    last_id = 0
+    while True:
+        batch = list(messages.filter(id__gt=last_id).order_by("id").values_list("id", flat=True)[:REINDEX_BATCH_SIZE])
+        if not batch:
+            return updated
+        updated += ChatMessage.objects.filter(id__in=batch).update(search_language=language)
+        last_id = batch[-1]
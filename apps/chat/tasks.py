@@ -0,0 +1,14 @@
+from celery import shared_task
+from celery.utils.log import get_task_logger
+
+from apps.chat import retention
+from apps.utils.celery import Queues
+
+logger = get_task_logger("ocs.chat")
+
+
+@shared_task(ignore_result=True, queue=Queues.BACKGROUND)
+def delete_expired_chat_history():
+    results = retention.delete_expired_chat_history()
+    if deleted := sum(result.total_deleted for result in results):
+        logger.info(f"Deleted {deleted} rows of expired chat history")
@@ -4,9 +4,13 @@ import pytest
 from langchain_community.utilities.openapi import OpenAPISpec
 from langchain_core.messages import ToolMessage
 
-from apps.chat.agent.openapi_tool import openapi_spec_op_to_function_def
+from apps.chat.agent.openapi_tool import (
+    _HttpClientPool,
+    get_function_def_for_operation,
+    openapi_spec_op_to_function_def,
+)
 from apps.chat.tests.test_openapi_tool import _make_openapi_schema
-from apps.service_providers.auth_service import anonymous_auth_service
+from apps.service_providers.auth_service import BearerTokenAuthService, anonymous_auth_service
 from apps.utils.factories.service_provider_factories import AuthProviderFactory
 
 
@@ -155,3 +159,36 @@ def _test_tool_call(spec_dict, call_args: dict, path=None):
     function_def = openapi_spec_op_to_function_def(spec, path, "get")
     tool = function_def.build_tool(auth_service=anonymous_auth_service, custom_action=Mock())
     return tool.run(call_args, tool_call_id="123")
+
+
+def test_function_def_is_cached_per_operation_schema():
+    spec = _make_openapi_schema({"parameters": []})
+    function_def = get_function_def_for_operation(1, spec)
+    assert get_function_def_for_operation(1, spec) is function_def
+
+    changed_spec = _make_openapi_schema({"parameters": []}, path="/changed")
+    changed_function_def = get_function_def_for_operation(1, changed_spec)
+    assert changed_function_def is not function_def
+    assert changed_function_def.url == "https://example.com/changed"
+
+
+def test_http_clients_are_pooled_per_action_and_credentials():
+    pool = _HttpClientPool(maxsize=10)
+    client = pool.get(1, BearerTokenAuthService(token="abc"))
+
+    assert pool.get(1, BearerTokenAuthService(token="abc")) is client
+    assert pool.get(1, BearerTokenAuthService(token="refreshed")) is not client
+    assert pool.get(2, BearerTokenAuthService(token="abc")) is not client
+
+
+def test_pooled_http_clients_do_not_keep_cookies(httpx_mock):
+    httpx_mock.add_response(url="https://example.com/login", headers={"Set-Cookie": "session=participant-1"})
+    httpx_mock.add_response(url="https://example.com/data")
+    client = _HttpClientPool(maxsize=10).get(1, anonymous_auth_service)
+
+    client.get("https://example.com/login")
+    client.get("https://example.com/data", cookies={"theme": "dark"})
+
+    first, second = httpx_mock.get_requests()
+    assert not client.cookies
+    assert second.headers["Cookie"] == "theme=dark"
@@ -29,7 +29,7 @@ class TestPersistPipelineState:
             input_state=PipelineState(messages=["hi"]),
             output=PipelineState(messages=["Hello"], session_tags=[("my-tag", None)]),
         )
-        session.chat.create_and_add_tag.assert_called_with("my-tag", session.team, tag_category=None)
+        session.chat.create_and_add_tags.assert_called_with([("my-tag", None)], session.team)
 
     def test_persists_session_state(self):
         session = mock.Mock()
@@ -118,7 +118,7 @@ class TestPersistPipelineState:
         )
         participant_data.save.assert_not_called()
         session.save.assert_not_called()
-        session.chat.create_and_add_tag.assert_not_called()
+        session.chat.create_and_add_tags.assert_not_called()
 
 
 class TestInvokePipelineWithoutHistory:
@@ -146,7 +146,7 @@ class TestInvokePipelineWithoutHistory:
             )
         assert bot.session.state == {"count": 1}
         assert bot.__dict__["participant_data"].data == {"new": "data"}
-        bot.session.chat.create_and_add_tag.assert_called_with("event-tag", bot.session.team, tag_category="")
+        bot.session.chat.create_and_add_tags.assert_called_with([("event-tag", "")], bot.session.team)
 
     def test_processes_intents_when_not_saving_history(self):
         bot = self._make_bot()
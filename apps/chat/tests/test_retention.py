@@ -0,0 +1,56 @@
+from datetime import timedelta
+
+import pytest
+from django.utils import timezone
+
+from apps.chat.models import Chat, ChatMessage, ChatMessageType
+from apps.chat.retention import delete_expired_chat_history, get_chat_history_policies
+from apps.trace.models import Trace
+from apps.utils.factories.experiment import ChatFactory, ChatMessageFactory
+from apps.utils.factories.team import TeamFactory
+from apps.utils.factories.traces import TraceFactory
+
+
+def _message(chat, days_ago, message_type=ChatMessageType.HUMAN):
+    return ChatMessageFactory.create(
+        chat=chat, message_type=message_type, content="hi", created_at=timezone.now() - timedelta(days=days_ago)
+    )
+
+
+def test_teams_without_a_retention_period_have_no_policies():
+    assert get_chat_history_policies(TeamFactory.build(chat_history_retention_days=None)) == []
+
+
+@pytest.mark.django_db()
+def test_expired_history_is_deleted(django_capture_on_commit_callbacks):
+    team = TeamFactory.create(chat_history_retention_days=30)
+    chat = ChatFactory.create(team=team)
+    old_message = _message(chat, days_ago=40)
+    recent_message = _message(chat, days_ago=5, message_type=ChatMessageType.AI)
+    old_trace = TraceFactory.create(
+        team=team, timestamp=timezone.now() - timedelta(days=40), output_message=old_message
+    )
+    recent_trace = TraceFactory.create(team=team, timestamp=timezone.now() - timedelta(days=5))
+    Chat.objects.refresh_message_counters([chat.id])
+
+    with django_capture_on_commit_callbacks(execute=True):
+        results = delete_expired_chat_history(time_budget=60)
+
+    assert all(result.complete for result in results)
+    assert list(ChatMessage.objects.filter(chat=chat)) == [recent_message]
+    assert list(Trace.objects.filter(team=team)) == [recent_trace]
+    assert not Trace.objects.filter(id=old_trace.id).exists()
+    chat.refresh_from_db()
+    assert chat.message_count == 1
+
+
+@pytest.mark.django_db()
+def test_other_teams_history_is_kept():
+    team = TeamFactory.create(chat_history_retention_days=30)
+    other_chat = ChatFactory.create(team=TeamFactory.create())
+    message = _message(other_chat, days_ago=400)
+
+    delete_expired_chat_history(time_budget=60)
+
+    assert ChatMessage.objects.filter(id=message.id).exists()
+    assert get_chat_history_policies(team)
@@ -0,0 +1,88 @@
+import pytest
+from django.db import connection
+
+from apps.chat.models import ChatMessage, ChatMessageType
+from apps.chat.search import (
+    attach_snippets,
+    highlight_snippet,
+    message_search_filter,
+    reindex_team_messages,
+    search_messages,
+)
+from apps.utils.factories.experiment import ExperimentSessionFactory
+from apps.utils.search import SearchLanguage
+
+
+def _message(session, content, message_type=ChatMessageType.HUMAN):
+    return ChatMessage.objects.create(chat=session.chat, content=content, message_type=message_type)
+
+
+@pytest.fixture()
+def session():
+    session = ExperimentSessionFactory()
+    session.team.message_search_language = SearchLanguage.ENGLISH
+    session.team.save()
+    return session
+
+
+def test_highlight_snippet_escapes_the_content():
+    snippet = highlight_snippet("<b>the payment</b> failed", "payment")
+    assert snippet == "&lt;b&gt;the <mark>payment</mark>&lt;/b&gt; failed"
+
+
+def test_highlight_snippet_highlights_substring_matches():
+    assert highlight_snippet("Order #A-1234 shipped", "a-12") == "Order #<mark>A-12</mark>34 shipped"
+
+
+@pytest.mark.django_db()
+def test_messages_are_indexed_in_the_team_language(session):
+    message = _message(session, "I was running late")
+    assert message.search_language == SearchLanguage.ENGLISH
+
+    results = list(search_messages(session.team, "runs"))
+    assert results == [message]
+
+
+@pytest.mark.django_db()
+def test_search_matches_substrings_and_ranks_word_matches_first(session):
+    word_match = _message(session, "Where is my payment?")
+    substring_match = _message(session, "Reference PAYMENT123", ChatMessageType.AI)
+    _message(session, "Something else entirely")
+    _message(ExperimentSessionFactory(), "Where is my payment?")
+
+    results = list(search_messages(session.team, "payment"))
+    assert results == [word_match, substring_match]
+    assert results[0].rank > results[1].rank == 0
+
+    attach_snippets(results, "payment", session.team.message_search_language)
+    assert "<mark>payment</mark>" in results[0].snippet
+    assert "<mark>PAYMENT</mark>123" in results[1].snippet
+
+
+@pytest.mark.django_db()
+def test_messages_are_found_by_word_form_once_reindexed():
+    session = ExperimentSessionFactory()
+    message = _message(session, "I was running late")
+    assert message.search_language == SearchLanguage.SIMPLE
+
+    session.team.message_search_language = SearchLanguage.ENGLISH
+    session.team.save()
+    assert not search_messages(session.team, "runs").exists()
+
+    assert reindex_team_messages(session.team.id, SearchLanguage.ENGLISH) == 1
+    assert list(search_messages(session.team, "runs")) == [message]
+    assert reindex_team_messages(session.team.id, SearchLanguage.ENGLISH) == 0
+
+
+@pytest.mark.django_db()
+def test_search_is_served_by_indexes(session):
+    """Sequential scans are disabled so that the planner only falls back to one when no index can serve
+    the search, e.g. a substring match that the trigram index doesn't support."""
+    _message(session, "Reference PAYMENT123")
+    messages = ChatMessage.objects.filter(message_search_filter("payment", session.team.message_search_language))
+
+    with connection.cursor() as cursor:
+        cursor.execute("SET LOCAL enable_seqscan = off")
+    plan = messages.explain()
+
+    assert f"Seq Scan on {ChatMessage._meta.db_table}" not in plan, plan
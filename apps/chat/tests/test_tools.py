@@ -12,6 +12,7 @@ from django.db import IntegrityError, connection
 from django.utils import timezone
 from langchain.tools import InjectedState
 from langchain_core.tools import InjectedToolCallId, StructuredTool
+from mcp.types import Tool as McpTool
 from pydantic_core import PydanticUndefined
 from time_machine import travel
 
@@ -22,6 +23,7 @@ from apps.chat.agent.tools import (
     SEARCH_TOOL_HEADER,
     TOOL_CLASS_MAP,
     DeleteReminderTool,
+    SearchCollectionByIdTool,
     SearchIndexTool,
     SearchToolConfig,
     _convert_to_sync_tool,
@@ -564,6 +566,45 @@ class TestSearchIndexTool:
         assert "citation_url" not in result
 
 
+@pytest.mark.django_db()
+class TestSearchCollectionByIdTool:
+    def test_collections_are_searched_together(self, team, local_index_manager_mock):
+        vector_data = TestSearchIndexTool().load_vector_data()
+        fruit = CollectionFactory.create(team=team, is_index=True)
+        vegetables, not_allowed = CollectionFactory.create_batch(
+            2,
+            team=team,
+            is_index=True,
+            llm_provider=fruit.llm_provider,
+            embedding_provider_model=fruit.embedding_provider_model,
+        )
+        for collection, text in [(fruit, "Apples are great"), (vegetables, "Oranges are nice")]:
+            FileChunkEmbedding.objects.create(
+                team=team,
+                file=FileFactory.create(team=team),
+                collection=collection,
+                chunk_number=1,
+                text=text,
+                embedding=vector_data[text],
+                page_number=0,
+            )
+        local_index_manager_mock.get_embedding_vector.return_value = vector_data["What are great fruit?"]
+
+        tool = SearchCollectionByIdTool(allowed_collection_ids=[fruit.id, vegetables.id], generate_citations=False)
+        result = tool.action(collection_index_ids=[fruit.id, vegetables.id, not_allowed.id], query="fruit")
+
+        assert f"<collection_id>{fruit.id}</collection_id>" in result
+        assert f"<collection_id>{vegetables.id}</collection_id>" in result
+        assert result.index("Apples are great") < result.index("Oranges are nice")
+        assert result.endswith(f"Collection index with ID {not_allowed.id} not found.")
+        # Both collections share an embedding model, so the query is embedded once
+        assert local_index_manager_mock.get_embedding_vector.call_count == 1
+
+    def test_no_collection_found(self):
+        tool = SearchCollectionByIdTool(allowed_collection_ids=[1])
+        assert tool.action(collection_index_ids=[1, 2], query="fruit") == "Collection indexes with IDs 1, 2 not found."
+
+
 class TestFormatMetadataBlock:
     def test_empty_metadata_returns_empty_string(self):
         assert _format_metadata_block(None) == ""
@@ -626,20 +667,11 @@ def test_convert_to_sync_tool():
 
 
 @pytest.mark.django_db()
-@mock.patch("apps.mcp_integrations.models.McpServer.fetch_tools")
+@mock.patch("apps.mcp_integrations.models.McpServer._fetch_tools_from_mcp_server")
 def test_get_mcp_tool_instances(fetch_tools, team):
-    async def async_func(url: str, method: str = "GET"):
-        return f"{method} {url}"
-
     fetch_tools.return_value = [
-        StructuredTool(
-            name="test-tool",
-            description="test-description",
-            args_schema={},
-            response_format="content_and_artifact",
-            func=None,
-            coroutine=async_func,
-        )
+        McpTool(name="test-tool", description="test-description", inputSchema={"type": "object"}),
+        McpTool(name="other-tool", description="other-description", inputSchema={"type": "object"}),
     ]
     server = MCPServerFactory.create(team=team)
     node = NodeFactory.create(
@@ -648,7 +680,12 @@ def test_get_mcp_tool_instances(fetch_tools, team):
         }
     )
     tools = get_mcp_tool_instances(node, team)
-    assert len(tools) == 1
+    assert [tool.name for tool in tools] == ["test-tool"]
+    assert tools[0].func is not None
+
+    # The tool definitions are cached
+    assert [tool.name for tool in get_mcp_tool_instances(node, team)] == ["test-tool"]
+    fetch_tools.assert_called_once()
 
 
 @pytest.mark.django_db()
@@ -9,6 +9,7 @@ from django.urls import reverse
 from django_tables2 import columns
 
 from apps.api.session_tokens import issue_session_token
+from apps.chat.models import ChatMessage
 from apps.experiments.models import Experiment, ExperimentSession, last_activity_expression
 from apps.generics import actions, chips
 from apps.generics.actions import chip_action
@@ -177,7 +178,7 @@ class ChatbotSessionsTable(tables.Table):
     participant = columns.Column(accessor="participant", verbose_name="Participant", order_by="participant__identifier")
     message_count = columns.Column(
         verbose_name="Message Count",
-        accessor="message_count",
+        accessor="chat__message_count",
         orderable=True,
     )
     last_activity = TimeAgoColumn(accessor="last_activity", verbose_name="Last activity", orderable=True)
@@ -241,3 +242,39 @@ class ChatbotSessionsTable(tables.Table):
         row_attrs = settings.DJANGO_TABLES2_ROW_ATTRS
         orderable = False
         empty_text = "No sessions yet!"
+
+
+class MessageSearchTable(tables.Table):
+    """Results of a message search. The views attach each message's highlighted `snippet` (see
+    `apps.chat.search.attach_snippets`)."""
+
+    created_at = TimeAgoColumn(verbose_name="Sent")
+    chatbot = tables.Column(verbose_name="Chatbot", accessor="chat__experiment_session__experiment", empty_values=())
+    session = actions.ActionsColumn(
+        actions=[
+            chip_action(
+                label_factory=lambda record, _: record.chat.experiment_session.participant.identifier,
+                button_style=actions.CHIP_BUTTON_STYLE,
+                truncate=True,
+            ),
+        ],
+        align="left",
+    )
+    message_type = tables.Column(verbose_name="From")
+    snippet = tables.Column(verbose_name="Message", empty_values=())
+
+    def render_chatbot(self, record):
+        template = get_template("generic/chip.html")
+        chatbot = record.chat.experiment_session.experiment
+        chip = chips.Chip(label=str(chatbot), url=chatbot.get_absolute_url())
+        return template.render({"chip": chip, "truncate": True})
+
+    def render_snippet(self, record):
+        return getattr(record, "snippet", "")
+
+    class Meta:
+        model = ChatMessage
+        fields = ("created_at", "chatbot", "session", "message_type", "snippet")
+        row_attrs = settings.DJANGO_TABLES2_ROW_ATTRS
+        orderable = False
+        empty_text = "No matching messages."
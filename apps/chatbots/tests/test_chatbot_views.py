@@ -1076,9 +1076,8 @@ def test_session_table_session_query_uses_limit(team_with_users):
         list(response.context_data["table"].paginated_rows)
 
     # Exclude the paginator's `SELECT COUNT(*)` row by matching its prefix; do NOT use
-    # `"count(" not in sql` because the main paginated SELECT embeds a `Subquery(... Count("id") ...)`
-    # for the message_count annotation, which would falsely match and leave `session_selects` empty
-    # (making the `all(...)` assertion below vacuously true).
+    # `"count(" not in sql`, which would also match any row-fetching SELECT that counts in a subquery
+    # and could leave `session_selects` empty (making the `all(...)` assertion below vacuously true).
     session_selects = [
         q["sql"]
         for q in ctx.captured_queries
@@ -107,4 +107,6 @@ urlpatterns = [
     path("<int:pk>/copy/", views.copy_chatbot, name="copy"),
     path("sessions/", views.AllSessionsHome.as_view(), name="all_sessions_home"),
     path("sessions-list/", views.ChatbotSessionsTableView.as_view(), name="all_sessions_list"),
+    path("messages/search/", views.MessageSearchHome.as_view(), name="message_search"),
+    path("messages/search-table/", views.MessageSearchTableView.as_view(), name="message_search_table"),
 ]
@@ -25,8 +25,10 @@ from apps.channels.exceptions import ChannelDisabledException
 from apps.channels.models import ChannelPlatform
 from apps.channels.registry import get_channel_class_for_platform
 from apps.channels.web_channel import WebChannel
+from apps.chat.models import ChatMessage
+from apps.chat.search import attach_snippets, search_messages
 from apps.chatbots.forms import ChatbotForm, ChatbotSettingsForm, CopyChatbotForm
-from apps.chatbots.tables import ChatbotSessionsTable, ChatbotTable
+from apps.chatbots.tables import ChatbotSessionsTable, ChatbotTable, MessageSearchTable
 from apps.chatbots.tasks import send_bot_message
 from apps.chatbots.version_resolver import resolve_published_or_working
 from apps.cost_tracking.services.reporting import get_latest_chatbot_usage_summary
@@ -51,6 +53,7 @@ from apps.experiments.views.utils import get_channels_context
 from apps.filters.models import FilterSet
 from apps.generics import actions
 from apps.generics.help import render_help_with_link
+from apps.generics.pagination import KeysetPaginator
 from apps.generics.views import paginate_session, render_session_details
 from apps.pipelines.exceptions import has_errors
 from apps.pipelines.nodes.node_metadata import (
@@ -581,6 +584,7 @@ class ChatbotSessionsTableView(LoginAndTeamRequiredMixin, PermissionRequiredMixi
     table_class = ChatbotSessionsTable
     template_name = "table/single_table.html"
     permission_required = "experiments.view_experimentsession"
+    paginator_class = KeysetPaginator
 
     def get_queryset(self):
         experiment_id = self.kwargs.get("experiment_id")
@@ -923,6 +927,41 @@ class AllSessionsHome(LoginAndTeamRequiredMixin, PermissionRequiredMixin, Templa
         }
 
 
+class MessageSearchHome(LoginAndTeamRequiredMixin, PermissionRequiredMixin, TemplateView):
+    template_name = "generic/object_home.html"
+    permission_required = "experiments.view_experimentsession"
+
+    def get_context_data(self, team_slug: str, **kwargs):  # ty: ignore[invalid-method-override]
+        return {
+            "active_tab": "message_search",
+            "title": "Message Search",
+            "page_title": "Message Search",
+            "subtitle": "Find the sessions in which something was said",
+            "allow_new": False,
+            "enable_search": True,
+            "table_url": reverse("chatbots:message_search_table", kwargs={"team_slug": team_slug}),
+        }
+
+
+class MessageSearchTableView(LoginAndTeamRequiredMixin, PermissionRequiredMixin, SingleTableView):  # ty: ignore[invalid-method-override]
+    model = ChatMessage
+    table_class = MessageSearchTable
+    template_name = "table/single_table.html"
+    permission_required = "experiments.view_experimentsession"
+    paginator_class = KeysetPaginator
+
+    def get_queryset(self):
+        return search_messages(self.request.team, self.request.GET.get("search", ""))
+
+    def get_table(self, **kwargs):
+        # Snippets are generated for the page of results only
+        table = super().get_table(**kwargs)
+        if getattr(table, "page", None) is not None:
+            messages = [row.record for row in table.page.object_list]
+            attach_snippets(messages, self.request.GET.get("search", ""), self.request.team.message_search_language)
+        return table
+
+
 @login_and_team_required
 @permission_required("experiments.invite_participants", raise_exception=True)
 def send_chatbot_invitation(request, team_slug: str, experiment_id: int, session_id: str):
@@ -3,8 +3,10 @@ from collections.abc import Generator
 from unittest.mock import Mock, patch
 
 import pytest
+from django.core.cache import cache
 from django.db import connections
 
+from apps.channels import resolution
 from apps.service_providers.llm_service.index_managers import LocalIndexManager, RemoteIndexManager
 from apps.teams.utils import unset_current_team
 from apps.utils.factories.experiment import ExperimentFactory
@@ -91,3 +93,10 @@ def _reset_team_context():
         yield
     finally:
         unset_current_team()
+
+
+@pytest.fixture(autouse=True)
+def _clear_channel_resolution_cache():
+    """Cached channel resolutions would outlive the rows they point at, which are rolled back after each test."""
+    cache.clear()
+    resolution._local_cache.clear()
@@ -7,6 +7,7 @@ is per 1K tokens (canonical for every v4 service kind).
 
 import logging
 from dataclasses import dataclass
+from datetime import datetime
 from decimal import Decimal
 
 from django.db import transaction
@@ -63,8 +64,23 @@ def record_usage_bulk(events: list[UsageEvent], ctx: UsageContext) -> None:
     if not events:
         return
 
+    rows = build_usage_records(events, ctx)
+    try:
+        with transaction.atomic():
+            UsageRecord.objects.bulk_create(rows)
+    except Exception:
+        logger.exception("cost_tracking.bulk_insert_failed", extra={"team_id": ctx.team_id, "n_events": len(rows)})
+
+
+def build_usage_records(events: list[UsageEvent], ctx: UsageContext, at: datetime | None = None) -> list[UsageRecord]:
+    """Resolve pricing per event and build (unsaved) UsageRecord rows.
+
+    `at` is the time the usage happened, which picks the pricing rule in effect; it defaults
+    to now. Writers that insert later than the usage (the buffered trace writer) pass it
+    explicitly.
+    """
     resolver = PricingResolver()
-    now = timezone.now()
+    now = at or timezone.now()
     rows: list[UsageRecord] = []
 
     for event in events:
@@ -109,9 +125,4 @@ def record_usage_bulk(events: list[UsageEvent], ctx: UsageContext) -> None:
                 extra=event.extra or {},
             )
         )
-
-    try:
-        with transaction.atomic():
-            UsageRecord.objects.bulk_create(rows)
-    except Exception:
-        logger.exception("cost_tracking.bulk_insert_failed", extra={"team_id": ctx.team_id, "n_events": len(rows)})
+    return rows
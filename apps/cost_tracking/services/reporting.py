@@ -1,6 +1,10 @@
 """Read path for cost tracking. The dashboard, REST endpoints, weekly digest, and the
 evaluations UI all consume this. Aggregations are single-query, team-scoped, and hit
 the `(team, timestamp)` / `(team, experiment, timestamp)` indexes.
+
+The team-wide aggregates read from the replica when there is one (see `reporting_reads`). The
+per-session, per-trace and per-run lookups stay on the primary: they are cheap and are viewed right
+after the activity they cost.
 """
 
 import logging
@@ -23,6 +27,7 @@ from apps.teams.models import Team
 from apps.trace.models import Trace
 from apps.usage_metrics.dashboard_querysets import filtered_querysets
 from apps.usage_metrics.filters import chat_tag_exists_pair, conversation_messages
+from apps.utils.db_routing import reporting_reads
 
 logger = logging.getLogger("ocs.cost_tracking")
 
@@ -277,6 +282,7 @@ def _attributable_records(team: Team, filters: CostFilters | None = None):
     return _scoped_records(team, filters).filter(source=UsageSource.CHAT)
 
 
+@reporting_reads("cost_reporting")
 def cost_summary(team: Team, *, start: datetime, end: datetime, filters: CostFilters | None = None) -> CostSummary:
     """Total cost in [start, end), delta vs the equal-length prior period,
     and a confidence breakdown so the dashboard footer can show what share
@@ -330,6 +336,7 @@ def cost_summary(team: Team, *, start: datetime, end: datetime, filters: CostFil
     )
 
 
+@reporting_reads("cost_reporting")
 def token_counts(team: Team, *, start: datetime, end: datetime, filters: CostFilters | None = None) -> TokenCounts:
     """Token usage in [start, end), summed from ``UsageRecord.quantity`` and split by ``service_kind``.
     Shares the scoped-record path (team + ``CostFilters``) with ``cost_summary`` so tokens and cost for
@@ -351,6 +358,7 @@ def token_counts(team: Team, *, start: datetime, end: datetime, filters: CostFil
     return TokenCounts(prompt=int(agg["prompt"]), completion=int(agg["completion"]), total=int(agg["total"]))
 
 
+@reporting_reads("cost_reporting")
 def cost_total(team: Team, *, start: datetime, end: datetime, filters: CostFilters | None = None) -> CostTotal:
     """Total priced spend in [start, end) and its currency, in a single grouped query. This is the
     lightweight read the usage API needs: it shares the scoped-record path with ``token_counts`` (so
@@ -386,6 +394,7 @@ def _entity_cost_map(
     return {row[f"{field}_id"]: row["cost"] for row in rows}
 
 
+@reporting_reads("cost_reporting")
 def costs_by_experiment(
     team: Team, *, start: datetime, end: datetime, filters: CostFilters | None = None
 ) -> dict[int, Decimal]:
@@ -398,6 +407,7 @@ def costs_by_experiment(
     return _entity_cost_map(team, "experiment", start=start, end=end, filters=filters)
 
 
+@reporting_reads("cost_reporting")
 def costs_by_participant(
     team: Team, *, start: datetime, end: datetime, filters: CostFilters | None = None
 ) -> dict[int, Decimal]:
@@ -411,6 +421,7 @@ def costs_by_participant(
     return _entity_cost_map(team, "participant", start=start, end=end, filters=filters)
 
 
+@reporting_reads("cost_reporting")
 def costs_by_model(team: Team, *, start: datetime, end: datetime, filters: CostFilters | None = None) -> list[dict]:
     """Cost per (provider_type, model_name) in [start, end), ordered by descending
     cost, as floats for direct JSON/Chart.js consumption. One grouped query over
@@ -432,6 +443,7 @@ def costs_by_model(team: Team, *, start: datetime, end: datetime, filters: CostF
     ]
 
 
+@reporting_reads("cost_reporting")
 def costs_by_service_kind(
     team: Team, *, start: datetime, end: datetime, filters: CostFilters | None = None
 ) -> list[dict]:
@@ -463,6 +475,7 @@ def costs_by_service_kind(
 P95_TOP_CHATBOTS = 5
 
 
+@reporting_reads("cost_reporting")
 def p95_cost_per_trace(
     team: Team,
     *,
@@ -532,6 +545,7 @@ class ChatbotUsageSummary:
     messages_count: int
 
 
+@reporting_reads("cost_reporting")
 def chatbot_usage_summary(team: Team, experiment_id: int, *, start: datetime, end: datetime) -> ChatbotUsageSummary:
     """Cost, session count and message count for one chatbot in [start, end), for the chatbot home
     page's usage widget. Session/message counts come from `filtered_querysets` - the same canonical,
@@ -785,6 +799,7 @@ def evaluation_run_costs(config_id: int, run_ids: list[int]) -> dict[int, Decima
     return {row["extra__evaluation_run_id"]: row["cost"] for row in rows}
 
 
+@reporting_reads("cost_reporting")
 def evaluation_config_cost_summary(config: EvaluationConfig) -> EvaluationConfigCostSummary:
     """Aggregate spend across every run of one config: last 30 days and all time, each
     with its own confidence flags (mirrors `cost_summary`'s per-period counters).
@@ -877,6 +892,7 @@ def trace_token_usage(trace: Trace) -> TraceTokenUsage:
     )
 
 
+@reporting_reads("cost_reporting")
 def coverage_gaps(team: Team, *, start: datetime, end: datetime, filters: CostFilters | None = None) -> CoverageGaps:
     """The models behind the period's unpriced / no-usage warnings, so the
     panel can list which models are responsible. Single grouped query over the
@@ -905,6 +921,7 @@ def coverage_gaps(team: Team, *, start: datetime, end: datetime, filters: CostFi
     return CoverageGaps(unpriced=unpriced, unknown=unknown)
 
 
+@reporting_reads("cost_reporting")
 def cost_timeseries(
     team: Team, *, start: datetime, end: datetime, granularity: str = "daily", filters: CostFilters | None = None
 ) -> list[dict]:
@@ -935,6 +952,7 @@ def cost_timeseries(
     return list(buckets.values())
 
 
+@reporting_reads("cost_reporting")
 def usage_timeseries(
     team: Team,
     *,
@@ -981,6 +999,7 @@ def usage_timeseries(
     ]
 
 
+@reporting_reads("cost_reporting")
 def usage_by_group(
     team: Team,
     *,
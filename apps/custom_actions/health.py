@@ -0,0 +1,189 @@
+"""Health checks of the servers behind custom actions.
+
+Actions are grouped by health endpoint and each distinct endpoint is probed once, however many actions
+(e.g. in cloned teams) point at it. The probes share one pooled async client and run concurrently, at
+most ``HEALTH_CHECK_CONCURRENCY`` at a time overall and ``HEALTH_CHECK_PER_HOST_CONCURRENCY`` per host,
+with requests to a host started at least ``HEALTH_CHECK_PER_HOST_INTERVAL`` seconds apart. The outcomes
+are written back with one update per status.
+
+An endpoint that keeps failing is checked less often by the periodic check: after its n-th consecutive
+failure it sits out ``2**(n-1) - 1`` check intervals, up to ``HEALTH_CHECK_MAX_BACKOFF``, and its
+actions stay down in the meantime. The failure counts are kept in the cache.
+"""
+
+import asyncio
+import hashlib
+import logging
+import time
+from collections import defaultdict
+from dataclasses import dataclass
+from typing import cast
+from urllib.parse import urlsplit
+
+import httpx
+from asgiref.sync import async_to_sync
+from django.core.cache import cache
+from django.utils import timezone
+from field_audit.models import AuditAction
+
+from apps.custom_actions.models import CustomAction, HealthCheckStatus
+from apps.ocs_notifications.notifications import custom_action_health_check_failure_notification
+
+logger = logging.getLogger("ocs.custom_actions")
+
+# Timeout for health check requests (in seconds)
+HEALTH_CHECK_TIMEOUT = 5
+HEALTH_CHECK_CONCURRENCY = 20
+HEALTH_CHECK_PER_HOST_CONCURRENCY = 2
+HEALTH_CHECK_PER_HOST_INTERVAL = 0.2
+# How often the periodic check runs (see SCHEDULED_TASKS), which backoff is counted in
+HEALTH_CHECK_INTERVAL = 60 * 60
+HEALTH_CHECK_MAX_BACKOFF = 24 * 60 * 60
+# Leeway for the periodic check running a little early
+BACKOFF_SLACK = 5 * 60
+
+
+@dataclass(frozen=True)
+class ProbeResult:
+    status: HealthCheckStatus
+    failure_reason: str = ""
+
+
+def check_custom_actions_health(actions, respect_backoff: bool = True) -> dict[str, ProbeResult]:
+    """Check the health endpoints of the given actions and store the outcome on each action.
+
+    Actions without a health endpoint are skipped, as are (with ``respect_backoff``) those whose
+    endpoint is backing off. Team members are notified of each action that goes down. Returns the
+    outcome of each endpoint that was probed.
+    """
+    actions_by_endpoint = defaultdict(list)
+    for action in actions:
+        if endpoint := action.health_endpoint:
+            actions_by_endpoint[endpoint].append(action)
+    if respect_backoff:
+        backing_off = _get_backing_off(actions_by_endpoint)
+        actions_by_endpoint = {
+            endpoint: endpoint_actions
+            for endpoint, endpoint_actions in actions_by_endpoint.items()
+            if endpoint not in backing_off
+        }
+    if not actions_by_endpoint:
+        return {}
+
+    results = async_to_sync(probe_endpoints)(list(actions_by_endpoint))
+    _update_backoff(results)
+    _save_results(actions_by_endpoint, results)
+    return results
+
+
+async def probe_endpoints(endpoints: list[str]) -> dict[str, ProbeResult]:
+    semaphore = asyncio.Semaphore(HEALTH_CHECK_CONCURRENCY)
+    host_limiters = defaultdict(_HostLimiter)
+    limits = httpx.Limits(max_connections=HEALTH_CHECK_CONCURRENCY, max_keepalive_connections=HEALTH_CHECK_CONCURRENCY)
+    async with httpx.AsyncClient(timeout=HEALTH_CHECK_TIMEOUT, limits=limits) as client:
+
+        async def probe(endpoint):
+            # The host's limit first, so that waiting for a busy host doesn't hold up the others
+            async with host_limiters[urlsplit(endpoint).netloc], semaphore:
+                return endpoint, await _probe(client, endpoint)
+
+        return dict(await asyncio.gather(*(probe(endpoint) for endpoint in endpoints)))
+
+
+async def _probe(client: httpx.AsyncClient, endpoint: str) -> ProbeResult:
+    try:
+        response = await client.get(endpoint)
+    except (httpx.RequestError, httpx.InvalidURL) as e:
+        # An invalid URL raises before any request is made, and would otherwise fail the whole gather
+        logger.warning(f"Health check error for {endpoint}: {str(e)}")
+        return ProbeResult(HealthCheckStatus.DOWN, str(e))
+
+    # Consider 2xx status codes as "up"
+    if 200 <= response.status_code < 300:
+        logger.info(f"Health check passed for {endpoint}: {response.status_code}")
+        return ProbeResult(HealthCheckStatus.UP)
+    logger.warning(f"Health check failed for {endpoint}: {response.status_code}")
+    return ProbeResult(HealthCheckStatus.DOWN, f"HTTP {response.status_code}")
+
+
+class _HostLimiter:
+    """Limits the concurrent requests to a host and spaces out their starts."""
+
+    def __init__(self):
+        self._semaphore = asyncio.Semaphore(HEALTH_CHECK_PER_HOST_CONCURRENCY)
+        self._lock = asyncio.Lock()
+        self._next_start = 0.0
+
+    async def __aenter__(self):
+        await self._semaphore.acquire()
+        async with self._lock:
+            now = time.monotonic()
+            delay = self._next_start - now
+            self._next_start = max(now, self._next_start) + HEALTH_CHECK_PER_HOST_INTERVAL
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+    async def __aexit__(self, *exc_info):
+        self._semaphore.release()
+
+
+def _save_results(actions_by_endpoint: dict[str, list[CustomAction]], results: dict[str, ProbeResult]):
+    now = timezone.now()
+    ids_by_status = defaultdict(list)
+    gone_down = []
+    for endpoint, endpoint_actions in actions_by_endpoint.items():
+        result = results[endpoint]
+        for action in endpoint_actions:
+            # Notify team members if status changed to DOWN from a non-DOWN state
+            if result.status == HealthCheckStatus.DOWN and action.health_status != HealthCheckStatus.DOWN:
+                gone_down.append((action, result.failure_reason))
+            action.health_status = result.status
+            action.last_health_check = now
+            ids_by_status[result.status].append(action.id)
+
+    # One update per status; field_audit can't audit bulk_update, and neither field is audited anyway
+    for status, ids in ids_by_status.items():
+        CustomAction.objects.filter(id__in=ids).update(
+            health_status=status, last_health_check=now, audit_action=AuditAction.IGNORE
+        )
+    for action, failure_reason in gone_down:
+        custom_action_health_check_failure_notification(action, failure_reason)
+
+
+def _get_backing_off(endpoints) -> set[str]:
+    keys = {_backoff_key(endpoint): endpoint for endpoint in endpoints}
+    now = time.time()
+    return {
+        keys[key]
+        for key, (failures, failed_at) in _get_failures(list(keys)).items()
+        if now - failed_at + BACKOFF_SLACK < _get_backoff(failures)
+    }
+
+
+def _update_backoff(results: dict[str, ProbeResult]):
+    failing = {endpoint for endpoint, result in results.items() if result.status == HealthCheckStatus.DOWN}
+    failures = _get_failures([_backoff_key(endpoint) for endpoint in failing])
+    now = time.time()
+    new_failures: dict[str, tuple[int, float]] = {}
+    for endpoint in failing:
+        key = _backoff_key(endpoint)
+        count, _ = failures.get(key, (0, now))
+        new_failures[key] = (count + 1, now)
+    cache.set_many(new_failures, timeout=HEALTH_CHECK_MAX_BACKOFF * 2)
+    cache.delete_many([_backoff_key(endpoint) for endpoint in results if endpoint not in failing])
+
+
+def _get_failures(keys: list[str]) -> dict[str, tuple[int, float]]:
+    """The cached ``(consecutive failures, time of the last failure)`` of the endpoints with the given keys."""
+    return cast(dict[str, tuple[int, float]], cache.get_many(keys))
+
+
+def _get_backoff(failures: int) -> float:
+    """How long after its last failure an endpoint is next checked."""
+    if failures <= 1:
+        return 0
+    return min(HEALTH_CHECK_INTERVAL * 2 ** (failures - 1), HEALTH_CHECK_MAX_BACKOFF)
+
+
+def _backoff_key(endpoint: str) -> str:
+    return f"custom-action-health-backoff:{hashlib.sha256(endpoint.encode()).hexdigest()}"
@@ -1,33 +1,30 @@
 import logging
 
-import httpx
 from celery.app import shared_task
-from django.utils import timezone
 
-from apps.custom_actions.models import CustomAction, HealthCheckStatus
-from apps.ocs_notifications.notifications import custom_action_health_check_failure_notification
+from apps.custom_actions.health import check_custom_actions_health
+from apps.custom_actions.models import CustomAction
 from apps.utils.celery import Queues
 
 logger = logging.getLogger("ocs.custom_actions")
 
-# Timeout for health check requests (in seconds)
-HEALTH_CHECK_TIMEOUT = 5
-
 
 @shared_task(ignore_result=True, queue=Queues.BACKGROUND)
 def check_all_custom_actions_health():
     """Periodic task to check health of all custom actions with health endpoints configured."""
-    custom_actions = CustomAction.objects.exclude(healthcheck_path__isnull=True).exclude(healthcheck_path="")
-
-    for action in custom_actions:
-        check_single_custom_action_health.delay(action.id)
+    custom_actions = list(
+        CustomAction.objects.exclude(healthcheck_path__isnull=True)
+        .exclude(healthcheck_path="")
+        .only("id", "name", "team_id", "server_url", "healthcheck_path", "health_status")
+    )
+    results = check_custom_actions_health(custom_actions)
 
-    logger.info(f"Scheduled health checks for {custom_actions.count()} custom actions")
+    logger.info(f"Checked {len(results)} health endpoints for {len(custom_actions)} custom actions")
 
 
 @shared_task(ignore_result=True, queue=Queues.BACKGROUND)
 def check_single_custom_action_health(action_id: int):
-    """Check health of a single custom action.
+    """Check health of a single custom action, regardless of any backoff of its endpoint.
 
     Args:
         action_id: The ID of the CustomAction to check
@@ -42,32 +39,4 @@ def check_single_custom_action_health(action_id: int):
         logger.warning(f"CustomAction {action.name} (id={action_id}) has no health endpoint configured")
         return
 
-    failure_reason = ""
-    try:
-        response = httpx.get(action.health_endpoint, timeout=HEALTH_CHECK_TIMEOUT)
-
-        # Consider 2xx status codes as "up"
-        if 200 <= response.status_code < 300:
-            new_status = HealthCheckStatus.UP
-            logger.info(f"Health check passed for {action.name}: {response.status_code}")
-        else:
-            new_status = HealthCheckStatus.DOWN
-            failure_reason = f"HTTP {response.status_code}"
-            logger.warning(f"Health check failed for {action.name}: {response.status_code}")
-
-    except httpx.RequestError as e:
-        new_status = HealthCheckStatus.DOWN
-        failure_reason = str(e)
-        logger.warning(f"Health check error for {action.name}: {str(e)}")
-
-    # Notify team members if status changed to DOWN from a non-DOWN state
-    should_notify = new_status == HealthCheckStatus.DOWN and action.health_status != HealthCheckStatus.DOWN
-
-    # Update the action's health status
-    action.health_status = new_status
-    action.last_health_check = timezone.now()
-    action.save(update_fields=["health_status", "last_health_check"])
-
-    # Send notification only on DOWN transition
-    if should_notify:
-        custom_action_health_check_failure_notification(action, failure_reason)
+    check_custom_actions_health([action], respect_backoff=False)
@@ -1,7 +1,10 @@
 from unittest.mock import patch
 
+import httpx
 import pytest
+from asgiref.sync import async_to_sync
 
+from apps.custom_actions.health import ProbeResult, probe_endpoints
 from apps.custom_actions.models import HealthCheckStatus
 from apps.custom_actions.tasks import check_all_custom_actions_health, check_single_custom_action_health
 from apps.utils.factories.custom_actions import CustomActionFactory
@@ -54,9 +57,8 @@ class TestHealthCheckTask:
         assert action.health_status == initial_status
         assert action.last_health_check is None
 
-    @patch("apps.custom_actions.tasks.check_single_custom_action_health.delay")
-    def test_check_all_custom_actions_health(self, mock_delay, team_with_users):
-        """Test that custom actions with health paths are loaded."""
+    def test_check_all_custom_actions_health(self, team_with_users, httpx_mock):
+        """Test that custom actions with health paths are checked."""
         # Create custom actions: some with health paths, some without
         action_with_health_1 = CustomActionFactory.create(
             team=team_with_users,
@@ -68,15 +70,83 @@ class TestHealthCheckTask:
             healthcheck_path="/healthz",
             server_url="https://example2.com",
         )
-        CustomActionFactory.create(
+        action_without_health = CustomActionFactory.create(
             team=team_with_users,
             healthcheck_path="",
         )
+        httpx_mock.add_response(url="https://example.com/health", status_code=200)
+        httpx_mock.add_response(url="https://example2.com/healthz", status_code=503)
 
         # Run the periodic task
         check_all_custom_actions_health()
 
-        # Verify delay was called only for actions with health paths
-        assert mock_delay.call_count == 2
-        mock_delay.assert_any_call(action_with_health_1.id)
-        mock_delay.assert_any_call(action_with_health_2.id)
+        for action in (action_with_health_1, action_with_health_2, action_without_health):
+            action.refresh_from_db()
+        assert action_with_health_1.health_status == HealthCheckStatus.UP
+        assert action_with_health_2.health_status == HealthCheckStatus.DOWN
+        assert action_without_health.last_health_check is None
+
+    def test_shared_endpoint_is_probed_once(self, team_with_users, httpx_mock):
+        actions = CustomActionFactory.create_batch(
+            3, team=team_with_users, healthcheck_path="/health", server_url="https://example.com"
+        )
+        httpx_mock.add_response(url="https://example.com/health", status_code=200)
+
+        check_all_custom_actions_health()
+
+        assert len(httpx_mock.get_requests()) == 1
+        for action in actions:
+            action.refresh_from_db()
+            assert action.health_status == HealthCheckStatus.UP
+
+    @patch("apps.custom_actions.health.custom_action_health_check_failure_notification")
+    def test_failing_endpoint_backs_off(self, notify, team_with_users, httpx_mock):
+        action = CustomActionFactory.create(
+            team=team_with_users, healthcheck_path="/health", server_url="https://example.com"
+        )
+        httpx_mock.add_response(url="https://example.com/health", status_code=500, is_reusable=True)
+
+        # A first failure is retried on the next run, a second one sits the next run out
+        for _ in range(3):
+            check_all_custom_actions_health()
+
+        assert len(httpx_mock.get_requests()) == 2
+        action.refresh_from_db()
+        assert action.health_status == HealthCheckStatus.DOWN
+        # Only the transition to DOWN is notified
+        notify.assert_called_once_with(action, "HTTP 500")
+
+    def test_single_check_ignores_backoff(self, team_with_users, httpx_mock):
+        action = CustomActionFactory.create(
+            team=team_with_users, healthcheck_path="/health", server_url="https://example.com"
+        )
+        httpx_mock.add_response(url="https://example.com/health", status_code=500)
+        httpx_mock.add_response(url="https://example.com/health", status_code=500)
+        httpx_mock.add_response(url="https://example.com/health", status_code=200)
+        check_all_custom_actions_health()
+        check_all_custom_actions_health()
+
+        check_single_custom_action_health(action.id)
+
+        action.refresh_from_db()
+        assert action.health_status == HealthCheckStatus.UP
+
+
+def test_probe_endpoints(httpx_mock):
+    httpx_mock.add_response(url="https://example.com/health", status_code=200)
+    httpx_mock.add_response(url="https://example.com/status", status_code=502)
+    httpx_mock.add_exception(httpx.ConnectError("Connection refused"), url="https://down.example.com/health")
+
+    results = async_to_sync(probe_endpoints)(
+        [
+            "https://example.com/health",
+            "https://example.com/status",
+            "https://down.example.com/health",
+            "https://example.com/hea\nlth",
+        ]
+    )
+
+    assert results["https://example.com/health"] == ProbeResult(HealthCheckStatus.UP)
+    assert results["https://example.com/status"] == ProbeResult(HealthCheckStatus.DOWN, "HTTP 502")
+    assert results["https://down.example.com/health"] == ProbeResult(HealthCheckStatus.DOWN, "Connection refused")
+    assert results["https://example.com/hea\nlth"].status == HealthCheckStatus.DOWN
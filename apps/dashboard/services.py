@@ -22,6 +22,7 @@ from apps.usage_metrics.metrics import (
     conversation_messages,
     distinct_active_participants,
 )
+from apps.utils.db_routing import reporting_reads
 
 from ..trace.models import Trace
 from .models import DashboardCache
@@ -58,6 +59,7 @@ class DashboardService:
         the service API stable for the dashboard's charts and tests."""
         return filtered_querysets(self.team, **filters)
 
+    @reporting_reads("dashboard")
     def get_active_participants_data(self, granularity: str = "daily", **filters) -> list[dict[str, Any]]:
         """Get active participants chart data"""
         cache_key = f"active_participants_{granularity}_{self._cache_key(filters)}"
@@ -89,6 +91,7 @@ class DashboardService:
         DashboardCache.set_cached_data(self.team, cache_key, data)
         return data
 
+    @reporting_reads("dashboard")
     def get_session_analytics_data(self, granularity: str = "daily", **filters) -> dict[str, list[dict[str, Any]]]:
         """Get session analytics data (total sessions and unique participants)"""
         cache_key = f"session_analytics_{granularity}_{self._cache_key(filters)}"
@@ -131,6 +134,7 @@ class DashboardService:
         DashboardCache.set_cached_data(self.team, cache_key, data)
         return data
 
+    @reporting_reads("dashboard")
     def get_message_volume_data(self, granularity: str = "daily", **filters) -> dict[str, list[dict[str, Any]]]:
         """Get message volume trends (participant vs bot messages)"""
         cache_key = f"message_volume_{granularity}_{self._cache_key(filters)}"
@@ -172,6 +176,7 @@ class DashboardService:
         DashboardCache.set_cached_data(self.team, cache_key, data)
         return data
 
+    @reporting_reads("dashboard")
     def get_bot_performance_summary(
         self,
         page: int = 1,
@@ -312,6 +317,7 @@ class DashboardService:
             row["cost_per_session"] = (cost / sessions_count) if sessions_count else None
         return row
 
+    @reporting_reads("dashboard")
     def get_user_engagement_data(self, limit: int = 10, include_cost: bool = False, **filters) -> dict[str, Any]:
         """Get user engagement analysis data.
 
@@ -391,6 +397,7 @@ class DashboardService:
         DashboardCache.set_cached_data(self.team, cache_key, data)
         return data
 
+    @reporting_reads("dashboard")
     def get_channel_breakdown_data(self, **filters) -> dict[str, Any]:
         """Get channel breakdown statistics by platform"""
         cache_key = f"channel_breakdown_{self._cache_key(filters)}"
@@ -438,6 +445,7 @@ class DashboardService:
         DashboardCache.set_cached_data(self.team, cache_key, data)
         return data
 
+    @reporting_reads("dashboard")
     def get_tag_analytics_data(self, **filters) -> dict[str, Any]:
         """Get tag analytics data"""
         cache_key = f"tag_analytics_{self._cache_key(filters)}"
@@ -486,6 +494,7 @@ class DashboardService:
         DashboardCache.set_cached_data(self.team, cache_key, data)
         return data
 
+    @reporting_reads("dashboard")
     def get_average_response_time_data(self, granularity: str = "daily", **filters) -> list[dict[str, Any]]:
         """Calculate average response time per period based on Trace table"""
         cache_key = f"average_response_time_{granularity}_{self._cache_key(filters)}"
@@ -588,6 +597,7 @@ class DashboardService:
         json_str = json.dumps(normalized, separators=(",", ":"), sort_keys=True, cls=DjangoJSONEncoder)
         return hashlib.sha1(json_str.encode()).hexdigest()
 
+    @reporting_reads("dashboard")
     def get_overview_stats(self, **filters) -> dict[str, Any]:
         """Get dashboard overview statistics"""
         cache_key = f"overview_stats_{self._cache_key(filters)}"
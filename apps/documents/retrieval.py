@@ -2,6 +2,7 @@
 
 `search_collection` is the single entry point used by the chat search tools and the
 collection query preview, so both share one definition of "what retrieval means".
+`search_collections` ranks several collections the same way, with fewer round trips.
 
 When the `flag_hybrid_search` flag is inactive for a collection's team, retrieval is
 dense-only and returns exactly what it did before hybrid search existed. When it is active,
@@ -13,6 +14,7 @@ incomparable scales, so score-level fusion would need brittle per-query normaliz
 """
 
 import functools
+import itertools
 import operator
 from collections import defaultdict
 from collections.abc import Iterable, Sequence
@@ -72,7 +74,92 @@ def search_collection(
     dense_weight = collection.search_dense_weight
     scores = _rrf_scores([dense_ids, lexical_ids], weights=[dense_weight, 1 - dense_weight])
     fused_ids = _rank_by_score(scores)[:top_k]
-    return _load_chunks_in_order(fused_ids, scores)
+    return load_chunks_in_order(fused_ids, scores)
+
+
+def search_collections(
+    collections: Sequence[Collection], query: str, top_k: int = 5
+) -> dict[int, list[FileChunkEmbedding]]:
+    """`search_collection` over several collections at once: the `top_k` chunks of each one.
+
+    The query is embedded once per embedding model rather than once per collection, and the
+    rankings of all of the collections are fetched together: one statement for the dense
+    rankings, one for the lexical rankings of the collections with hybrid search, and one to load
+    the chunks. Each collection is ranked, and its rankings fused, exactly as `search_collection`
+    would rank it on its own.
+
+    Returns:
+        The chunks of each collection by collection ID, most relevant first. Only `text`,
+        `file.name` and `file.metadata` are loaded.
+    """
+    if not collections:
+        return {}
+
+    query_vectors = _get_query_vectors(collections, query)
+    hybrid = {collection.id: collection.hybrid_search_enabled for collection in collections}
+    fetch_k = {
+        collection.id: max(top_k, collection.search_fetch_k) if hybrid[collection.id] else top_k
+        for collection in collections
+    }
+    dense_ids = _ranked_ids_by_collection(
+        [
+            _dense_queryset(collection, query_vectors[collection.id], fetch_k[collection.id]).values_list(
+                "collection_id", "id", "distance"
+            )
+            for collection in collections
+        ]
+    )
+    lexical_querysets = [
+        queryset.values_list("collection_id", "id", "rank")
+        for collection in collections
+        if hybrid[collection.id]
+        and (queryset := _lexical_queryset(collection, query, fetch_k[collection.id])) is not None
+    ]
+    lexical_ids = _ranked_ids_by_collection(lexical_querysets, descending=True)
+
+    ids_by_collection = {}
+    scores = {}
+    for collection in collections:
+        dense = dense_ids.get(collection.id, [])
+        lexical = lexical_ids.get(collection.id)
+        if not lexical:
+            ids_by_collection[collection.id] = dense[:top_k]
+            continue
+        dense_weight = collection.search_dense_weight
+        collection_scores = _rrf_scores([dense, lexical], weights=[dense_weight, 1 - dense_weight])
+        ids_by_collection[collection.id] = _rank_by_score(collection_scores)[:top_k]
+        scores |= collection_scores
+    return load_chunks_by_collection(ids_by_collection, scores)
+
+
+def _get_query_vectors(collections: Sequence[Collection], query: str) -> dict[int, list[float]]:
+    """The query embedding for each collection, embedding the query once per embedding model."""
+    vectors_by_model = {}
+    vectors = {}
+    for collection in collections:
+        model_key = (collection.llm_provider_id, collection.embedding_provider_model_id)
+        if model_key not in vectors_by_model:
+            vectors_by_model[model_key] = collection.get_query_vector(query)
+        vectors[collection.id] = vectors_by_model[model_key]
+    return vectors
+
+
+def _ranked_ids_by_collection(querysets: list, descending: bool = False) -> dict[int, list[int]]:
+    """Run the `(collection_id, id, score)` querysets as one UNION ALL and group the IDs by collection.
+
+    Each branch keeps its own ORDER BY and LIMIT, so each can still use the vector index. The order
+    of the combined rows is not guaranteed, so each collection's IDs are re-sorted on the score, ties
+    breaking on ID as they do in the queries.
+    """
+    if not querysets:
+        return {}
+    first, *rest = querysets
+    rows = first.union(*rest, all=True) if rest else first
+    sign = -1 if descending else 1
+    ranked = defaultdict(list)
+    for collection_id, chunk_id, _score in sorted(rows, key=lambda row: (sign * row[2], row[1])):
+        ranked[collection_id].append(chunk_id)
+    return ranked
 
 
 def _rrf_scores(
@@ -169,22 +256,32 @@ def _lexical_candidate_ids(collection: Collection, query: str, limit: int) -> li
     its chunks were indexed with. A mismatch here matches nothing at all, and looks exactly like
     a query with no lexical hits.
     """
+    queryset = _lexical_queryset(collection, query, limit)
+    if queryset is None:
+        return []
+    return list(queryset.values_list("id", flat=True))
+
+
+def _lexical_queryset(collection: Collection, query: str, limit: int):
+    """Chunks matching `query` lexically, annotated with their `rank`, best first.
+
+    Returns None when the query has no searchable terms.
+    """
     search_query = _lexical_search_query(query, collection.search_language)
     if search_query is None:
-        return []
+        return None
 
-    return list(
+    return (
         FileChunkEmbedding.objects.filter(collection_id=collection.id)
         .filter(chunk_from_indexed_file())
         .filter(search_vector=search_query)
         # ts_rank_cd (cover density) rewards matches that occur close together.
         .annotate(rank=SearchRank(F("search_vector"), search_query, cover_density=True))
-        .order_by("-rank", "id")
-        .values_list("id", flat=True)[:limit]
+        .order_by("-rank", "id")[:limit]
     )
 
 
-def _load_chunks_in_order(chunk_ids: Iterable[int], scores: dict[int, float] | None = None) -> list[FileChunkEmbedding]:
+def load_chunks_in_order(chunk_ids: Iterable[int], scores: dict[int, float] | None = None) -> list[FileChunkEmbedding]:
     """Fetch chunks by ID, preserving the given order.
 
     Postgres does not guarantee ordering for an `id__in` lookup, so the fused ranking is
@@ -206,3 +303,16 @@ def _load_chunks_in_order(chunk_ids: Iterable[int], scores: dict[int, float] | N
     for chunk in ordered:
         chunk.fused_score = (scores or {}).get(chunk.id)
     return ordered
+
+
+def load_chunks_by_collection(
+    ids_by_collection: dict[int, list[int]], scores: dict[int, float] | None = None
+) -> dict[int, list[FileChunkEmbedding]]:
+    """`load_chunks_in_order` for the chunks of several collections, with one query."""
+    chunks_by_id = {
+        chunk.id: chunk for chunk in load_chunks_in_order(itertools.chain(*ids_by_collection.values()), scores)
+    }
+    return {
+        collection_id: [chunks_by_id[chunk_id] for chunk_id in chunk_ids if chunk_id in chunks_by_id]
+        for collection_id, chunk_ids in ids_by_collection.items()
+    }
@@ -0,0 +1,113 @@
+"""Cache of collection search results for the chat search tools.
+
+Bots get asked the same questions over and over, within a session and across participants, and every
+search would otherwise embed the query (a provider round trip) and run the dense and lexical queries
+again. `search_collections_cached` stores the ranked chunk IDs of each collection's search in the
+shared cache, keyed on the collection, the normalized query, ``top_k`` and every setting that changes
+the ranking, so a hit costs a single primary-key query to load the chunks.
+
+Published collection versions never change, but the working version can be re-indexed. Each collection
+has a generation token that is part of every key; `invalidate_search_cache` replaces it whenever the
+collection's chunks change, which orphans the old entries until their TTL
+(``DOCUMENT_SEARCH_CACHE_TTL``) runs out. A generation token that has been evicted is replaced rather
+than assumed, so eviction can only cause misses, never stale results.
+"""
+
+import hashlib
+import json
+import uuid
+from collections.abc import Sequence
+
+from django.conf import settings
+from django.core.cache import cache
+
+from apps.documents.models import Collection
+from apps.documents.retrieval import load_chunks_by_collection, search_collections
+from apps.files.models import FileChunkEmbedding
+
+CACHE_KEY_VERSION = 1
+
+
+def search_collection_cached(
+    collection: Collection, query: str, top_k: int = 5
+) -> tuple[list[FileChunkEmbedding], bool]:
+    """`search_collection`, reusing the results of an earlier identical search where possible.
+
+    Returns:
+        The chunks, most relevant first, and whether they came from the cache.
+    """
+    results, cache_hits = search_collections_cached([collection], query, top_k)
+    return results[collection.id], collection.id in cache_hits
+
+
+def search_collections_cached(
+    collections: Sequence[Collection], query: str, top_k: int = 5
+) -> tuple[dict[int, list[FileChunkEmbedding]], set[int]]:
+    """`search_collections`, only searching the collections whose results aren't cached.
+
+    Returns:
+        The chunks of each collection by collection ID, and the IDs of the collections whose
+        results came from the cache.
+    """
+    if not settings.DOCUMENT_SEARCH_CACHE_TTL:
+        return search_collections(collections, query, top_k=top_k), set()
+
+    cache_keys = {collection.id: get_cache_key(collection, query, top_k) for collection in collections}
+    cached = cache.get_many(list(cache_keys.values()))
+    cached_ids = {
+        collection_id: cached[cache_key] for collection_id, cache_key in cache_keys.items() if cache_key in cached
+    }
+
+    uncached = [collection for collection in collections if collection.id not in cached_ids]
+    results = search_collections(uncached, query, top_k=top_k)
+    if results:
+        cache.set_many(
+            {cache_keys[collection_id]: [chunk.id for chunk in chunks] for collection_id, chunks in results.items()},
+            settings.DOCUMENT_SEARCH_CACHE_TTL,
+        )
+    return load_chunks_by_collection(cached_ids) | results, set(cached_ids)
+
+
+def invalidate_search_cache(collection_id: int):
+    """Stop serving cached results for the collection. Call this whenever its chunks change."""
+    cache.set(_generation_key(collection_id), uuid.uuid4().hex, timeout=None)
+
+
+def get_cache_key(collection: Collection, query: str, top_k: int) -> str:
+    hybrid = collection.hybrid_search_enabled
+    key_data = {
+        "version": CACHE_KEY_VERSION,
+        "collection_id": collection.id,
+        "generation": _get_generation(collection.id),
+        "embedding_model_id": collection.embedding_provider_model_id,
+        "query": normalize_query(query),
+        "top_k": top_k,
+        "hybrid": hybrid,
+    }
+    if hybrid:
+        key_data |= {
+            "search_language": collection.search_language,
+            "dense_weight": collection.search_dense_weight,
+            "fetch_k": collection.search_fetch_k,
+            "rrf_k": settings.DOCUMENT_SEARCH_RRF_K,
+        }
+    digest = hashlib.sha256(json.dumps(key_data, sort_keys=True).encode()).hexdigest()
+    return f"collection-search:{collection.id}:{digest}"
+
+
+def normalize_query(query: str) -> str:
+    """Queries that differ only in case or whitespace share an entry."""
+    return " ".join(query.split()).casefold()
+
+
+def _get_generation(collection_id: int) -> str:
+    key = _generation_key(collection_id)
+    if generation := cache.get(key):
+        return generation
+    cache.add(key, uuid.uuid4().hex, timeout=None)
+    # Another worker may have added one first
+    return cache.get(key)
+
+
+def _generation_key(collection_id: int) -> str:
+    return f"collection-search-generation:{collection_id}"
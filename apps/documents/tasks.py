@@ -30,6 +30,7 @@ from apps.documents.models import (
     DocumentSource,
     FileStatus,
 )
+from apps.documents.search_cache import invalidate_search_cache
 from apps.documents.utils import bulk_delete_collection_files
 from apps.files.models import File, FilePurpose
 from apps.service_providers.models import LlmProvider
@@ -102,6 +103,7 @@ def index_collection_files(collection_files_queryset: QuerySet[CollectionFile])
             chunk_overlap=strategy.chunk_overlap,
         )
 
+    invalidate_search_cache(collection.id)
     return previous_remote_file_ids
 
 
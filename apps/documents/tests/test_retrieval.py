@@ -7,7 +7,13 @@ from django.template.loader import render_to_string
 from waffle.testutils import override_flag
 
 from apps.documents.models import CollectionFile, FileStatus, SearchLanguage
-from apps.documents.retrieval import _lexical_candidate_ids, _rank_by_score, _rrf_scores, search_collection
+from apps.documents.retrieval import (
+    _lexical_candidate_ids,
+    _rank_by_score,
+    _rrf_scores,
+    search_collection,
+    search_collections,
+)
 from apps.service_providers.llm_service.index_managers import LocalIndexManager
 from apps.utils.factories.documents import CollectionFactory
 from apps.utils.factories.files import FileChunkEmbeddingFactory, FileFactory
@@ -312,6 +318,54 @@ class TestSearchCollection:
         assert collection.search_fetch_k == 40
 
 
+@pytest.mark.django_db()
+class TestSearchCollections:
+    def test_each_collection_is_ranked_as_it_would_be_on_its_own(self):
+        # No lexical match in the first collection, so it falls back to the dense ranking
+        dense_only, dense_file = _make_indexed_collection()
+        near = _add_chunk(dense_only, dense_file, "totally unrelated prose", _unit_vector(0))
+        _add_chunk(dense_only, dense_file, "more unrelated prose", _unit_vector(1))
+        hybrid, hybrid_file = _make_indexed_collection()
+        _add_chunk(hybrid, hybrid_file, "totally unrelated prose", _unit_vector(0))
+        keyword_hit = _add_chunk(hybrid, hybrid_file, "the quokka is a small macropod", _unit_vector(1))
+
+        with mock.patch.object(type(hybrid), "get_query_vector", return_value=_unit_vector(0)):
+            with override_flag(HYBRID_FLAG, active=True):
+                results = search_collections([dense_only, hybrid], "quokka", top_k=1)
+                expected = {
+                    collection.id: search_collection(collection, "quokka", top_k=1)
+                    for collection in [dense_only, hybrid]
+                }
+
+        assert [chunk.id for chunk in results[dense_only.id]] == [near.id]
+        assert [chunk.id for chunk in results[hybrid.id]] == [keyword_hit.id]
+        assert {collection_id: [chunk.id for chunk in chunks] for collection_id, chunks in results.items()} == {
+            collection_id: [chunk.id for chunk in chunks] for collection_id, chunks in expected.items()
+        }
+
+    def test_the_query_is_embedded_once_per_embedding_model(self):
+        collection, file = _make_indexed_collection()
+        _add_chunk(collection, file, "quokka facts", _unit_vector(0))
+        same_model = CollectionFactory.create(
+            team=collection.team,
+            llm_provider=collection.llm_provider,
+            embedding_provider_model=collection.embedding_provider_model,
+            is_index=True,
+        )
+        other_model, _file = _make_indexed_collection()
+
+        with mock.patch.object(type(collection), "get_query_vector", return_value=_unit_vector(0)) as embed:
+            with override_flag(HYBRID_FLAG, active=False):
+                results = search_collections([collection, same_model, other_model], "quokka", top_k=5)
+
+        assert embed.call_count == 2
+        assert len(results[collection.id]) == 1
+        assert results[same_model.id] == results[other_model.id] == []
+
+    def test_no_collections(self):
+        assert search_collections([], "quokka") == {}
+
+
 @pytest.mark.django_db()
 class TestLexicalSearchLanguage:
     """The configuration used to build a chunk's vector and to parse the query must agree, and it
@@ -0,0 +1,103 @@
+from unittest import mock
+
+import pytest
+from django.conf import settings
+from django.test import override_settings
+
+from apps.documents.models import Collection, CollectionFile, FileStatus
+from apps.documents.search_cache import (
+    invalidate_search_cache,
+    normalize_query,
+    search_collection_cached,
+    search_collections_cached,
+)
+from apps.utils.factories.documents import CollectionFactory
+from apps.utils.factories.files import FileChunkEmbeddingFactory, FileFactory
+
+
+def _unit_vector(index: int) -> list[float]:
+    vector = [0.0] * settings.EMBEDDING_VECTOR_SIZE
+    vector[index] = 1.0
+    return vector
+
+
+@pytest.fixture()
+def collection():
+    collection = CollectionFactory.create(is_index=True, is_remote_index=False)
+    file = FileFactory.create(team=collection.team)
+    CollectionFile.objects.create(collection=collection, file=file, status=FileStatus.COMPLETED)
+    for index, text in enumerate(["Apples are great", "Oranges are nice"]):
+        FileChunkEmbeddingFactory.create(
+            team=collection.team, collection=collection, file=file, text=text, embedding=_unit_vector(index)
+        )
+    return collection
+
+
+@pytest.fixture()
+def get_query_vector():
+    with mock.patch.object(Collection, "get_query_vector", return_value=_unit_vector(0)) as get_query_vector:
+        yield get_query_vector
+
+
+def test_queries_are_normalized():
+    assert normalize_query("  What are\n great   FRUIT? ") == "what are great fruit?"
+
+
+@pytest.mark.django_db()
+def test_repeated_searches_are_served_from_the_cache(collection, get_query_vector):
+    chunks, hit = search_collection_cached(collection, "What are great fruit?", top_k=2)
+    assert not hit
+
+    cached_chunks, hit = search_collection_cached(collection, "what are  great fruit?", top_k=2)
+    assert hit
+    assert [chunk.text for chunk in chunks] == ["Apples are great", "Oranges are nice"]
+    assert [chunk.id for chunk in cached_chunks] == [chunk.id for chunk in chunks]
+    assert get_query_vector.call_count == 1
+
+
+@pytest.mark.django_db()
+def test_a_different_top_k_is_not_served_from_the_cache(collection, get_query_vector):
+    search_collection_cached(collection, "fruit", top_k=2)
+
+    chunks, hit = search_collection_cached(collection, "fruit", top_k=1)
+    assert not hit
+    assert len(chunks) == 1
+
+
+@pytest.mark.django_db()
+def test_reindexing_invalidates_the_cache(collection, get_query_vector):
+    search_collection_cached(collection, "fruit", top_k=2)
+
+    invalidate_search_cache(collection.id)
+
+    _chunks, hit = search_collection_cached(collection, "fruit", top_k=2)
+    assert not hit
+
+
+@pytest.mark.django_db()
+@override_settings(DOCUMENT_SEARCH_CACHE_TTL=0)
+def test_the_cache_can_be_disabled(collection, get_query_vector):
+    search_collection_cached(collection, "fruit", top_k=2)
+
+    _chunks, hit = search_collection_cached(collection, "fruit", top_k=2)
+    assert not hit
+    assert get_query_vector.call_count == 2
+
+
+@pytest.mark.django_db()
+def test_only_the_uncached_collections_are_searched(collection, get_query_vector):
+    other = CollectionFactory.create(
+        team=collection.team,
+        embedding_provider_model=collection.embedding_provider_model,
+        is_index=True,
+        is_remote_index=False,
+    )
+    search_collection_cached(collection, "fruit", top_k=2)
+
+    with mock.patch("apps.documents.search_cache.search_collections", return_value={other.id: []}) as search:
+        results, hits = search_collections_cached([collection, other], "fruit", top_k=2)
+
+    search.assert_called_once_with([other], "fruit", top_k=2)
+    assert hits == {collection.id}
+    assert [chunk.text for chunk in results[collection.id]] == ["Apples are great", "Oranges are nice"]
+    assert results[other.id] == []
@@ -1,4 +1,5 @@
 from apps.documents.models import Collection, CollectionFile
+from apps.documents.search_cache import invalidate_search_cache
 from apps.files.models import File
 from apps.utils.deletion import get_related_m2m_objects
 
@@ -23,6 +24,9 @@ def delete_collection_file(collection_file: CollectionFile):
 
         file.delete_or_archive()
 
+    if collection.is_index:
+        invalidate_search_cache(collection.id)
+
 
 def bulk_delete_collection_files(
     collection: Collection, collection_files: list[CollectionFile], is_index_deletion=False
@@ -65,3 +69,6 @@ def bulk_delete_collection_files(
             File.objects.get_all().filter(id__in=to_delete).delete()
         if files_with_versions:
             File.objects.filter(id__in=files_with_versions).update(is_archived=True)
+
+    if collection.is_index:
+        invalidate_search_cache(collection.id)
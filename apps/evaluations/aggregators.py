@@ -1,8 +1,13 @@
+import math
 from abc import ABC, abstractmethod
 from collections import Counter
-from statistics import mean, median, stdev
+from fractions import Fraction
 from typing import Any, ClassVar
 
+# A histogram of values, as ``(value, count)`` pairs. Pairs rather than a dict, since values that are
+# equal as dict keys (e.g. ``1`` and ``True``) may still have to be told apart.
+ValueCounts = list[tuple[Any, int]]
+
 
 class BaseAggregator(ABC):
     """Base class for all aggregators."""
@@ -12,9 +17,14 @@ class BaseAggregator(ABC):
     applies_to: ClassVar[tuple[type, ...]]
 
     @classmethod
-    @abstractmethod
     def compute(cls, values: list) -> Any:
         """Compute the aggregation for a list of values."""
+        return cls.compute_counts([(value, 1) for value in values])
+
+    @classmethod
+    @abstractmethod
+    def compute_counts(cls, value_counts: ValueCounts) -> Any:
+        """Compute the aggregation for a histogram of values, without expanding it."""
         pass
 
     @classmethod
@@ -43,42 +53,50 @@ class MeanAggregator(BaseNumericAggregator):
     name = "mean"
 
     @classmethod
-    def compute(cls, values: list) -> float:
-        return round(mean(values), 4)
+    def compute_counts(cls, value_counts: ValueCounts) -> float:
+        return round(float(_mean(value_counts)), 4)
 
 
 class MedianAggregator(BaseNumericAggregator):
     name = "median"
 
     @classmethod
-    def compute(cls, values: list) -> float:
-        return round(median(values), 4)
+    def compute_counts(cls, value_counts: ValueCounts) -> float:
+        ordered = sorted(value_counts, key=lambda value_count: value_count[0])
+        total = _total(value_counts)
+        middle = _nth_value(ordered, total // 2)
+        if total % 2:
+            return round(middle, 4)
+        return round((_nth_value(ordered, total // 2 - 1) + middle) / 2, 4)
 
 
 class MinAggregator(BaseNumericAggregator):
     name = "min"
 
     @classmethod
-    def compute(cls, values: list) -> float:
-        return min(values)
+    def compute_counts(cls, value_counts: ValueCounts) -> float:
+        return min(value for value, _ in value_counts)
 
 
 class MaxAggregator(BaseNumericAggregator):
     name = "max"
 
     @classmethod
-    def compute(cls, values: list) -> float:
-        return max(values)
+    def compute_counts(cls, value_counts: ValueCounts) -> float:
+        return max(value for value, _ in value_counts)
 
 
 class StdDevAggregator(BaseNumericAggregator):
     name = "std_dev"
 
     @classmethod
-    def compute(cls, values: list) -> float | None:
-        if len(values) < 2:
+    def compute_counts(cls, value_counts: ValueCounts) -> float | None:
+        total = _total(value_counts)
+        if total < 2:
             return None
-        return round(stdev(values), 4)
+        mean = _mean(value_counts)
+        squares = sum((Fraction(value) - mean) ** 2 * count for value, count in value_counts)
+        return round(math.sqrt(squares / (total - 1)), 4)
 
 
 NUMERIC_AGGREGATORS: list[type[BaseAggregator]] = [
@@ -94,20 +112,19 @@ class DistributionAggregator(BaseCategoricalAggregator):
     name = "distribution"
 
     @classmethod
-    def compute(cls, values: list) -> dict[str, float]:
-        counter = Counter(values)
-        total = len(values)
-        return {str(k): round(v / total * 100, 1) for k, v in counter.most_common()}
+    def compute_counts(cls, value_counts: ValueCounts) -> dict[str, float]:
+        total = _total(value_counts)
+        return {str(k): round(v / total * 100, 1) for k, v in _counter(value_counts).most_common()}
 
 
 class ModeAggregator(BaseCategoricalAggregator):
     name = "mode"
 
     @classmethod
-    def compute(cls, values: list) -> str | None:
-        if not values:
+    def compute_counts(cls, value_counts: ValueCounts) -> str | None:
+        if not value_counts:
             return None
-        return str(Counter(values).most_common(1)[0][0])
+        return str(_counter(value_counts).most_common(1)[0][0])
 
 
 CATEGORICAL_AGGREGATORS: list[type[BaseAggregator]] = [
@@ -125,27 +142,30 @@ def get_aggregators_for_value(value: Any) -> list[type[BaseAggregator]]:
 
 def aggregate_field(values: list) -> dict:
     """Aggregate a list of values using all applicable aggregators."""
-    if not values:
-        return {}
+    return aggregate_field_counts([(value, 1) for value in values])
+
 
+def aggregate_field_counts(value_counts: ValueCounts) -> dict:
+    """Aggregate a histogram of values using all applicable aggregators. Equivalent to `aggregate_field`
+    on the expanded values."""
     # Filter out None values
-    filtered = [v for v in values if v is not None]
+    filtered = [(v, count) for v, count in value_counts if v is not None and count > 0]
     if not filtered:
         return {}
 
-    sample = filtered[0]
+    sample = filtered[0][0]
     aggregators = get_aggregators_for_value(sample)
     if not aggregators:
-        return {"count": len(filtered)}
+        return {"count": _total(filtered)}
 
     # Filter to only values matching the determined type
-    filtered = [v for v in filtered if aggregators[0].accepts(v)]
+    filtered = [(v, count) for v, count in filtered if aggregators[0].accepts(v)]
     if not filtered:
         return {}
 
-    result = {"type": aggregators[0].field_type, "count": len(filtered)}
+    result = {"type": aggregators[0].field_type, "count": _total(filtered)}
     for agg in aggregators:
-        computed = agg.compute(filtered)
+        computed = agg.compute_counts(filtered)
         if computed is not None:
             result[agg.name] = computed
 
@@ -159,14 +179,46 @@ def aggregate_binary_field(values: list) -> dict:
     from count/mean/true_count and reported as excluded_count when present -
     annotation data is not schema-constrained outside the form.
     """
-    present = [v for v in values if v is not None]
-    counted = [int(v) for v in present if v in (0, 1)]
-
-    result = {"type": "binary", "count": len(counted)}
-    if counted:
-        result["mean"] = round(sum(counted) / len(counted), 4)
-        result["true_count"] = sum(counted)
-    excluded = len(present) - len(counted)
+    return aggregate_binary_field_counts([(value, 1) for value in values])
+
+
+def aggregate_binary_field_counts(value_counts: ValueCounts) -> dict:
+    """`aggregate_binary_field` for a histogram of values."""
+    present = [(v, count) for v, count in value_counts if v is not None]
+    counted = [(int(v), count) for v, count in present if v in (0, 1)]
+
+    total = _total(counted)
+    result = {"type": "binary", "count": total}
+    if total:
+        true_count = sum(v * count for v, count in counted)
+        result["mean"] = round(true_count / total, 4)
+        result["true_count"] = true_count
+    excluded = _total(present) - total
     if excluded:
         result["excluded_count"] = excluded
     return result
+
+
+def _total(value_counts: ValueCounts) -> int:
+    return sum(count for _, count in value_counts)
+
+
+def _counter(value_counts: ValueCounts) -> Counter:
+    counter = Counter()
+    for value, count in value_counts:
+        counter[value] += count
+    return counter
+
+
+def _mean(value_counts: ValueCounts) -> Fraction:
+    # Exact, like `statistics.mean`, so that large counts don't accumulate rounding errors
+    return sum((Fraction(value) * count for value, count in value_counts), Fraction(0)) / _total(value_counts)
+
+
+def _nth_value(ordered: ValueCounts, index: int):
+    """The value at `index` of the expanded histogram, whose values are in order."""
+    for value, count in ordered:
+        if index < count:
+            return value
+        index -= count
+    raise IndexError(index)
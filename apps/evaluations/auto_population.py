@@ -4,7 +4,7 @@ from celery import shared_task
 from celery.utils.log import get_task_logger
 from django.conf import settings
 from django.db import transaction
-from django.db.models import F
+from django.db.models import Exists, F, OuterRef, Q
 from django.http import QueryDict
 from django.utils import timezone
 
@@ -13,12 +13,14 @@ from apps.evaluations.models import (
     DatasetAutoPopulationRule,
     EvaluationConfig,
     EvaluationDataset,
+    EvaluationMessage,
     EvaluationRunType,
 )
 from apps.evaluations.notifications import auto_population_rule_disabled_notification
 from apps.evaluations.utils import iter_session_evaluation_messages_for_sessions
 from apps.experiments.filters import ExperimentSessionFilter
 from apps.experiments.models import ExperimentSession
+from apps.teams.utils import current_team
 from apps.utils.celery import Queues
 from apps.web.dynamic_filters.datastructures import FilterParams
 
@@ -60,25 +62,51 @@ def _handle_rule_failure(rule: DatasetAutoPopulationRule, exception: Exception)
 def _scan_for_new_sessions(rule: DatasetAutoPopulationRule, created_floor) -> list[int]:
     """Find new sessions matching the rule's filter and append them to the dataset.
 
-    Returns the ids of the newly created EvaluationMessage rows. Messages are streamed rather
-    than materialised: a rule's first tick spans EVALUATIONS_AUTO_POPULATION_LOOKBACK_DAYS and
-    can therefore match as many sessions as a bulk clone would.
+    Returns the ids of the newly created EvaluationMessage rows, and moves the rule's
+    (created_at, id) watermark up to the newest session scanned (the caller saves it).
+
+    Each tick only looks at the next EVALUATIONS_AUTO_POPULATION_BATCH_SIZE sessions past the
+    watermark, so its cost follows the new traffic rather than the history of the source bot.
+    A session can start matching the filter after it was scanned (it gets more messages, a tag,
+    ...), so the sessions within EVALUATIONS_AUTO_POPULATION_OVERLAP_HOURS behind the watermark
+    are re-checked as well; matches that arrive later than that are not picked up. A rule
+    without a watermark starts at `created_floor`.
 
     Note this runs inside the per-rule transaction opened by auto_populate_eval_datasets, so
     add_messages_stream's per-batch commits degrade to savepoints here and the whole tick stays
-    one transaction. That is fine for incremental ticks, and memory stays bounded regardless.
+    one transaction. The batch size bounds how long that transaction, and the rule's lock, are held.
     """
-    qs = ExperimentSession.objects.filter(
+    sessions = ExperimentSession.objects.filter(
         team=rule.team,
         experiment=rule.source_experiment,
         created_at__gt=created_floor,
-    ).exclude(id__in=rule.dataset.messages.filter(session__isnull=False).values_list("session_id", flat=True))
+    )
+    watermark_at, watermark_id = rule.watermark_created_at, rule.watermark_session_id
+    past_watermark = Q()
+    if watermark_at is not None:
+        past_watermark = Q(created_at__gt=watermark_at) | Q(created_at=watermark_at, id__gt=watermark_id)
+
+    batch_size = settings.EVALUATIONS_AUTO_POPULATION_BATCH_SIZE
+    batch = list(
+        sessions.filter(past_watermark).order_by("created_at", "id").values_list("created_at", "id")[:batch_size]
+    )
+    to_scan = Q(id__in=[session_id for _created_at, session_id in batch])
+    if watermark_at is not None:
+        overlap_floor = watermark_at - timedelta(hours=settings.EVALUATIONS_AUTO_POPULATION_OVERLAP_HOURS)
+        to_scan |= Q(created_at__gte=overlap_floor) & ~past_watermark
+
+    already_ingested = EvaluationMessage.objects.filter(evaluationdataset=rule.dataset_id, session_id=OuterRef("id"))
+    qs = sessions.filter(to_scan).exclude(Exists(already_ingested))
 
     if rule.filter_query_string:
         params = FilterParams(QueryDict(rule.filter_query_string))
-        qs = ExperimentSessionFilter().apply(qs, params, timezone=None)
+        # The filters resolve tag names among the current team's tags
+        with current_team(rule.team):
+            qs = ExperimentSessionFilter().apply(qs, params, timezone=None)
 
     created_ids, _ = rule.dataset.add_messages_stream(iter_session_evaluation_messages_for_sessions(qs))
+    if batch:
+        rule.watermark_created_at, rule.watermark_session_id = batch[-1]
     return created_ids
 
 
@@ -104,7 +132,16 @@ def _ingest_rule(rule: DatasetAutoPopulationRule) -> list[int]:
     rule.last_run_status = AutoPopulationRunStatus.SUCCESS if appended else AutoPopulationRunStatus.NO_OP
     rule.consecutive_failure_count = 0
     rule.last_error = ""
-    rule.save(update_fields=["last_run_at", "last_run_status", "consecutive_failure_count", "last_error"])
+    rule.save(
+        update_fields=[
+            "last_run_at",
+            "last_run_status",
+            "consecutive_failure_count",
+            "last_error",
+            "watermark_created_at",
+            "watermark_session_id",
+        ]
+    )
 
     if appended:
         transaction.on_commit(lambda: _trigger_delta_runs_for_dataset(dataset, appended))
@@ -1226,6 +1226,9 @@ class DatasetAutoPopulationRuleForm(forms.ModelForm):
         instance = super().save(commit=False)
         instance.team = self.team
         instance.dataset = self.dataset
+        if {"source_experiment", "filter_query_string"} & set(self.changed_data):
+            # Sessions the rule has already scanned may match the new criteria
+            instance.reset_watermark()
         if commit:
             instance.save()
         return instance
@@ -0,0 +1,23 @@
+# Generated by Django 5.2.16 on 2026-10-18 23:26
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('evaluations', '0021_strip_evaluator_llm_provider_params'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='datasetautopopulationrule',
+            name='watermark_created_at',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='datasetautopopulationrule',
+            name='watermark_session_id',
+            field=models.BigIntegerField(blank=True, null=True),
+        ),
+    ]
@@ -541,6 +541,9 @@ class DatasetAutoPopulationRule(BaseTeamModel):
     last_run_status = models.CharField(max_length=10, choices=AutoPopulationRunStatus.choices, blank=True)
     last_error = models.TextField(blank=True)
     consecutive_failure_count = models.PositiveSmallIntegerField(default=0)
+    # (created_at, id) of the newest source session the rule has scanned
+    watermark_created_at = models.DateTimeField(null=True, blank=True)
+    watermark_session_id = models.BigIntegerField(null=True, blank=True)
 
     class Meta:
         indexes = [models.Index(fields=["is_enabled", "last_run_at"])]
@@ -557,6 +560,11 @@ class DatasetAutoPopulationRule(BaseTeamModel):
         if self.team_id and self.source_experiment_id and self.source_experiment.team_id != self.team_id:
             raise ValidationError({"source_experiment": "Source chatbot must belong to the same team as the rule."})
 
+    def reset_watermark(self):
+        """Scan the source experiment from the start of the lookback window again on the next tick."""
+        self.watermark_created_at = None
+        self.watermark_session_id = None
+
     def get_absolute_url(self):
         return reverse(
             "evaluations:auto_population_rule_edit",
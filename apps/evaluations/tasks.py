@@ -51,8 +51,9 @@ from apps.evaluations.utils import (
 from apps.experiments.models import Experiment, ExperimentSession, Participant
 from apps.files.models import File, FilePurpose
 from apps.teams.models import Team
-from apps.teams.utils import current_team
+from apps.teams.utils import current_team, get_message_search_language
 from apps.utils.celery import Queues
+from apps.utils.retention import RetentionPolicy, run_retention_policy
 from apps.web.dynamic_filters.datastructures import FilterParams
 
 EVAL_SESSIONS_TTL_DAYS = 30
@@ -719,6 +720,8 @@ def _create_message_history(chat: Chat, history: list[dict]) -> None:
     # Set explicit timestamps with incremental offsets to ensure proper chronological ordering
     # when messages are retrieved with order_by("created_at")
     base_time = timezone.now() - timedelta(seconds=len(history))
+    # bulk_create bypasses `ChatMessage.save`, which sets the language the message is indexed with
+    search_language = get_message_search_language(chat.team_id)
     history_messages = [
         ChatMessage(
             chat=chat,
@@ -726,48 +729,45 @@ def _create_message_history(chat: Chat, history: list[dict]) -> None:
             content=history_entry.get("content", ""),
             summary=history_entry.get("summary"),
             created_at=base_time + timedelta(seconds=idx),
+            search_language=search_language,
         )
         for idx, history_entry in enumerate(history)
     ]
     ChatMessage.objects.bulk_create(history_messages)
+    Chat.objects.refresh_message_counters([chat.id])
 
 
 @shared_task(queue=Queues.BACKGROUND)
 def cleanup_old_evaluation_data() -> None:
     """Delete ExperimentSessions that were created during evaluation runs and
-    are older than one week.
-
+    are older than EVAL_SESSIONS_TTL_DAYS.
     """
-    one_week_ago = timezone.now() - timedelta(days=EVAL_SESSIONS_TTL_DAYS)
-    old_evaluation_sessions = ExperimentSession.objects.filter(
-        experiment_channel__platform=ChannelPlatform.EVALUATIONS, created_at__lt=one_week_ago
-    )
 
-    sessions_count = old_evaluation_sessions.count()
-    if sessions_count == 0:
-        logger.info("No old evaluation sessions found to cleanup")
-        return
-    # Delete via Chat rather than ExperimentSession so the cascade also removes
-    # ChatMessage records. ExperimentSession.chat is a OneToOneField with
-    # on_delete=CASCADE, so deleting the Chat cascades to the session as well.
-    deleted_chats = Chat.objects.filter(experiment_session__in=old_evaluation_sessions).delete()
+    def get_queryset():
+        old_evaluation_sessions = ExperimentSession.objects.filter(
+            experiment_channel__platform=ChannelPlatform.EVALUATIONS,
+            created_at__lt=timezone.now() - timedelta(days=EVAL_SESSIONS_TTL_DAYS),
+        )
+        # Delete via Chat rather than ExperimentSession so the cascade also removes
+        # ChatMessage records. ExperimentSession.chat is a OneToOneField with
+        # on_delete=CASCADE, so deleting the Chat cascades to the session as well.
+        return Chat.objects.filter(experiment_session__in=old_evaluation_sessions)
 
-    logger.info(f"Cleanup completed: deleted {deleted_chats[0]} chat records and associated evaluation sessions")
+    # Small batches: every chat cascades to all of its messages
+    run_retention_policy(RetentionPolicy(name="old_evaluation_sessions", get_queryset=get_queryset, batch_size=100))
 
 
 @shared_task(queue=Queues.BACKGROUND)
 def cleanup_old_preview_evaluation_runs() -> None:
     """Delete preview evaluation runs older than 1 day"""
-    one_day_ago = timezone.now() - timedelta(days=1)
-    old_preview_runs = EvaluationRun.objects.filter(type=EvaluationRunType.PREVIEW, created_at__lt=one_day_ago)
-
-    preview_runs_count = old_preview_runs.count()
-    if preview_runs_count == 0:
-        logger.info("No old preview evaluation runs found to cleanup")
-        return
-
-    deleted_preview_runs = old_preview_runs.delete()
-    logger.info(f"Cleanup completed: deleted {deleted_preview_runs[0]} preview evaluation runs")
+    run_retention_policy(
+        RetentionPolicy(
+            name="old_preview_evaluation_runs",
+            get_queryset=lambda: EvaluationRun.objects.filter(
+                type=EvaluationRunType.PREVIEW, created_at__lt=timezone.now() - timedelta(days=1)
+            ),
+        )
+    )
 
 
 @shared_task(bind=True, queue=Queues.BACKGROUND)
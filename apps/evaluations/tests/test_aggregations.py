@@ -1,7 +1,15 @@
+import statistics
+
 import pytest
 
 from apps.evaluations.aggregation import compute_aggregates_for_run
-from apps.evaluations.aggregators import aggregate_binary_field, aggregate_field, get_aggregators_for_value
+from apps.evaluations.aggregators import (
+    aggregate_binary_field,
+    aggregate_binary_field_counts,
+    aggregate_field,
+    aggregate_field_counts,
+    get_aggregators_for_value,
+)
 from apps.evaluations.models import EvaluationRunStatus
 from apps.evaluations.utils import build_trend_data
 from apps.utils.factories.evaluations import (
@@ -37,6 +45,20 @@ class TestAggregators:
         assert result["min"] == 1
         assert result["max"] == 5
 
+    @pytest.mark.parametrize("value_counts", [[(3, 2), (1, 1), (2.5, 4)], [(5, 1), (1, 3)], [(0.1, 1000), (7, 1)]])
+    def test_aggregate_field_counts_matches_the_statistics_of_the_expanded_values(self, value_counts):
+        values = [value for value, count in value_counts for _ in range(count)]
+        result = aggregate_field_counts(value_counts)
+        assert result["count"] == len(values)
+        assert result["mean"] == round(statistics.mean(values), 4)
+        assert result["median"] == round(statistics.median(values), 4)
+        assert result["std_dev"] == round(statistics.stdev(values), 4)
+        assert (result["min"], result["max"]) == (min(values), max(values))
+
+    def test_aggregate_binary_field_counts(self):
+        result = aggregate_binary_field_counts([(1, 3), (True, 1), (0, 4), ("yes", 2), (None, 5)])
+        assert result == {"type": "binary", "count": 8, "mean": 0.5, "true_count": 4, "excluded_count": 2}
+
     def test_aggregate_categorical_field(self):
         result = aggregate_field(["good", "good", "bad", "good"])
         assert result["type"] == "categorical"
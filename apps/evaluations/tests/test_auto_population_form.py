@@ -1,7 +1,8 @@
 import pytest
+from django.utils import timezone
 
 from apps.evaluations.forms import DatasetAutoPopulationRuleForm
-from apps.utils.factories.evaluations import EvaluationDatasetFactory
+from apps.utils.factories.evaluations import DatasetAutoPopulationRuleFactory, EvaluationDatasetFactory
 from apps.utils.factories.experiment import ExperimentFactory
 
 
@@ -79,3 +80,26 @@ def test_form_accepts_valid_input():
     rule = form.save()
     assert rule.team == dataset.team
     assert rule.dataset == dataset
+
+
+@pytest.mark.django_db()
+def test_changing_the_source_experiment_resets_the_watermark():
+    rule = DatasetAutoPopulationRuleFactory.create(watermark_created_at=timezone.now(), watermark_session_id=1)
+    experiment = ExperimentFactory.create(team=rule.team)
+
+    form = DatasetAutoPopulationRuleForm(
+        instance=rule,
+        team=rule.team,
+        dataset=rule.dataset,
+        data={
+            "source_experiment": experiment.id,
+            "filter_query_string": "",
+            "is_enabled": True,
+        },
+    )
+    assert form.is_valid(), form.errors
+    form.save()
+
+    rule.refresh_from_db()
+    assert rule.watermark_created_at is None
+    assert rule.watermark_session_id is None
@@ -1,6 +1,8 @@
 from datetime import timedelta as _td
 
 import pytest
+from django.test import override_settings
+from django.utils import timezone
 
 import apps.evaluations.auto_population as eval_tasks
 from apps.evaluations.auto_population import _handle_rule_failure, _ingest_rule
@@ -74,6 +76,54 @@ def test_ingest_rule_skips_sessions_already_in_dataset():
     assert dataset.messages.count() == 1
 
 
+def _rule_with_empty_dataset():
+    team = TeamFactory.create()
+    dataset = EvaluationDataset.objects.create(team=team, name="Test Dataset", evaluation_mode=EvaluationMode.SESSION)
+    return DatasetAutoPopulationRuleFactory.create(team=team, dataset=dataset)
+
+
+def _session_with_messages(rule, **kwargs):
+    session = ExperimentSessionFactory.create(experiment=rule.source_experiment, team=rule.team, **kwargs)
+    session.chat.messages.create(message_type="human", content="hi")
+    session.chat.messages.create(message_type="ai", content="hello")
+    return session
+
+
+@pytest.mark.django_db()
+@override_settings(EVALUATIONS_AUTO_POPULATION_BATCH_SIZE=1)
+def test_ingest_rule_scans_past_the_watermark_a_batch_at_a_time():
+    rule = _rule_with_empty_dataset()
+    first = _session_with_messages(rule)
+    second = _session_with_messages(rule)
+
+    _ingest_rule(rule)
+    rule.refresh_from_db()
+    assert {m.session_id for m in rule.dataset.messages.all()} == {first.id}
+    assert (rule.watermark_created_at, rule.watermark_session_id) == (first.created_at, first.id)
+
+    _ingest_rule(rule)
+    rule.refresh_from_db()
+    assert {m.session_id for m in rule.dataset.messages.all()} == {first.id, second.id}
+    assert rule.watermark_session_id == second.id
+
+
+@pytest.mark.django_db()
+@override_settings(EVALUATIONS_AUTO_POPULATION_OVERLAP_HOURS=1)
+def test_ingest_rule_only_rechecks_sessions_within_the_overlap_behind_the_watermark():
+    rule = _rule_with_empty_dataset()
+    rule.created_at = timezone.now() - _td(days=1)
+    rule.save(update_fields=["created_at"])
+    within_overlap = _session_with_messages(rule)
+    too_old = _session_with_messages(rule)
+    too_old.created_at = timezone.now() - _td(hours=3)
+    too_old.save(update_fields=["created_at"])
+    rule.watermark_created_at, rule.watermark_session_id = timezone.now(), within_overlap.id + 1
+
+    _ingest_rule(rule)
+
+    assert {m.session_id for m in rule.dataset.messages.all()} == {within_overlap.id}
+
+
 @pytest.mark.django_db()
 def test_ingest_rule_skips_sessions_older_than_rule_created_at():
     team = TeamFactory.create()
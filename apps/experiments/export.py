@@ -15,6 +15,8 @@ from apps.chat.models import ChatMessage
 from apps.experiments.filters import ExperimentSessionFilter
 from apps.experiments.models import ExperimentSession
 from apps.service_providers.tracing import OCS_TRACE_PROVIDER
+from apps.teams.utils import current_team
+from apps.utils.db_routing import reporting_reads
 from apps.web.dynamic_filters.datastructures import FilterParams
 
 _SPOOLED_MAX_BYTES = 10 * 1024 * 1024  # 10 MB threshold before spilling to disk
@@ -44,9 +46,11 @@ def _format_comments(user_comments: list[UserComment]) -> str:
 def get_filtered_sessions(experiment, query_params, timezone):
     sessions_queryset = ExperimentSession.objects.filter(experiment=experiment).select_related("participant__user")
     session_filter = ExperimentSessionFilter()
-    sessions_queryset = session_filter.apply(
-        sessions_queryset, filter_params=FilterParams(query_params), timezone=timezone
-    )
+    # The filters resolve tag names among the current team's tags
+    with current_team(experiment.team):
+        sessions_queryset = session_filter.apply(
+            sessions_queryset, filter_params=FilterParams(query_params), timezone=timezone
+        )
 
     return sessions_queryset
 
@@ -72,6 +76,7 @@ def _get_participant_data_for_message(message) -> dict:
     return {}
 
 
+@reporting_reads("session_export")
 def count_export_messages(sessions_queryset) -> int:
     """Total number of messages an export of these sessions will produce.
 
@@ -243,7 +248,10 @@ def generate_export_rows(
             progress_callback(count)
 
     while True:
-        chunk = list(base_qs.filter(pk__gt=last_pk)[:EXPORT_CHUNK_SIZE])
+        # The context can't span the yields below (it would leak into the consumer between rows), so
+        # each chunk is fetched, prefetches included, inside its own
+        with reporting_reads("session_export"):
+            chunk = list(base_qs.filter(pk__gt=last_pk)[:EXPORT_CHUNK_SIZE])
         if not chunk:
             break
 
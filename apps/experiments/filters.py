@@ -2,18 +2,25 @@ from collections.abc import Sequence
 from typing import ClassVar
 
 from django.contrib.contenttypes.models import ContentType
+from django.core.cache import cache
 from django.db.models import Exists, OuterRef, Q
+from pydantic import computed_field
 
-from apps.annotations.models import CustomTaggedItem, Tag
+from apps.annotations.models import CustomTaggedItem, Tag, find_tag_ids
 from apps.channels.models import ChannelPlatform
 from apps.chat.models import Chat, ChatMessage
+from apps.chat.search import message_search_filter
 from apps.experiments.models import Experiment
+from apps.teams.utils import get_current_team
+from apps.utils.search import SearchLanguage
 from apps.web.dynamic_filters.base import (
     DATE_RANGE_OPTIONS,
     TYPE_CHOICE,
+    TYPE_STRING,
     ChoiceColumnFilter,
     ColumnFilter,
     MultiColumnFilter,
+    Operators,
 )
 from apps.web.dynamic_filters.column_filters import (
     ExperimentFilter,
@@ -24,6 +31,33 @@ from apps.web.dynamic_filters.column_filters import (
     TimestampFilter,
 )
 
+# Tags used on at most this many objects are matched by looking up the tagged chats up front rather than
+# by checking each session for them
+SELECTIVE_TAG_MAX_ITEMS = 5000
+TAGGED_ITEM_COUNT_CACHE_TIMEOUT = 10 * 60
+
+
+def _resolve_tag_ids(tag_names, category=None) -> list[int]:
+    """The IDs of the current team's tags with the given names (see `find_tag_ids`), or of every team's
+    tags with them when there is no current team."""
+    if team := get_current_team():
+        return find_tag_ids(team.id, tag_names, category=category)
+    tags = Tag.objects.filter(name__in=tag_names)
+    if category is not None:
+        tags = tags.filter(category=category)
+    return list(tags.values_list("id", flat=True))
+
+
+def _is_selective(tag_ids) -> bool:
+    """Whether the tags are used on few enough objects for `SELECTIVE_TAG_MAX_ITEMS`. The count stops at
+    the limit, so it stays cheap however much the tags are used, and is cached for a while."""
+    key = f"tagged-item-count:{','.join(map(str, sorted(tag_ids)))}"
+    count = cache.get(key)
+    if count is None:
+        count = CustomTaggedItem.objects.filter(tag_id__in=tag_ids)[: SELECTIVE_TAG_MAX_ITEMS + 1].count()
+        cache.set(key, count, TAGGED_ITEM_COUNT_CACHE_TIMEOUT)
+    return count <= SELECTIVE_TAG_MAX_ITEMS
+
 
 class LastActivityFilter(TimestampFilter):
     """Timestamp filter over the session's last activity, matching the sessions table column.
@@ -67,6 +101,44 @@ class MessageTimestampFilter(TimestampFilter):
         )
 
 
+class MessageContentFilter(ColumnFilter):
+    """Matches sessions with a message whose content matches a search query, using the indexed message
+    search (see :mod:`apps.chat.search`) rather than a substring scan of every message.
+
+    The query is parsed with the current team's message search language.
+    """
+
+    query_param: str = "message_content"
+    label: str = "Messages Containing"
+    type: str = TYPE_STRING
+    description: str = (
+        "Filter by what was said in the session: matches words (stemmed in the team's search language), "
+        "quoted phrases or any text of three or more characters in the session's messages"
+    )
+
+    @computed_field
+    @property
+    def operators(self) -> list[Operators]:
+        return [Operators.CONTAINS, Operators.DOES_NOT_CONTAIN]
+
+    def _message_matches(self, value):
+        team = get_current_team()
+        language = team.message_search_language if team else SearchLanguage.SIMPLE
+        if (condition := message_search_filter(value, language)) is None:
+            return None
+        return Exists(ChatMessage.objects.filter(condition, chat_id=OuterRef("chat_id")))
+
+    def apply_contains(self, queryset, value, timezone=None):
+        if (matches := self._message_matches(value)) is None:
+            return queryset
+        return queryset.filter(matches)
+
+    def apply_does_not_contain(self, queryset, value, timezone=None):
+        if (matches := self._message_matches(value)) is None:
+            return queryset
+        return queryset.exclude(matches)
+
+
 def get_filter_context_data(
     team,
     columns: dict[str, dict],
@@ -99,35 +171,43 @@ class ChatMessageTagsFilter(ChoiceColumnFilter):
     def prepare(self, team, **_):
         self.options = [tag.name for tag in team.tag_set.filter(is_system_tag=False)]
 
-    def _chat_or_message_tag_exists(self, tag_names):
-        """Match outer rows whose chat, or any of the chat's messages, carries one of ``tag_names``.
+    def _chat_or_message_tag_match(self, tag_names) -> Q | None:
+        """Match outer rows whose chat, or any of the chat's messages, carries one of ``tag_names``, or
+        ``None`` if no such tag exists, in which case nothing can match.
 
-        Both halves correlate directly on ``chat_id`` at the top level so Postgres can
-        precompute each subquery once as a hashed subplan instead of re-running it per
-        session row.
+        For tags used on few objects, the chats carrying them are selected up front by two uncorrelated
+        ``IN`` subqueries, which Postgres runs once each off the tag index and hashes. Otherwise both
+        halves are ``EXISTS`` checks correlated directly on ``chat_id`` at the top level, so Postgres can
+        probe the tagged items' ``(content_type, object_id)`` index and the messages' ``chat`` index
+        per session row instead of materializing a large set of chats.
         """
-        tag_ids = list(Tag.objects.filter(name__in=tag_names).values_list("id", flat=True))
+        if not (tag_ids := _resolve_tag_ids(tag_names)):
+            return None
         chat_ct = ContentType.objects.get_for_model(Chat)
-        chat_tag_exists = Exists(
-            CustomTaggedItem.objects.filter(
-                object_id=OuterRef("chat_id"),
-                content_type_id=chat_ct.id,
-                tag_id__in=tag_ids,
-            )
+        chat_tags = CustomTaggedItem.objects.filter(content_type_id=chat_ct.id, tag_id__in=tag_ids)
+        message_tags = ChatMessage.objects.filter(tags__in=tag_ids)
+        if _is_selective(tag_ids):
+            return Q(chat_id__in=chat_tags.values("object_id")) | Q(chat_id__in=message_tags.values("chat_id"))
+        return Q(Exists(chat_tags.filter(object_id=OuterRef("chat_id")))) | Q(
+            Exists(message_tags.filter(chat_id=OuterRef("chat_id")))
         )
-        message_tag_exists = Exists(ChatMessage.objects.filter(chat_id=OuterRef("chat_id"), tags__in=tag_ids))
-        return chat_tag_exists | message_tag_exists
 
     def apply_any_of(self, queryset, value, timezone=None):
-        return queryset.filter(self._chat_or_message_tag_exists(value))
+        if (match := self._chat_or_message_tag_match(value)) is None:
+            return queryset.none()
+        return queryset.filter(match)
 
     def apply_all_of(self, queryset, value, timezone=None):
         for tag in value:
-            queryset = queryset.filter(self._chat_or_message_tag_exists([tag]))
+            if (match := self._chat_or_message_tag_match([tag])) is None:
+                return queryset.none()
+            queryset = queryset.filter(match)
         return queryset
 
     def apply_excludes(self, queryset, value, timezone=None):
-        return queryset.exclude(self._chat_or_message_tag_exists(value))
+        if (match := self._chat_or_message_tag_match(value)) is None:
+            return queryset
+        return queryset.exclude(match)
 
 
 def _message_tag_exists(tag_names, category=None):
@@ -137,16 +217,16 @@ def _message_tag_exists(tag_names, category=None):
     JOIN-multiplication that ``queryset.filter(tags__name__in=...)`` would cause when
     a message carries multiple matching tags — the global ``.distinct()`` was removed
     from :meth:`MultiColumnFilter.apply`, so JOIN-based filters now leak duplicates.
+    The names are resolved to tag IDs first, so the subquery needs no join to the tags.
     """
     chat_message_ct = ContentType.objects.get_for_model(ChatMessage)
-    qs = CustomTaggedItem.objects.filter(
-        content_type_id=chat_message_ct.id,
-        tag__name__in=tag_names,
-        object_id=OuterRef("pk"),
+    return Exists(
+        CustomTaggedItem.objects.filter(
+            content_type_id=chat_message_ct.id,
+            tag_id__in=_resolve_tag_ids(tag_names, category=category),
+            object_id=OuterRef("pk"),
+        )
     )
-    if category is not None:
-        qs = qs.filter(tag__category=category)
-    return Exists(qs)
 
 
 class MessageTagsFilter(ChoiceColumnFilter):
@@ -185,22 +265,24 @@ class VersionsFilter(ChoiceColumnFilter):
         single_experiment = kwargs.get("single_experiment")
         self.options = Experiment.objects.get_version_names(team, working_version=single_experiment)  # ty: ignore[invalid-assignment]
 
-    def _get_version_numbers(self, version_names):
+    def parse_query_value(self, query_value) -> list[int]:
         """Convert version names to numbers removing the 'v' prefix from 'v1'."""
-        return [int(name.replace("v", "")) for name in version_names]
+        version_numbers = []
+        for name in self.values_list(query_value):
+            try:
+                version_numbers.append(int(name.replace("v", "")))
+            except (ValueError, TypeError, AttributeError):
+                continue
+        return version_numbers
 
     def apply_any_of(self, queryset, value, timezone=None):
-        version_numbers = self._get_version_numbers(value)
-        qs = queryset.filter(experiment_versions__overlap=version_numbers)
-        return qs
+        return queryset.filter(experiment_versions__overlap=value)
 
     def apply_excludes(self, queryset, value, timezone=None):
-        version_numbers = self._get_version_numbers(value)
-        return queryset.exclude(experiment_versions__overlap=version_numbers)
+        return queryset.exclude(experiment_versions__overlap=value)
 
     def apply_all_of(self, queryset, value, timezone=None):
-        version_numbers = self._get_version_numbers(value)
-        return queryset.filter(experiment_versions__contains=version_numbers)
+        return queryset.filter(experiment_versions__contains=value)
 
 
 class MessageVersionsFilter(ChoiceColumnFilter):
@@ -281,6 +363,7 @@ class ExperimentSessionFilter(MultiColumnFilter):
             query_param="message_date",
             description="Filter by message date",
         ),
+        MessageContentFilter(),
         ChatMessageTagsFilter(),
         VersionsFilter(),
         ChannelsFilter(),
@@ -0,0 +1,33 @@
+from django.db.models import Max
+
+from apps.chat.models import Chat
+from apps.data_migrations.management.commands.base import IdempotentCommand
+
+
+class Command(IdempotentCommand):
+    help = "Backfill the denormalized message count on Chat"
+    migration_name = "backfill_session_activity_counters_2026_10_18"
+    atomic = False
+    disable_audit = True
+
+    def perform_migration(self, dry_run=False):
+        self._backfill(Chat.objects.all(), "chats", lambda batch: batch.refresh_message_counters(), dry_run)
+
+    def _backfill(self, queryset, name, refresh, dry_run, batch_size=1000):
+        # Walk the ID space in fixed ranges so each batch is a cheap primary key range scan
+        max_id = queryset.aggregate(max_id=Max("id"))["max_id"]
+        if max_id is None:
+            self.stdout.write(self.style.SUCCESS(f"No {name} found"))
+            return
+
+        if dry_run:
+            self.stdout.write(f"Would update {queryset.count()} {name}")
+            return
+
+        total_updated = 0
+        for start in range(0, max_id + 1, batch_size):
+            total_updated += refresh(queryset.filter(id__gte=start, id__lt=start + batch_size))
+            if start // batch_size % 10 == 0:
+                self.stdout.write(f"Updated {total_updated} {name} ({min(start + batch_size, max_id)}/{max_id})...")
+
+        self.stdout.write(self.style.SUCCESS(f"Successfully updated {total_updated} {name}"))
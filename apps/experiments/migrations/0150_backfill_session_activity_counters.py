@@ -0,0 +1,17 @@
+from django.db import migrations
+
+from apps.data_migrations.utils.migrations import RunDataMigration
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('experiments', '0149_expsession_team_lastact_c_idx'),
+        ('chat', '0026_chat_message_counters'),
+        ('trace', '0016_trace_timestamp_default'),
+        ('data_migrations', '0001_initial'),
+    ]
+
+    operations = [
+        RunDataMigration("backfill_session_activity_counters"),
+    ]
@@ -0,0 +1,17 @@
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    atomic = False
+
+    dependencies = [
+        ("experiments", "0150_backfill_session_activity_counters"),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name="experimentsession",
+            index=models.Index(fields=["experiment", "created_at", "id"], name="expsession_exp_created_idx"),
+        ),
+    ]
@@ -1379,31 +1379,19 @@ def last_activity_expression():
     return functions.Coalesce("last_activity_at", "created_at")
 
 
-class ExperimentSessionQuerySet(models.QuerySet):
-    def annotate_with_message_count(self):
-        message_count_subquery = Subquery(
-            ChatMessage.objects.filter(chat_id=OuterRef("chat_id"))
-            .values("chat")
-            .annotate(count=Count("id"))
-            .values("count")[:1]
-        )
-        return self.annotate(message_count=message_count_subquery)
-
-
 class ExperimentSessionObjectManager(models.Manager):
-    def get_queryset(self):
-        return ExperimentSessionQuerySet(self.model, using=self._db)
-
     def get_table_queryset(self, team, experiment_id=None):
         queryset = self.get_queryset().filter(team=team)
         if experiment_id:
             queryset = queryset.filter(experiment__id=experiment_id)
 
+        # The message count is read from the (denormalized) chat counter
         queryset = queryset.select_related("experiment", "participant__user", "chat")
         # Order by the same expression the "Last activity" column renders, so a session whose
         # `last_activity_at` is null doesn't sort to the bottom while displaying a recent
-        # `created_at`. Backed by `expsession_team_lastact_c_idx`.
-        return queryset.annotate_with_message_count().order_by(last_activity_expression().desc())
+        # `created_at`. Backed by `expsession_team_lastact_c_idx`. The annotation and the unique
+        # tiebreaker let `KeysetPaginator` seek to the next page instead of using OFFSET.
+        return queryset.annotate(last_activity_key=last_activity_expression()).order_by("-last_activity_key", "-id")
 
 
 class ExperimentSession(BaseTeamModel):
@@ -1453,6 +1441,8 @@ class ExperimentSession(BaseTeamModel):
             models.Index(fields=["team", "first_activity_at"], name="expsession_team_firstact_idx"),
             # Supports the global (cross-team) date-range scans in the admin dashboard.
             models.Index(fields=["created_at"], name="expsession_created_at_idx"),
+            # Supports the keyset scans of evaluation dataset auto-population rules.
+            models.Index(fields=["experiment", "created_at", "id"], name="expsession_exp_created_idx"),
             # Supports the sessions-table default ordering, which sorts by `last_activity`
             # (coalesced) rather than the raw column — the index above can't serve that.
             models.Index(
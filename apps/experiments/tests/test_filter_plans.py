@@ -0,0 +1,110 @@
+"""Tests for how saved session filters are planned: the per-team tag lookups, the SQL shape chosen for tag
+filters and, through ``EXPLAIN``, that they can be served by the tables' indexes."""
+
+import pytest
+from django.db import connection
+from django.http import QueryDict
+
+from apps.annotations.models import CustomTaggedItem, Tag, find_tag_ids
+from apps.chat.models import ChatMessage, ChatMessageType
+from apps.experiments import filters
+from apps.experiments.filters import ExperimentSessionFilter
+from apps.experiments.models import ExperimentSession
+from apps.teams.utils import current_team
+from apps.utils.factories.experiment import ExperimentSessionFactory
+from apps.web.dynamic_filters.datastructures import FilterParams
+
+
+def _apply(team, query_string: str):
+    queryset = ExperimentSession.objects.filter(team=team)
+    with current_team(team):
+        return ExperimentSessionFilter().apply(queryset, FilterParams(QueryDict(query_string)))
+
+
+@pytest.fixture()
+def tagged_sessions():
+    """Three sessions: one whose chat is tagged "important", one with a message tagged "important" and
+    an untagged one."""
+    chat_tagged = ExperimentSessionFactory.create()
+    team = chat_tagged.team
+    message_tagged = ExperimentSessionFactory.create(experiment=chat_tagged.experiment)
+    untagged = ExperimentSessionFactory.create(experiment=chat_tagged.experiment)
+    tag = Tag.objects.create(name="important", team=team)
+    chat_tagged.chat.add_tag(tag, team=team, added_by=None)
+    message = ChatMessage.objects.create(chat=message_tagged.chat, content="hi", message_type=ChatMessageType.HUMAN)
+    message.add_tag(tag, team=team, added_by=None)
+    return team, chat_tagged, message_tagged, untagged
+
+
+@pytest.mark.django_db()
+class TestTagFilterShapes:
+    @pytest.mark.parametrize("selective", [True, False])
+    def test_tag_filters(self, tagged_sessions, selective, monkeypatch):
+        team, chat_tagged, message_tagged, untagged = tagged_sessions
+        monkeypatch.setattr(filters, "SELECTIVE_TAG_MAX_ITEMS", 100 if selective else 0)
+
+        any_of = _apply(team, "f_tags=important&op_tags=any of")
+        assert set(any_of) == {chat_tagged, message_tagged}
+        assert ("IN (SELECT" in str(any_of.query)) == selective
+        assert set(_apply(team, "f_tags=important&op_tags=excludes")) == {untagged}
+
+    def test_unknown_tag(self, tagged_sessions):
+        team, *sessions = tagged_sessions
+        assert not _apply(team, "f_tags=unknown&op_tags=any of").exists()
+        assert not _apply(team, "f_tags=important~unknown&op_tags=all of").exists()
+        assert set(_apply(team, "f_tags=unknown&op_tags=excludes")) == set(sessions)
+
+    def test_tags_of_other_teams_are_ignored(self, tagged_sessions):
+        team, *_ = tagged_sessions
+        other_session = ExperimentSessionFactory.create()
+        other_tag = Tag.objects.create(name="elsewhere", team=other_session.team)
+        other_session.chat.add_tag(other_tag, team=other_session.team, added_by=None)
+
+        assert not _apply(team, "f_tags=elsewhere&op_tags=any of").exists()
+
+
+@pytest.mark.django_db()
+def test_find_tag_ids_is_cached_until_the_teams_tags_change(django_assert_num_queries):
+    team = ExperimentSessionFactory.create().team
+    tag = Tag.objects.create(name="important", team=team)
+
+    assert find_tag_ids(team.id, ["important", "unknown"]) == [tag.id]
+    with django_assert_num_queries(0):
+        assert find_tag_ids(team.id, ["important", "unknown"]) == [tag.id]
+
+    new_tag = Tag.objects.create(name="unknown", team=team)
+    assert find_tag_ids(team.id, ["important", "unknown"]) == [tag.id, new_tag.id]
+
+
+@pytest.mark.django_db()
+class TestSavedFilterPlans:
+    """Checks that the plans of saved filters can use index scans on the large tables. Sequential scans
+    are disabled so that the test data being small doesn't make the planner prefer them: it only falls
+    back to one when no index can serve the query."""
+
+    LARGE_TABLES = [ChatMessage._meta.db_table, CustomTaggedItem._meta.db_table, ExperimentSession._meta.db_table]
+
+    @pytest.mark.parametrize(
+        "query_string",
+        [
+            "f_tags=important&op_tags=any of",
+            "f_tags=important&op_tags=excludes",
+            "f_message_date=2024-01-01&op_message_date=after",
+            "f_versions=v1~v2&op_versions=any of",
+            "f_tags=important&op_tags=any of&f_last_activity=7d&op_last_activity=range",
+            "f_message_content=hello&op_message_content=contains",
+            "f_message_content=hello&op_message_content=does not contain",
+        ],
+    )
+    @pytest.mark.parametrize("selective", [True, False])
+    def test_no_sequential_scans(self, tagged_sessions, query_string, selective, monkeypatch):
+        team, *_ = tagged_sessions
+        monkeypatch.setattr(filters, "SELECTIVE_TAG_MAX_ITEMS", 100 if selective else 0)
+        queryset = _apply(team, query_string)
+
+        with connection.cursor() as cursor:
+            cursor.execute("SET LOCAL enable_seqscan = off")
+        plan = queryset.explain()
+
+        for table in self.LARGE_TABLES:
+            assert f"Seq Scan on {table}" not in plan, plan
@@ -11,9 +11,11 @@ from apps.chat.models import Chat, ChatMessage, ChatMessageType
 from apps.experiments.filters import ExperimentSessionFilter
 from apps.experiments.models import ExperimentSession, SessionStatus
 from apps.teams.models import Team
+from apps.teams.utils import current_team
 from apps.utils.deletion import delete_object_with_auditing_of_related_objects
 from apps.utils.factories.experiment import ExperimentSessionFactory
 from apps.utils.factories.team import TeamFactory
+from apps.utils.search import SearchLanguage
 from apps.web.dynamic_filters.base import Operators
 from apps.web.dynamic_filters.datastructures import FilterParams
 
@@ -655,6 +657,38 @@ class TestLastActivityFilter:
         assert list(filtered) == [never_messaged]
 
 
+@pytest.mark.django_db()
+class TestMessageContentFilter:
+    @pytest.fixture()
+    def sessions(self):
+        cancelled = ExperimentSessionFactory.create()
+        thanked = ExperimentSessionFactory.create(experiment=cancelled.experiment)
+        cancelled.team.message_search_language = SearchLanguage.ENGLISH
+        cancelled.team.save()
+        for session, content in ((cancelled, "My appointment was cancelled"), (thanked, "Thanks for the help")):
+            ChatMessage.objects.create(chat=session.chat, content=content, message_type=ChatMessageType.HUMAN)
+        return cancelled, thanked
+
+    def _filter(self, sessions, operator, value):
+        params = {"f_message_content": value, "op_message_content": operator}
+        with current_team(sessions[0].team):
+            return ExperimentSessionFilter().apply(
+                sessions[0].experiment.sessions.all(), FilterParams(_get_querydict(params))
+            )
+
+    def test_contains_matches_word_forms(self, sessions):
+        cancelled, _ = sessions
+        assert list(self._filter(sessions, Operators.CONTAINS, "cancelling appointments")) == [cancelled]
+
+    def test_contains_matches_substrings(self, sessions):
+        _, thanked = sessions
+        assert list(self._filter(sessions, Operators.CONTAINS, "hel")) == [thanked]
+
+    def test_does_not_contain(self, sessions):
+        _, thanked = sessions
+        assert list(self._filter(sessions, Operators.DOES_NOT_CONTAIN, "appointment")) == [thanked]
+
+
 @pytest.fixture(scope="class")
 def participant_session(django_db_setup, django_db_blocker):
     """Create a base experiment session with participant"""
@@ -998,25 +998,17 @@ class TestExperimentTrends:
     def test_get_experiment_trend_data_with_errors(self, experiment):
         """Test that the function returns error counts when there are error traces"""
         # Create traces with error status
-        with time_machine.travel("2025-01-01 12:00:00") as curr_time:
-            Trace.objects.create(
-                experiment=experiment, team=experiment.team, status=TraceStatus.SUCCESS, timestamp=curr_time, duration=1
-            )
-            Trace.objects.create(
-                experiment=experiment, team=experiment.team, status=TraceStatus.ERROR, timestamp=curr_time, duration=1
-            )
+        with time_machine.travel("2025-01-01 12:00:00"):
+            Trace.objects.create(experiment=experiment, team=experiment.team, status=TraceStatus.SUCCESS, duration=1)
+            Trace.objects.create(experiment=experiment, team=experiment.team, status=TraceStatus.ERROR, duration=1)
 
         with time_machine.travel("2025-01-01 10:00:00"):
-            Trace.objects.create(
-                experiment=experiment, team=experiment.team, status=TraceStatus.ERROR, timestamp=curr_time, duration=1
-            )
+            Trace.objects.create(experiment=experiment, team=experiment.team, status=TraceStatus.ERROR, duration=1)
 
         with time_machine.travel("2025-01-01 7:00:00"):
-            Trace.objects.create(
-                experiment=experiment, team=experiment.team, status=TraceStatus.ERROR, timestamp=curr_time, duration=1
-            )
+            Trace.objects.create(experiment=experiment, team=experiment.team, status=TraceStatus.ERROR, duration=1)
 
-        with time_machine.travel("2025-01-01 13:00:00") as curr_time:
+        with time_machine.travel("2025-01-01 13:00:00"):
             success, errors = experiment.get_trend_data()
 
         # Should return actual error counts (2 errors in one hour, 1 in another)
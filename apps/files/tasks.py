@@ -3,11 +3,17 @@ from django.utils import timezone
 
 from apps.files.models import File
 from apps.utils.celery import Queues
+from apps.utils.retention import RetentionPolicy, run_retention_policy
 
 
 @shared_task(ignore_result=True, queue=Queues.BACKGROUND)
 def clean_up_expired_files():
     """
-    Cleans up expired files
+    Cleans up expired files. Their stored content is deleted by django_cleanup once each batch commits.
     """
-    File.objects.filter(expiry_date__lt=timezone.now()).delete()
+    run_retention_policy(
+        RetentionPolicy(
+            name="expired_files",
+            get_queryset=lambda: File.objects.filter(expiry_date__lt=timezone.now()),
+        )
+    )
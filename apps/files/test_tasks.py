@@ -1,3 +1,5 @@
+from unittest import mock
+
 import pytest
 from django.utils import timezone
 
@@ -17,3 +19,13 @@ def test_clean_up_expired_files():
 
     # This will throw an exception if the file does not exist
     non_expired_file.refresh_from_db()
+
+
+@pytest.mark.django_db()
+def test_clean_up_expired_files_deletes_their_content(django_capture_on_commit_callbacks):
+    expired_file = FileFactory.create(expiry_date=timezone.now() - timezone.timedelta(days=1))
+    storage = expired_file.file.storage
+    with mock.patch.object(storage, "delete") as delete, django_capture_on_commit_callbacks(execute=True):
+        clean_up_expired_files()
+
+    delete.assert_called_once_with(expired_file.file.name)
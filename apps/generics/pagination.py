@@ -0,0 +1,202 @@
+"""Pagination for tables over large querysets, e.g. the sessions and traces tables.
+
+`KeysetPaginator` can be used in place of Django's paginator in a django-tables2 view
+(``paginator_class = KeysetPaginator``). While the table is in its default order, each page links to
+the next (and previous) page with a signed cursor holding the ordering values of the boundary row, and
+that page is fetched by seeking past those values rather than with an ``OFFSET`` that reads and
+discards every earlier row. A page opened by number (e.g. the first page, or after changing the sort)
+falls back to ``OFFSET``.
+
+Large totals are estimated: up to ``EXACT_COUNT_LIMIT`` rows are counted exactly, beyond that the
+total shown is the query planner's estimate, so opening a table doesn't count millions of rows.
+"""
+
+import datetime
+import uuid
+from decimal import Decimal
+
+from django.core import signing
+from django.core.paginator import EmptyPage, Page, Paginator
+from django.db import connections
+from django.db.models import Q, QuerySet
+from django.utils.functional import cached_property
+from django_tables2.rows import BoundRows
+
+# Result sets up to this size are counted exactly; the totals of larger ones are estimated
+EXACT_COUNT_LIMIT = 10_000
+CURSOR_FIELD = "cursor"
+_CURSOR_SALT = "apps.generics.pagination"
+_UNIQUE_ORDERING = {"id", "-id", "pk", "-pk"}
+
+
+class KeysetPage(Page):
+    def __init__(self, object_list, number, paginator, has_next: bool, next_cursor="", previous_cursor=""):
+        super().__init__(object_list, number, paginator)
+        self._has_next = has_next
+        self.next_cursor = next_cursor
+        self.previous_cursor = previous_cursor
+
+    def has_next(self):
+        return self._has_next
+
+    def next_page_number(self):
+        # Known from the rows fetched, so not checked against the (possibly estimated) total
+        return self.number + 1
+
+    def end_index(self):
+        return (self.number - 1) * self.paginator.per_page + len(self.object_list)
+
+
+class KeysetPaginator(Paginator):
+    """Paginates with cursors while the queryset is ordered by fields ending with a unique ``id``.
+
+    The ordering fields must be concrete fields or annotations of the records and must not be null
+    (see `ExperimentSessionObjectManager.get_table_queryset` for a nullable column ordered through a
+    coalescing annotation). Any other queryset or ordering is paginated as by Django's paginator,
+    apart from the estimated totals.
+    """
+
+    def __init__(self, object_list, per_page, orphans=0, allow_empty_first_page=True, cursor=None, **kwargs):
+        # Orphans would merge a short last page that a seek can't know about
+        super().__init__(object_list, per_page, orphans=0, allow_empty_first_page=allow_empty_first_page, **kwargs)
+        self.count_is_estimated = False
+        self.cursor = cursor if cursor is not None else self._get_cursor_from_request()
+        # The query param holding the cursor, which carries the table's prefix like its other params
+        self.cursor_field = f"{self._get_table_prefix()}{CURSOR_FIELD}"
+
+    @cached_property
+    def count(self):
+        queryset = self._get_queryset()
+        if queryset is None:
+            return super().count
+
+        # Counting a bounded subquery stops the scan once the limit is reached
+        count = queryset.order_by()[: EXACT_COUNT_LIMIT + 1].count()
+        if count <= EXACT_COUNT_LIMIT:
+            return count
+        self.count_is_estimated = True
+        return max(_estimate_count(queryset), count)
+
+    def validate_number(self, number):
+        try:
+            return super().validate_number(number)
+        except EmptyPage:
+            # An estimated total may be too low
+            if self.count_is_estimated and int(number) > 1:
+                return int(number)
+            raise
+
+    def page(self, number):
+        queryset = self._get_queryset()
+        ordering = _get_keyset_ordering(queryset) if queryset is not None else None
+        if queryset is None or not ordering:
+            return super().page(number)
+
+        number = self.validate_number(number)
+        cursor = self._decode_cursor(number, ordering)
+        if cursor and cursor["direction"] == "previous":
+            reverse_ordering = [name.removeprefix("-") if name.startswith("-") else f"-{name}" for name in ordering]
+            seek = _seek_filter(ordering, cursor["values"], forward=False)
+            records = list(queryset.filter(seek).order_by(*reverse_ordering)[: self.per_page])
+            records.reverse()
+            has_next = True
+        else:
+            if cursor:
+                rows = queryset.filter(_seek_filter(ordering, cursor["values"], forward=True))
+            else:
+                rows = queryset[(number - 1) * self.per_page :]
+            # One extra row tells whether there is a next page without relying on the total
+            records = list(rows[: self.per_page + 1])
+            has_next = len(records) > self.per_page
+            records = records[: self.per_page]
+
+        next_cursor = previous_cursor = ""
+        if records and has_next:
+            next_cursor = _encode_cursor(number + 1, "next", ordering, records[-1])
+        if records and number > 2:
+            # The first page is cheap to fetch by number
+            previous_cursor = _encode_cursor(number - 1, "previous", ordering, records[0])
+
+        if isinstance(self.object_list, BoundRows):
+            records = BoundRows(records, table=self.object_list.table, pinned_data=self.object_list.pinned_data)
+        return KeysetPage(records, number, self, has_next, next_cursor, previous_cursor)
+
+    def _get_queryset(self) -> QuerySet | None:
+        data = self.object_list
+        if isinstance(data, BoundRows):
+            # BoundRows -> TableQuerysetData -> QuerySet
+            data = getattr(data.data, "data", None)
+        return data if isinstance(data, QuerySet) else None
+
+    def _get_cursor_from_request(self) -> str:
+        table = getattr(self.object_list, "table", None)
+        request = getattr(table, "request", None)
+        if request is None:
+            return ""
+        return request.GET.get(f"{self._get_table_prefix()}{CURSOR_FIELD}", "")
+
+    def _get_table_prefix(self) -> str:
+        table = getattr(self.object_list, "table", None)
+        return getattr(table, "prefix", "") or ""
+
+    def _decode_cursor(self, number: int, ordering: list[str]) -> dict | None:
+        if not self.cursor:
+            return None
+        try:
+            cursor = signing.loads(self.cursor, salt=_CURSOR_SALT)
+        except signing.BadSignature:
+            return None
+        # A cursor carried over from another page or sort order doesn't apply
+        if cursor.get("page") != number or cursor.get("ordering") != ordering:
+            return None
+        return cursor
+
+
+def _get_keyset_ordering(queryset: QuerySet) -> list[str] | None:
+    ordering = list(queryset.query.order_by)
+    if not ordering or not all(isinstance(name, str) for name in ordering) or ordering[-1] not in _UNIQUE_ORDERING:
+        return None
+    if any("__" in name or name.startswith("?") for name in ordering):
+        return None
+    return ordering
+
+
+def _seek_filter(ordering: list[str], values: list, forward: bool) -> Q:
+    """Rows after (or, going backwards, before) the row with `values` in `ordering`."""
+    condition = Q()
+    equal = Q()
+    for name, value in zip(ordering, values, strict=True):
+        field = name.removeprefix("-")
+        after = "lt" if name.startswith("-") == forward else "gt"
+        condition |= equal & Q(**{f"{field}__{after}": value})
+        equal &= Q(**{field: value})
+    return condition
+
+
+def _encode_cursor(number: int, direction: str, ordering: list[str], record) -> str:
+    values = [_to_json(getattr(record, name.removeprefix("-"))) for name in ordering]
+    data = {"page": number, "direction": direction, "ordering": ordering, "values": values}
+    return signing.dumps(data, salt=_CURSOR_SALT, compress=True)
+
+
+def _to_json(value):
+    # Full precision: `DjangoJSONEncoder` truncates datetimes to milliseconds, which would skip rows
+    if isinstance(value, datetime.date | datetime.time):
+        return value.isoformat()
+    if isinstance(value, uuid.UUID | Decimal):
+        return str(value)
+    return value
+
+
+def _estimate_count(queryset: QuerySet) -> int:
+    """The number of rows the query planner expects `queryset` to return."""
+    connection = connections[queryset.db]
+    if connection.vendor != "postgresql":
+        return 0
+    sql, params = queryset.order_by().query.sql_with_params()
+    with connection.cursor() as cursor:
+        cursor.execute(f"EXPLAIN (FORMAT JSON) {sql}", params)
+        row = cursor.fetchone()
+    if row is None:
+        return 0
+    return int(row[0][0]["Plan"]["Plan Rows"])
@@ -0,0 +1,101 @@
+from datetime import timedelta
+from unittest.mock import patch
+
+import pytest
+from django.utils import timezone
+from django_tables2 import RequestConfig
+
+from apps.generics import pagination
+from apps.generics.pagination import KeysetPaginator
+from apps.trace.models import Trace
+from apps.trace.tables import TraceTable
+from apps.utils.factories.experiment import ExperimentSessionFactory
+from apps.utils.factories.traces import TraceFactory
+
+
+@pytest.fixture()
+def traces():
+    session = ExperimentSessionFactory.create()
+    now = timezone.now()
+    # Pairs of traces share a timestamp so that the id tiebreaker matters
+    return [
+        TraceFactory.create(
+            team=session.team,
+            experiment=session.experiment,
+            session=session,
+            participant=session.participant,
+            at=now - timedelta(minutes=i // 2),
+        )
+        for i in range(7)
+    ]
+
+
+def _table_page(rf, team, params=None, prefix=""):
+    queryset = Trace.objects.filter(team=team).order_by("-timestamp", "-id")
+    table = TraceTable(queryset, prefix=prefix)
+    RequestConfig(rf.get("/", params or {}), paginate={"per_page": 3, "paginator_class": KeysetPaginator}).configure(
+        table
+    )
+    return table.page
+
+
+def _ids(page):
+    return [row.record.id for row in page.object_list]
+
+
+@pytest.mark.django_db()
+def test_cursor_pages_match_offset_pages(rf, traces):
+    team = traces[0].team
+    expected = list(Trace.objects.filter(team=team).order_by("-timestamp", "-id").values_list("id", flat=True))
+
+    first = _table_page(rf, team)
+    second = _table_page(rf, team, {"page": 2, "cursor": first.next_cursor})
+    third = _table_page(rf, team, {"page": 3, "cursor": second.next_cursor})
+
+    assert _ids(first) + _ids(second) + _ids(third) == expected
+    assert not third.has_next()
+    assert third.next_cursor == ""
+    assert _ids(_table_page(rf, team, {"page": 2, "cursor": third.previous_cursor})) == _ids(second)
+    assert _ids(_table_page(rf, team, {"page": 3})) == _ids(third)
+
+
+@pytest.mark.django_db()
+def test_prefixed_tables_read_their_own_cursor(rf, traces):
+    team = traces[0].team
+    first = _table_page(rf, team, prefix="t-")
+    assert first.paginator.cursor_field == "t-cursor"
+
+    second = _table_page(rf, team, {"t-page": 2, "t-cursor": first.next_cursor}, prefix="t-")
+
+    assert second.paginator.cursor == first.next_cursor
+    assert _ids(second) == _ids(_table_page(rf, team, {"page": 2}))
+
+
+@pytest.mark.django_db()
+def test_cursor_for_another_page_is_ignored(rf, traces):
+    team = traces[0].team
+    first = _table_page(rf, team)
+
+    page = _table_page(rf, team, {"page": 3, "cursor": first.next_cursor})
+
+    assert page.number == 3
+    assert _ids(page) == _ids(_table_page(rf, team, {"page": 3}))
+
+
+@pytest.mark.django_db()
+def test_tampered_cursor_is_ignored(rf, traces):
+    page = _table_page(rf, traces[0].team, {"page": 2, "cursor": "not-a-cursor"})
+
+    assert len(page.object_list) == 3
+
+
+@pytest.mark.django_db()
+def test_large_totals_are_estimated(rf, traces):
+    with (
+        patch.object(pagination, "EXACT_COUNT_LIMIT", 5),
+        patch.object(pagination, "_estimate_count", return_value=1000),
+    ):
+        page = _table_page(rf, traces[0].team)
+
+    assert page.paginator.count == 1000
+    assert page.paginator.count_is_estimated
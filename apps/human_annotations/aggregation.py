@@ -1,10 +1,15 @@
-from collections import defaultdict
+import json
+import time
+from collections import Counter, defaultdict
 
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
 from django.db.models import Prefetch
 
-from apps.evaluations.aggregators import aggregate_binary_field, aggregate_field
+from apps.evaluations.aggregators import aggregate_binary_field_counts, aggregate_field_counts
 
-from .models import Annotation, AnnotationQueueAggregate, AnnotationStatus
+from .models import Annotation, AnnotationItem, AnnotationQueueAggregate, AnnotationStatus
 
 
 def _get_aggregatable_fields(queue) -> set[str]:
@@ -17,46 +22,176 @@ def compute_aggregates_for_queue(queue) -> AnnotationQueueAggregate:
 
     Per item: use authoritative annotation if one exists, else fall back to all
     submitted annotations. Fields are aggregated per the schema: binary fields
-    dispatch to `aggregate_binary_field`, everything else to the numeric /
-    categorical `aggregate_field`. Text (string) fields are excluded from
+    dispatch to `aggregate_binary_field_counts`, everything else to the numeric /
+    categorical `aggregate_field_counts`. Text (string) fields are excluded from
     aggregation.
 
     Unlike the evaluation-run side (`apps.evaluations.aggregation`), which gates
     value collection on `get_aggregators_for_value` before dispatch, this function
     collects any non-None value regardless of shape. A value of an unsupported
-    shape (a dict or list) therefore reaches `aggregate_binary_field` and is
+    shape (a dict or list) therefore reaches `aggregate_binary_field_counts` and is
     counted in `excluded_count`, where the evaluation-run side would have dropped
     it before it was ever counted.
+
+    This is the full rebuild: it also resets the per-field histograms and the
+    per-item contributions that `update_item_aggregates` maintains incrementally.
     """
-    aggregatable_fields = _get_aggregatable_fields(queue)
-    field_values = defaultdict(list)
-    items = queue.items.prefetch_related(
-        Prefetch(
-            "annotations",
-            queryset=Annotation.objects.filter(status=AnnotationStatus.SUBMITTED),
-        )
-    ).all()
-
-    for item in items:
-        submitted = list(item.annotations.all())
-        authoritative = [a for a in submitted if a.is_authoritative]
-        contributing = authoritative if authoritative else submitted
-        for ann in contributing:
-            for field_name, value in ann.data.items():
-                if field_name in aggregatable_fields and value is not None:
-                    field_values[field_name].append(value)
-
-    agg_data = {
-        field_name: (
-            aggregate_binary_field(values)
-            if (queue.schema.get(field_name) or {}).get("type") == "binary"
-            else aggregate_field(values)
+    items = (
+        queue.items.only("id", "aggregated_values")
+        .prefetch_related(
+            Prefetch(
+                "annotations",
+                queryset=Annotation.objects.filter(status=AnnotationStatus.SUBMITTED),
+            )
         )
-        for field_name, values in field_values.items()
-    }
+        .order_by("id")
+    )
+
+    with transaction.atomic():
+        aggregate = _lock_aggregate(queue)
+        histograms = defaultdict(Counter)
+        changed_items = []
+        for item in items.iterator(chunk_size=2000):
+            contribution = get_item_contribution(queue, list(item.annotations.all()))
+            for field_name, counts in contribution.items():
+                histograms[field_name].update(counts)
+            if contribution != item.aggregated_values:
+                item.aggregated_values = contribution
+                changed_items.append(item)
+        AnnotationItem.objects.bulk_update(changed_items, ["aggregated_values"], batch_size=1000)
+
+        aggregate.field_values = {field_name: dict(counts) for field_name, counts in histograms.items()}
+        aggregate.aggregates = render_aggregates(queue, aggregate.field_values)
+        aggregate.save(update_fields=["field_values", "aggregates", "updated_at"])
+    return aggregate
+
+
+def update_item_aggregates(item, queue=None, removed=False) -> AnnotationQueueAggregate:
+    """Apply one item's change to its queue's stored aggregates without recomputing the whole queue.
+
+    The item's current contribution (see `get_item_contribution`) is compared with the one recorded
+    on the item when it was last aggregated, and only the difference is applied to the queue's
+    histograms; the stats of the fields that changed are then recomputed from them. Pass
+    ``removed=True`` before deleting the item to take its contribution out.
 
-    obj, _ = AnnotationQueueAggregate.objects.update_or_create(
-        queue=queue,
-        defaults={"aggregates": agg_data, "team": queue.team},
+    Updates for a queue are serialized on its aggregate row. A queue whose histograms have never
+    been built (e.g. aggregated before they existed) gets a full `compute_aggregates_for_queue`
+    instead. Either way a debounced background reconcile is scheduled as a backstop.
+    """
+    if queue is None:
+        queue = item.queue
+    with transaction.atomic():
+        aggregate = _lock_aggregate(queue)
+        if aggregate.field_values is None:
+            # The reconcile is scheduled on commit, like the one below
+            schedule_queue_reconcile(queue.id)
+            return compute_aggregates_for_queue(queue)
+
+        if removed:
+            new = {}
+        else:
+            new = get_item_contribution(queue, list(item.annotations.filter(status=AnnotationStatus.SUBMITTED)))
+        old = AnnotationItem.objects.filter(pk=item.pk).values_list("aggregated_values", flat=True).first() or {}
+        if new != old:
+            changed_fields = _apply_contribution_change(aggregate.field_values, old, new)
+            stats = {name: value for name, value in aggregate.aggregates.items() if name in aggregate.field_values}
+            changed = {name: aggregate.field_values[name] for name in changed_fields if name in aggregate.field_values}
+            aggregate.aggregates = stats | render_aggregates(queue, changed)
+            aggregate.save(update_fields=["field_values", "aggregates", "updated_at"])
+            AnnotationItem.objects.filter(pk=item.pk).update(aggregated_values=new)
+
+    schedule_queue_reconcile(queue.id)
+    return aggregate
+
+
+def get_item_contribution(queue, submitted: list[Annotation]) -> dict[str, dict[str, int]]:
+    """The values one item's submitted annotations contribute to the queue aggregate, as
+    ``{field: {encoded value: count}}``: its authoritative annotation if it has one, else all of them."""
+    aggregatable_fields = _get_aggregatable_fields(queue)
+    authoritative = [a for a in submitted if a.is_authoritative]
+    contributing = authoritative if authoritative else submitted
+    contribution = defaultdict(Counter)
+    for ann in contributing:
+        for field_name, value in ann.data.items():
+            if field_name in aggregatable_fields and value is not None:
+                contribution[field_name][_encode_value(value)] += 1
+    return {field_name: dict(counts) for field_name, counts in contribution.items()}
+
+
+def render_aggregates(queue, field_values: dict[str, dict[str, int]]) -> dict:
+    """Compute the stats of each aggregatable field straight from its value histogram."""
+    aggregatable_fields = _get_aggregatable_fields(queue)
+    agg_data = {}
+    for field_name, counts in field_values.items():
+        if field_name not in aggregatable_fields or not counts:
+            continue
+        value_counts = [(json.loads(value), count) for value, count in counts.items()]
+        if (queue.schema.get(field_name) or {}).get("type") == "binary":
+            agg_data[field_name] = aggregate_binary_field_counts(value_counts)
+        else:
+            agg_data[field_name] = aggregate_field_counts(value_counts)
+    return agg_data
+
+
+def schedule_queue_reconcile(queue_id: int) -> None:
+    """Queue a full `compute_aggregates_for_queue` for once the queue has had no aggregate updates for
+    ``ANNOTATION_AGGREGATE_RECONCILE_DELAY`` seconds. Catches anything the incremental updates
+    missed, such as annotations changed outside the annotate views."""
+    from apps.human_annotations.tasks import (  # noqa: PLC0415 - circular: tasks imports aggregation
+        reconcile_queue_aggregates,
     )
-    return obj
+
+    delay = settings.ANNOTATION_AGGREGATE_RECONCILE_DELAY
+    cache.set(_last_update_key(queue_id), time.time(), timeout=delay * 2)
+    if cache.add(_reconcile_scheduled_key(queue_id), True, timeout=delay * 4):
+        transaction.on_commit(lambda: reconcile_queue_aggregates.apply_async((queue_id,), countdown=delay))
+
+
+def seconds_until_reconcile(queue_id: int) -> float:
+    """How much longer a scheduled reconcile should wait for the queue's updates to settle."""
+    last_update = cache.get(_last_update_key(queue_id))
+    if last_update is None:
+        return 0
+    return max(0, last_update + settings.ANNOTATION_AGGREGATE_RECONCILE_DELAY - time.time())
+
+
+def clear_reconcile_schedule(queue_id: int) -> None:
+    cache.delete(_reconcile_scheduled_key(queue_id))
+
+
+def _lock_aggregate(queue) -> AnnotationQueueAggregate:
+    AnnotationQueueAggregate.objects.get_or_create(queue=queue, defaults={"team": queue.team})
+    return AnnotationQueueAggregate.objects.select_for_update().get(queue=queue)
+
+
+def _apply_contribution_change(histograms: dict, old: dict, new: dict) -> set[str]:
+    """Replace an item's old contribution with its new one in the queue histograms, in place.
+    Returns the fields whose histogram changed."""
+    changed_fields = set()
+    for field_name in old.keys() | new.keys():
+        old_counts, new_counts = old.get(field_name, {}), new.get(field_name, {})
+        if old_counts == new_counts:
+            continue
+        counts = Counter(histograms.get(field_name, {}))
+        counts.subtract(old_counts)
+        counts.update(new_counts)
+        counts = {value: count for value, count in counts.items() if count > 0}
+        if counts:
+            histograms[field_name] = counts
+        else:
+            histograms.pop(field_name, None)
+        changed_fields.add(field_name)
+    return changed_fields
+
+
+def _encode_value(value) -> str:
+    """Histogram key for a value. JSON keeps e.g. ``1``, ``True`` and ``"1"`` apart."""
+    return json.dumps(value, sort_keys=True)
+
+
+def _last_update_key(queue_id: int) -> str:
+    return f"annotation-queue-aggregate-updated:{queue_id}"
+
+
+def _reconcile_scheduled_key(queue_id: int) -> str:
+    return f"annotation-queue-aggregate-reconcile:{queue_id}"
@@ -0,0 +1,26 @@
+from django.core.management.base import BaseCommand
+
+from apps.human_annotations.aggregation import compute_aggregates_for_queue
+from apps.human_annotations.models import AnnotationQueue
+
+
+class Command(BaseCommand):
+    help = "Recompute the stored aggregates of annotation queues from their annotations."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--queue", type=int, action="append", dest="queue_ids", help="Queue ID (repeatable)")
+        parser.add_argument("--team", help="Only rebuild the queues of the team with this slug")
+
+    def handle(self, *args, queue_ids=None, team=None, **options):
+        queues = AnnotationQueue.objects.select_related("team").order_by("id")
+        if queue_ids:
+            queues = queues.filter(id__in=queue_ids)
+        if team:
+            queues = queues.filter(team__slug=team)
+
+        rebuilt = 0
+        for queue in queues.iterator(chunk_size=100):
+            compute_aggregates_for_queue(queue)
+            rebuilt += 1
+            self.stdout.write(f"Rebuilt aggregates for queue {queue.id} ({queue.name})")
+        self.stdout.write(self.style.SUCCESS(f"Rebuilt {rebuilt} queue(s)."))
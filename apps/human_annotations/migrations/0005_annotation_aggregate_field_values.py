@@ -0,0 +1,23 @@
+# Generated by Django 5.2.16 on 2026-10-18 23:47
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('human_annotations', '0004_backfill_authoritative'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='annotationitem',
+            name='aggregated_values',
+            field=models.JSONField(blank=True, default=dict),
+        ),
+        migrations.AddField(
+            model_name='annotationqueueaggregate',
+            name='field_values',
+            field=models.JSONField(blank=True, help_text='Histogram of the contributing values per field, from which the stats are computed. Null until the aggregate has been fully computed once.', null=True),
+        ),
+    ]
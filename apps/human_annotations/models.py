@@ -192,7 +192,7 @@ class AnnotationQueue(BaseTeamModel):
                 AnnotationItem.objects.bulk_update(to_update, ["status"])
 
         # Clearing authoritative flags changes aggregation (authoritative vs all-submitted),
-        # so refresh stored aggregates. Run outside the transaction, like recompute_queue_aggregates.
+        # so refresh stored aggregates. Run outside the transaction, like update_queue_aggregates.
         if cleared:
             from apps.human_annotations.aggregation import (  # noqa: PLC0415 - circular: aggregation imports human_annotations.models
                 compute_aggregates_for_queue,
@@ -242,6 +242,10 @@ class AnnotationItem(BaseTeamModel):
     # Append-only list of flags: [{"user": "<name>", "user_id": <id>, "reason": "...", "timestamp": "..."}]
     flags = SanitizedJSONField(default=list, blank=True)
 
+    # The values this item currently contributes to its queue's aggregate, as {field: {encoded value: count}}.
+    # Kept so a change to the item's annotations can be applied to the aggregate as a delta.
+    aggregated_values = models.JSONField(default=dict, blank=True)
+
     class Meta:
         ordering = ["created_at"]
         indexes = [
@@ -348,7 +352,7 @@ class Annotation(BaseTeamModel):
                 item.review_count = item.annotations.filter(status=AnnotationStatus.SUBMITTED).count()
                 item.update_status(save=False)
                 item.save(update_fields=["review_count", "status"])
-            self.recompute_queue_aggregates(item.queue)
+            self.update_queue_aggregates(item.queue)
         else:
             super().save(*args, **kwargs)
 
@@ -375,18 +379,19 @@ class Annotation(BaseTeamModel):
         self.authoritative_set_by = None
         self.authoritative_set_at = timezone.now()
 
-    def recompute_queue_aggregates(self, queue=None):
-        """Recompute aggregates for the queue this annotation belongs to."""
+    def update_queue_aggregates(self, queue=None):
+        """Apply a change to this annotation (submitted, edited, or its authoritative flag changed) to
+        the stored aggregates of the queue it belongs to."""
         if queue is None:
             queue = self.item.queue
         from apps.human_annotations.aggregation import (  # noqa: PLC0415 - circular: aggregation imports human_annotations.models
-            compute_aggregates_for_queue,
+            update_item_aggregates,
         )
 
         try:
-            compute_aggregates_for_queue(queue)
+            update_item_aggregates(self.item, queue)
         except Exception:
-            logger.exception("Failed to recompute aggregates for queue %s", queue.id)
+            logger.exception("Failed to update aggregates for queue %s", queue.id)
 
 
 class AnnotationQueueAggregate(BaseTeamModel):
@@ -394,3 +399,9 @@ class AnnotationQueueAggregate(BaseTeamModel):
 
     queue = models.OneToOneField(AnnotationQueue, on_delete=models.CASCADE, related_name="aggregate")
     aggregates = models.JSONField(default=dict, help_text="Aggregated stats per schema field")
+    field_values = models.JSONField(
+        null=True,
+        blank=True,
+        help_text="Histogram of the contributing values per field, from which the stats are computed. "
+        "Null until the aggregate has been fully computed once.",
+    )
@@ -0,0 +1,28 @@
+from celery import shared_task
+from celery.utils.log import get_task_logger
+
+from apps.human_annotations.aggregation import (
+    clear_reconcile_schedule,
+    compute_aggregates_for_queue,
+    seconds_until_reconcile,
+)
+from apps.human_annotations.models import AnnotationQueue
+from apps.utils.celery import Queues
+
+logger = get_task_logger("ocs.human_annotations")
+
+
+@shared_task(ignore_result=True, queue=Queues.BACKGROUND)
+def reconcile_queue_aggregates(queue_id: int):
+    """Fully recompute a queue's aggregates once its incremental updates have settled. While reviewers
+    are still submitting, the reconcile is pushed back rather than run on every change."""
+    if wait := seconds_until_reconcile(queue_id):
+        reconcile_queue_aggregates.apply_async((queue_id,), countdown=wait)
+        return
+
+    clear_reconcile_schedule(queue_id)
+    queue = AnnotationQueue.objects.filter(id=queue_id).first()
+    if queue is None:
+        return
+    compute_aggregates_for_queue(queue)
+    logger.info("Reconciled aggregates for annotation queue %s", queue_id)
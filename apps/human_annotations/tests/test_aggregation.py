@@ -1,13 +1,17 @@
+from unittest import mock
+
 import pytest
 
-from apps.human_annotations.aggregation import compute_aggregates_for_queue
+from apps.human_annotations.aggregation import compute_aggregates_for_queue, update_item_aggregates
 from apps.human_annotations.models import (
     Annotation,
     AnnotationItem,
     AnnotationItemType,
     AnnotationQueue,
+    AnnotationQueueAggregate,
     AnnotationStatus,
 )
+from apps.human_annotations.tasks import reconcile_queue_aggregates
 from apps.utils.factories.experiment import ExperimentSessionFactory
 from apps.utils.factories.human_annotations import AnnotationQueueFactory
 from apps.utils.factories.team import TeamWithUsersFactory
@@ -220,3 +224,75 @@ def test_binary_field_aggregates_as_rate(team):
         "mean": 0.6667,
         "true_count": 2,
     }
+
+
+def _full_recompute_aggregates(queue):
+    return compute_aggregates_for_queue(queue).aggregates
+
+
+@pytest.mark.django_db()
+def test_incremental_updates_match_a_full_recompute(team, queue_with_int_schema):
+    user1 = team.members.first()
+    user2 = team.members.last()
+    queue = queue_with_int_schema
+    queue.num_reviews_required = 2
+    queue.save(update_fields=["num_reviews_required"])
+    item = _make_item_and_annotate(queue, team, user1, {"score": 1})
+    _make_item_and_annotate(queue, team, user1, {"score": 4})
+    second = Annotation.objects.create(item=item, team=team, reviewer=user2, data={"score": 5})
+
+    # Edit, then mark one annotation as authoritative
+    second.data = {"score": 3}
+    second.save(update_fields=["data"])
+    second.update_queue_aggregates(queue)
+    second.is_authoritative = True
+    second.save(update_fields=["is_authoritative"])
+    second.update_queue_aggregates(queue)
+
+    queue.aggregate.refresh_from_db()
+    incremental = queue.aggregate.aggregates
+    assert incremental["score"]["count"] == 2
+    assert incremental["score"]["mean"] == 3.5
+    assert incremental == _full_recompute_aggregates(queue)
+
+
+@pytest.mark.django_db()
+def test_removing_an_item_takes_its_values_out_of_the_aggregate(team, queue_with_int_schema):
+    user = team.members.first()
+    item = _make_item_and_annotate(queue_with_int_schema, team, user, {"score": 1})
+    _make_item_and_annotate(queue_with_int_schema, team, user, {"score": 5})
+
+    update_item_aggregates(item, removed=True)
+    item.delete()
+
+    aggregate = AnnotationQueueAggregate.objects.get(queue=queue_with_int_schema)
+    assert aggregate.aggregates["score"]["count"] == 1
+    assert aggregate.aggregates == _full_recompute_aggregates(queue_with_int_schema)
+
+
+@pytest.mark.django_db()
+def test_an_aggregate_without_histograms_is_fully_recomputed(team, queue_with_int_schema):
+    user = team.members.first()
+    item = _make_item_and_annotate(queue_with_int_schema, team, user, {"score": 2})
+    _make_item_and_annotate(queue_with_int_schema, team, user, {"score": 4})
+    AnnotationQueueAggregate.objects.filter(queue=queue_with_int_schema).update(aggregates={}, field_values=None)
+
+    aggregate = update_item_aggregates(item)
+
+    assert aggregate.aggregates["score"]["count"] == 2
+    assert aggregate.field_values == {"score": {"2": 1, "4": 1}}
+
+
+@pytest.mark.django_db()
+def test_reconcile_waits_for_updates_to_settle(team, queue_with_int_schema):
+    _make_item_and_annotate(queue_with_int_schema, team, team.members.first(), {"score": 2})
+    AnnotationQueueAggregate.objects.filter(queue=queue_with_int_schema).update(aggregates={})
+
+    with mock.patch.object(reconcile_queue_aggregates, "apply_async") as apply_async:
+        reconcile_queue_aggregates(queue_with_int_schema.id)
+    apply_async.assert_called_once()
+    assert AnnotationQueueAggregate.objects.get(queue=queue_with_int_schema).aggregates == {}
+
+    with mock.patch("apps.human_annotations.tasks.seconds_until_reconcile", return_value=0):
+        reconcile_queue_aggregates(queue_with_int_schema.id)
+    assert AnnotationQueueAggregate.objects.get(queue=queue_with_int_schema).aggregates["score"]["count"] == 1
@@ -285,7 +285,7 @@ class EditAnnotation(LoginAndTeamRequiredMixin, PermissionRequiredMixin, View):
             data = {k: v for k, v in form.cleaned_data.items() if v is not None and v != ""}
             annotation.data = data
             annotation.save(update_fields=["data", "updated_at"])
-            annotation.recompute_queue_aggregates(queue)
+            annotation.update_queue_aggregates(queue)
             messages.success(request, "Annotation updated.")
             return redirect("human_annotations:annotate_item", team_slug=team_slug, pk=pk, item_pk=item_pk)
 
@@ -394,7 +394,7 @@ class SetAuthoritative(LoginAndTeamRequiredMixin, View):
             )
             item.update_status()
 
-        annotation.recompute_queue_aggregates(queue)
+        annotation.update_queue_aggregates(queue)
 
         item.refresh_from_db()
         annotations = _build_annotations_context(item, request.user, queue)
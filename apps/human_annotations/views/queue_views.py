@@ -7,7 +7,7 @@ from django.contrib.auth import get_user_model
 from django.contrib.auth.decorators import permission_required
 from django.contrib.auth.mixins import PermissionRequiredMixin
 from django.core.exceptions import ValidationError
-from django.db import IntegrityError
+from django.db import IntegrityError, transaction
 from django.db.models import Count, Exists, OuterRef, Prefetch, Subquery, Sum
 from django.db.models.functions import Coalesce
 from django.http import Http404, HttpResponse, JsonResponse
@@ -32,6 +32,7 @@ from apps.teams.flags import Flags
 from apps.teams.mixins import LoginAndTeamRequiredMixin
 from apps.web.dynamic_filters.datastructures import FilterParams
 
+from ..aggregation import update_item_aggregates
 from ..forms import AnnotationQueueForm, ImportFromDatasetForm
 from ..models import (
     Annotation,
@@ -474,7 +475,9 @@ class RemoveSessionFromQueue(LoginAndTeamRequiredMixin, PermissionRequiredMixin,
 
     def delete(self, request, team_slug: str, pk: int, item_pk: int):
         item = get_object_or_404(AnnotationItem, pk=item_pk, queue_id=pk, queue__team=request.team)
-        item.delete()
+        with transaction.atomic():
+            update_item_aggregates(item, removed=True)
+            item.delete()
         messages.success(request, "Session removed from queue.")
         return HttpResponse()
 
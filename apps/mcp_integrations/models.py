@@ -1,16 +1,22 @@
 import logging
 
-from asgiref.sync import async_to_sync
 from django.contrib.postgres.fields import ArrayField
+from django.core.cache import cache
 from django.db import models
 from django.urls import reverse
-from langchain_mcp_adapters.client import MultiServerMCPClient
+from langchain_core.tools import BaseTool
+from langchain_mcp_adapters.tools import convert_mcp_tool_to_langchain_tool
+from mcp.types import Tool
 
+from apps.mcp_integrations.sessions import get_connection_key, session_pool
 from apps.teams.models import BaseTeamModel
 from apps.teams.utils import get_slug_for_team
 
 logger = logging.getLogger("ocs.mcp_integrations")
 
+# Tool definitions are also refreshed whenever `sync_tools_task` runs for the server
+MCP_TOOLS_CACHE_TTL = 60 * 60
+
 
 class TransportType(models.TextChoices):
     SSE = "sse", "SSE (Server-Sent Events)"
@@ -50,33 +56,58 @@ class McpServer(BaseTeamModel):
         Fetch tools from the MCP server and update the available_tools field.
         """
         tools = self.fetch_tools()
-        self.available_tools = [tool.name[:255] for tool in tools]
+        self.available_tools = [tool.name[:255] for tool in tools]  # ty: ignore[invalid-assignment]
         self.save(update_fields=["available_tools"])
 
-    def fetch_tools(self):
+    def get_tools(self, tool_names: list[str]) -> list[BaseTool]:
         """
-        Fetch tools from the MCP server
+        Build LangChain tools for `tool_names` from the cached tool definitions. Calls to the tools are made
+        over this process's pooled session to the server.
         """
-        headers = {}
-        if self.auth_provider:
-            auth_service = self.auth_provider.get_auth_service()
-            headers |= auth_service.get_auth_headers()
+        headers = self._get_auth_headers()
+        connection = self._get_connection(headers)
+        definitions = cache.get(self._get_tools_cache_key(connection))
+        if definitions is None:
+            tools = self.fetch_tools(headers)
+        else:
+            tools = [Tool.model_validate(definition) for definition in definitions]
+
+        session = session_pool.session(get_connection_key(self.id, connection), connection)
+        return [
+            convert_mcp_tool_to_langchain_tool(session, tool, server_name=self.name)
+            for tool in tools
+            if tool.name in tool_names
+        ]
+
+    def fetch_tools(self, headers: dict | None = None) -> list[Tool]:
+        """
+        Fetch tools from the MCP server and refresh the cached tool definitions.
+        """
+        if headers is None:
+            headers = self._get_auth_headers()
 
-        return self._fetch_tools_from_mcp_server(headers)
+        tools = self._fetch_tools_from_mcp_server(headers)
+        if tools:
+            definitions = [tool.model_dump(mode="json", by_alias=True) for tool in tools]
+            cache.set(self._get_tools_cache_key(self._get_connection(headers)), definitions, MCP_TOOLS_CACHE_TTL)
+        return tools
 
-    @async_to_sync
-    async def _fetch_tools_from_mcp_server(self, headers: dict):
+    def _fetch_tools_from_mcp_server(self, headers: dict) -> list[Tool]:
+        connection = self._get_connection(headers)
         try:
-            client = MultiServerMCPClient(
-                {
-                    "gateway": {
-                        "transport": self.transport_type,
-                        "url": self.server_url,
-                        "headers": headers,
-                    }
-                }
-            )
-            return await client.get_tools()
+            return session_pool.list_tools(get_connection_key(self.id, connection), connection)
         except Exception:
             logger.exception(f"Error fetching tools from MCP server {self.name}")
             return []
+
+    def _get_auth_headers(self) -> dict:
+        if self.auth_provider:
+            return self.auth_provider.get_auth_service().get_auth_headers()
+        return {}
+
+    def _get_connection(self, headers: dict) -> dict:
+        return {"transport": self.transport_type, "url": self.server_url, "headers": headers}
+
+    def _get_tools_cache_key(self, connection: dict) -> str:
+        # Keyed on the connection as well as the server so that changing the URL or credentials misses
+        return f"mcp_tools:{get_connection_key(self.id, connection)}"
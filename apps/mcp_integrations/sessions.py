@@ -0,0 +1,224 @@
+"""A per-process pool of persistent MCP client sessions.
+
+Opening an MCP session costs a transport handshake and an ``initialize`` round trip before the first
+request can be sent. Sessions in the pool are opened once per server (and set of credentials) and reused
+by every tool call and tool listing in the process.
+
+An MCP session is bound to the event loop it was opened on, while ``async_to_sync`` runs each call on a
+short-lived loop. The pool therefore keeps its sessions on a dedicated event loop thread and callers submit
+work to that loop. A session that has been idle for a while is pinged before it is reused, a session whose
+connection has dropped is reopened on its next use, and sessions idle for longer than
+``SESSION_IDLE_TIMEOUT`` are closed.
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
+
+from langchain_mcp_adapters.sessions import create_session
+from mcp import ClientSession
+from mcp.types import CallToolResult, Tool
+
+logger = logging.getLogger("ocs.mcp_integrations")
+
+# Sessions that haven't been used for this long are pinged before they are reused
+HEALTH_CHECK_INTERVAL = 30
+SESSION_IDLE_TIMEOUT = 5 * 60
+PING_TIMEOUT = 5
+CONNECT_TIMEOUT = 30
+# Bounds the time a synchronous caller waits for a tool listing
+LIST_TOOLS_TIMEOUT = 60
+
+
+def get_connection_key(server_id: int, connection: dict) -> str:
+    """Identifies a server and the credentials used to connect to it, without exposing the credentials."""
+    fingerprint = hashlib.sha256(json.dumps(connection, sort_keys=True).encode()).hexdigest()
+    return f"{server_id}:{fingerprint}"
+
+
+@dataclass
+class _PooledSession:
+    session: ClientSession
+    task: asyncio.Task
+    stop: asyncio.Event
+    last_used: float = field(default_factory=time.monotonic)
+    in_flight: int = 0
+
+    @property
+    def is_open(self) -> bool:
+        return not self.task.done()
+
+    async def close(self):
+        self.stop.set()
+        try:
+            await asyncio.wait_for(self.task, timeout=PING_TIMEOUT)
+        except Exception:
+            self.task.cancel()
+
+
+class McpSessionPool:
+    def __init__(self):
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._pid: int | None = None
+        self._start_lock = threading.Lock()
+        self._sessions: dict[str, _PooledSession] = {}
+        self._locks: dict[str, asyncio.Lock] = {}
+
+    def list_tools(self, key: str, connection: dict) -> list[Tool]:
+        """List all the tools of the server. Listing is idempotent, so it is retried once on a new session."""
+        future = asyncio.run_coroutine_threadsafe(self._list_tools(key, connection), self._get_loop())
+        return future.result(timeout=LIST_TOOLS_TIMEOUT)
+
+    async def call_tool(self, key: str, connection: dict, name: str, arguments: dict | None) -> CallToolResult:
+        """Call a tool from any event loop.
+
+        A failed call is not retried since the server may already have acted on it; the session is
+        reopened on its next use instead if its connection dropped.
+        """
+
+        async def _call(session: ClientSession):
+            return await session.call_tool(name, arguments)
+
+        future = asyncio.run_coroutine_threadsafe(self._run(key, connection, _call), self._get_loop())
+        return await asyncio.wrap_future(future)
+
+    def session(self, key: str, connection: dict) -> "PooledSessionProxy":
+        return PooledSessionProxy(self, key, connection)
+
+    def close_all(self):
+        if self._loop and self._pid == os.getpid():
+            asyncio.run_coroutine_threadsafe(self._close_all(), self._loop).result(timeout=CONNECT_TIMEOUT)
+
+    def _get_loop(self) -> asyncio.AbstractEventLoop:
+        # A forked worker process inherits the pool but not its thread, so it starts its own
+        if self._loop is None or self._pid != os.getpid():
+            with self._start_lock:
+                if self._loop is None or self._pid != os.getpid():
+                    self._sessions = {}
+                    self._locks = {}
+                    self._loop = asyncio.new_event_loop()
+                    self._pid = os.getpid()
+                    threading.Thread(target=self._loop.run_forever, name="mcp-session-pool", daemon=True).start()
+        return self._loop
+
+    async def _list_tools(self, key: str, connection: dict) -> list[Tool]:
+        try:
+            return await self._run(key, connection, _list_all_tools)
+        except Exception:
+            logger.warning("Listing MCP tools failed, retrying on a new session", exc_info=True)
+            await self._discard(key)
+            return await self._run(key, connection, _list_all_tools)
+
+    async def _run(self, key: str, connection: dict, fn: Callable[[ClientSession], Awaitable]):
+        pooled = await self._get_session(key, connection)
+        pooled.in_flight += 1
+        try:
+            return await fn(pooled.session)
+        finally:
+            pooled.in_flight -= 1
+            pooled.last_used = time.monotonic()
+            if not pooled.is_open:
+                self._sessions.pop(key, None)
+
+    async def _get_session(self, key: str, connection: dict) -> _PooledSession:
+        await self._close_idle_sessions()
+        async with self._locks.setdefault(key, asyncio.Lock()):
+            pooled = self._sessions.get(key)
+            if pooled and not await self._is_healthy(pooled):
+                await self._discard(key)
+                pooled = None
+            if not pooled:
+                pooled = await self._open(connection)
+                self._sessions[key] = pooled
+            return pooled
+
+    async def _is_healthy(self, pooled: _PooledSession) -> bool:
+        if not pooled.is_open:
+            return False
+        if pooled.in_flight or time.monotonic() - pooled.last_used < HEALTH_CHECK_INTERVAL:
+            return True
+        try:
+            await asyncio.wait_for(pooled.session.send_ping(), timeout=PING_TIMEOUT)
+        except Exception:
+            logger.info("Pooled MCP session failed its health check, reconnecting")
+            return False
+        pooled.last_used = time.monotonic()
+        return True
+
+    async def _open(self, connection: dict) -> _PooledSession:
+        ready = asyncio.get_running_loop().create_future()
+        stop = asyncio.Event()
+
+        async def _hold_session():
+            # The transport's context managers must be entered and exited by the same task
+            try:
+                async with create_session(connection) as session:
+                    await session.initialize()
+                    ready.set_result(session)
+                    await stop.wait()
+            except asyncio.CancelledError:
+                if not ready.done():
+                    ready.cancel()
+                raise
+            except Exception as e:
+                if not ready.done():
+                    ready.set_exception(e)
+                else:
+                    logger.info("Pooled MCP session closed: %s", e)
+
+        task = asyncio.create_task(_hold_session())
+        try:
+            session = await asyncio.wait_for(asyncio.shield(ready), timeout=CONNECT_TIMEOUT)
+        except BaseException:
+            task.cancel()
+            raise
+        return _PooledSession(session=session, task=task, stop=stop)
+
+    async def _discard(self, key: str):
+        if pooled := self._sessions.pop(key, None):
+            await pooled.close()
+
+    async def _close_idle_sessions(self):
+        now = time.monotonic()
+        for key, pooled in list(self._sessions.items()):
+            idle = not pooled.in_flight and now - pooled.last_used > SESSION_IDLE_TIMEOUT
+            if idle or not pooled.is_open:
+                await self._discard(key)
+
+    async def _close_all(self):
+        for key in list(self._sessions):
+            await self._discard(key)
+
+
+class PooledSessionProxy:
+    """Stands in for a `ClientSession` in the tools built by `langchain_mcp_adapters`, so that their calls
+    go through the pool."""
+
+    def __init__(self, pool: McpSessionPool, key: str, connection: dict):
+        self._pool = pool
+        self._key = key
+        self._connection = connection
+
+    async def call_tool(self, name: str, arguments: dict | None = None, *args, **kwargs) -> CallToolResult:
+        # Progress callbacks belong to the caller's event loop, so they are not forwarded
+        return await self._pool.call_tool(self._key, self._connection, name, arguments)
+
+
+async def _list_all_tools(session: ClientSession) -> list[Tool]:
+    tools = []
+    cursor = None
+    while True:
+        result = await session.list_tools(cursor=cursor)
+        tools.extend(result.tools)
+        if not result.nextCursor:
+            return tools
+        cursor = result.nextCursor
+
+
+session_pool = McpSessionPool()
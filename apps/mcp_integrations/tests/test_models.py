@@ -1,6 +1,7 @@
 from unittest.mock import Mock, patch
 
 import pytest
+from mcp.types import Tool
 
 from apps.mcp_integrations.models import McpServer
 from apps.utils.factories.service_provider_factories import AuthProviderFactory
@@ -15,10 +16,8 @@ class TestMcpServer:
             server_url="http://example.com/mcp",
         )
 
-        tool1 = Mock()
-        tool1.name = "Tool1"
-        tool2 = Mock()
-        tool2.name = "T" * 300  # Exceeds max length for CharField, but this will be truncated
+        tool1 = Tool(name="Tool1", inputSchema={})
+        tool2 = Tool(name="T" * 300, inputSchema={})  # Exceeds max length for CharField, but this will be truncated
         with patch("apps.mcp_integrations.models.McpServer._fetch_tools_from_mcp_server") as mock_fetch:
             mock_fetch.return_value = [tool1, tool2]
             server.sync_tools()
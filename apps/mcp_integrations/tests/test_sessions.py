@@ -0,0 +1,91 @@
+import asyncio
+from contextlib import asynccontextmanager
+from unittest.mock import patch
+
+import pytest
+from mcp.types import CallToolResult, ListToolsResult, TextContent, Tool
+
+from apps.mcp_integrations import sessions
+from apps.mcp_integrations.sessions import McpSessionPool, get_connection_key
+
+CONNECTION = {"transport": "streamable_http", "url": "http://example.com/mcp", "headers": {}}
+KEY = get_connection_key(1, CONNECTION)
+
+
+class FakeSession:
+    def __init__(self):
+        self.healthy = True
+        self.calls = []
+
+    async def initialize(self):
+        pass
+
+    async def send_ping(self):
+        if not self.healthy:
+            raise ConnectionError("connection lost")
+
+    async def list_tools(self, cursor=None):
+        if cursor is None:
+            return ListToolsResult(tools=[Tool(name="a", inputSchema={})], nextCursor="page-2")
+        return ListToolsResult(tools=[Tool(name="b", inputSchema={})])
+
+    async def call_tool(self, name, arguments):
+        self.calls.append((name, arguments))
+        return CallToolResult(content=[TextContent(type="text", text=f"{name} called")])
+
+
+@pytest.fixture()
+def opened_sessions():
+    opened = []
+
+    @asynccontextmanager
+    async def create_session(connection):
+        session = FakeSession()
+        opened.append(session)
+        yield session
+
+    with patch("apps.mcp_integrations.sessions.create_session", create_session):
+        yield opened
+
+
+@pytest.fixture()
+def pool():
+    pool = McpSessionPool()
+    yield pool
+    pool.close_all()
+
+
+def _call_tool(pool, name):
+    return asyncio.run(pool.session(KEY, CONNECTION).call_tool(name, {"x": 1}))
+
+
+def test_sessions_are_reused(pool, opened_sessions):
+    assert [tool.name for tool in pool.list_tools(KEY, CONNECTION)] == ["a", "b"]
+    result = _call_tool(pool, "a")
+    _call_tool(pool, "b")
+
+    assert result.content[0].text == "a called"
+    assert len(opened_sessions) == 1
+    assert opened_sessions[0].calls == [("a", {"x": 1}), ("b", {"x": 1})]
+
+
+def test_unhealthy_session_is_replaced(pool, opened_sessions):
+    _call_tool(pool, "a")
+    opened_sessions[0].healthy = False
+
+    with patch.object(sessions, "HEALTH_CHECK_INTERVAL", 0):
+        _call_tool(pool, "b")
+
+    assert len(opened_sessions) == 2
+    assert opened_sessions[1].calls == [("b", {"x": 1})]
+
+
+def test_connections_with_different_credentials_use_separate_sessions(pool, opened_sessions):
+    other_connection = {**CONNECTION, "headers": {"Authorization": "Bearer other"}}
+    other_key = get_connection_key(1, other_connection)
+    assert other_key != KEY
+
+    pool.list_tools(KEY, CONNECTION)
+    pool.list_tools(other_key, other_connection)
+
+    assert len(opened_sessions) == 2
@@ -14,6 +14,7 @@ from apps.ocs_notifications.models import (
     NotificationEvent,
 )
 from apps.utils.celery import Queues
+from apps.utils.retention import RetentionPolicy, run_retention_policy
 from apps.web.meta import absolute_url
 
 if TYPE_CHECKING:
@@ -93,5 +94,9 @@ def send_notification_email(users: list[CustomUser], notification_event: Notific
 @shared_task(ignore_result=True, queue=Queues.BACKGROUND)
 def cleanup_old_notification_events():
     """Delete NotificationEvent records older than 3 months."""
-    three_months_ago = timezone.now() - timedelta(days=90)
-    NotificationEvent.objects.filter(created_at__lt=three_months_ago).delete()
+    run_retention_policy(
+        RetentionPolicy(
+            name="old_notification_events",
+            get_queryset=lambda: NotificationEvent.objects.filter(created_at__lt=timezone.now() - timedelta(days=90)),
+        )
+    )
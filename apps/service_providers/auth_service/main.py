@@ -1,3 +1,5 @@
+import hashlib
+import json
 from typing import Any
 
 import httpx
@@ -9,14 +11,22 @@ from apps.service_providers.auth_service.schemes import CommCareAuth, HeaderAuth
 
 
 class AuthService(pydantic.BaseModel):
-    def get_http_client(self) -> httpx.Client:
+    def get_http_client(self, limits: httpx.Limits | None = None) -> httpx.Client:
         kwargs = {
             **self._get_http_client_kwargs(),
             "timeout": settings.RESTRICTED_HTTP_MAX_TIMEOUT,
-            "limits": httpx.Limits(max_keepalive_connections=5, max_connections=10),
+            "limits": limits or httpx.Limits(max_keepalive_connections=5, max_connections=10),
         }
         return httpx.Client(**kwargs)
 
+    def get_fingerprint(self) -> str:
+        """A hash of the service type and its credentials, for keying objects that hold the credentials."""
+        values = {
+            name: value.get_secret_value() if isinstance(value, pydantic.SecretStr) else value for name, value in self
+        }
+        data = json.dumps([type(self).__name__, values], sort_keys=True, default=str)
+        return hashlib.sha256(data.encode()).hexdigest()
+
     def _get_http_client_kwargs(self) -> dict:
         return {}
 
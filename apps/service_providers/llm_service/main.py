@@ -9,7 +9,7 @@ from typing import TYPE_CHECKING, ClassVar, Literal
 import pydantic
 from django.db.models import Q
 from langchain_core.language_models import BaseChatModel
-from langchain_core.messages import AIMessage, HumanMessage
+from langchain_core.messages import AIMessage, BaseMessage, HumanMessage
 from openai import NOT_GIVEN, OpenAI
 from openai._base_client import SyncAPIClient
 from pydantic import BaseModel
@@ -106,6 +106,14 @@ class LlmService(pydantic.BaseModel):
         """
         return None
 
+    def mark_cacheable_prefix(self, message: BaseMessage) -> BaseMessage:
+        """Mark the end of a prompt prefix that is sent with several requests (e.g. a long document
+        followed by different questions) so that the provider caches it, if caching requires opt-in.
+
+        Providers with automatic server-side prefix caching return the message unchanged.
+        """
+        return message
+
     def get_output_parser(self):
         return self._default_parser
 
@@ -429,6 +437,13 @@ class AnthropicLlmService(LlmService):
         # below the model's cacheable minimum, so this is safe for small prompts.
         return AnthropicPromptCachingMiddleware(ttl="5m", unsupported_model_behavior="ignore")
 
+    def mark_cacheable_prefix(self, message: BaseMessage) -> BaseMessage:
+        content = message.content
+        if isinstance(content, str):
+            content = [{"type": "text", "text": content}]
+        content = [*content[:-1], {**content[-1], "cache_control": {"type": "ephemeral", "ttl": "5m"}}]
+        return message.model_copy(update={"content": content})
+
     def attach_built_in_tools(self, built_in_tools: list[str], config: dict[str, BaseModel] | None = None) -> list:
         config = config or {}
         tools = []
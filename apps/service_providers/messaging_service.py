@@ -99,7 +99,7 @@ class MessagingService(pydantic.BaseModel):
         raise NotImplementedError
 
     def get_message_audio(self, message: TwilioMessage | WhatsAppMessage):
-        """Should return a BytesIO object in .wav format"""
+        """Should return the voice note as a BytesIO object named with its format (see `audio.named_audio`)"""
         raise NotImplementedError
 
     def download_message_media(self, message) -> tuple[bytes, str]:
@@ -190,7 +190,8 @@ class HttpMediaDownloadMixin:
         family, sub_type = content_type.split("/", 1)
         if family != "audio":
             raise MessageMediaError(f"Unexpected content-type for audio: {content_type}")
-        return audio.convert_audio(data, target_format="wav", source_format=sub_type)
+        # Transcoding (if the speech provider needs it at all) happens in `SpeechService.transcribe_audio`
+        return audio.named_audio(raw_bytes, source_format=sub_type)
 
 
 class TwilioService(HttpMediaDownloadMixin, MessagingService):
@@ -0,0 +1,41 @@
+# Generated by Django 5.2.16 on 2026-10-18 21:46
+
+import apps.service_providers.models
+import apps.utils.models
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('experiments', '0149_expsession_team_lastact_c_idx'),
+        ('service_providers', '0073_deprecate_groq_models'),
+        ('teams', '0015_team_created_by'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SynthesizedAudioCacheEntry',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('cache_key', models.CharField(help_text='Hash of the provider config, voice and text', max_length=64)),
+                ('format', models.CharField(max_length=16)),
+                ('duration', models.FloatField()),
+                ('size', models.PositiveIntegerField()),
+                ('file', models.FileField(upload_to=apps.service_providers.models._synthesized_audio_upload_to)),
+                ('hit_count', models.PositiveIntegerField(default=0)),
+                ('last_used_at', models.DateTimeField()),
+                ('synthetic_voice', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='+', to='experiments.syntheticvoice')),
+                ('team', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='teams.team', verbose_name='Team')),
+                ('voice_provider', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='audio_cache_entries', to='service_providers.voiceprovider')),
+            ],
+            options={
+                'indexes': [models.Index(fields=['team', 'last_used_at'], name='service_pro_team_id_ef88f2_idx')],
+                'constraints': [models.UniqueConstraint(fields=('voice_provider', 'cache_key'), name='unique_synthesized_audio_key')],
+            },
+            bases=(models.Model, apps.utils.models.VersioningMixin),
+        ),
+    ]
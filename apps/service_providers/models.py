@@ -747,3 +747,31 @@ class EmbeddingProviderModel(BaseTeamModel):
 
     def __str__(self):
         return f"{self.name}"
+
+
+def _synthesized_audio_upload_to(instance: "SynthesizedAudioCacheEntry", filename: str) -> str:
+    return f"tts-cache/{instance.team_id}/{filename}"
+
+
+class SynthesizedAudioCacheEntry(BaseTeamModel):
+    """Synthesized speech for a piece of text, stored so that repeated replies (consent prompts, reminders,
+    canned errors) don't go back to the TTS provider. See `apps.service_providers.speech_cache`."""
+
+    voice_provider = models.ForeignKey(VoiceProvider, on_delete=models.CASCADE, related_name="audio_cache_entries")
+    synthetic_voice = models.ForeignKey(SyntheticVoice, on_delete=models.CASCADE, related_name="+")
+    cache_key = models.CharField(max_length=64, help_text="Hash of the provider config, voice and text")
+    format = models.CharField(max_length=16)
+    duration = models.FloatField()
+    size = models.PositiveIntegerField()
+    file = models.FileField(upload_to=_synthesized_audio_upload_to)
+    hit_count = models.PositiveIntegerField(default=0)
+    last_used_at = models.DateTimeField()
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=("voice_provider", "cache_key"), name="unique_synthesized_audio_key"),
+        ]
+        indexes = [models.Index(fields=["team", "last_used_at"])]
+
+    def __str__(self):
+        return f"{self.synthetic_voice_id}:{self.cache_key}"
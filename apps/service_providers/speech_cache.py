@@ -0,0 +1,138 @@
+"""Content-addressed cache of synthesized speech.
+
+Voice replies repeat a lot of text verbatim (consent prompts, static trigger messages, reminders, canned
+errors), and every one of them would otherwise be a paid, slow round trip to the TTS provider. Audio is
+stored in the default file storage and indexed by `SynthesizedAudioCacheEntry`, keyed on a hash of the
+provider config, the voice and the text. The stored entry records the provider's output format.
+
+Only text that has been synthesized at least ``TTS_CACHE_ADMIT_AFTER`` times within the TTL is written
+to the cache, so one-off LLM replies don't each cost a storage upload. Entries are evicted by
+`evict_synthesized_audio_cache` once unused for ``TTS_CACHE_TTL_DAYS``, and the least recently used
+entries beyond ``TTS_CACHE_MAX_ENTRIES_PER_TEAM`` are dropped.
+"""
+
+import hashlib
+import json
+import logging
+from datetime import timedelta
+from io import BytesIO
+
+from django.conf import settings
+from django.core.cache import cache
+from django.core.files.base import ContentFile
+from django.db import IntegrityError, transaction
+from django.db.models import F
+from django.utils import timezone
+
+from apps.experiments.models import SyntheticVoice
+from apps.service_providers.models import SynthesizedAudioCacheEntry, VoiceProvider
+from apps.service_providers.speech_service import SynthesizedAudio
+
+logger = logging.getLogger("ocs.speech")
+
+CACHE_KEY_VERSION = 1
+
+
+def synthesize_voice(voice_provider: VoiceProvider, synthetic_voice: SyntheticVoice, text: str) -> SynthesizedAudio:
+    """Synthesize `text` with `synthetic_voice`, reusing previously synthesized audio where possible."""
+    if not settings.TTS_CACHE_ENABLED or len(text) > settings.TTS_CACHE_MAX_TEXT_LENGTH:
+        return voice_provider.get_speech_service().synthesize_voice(text, synthetic_voice)
+
+    cache_key = get_cache_key(voice_provider, synthetic_voice, text)
+    if audio := _get_cached_audio(voice_provider, cache_key):
+        return audio
+
+    audio = voice_provider.get_speech_service().synthesize_voice(text, synthetic_voice)
+    if _should_admit(voice_provider, cache_key):
+        _store(voice_provider, synthetic_voice, cache_key, audio)
+    return audio
+
+
+def get_cache_key(voice_provider: VoiceProvider, synthetic_voice: SyntheticVoice, text: str) -> str:
+    """The provider config is part of the key so that changing e.g. the ElevenLabs model stops serving
+    audio produced with the old settings."""
+    key_data = {
+        "version": CACHE_KEY_VERSION,
+        "provider_type": voice_provider.type,
+        "provider_config": voice_provider.config,
+        "voice_id": synthetic_voice.id,
+        "text": text,
+    }
+    return hashlib.sha256(json.dumps(key_data, sort_keys=True).encode()).hexdigest()
+
+
+def _get_cached_audio(voice_provider: VoiceProvider, cache_key: str) -> SynthesizedAudio | None:
+    entry = SynthesizedAudioCacheEntry.objects.filter(voice_provider=voice_provider, cache_key=cache_key).first()
+    if not entry:
+        return None
+
+    try:
+        with entry.file.open("rb") as f:
+            audio_bytes = f.read()
+    except OSError:
+        # The blob is gone (e.g. removed out of band); drop the entry and re-synthesize.
+        logger.warning("Missing audio for synthesized audio cache entry %s", entry.id)
+        entry.delete()
+        return None
+
+    SynthesizedAudioCacheEntry.objects.filter(id=entry.id).update(
+        hit_count=F("hit_count") + 1, last_used_at=timezone.now()
+    )
+    return SynthesizedAudio(audio=BytesIO(audio_bytes), duration=entry.duration, format=entry.format)
+
+
+def _should_admit(voice_provider: VoiceProvider, cache_key: str) -> bool:
+    """Count misses per key in the shared cache and only admit keys that have been seen before."""
+    admit_after = settings.TTS_CACHE_ADMIT_AFTER
+    if admit_after <= 1:
+        return True
+
+    counter_key = f"tts-cache-miss:{voice_provider.id}:{cache_key}"
+    cache.add(counter_key, 0, timeout=timedelta(days=settings.TTS_CACHE_TTL_DAYS).total_seconds())
+    try:
+        misses = cache.incr(counter_key)
+    except ValueError:
+        # The counter expired between `add` and `incr`
+        return False
+    return misses >= admit_after
+
+
+def _store(voice_provider: VoiceProvider, synthetic_voice: SyntheticVoice, cache_key: str, audio: SynthesizedAudio):
+    audio_bytes = audio.audio.getvalue()
+    entry = SynthesizedAudioCacheEntry(
+        team_id=voice_provider.team_id,
+        voice_provider=voice_provider,
+        synthetic_voice=synthetic_voice,
+        cache_key=cache_key,
+        format=audio.format,
+        duration=audio.duration,
+        size=len(audio_bytes),
+        last_used_at=timezone.now(),
+    )
+    try:
+        entry.file.save(f"{cache_key}.{audio.format}", ContentFile(audio_bytes), save=False)
+        with transaction.atomic():
+            entry.save()
+    except IntegrityError:
+        # Another worker cached the same audio first
+        entry.file.delete(save=False)
+    except Exception:
+        # Caching is best effort: the reply has already been synthesized and must still go out.
+        logger.exception("Unable to cache synthesized audio for voice provider %s", voice_provider.id)
+
+
+def evict_expired_entries() -> int:
+    """Delete entries unused for longer than the TTL and, per team, the least recently used entries over
+    the size cap. Returns the number of entries deleted."""
+    cutoff = timezone.now() - timedelta(days=settings.TTS_CACHE_TTL_DAYS)
+    # Row deletes trigger django-cleanup, which removes the blobs from storage.
+    deleted, _ = SynthesizedAudioCacheEntry.objects.filter(last_used_at__lt=cutoff).delete()
+
+    max_entries = settings.TTS_CACHE_MAX_ENTRIES_PER_TEAM
+    team_ids = SynthesizedAudioCacheEntry.objects.values_list("team_id", flat=True).distinct()
+    for team_id in team_ids:
+        stale_ids = SynthesizedAudioCacheEntry.objects.filter(team_id=team_id).order_by("-last_used_at")[max_entries:]
+        if stale_ids := list(stale_ids.values_list("id", flat=True)):
+            count, _ = SynthesizedAudioCacheEntry.objects.filter(id__in=stale_ids).delete()
+            deleted += count
+    return deleted
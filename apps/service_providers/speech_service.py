@@ -13,7 +13,7 @@ from elevenlabs.client import ElevenLabs as ElevenLabsClient
 from openai import OpenAI
 from pydub import AudioSegment
 
-from apps.channels.audio import convert_audio
+from apps.channels.audio import convert_audio, prepare_audio_for_transcription
 from apps.chat.exceptions import AudioSynthesizeException, AudioTranscriptionException, UserReportableError
 from apps.experiments.models import SyntheticVoice
 from apps.service_providers.intron import INTRON_BASE_URL
@@ -21,6 +21,9 @@ from apps.service_providers.minimax import DEFAULT_MINIMAX_TTS_MODEL, MINIMAX_BA
 
 log = logging.getLogger("ocs.speech")
 
+# https://platform.openai.com/docs/guides/speech-to-text
+OPENAI_TRANSCRIPTION_FORMATS = frozenset({"flac", "mp3", "mp4", "mpeg", "mpga", "m4a", "ogg", "wav", "webm"})
+
 
 @dataclass
 class SynthesizedAudio:
@@ -50,6 +53,8 @@ class SynthesizedAudio:
 class SpeechService(pydantic.BaseModel):
     _type: ClassVar[str]
     supports_transcription: ClassVar[bool] = False
+    # Formats `_transcribe_audio` accepts as-is. Anything else is transcoded to WAV first.
+    transcription_formats: ClassVar[frozenset[str]] = frozenset({"wav"})
 
     def synthesize_voice(self, text: str, synthetic_voice: SyntheticVoice) -> SynthesizedAudio:
         assert synthetic_voice.service == self._type
@@ -61,6 +66,7 @@ class SpeechService(pydantic.BaseModel):
 
     def transcribe_audio(self, audio: IO[bytes]) -> str:
         try:
+            audio = prepare_audio_for_transcription(audio, accepted_formats=self.transcription_formats)
             return self._transcribe_audio(audio)
         except Exception as e:
             log.exception(e)
@@ -213,6 +219,7 @@ class AzureSpeechService(SpeechService):
 class OpenAISpeechService(SpeechService):
     _type: ClassVar[str] = SyntheticVoice.OpenAI
     supports_transcription: ClassVar[bool] = True
+    transcription_formats: ClassVar[frozenset[str]] = OPENAI_TRANSCRIPTION_FORMATS
     openai_api_key: str
     openai_api_base: str | None = None
     openai_organization: str | None = None
@@ -247,6 +254,7 @@ class OpenAISpeechService(SpeechService):
 class ElevenLabsSpeechService(SpeechService):
     _type: ClassVar[str] = SyntheticVoice.ElevenLabs
     supports_transcription: ClassVar[bool] = True
+    transcription_formats: ClassVar[frozenset[str]] = frozenset({"ogg", "mp3", "wav", "m4a", "webm", "flac"})
     _output_format: ClassVar[str] = "mp3_44100_128"
     _stt_model: ClassVar[str] = "scribe_v2"
     elevenlabs_api_key: str
@@ -279,6 +287,7 @@ class ElevenLabsSpeechService(SpeechService):
 class OpenAIVoiceEngineSpeechService(SpeechService):
     _type: ClassVar[str] = SyntheticVoice.OpenAIVoiceEngine
     supports_transcription: ClassVar[bool] = True
+    transcription_formats: ClassVar[frozenset[str]] = OPENAI_TRANSCRIPTION_FORMATS
     openai_api_key: str
     openai_api_base: str | None = None
     openai_organization: str | None = None
@@ -0,0 +1,13 @@
+from celery import shared_task
+from celery.utils.log import get_task_logger
+
+from apps.service_providers import speech_cache
+from apps.utils.celery import Queues
+
+logger = get_task_logger("ocs.service_providers")
+
+
+@shared_task(ignore_result=True, queue=Queues.BACKGROUND)
+def evict_synthesized_audio_cache():
+    deleted = speech_cache.evict_expired_entries()
+    logger.info(f"Evicted {deleted} synthesized audio cache entries")
@@ -182,12 +182,12 @@ class TestMetaCloudAPIServiceAudio:
         assert meta_cloud_api_service.voice_replies_supported is True
 
     @patch("apps.service_providers.messaging_service.httpx.get")
-    def test_get_message_audio_fetches_and_converts(self, mock_get, meta_cloud_api_service):
+    def test_get_message_audio_fetches_audio(self, mock_get, meta_cloud_api_service):
         """get_message_audio should:
         1. GET the media URL from Meta's API using the media_id
         2. Download the binary audio from that URL
         3. Cache the media data on the message
-        4. Convert the audio to WAV format
+        4. Return the audio untranscoded, named with its format
         """
         # Step 1 response: Meta API returns the media download URL
         media_url_response = httpx.Response(
@@ -214,8 +214,7 @@ class TestMetaCloudAPIServiceAudio:
         )
 
         with patch("apps.service_providers.messaging_service.audio.convert_audio") as mock_convert:
-            mock_convert.return_value = BytesIO(b"converted-wav")
-            meta_cloud_api_service.get_message_audio(message)
+            result = meta_cloud_api_service.get_message_audio(message)
 
         # Verify the two HTTP calls were made correctly
         assert mock_get.call_count == 2
@@ -230,11 +229,10 @@ class TestMetaCloudAPIServiceAudio:
         assert message.cached_media_data is not None
         assert message.cached_media_data.content_type == "audio/ogg"
 
-        # Verify audio was converted
-        mock_convert.assert_called_once()
-        call_kwargs = mock_convert.call_args
-        assert call_kwargs.kwargs["target_format"] == "wav"
-        assert call_kwargs.kwargs["source_format"] == "ogg"
+        # Conversion is deferred to the speech service
+        mock_convert.assert_not_called()
+        assert result.getvalue() == audio_bytes
+        assert result.name == "audio.ogg"
 
     @patch("apps.service_providers.messaging_service.httpx.get")
     def test_get_message_audio_raises_on_non_audio(self, mock_get, meta_cloud_api_service):
@@ -0,0 +1,133 @@
+from datetime import timedelta
+from io import BytesIO
+from unittest.mock import patch
+
+import pytest
+from django.core.cache import cache
+from django.utils import timezone
+
+from apps.service_providers import speech_cache
+from apps.service_providers.models import SynthesizedAudioCacheEntry
+from apps.service_providers.speech_service import SynthesizedAudio
+from apps.utils.factories.experiment import SyntheticVoiceFactory
+from apps.utils.factories.service_provider_factories import VoiceProviderFactory
+
+
+@pytest.fixture(autouse=True)
+def _cache_settings(settings):
+    settings.STORAGES = {**settings.STORAGES, "default": {"BACKEND": "django.core.files.storage.InMemoryStorage"}}
+    settings.TTS_CACHE_ENABLED = True
+    settings.TTS_CACHE_ADMIT_AFTER = 2
+    settings.TTS_CACHE_MAX_TEXT_LENGTH = 100
+    cache.clear()
+
+
+@pytest.fixture()
+def voice_provider(db):
+    return VoiceProviderFactory()
+
+
+@pytest.fixture()
+def synthetic_voice(db):
+    return SyntheticVoiceFactory()
+
+
+@pytest.fixture()
+def synthesize():
+    with patch("apps.service_providers.speech_service.AWSSpeechService._synthesize_voice") as synthesize:
+        synthesize.side_effect = lambda text, voice: SynthesizedAudio(
+            audio=BytesIO(f"audio:{text}".encode()), duration=1.5, format="mp3"
+        )
+        yield synthesize
+
+
+@pytest.mark.django_db()
+def test_text_is_cached_after_repeated_synthesis(voice_provider, synthetic_voice, synthesize):
+    for _ in range(2):
+        speech_cache.synthesize_voice(voice_provider, synthetic_voice, "Reply 1 to consent")
+    assert synthesize.call_count == 2
+
+    audio = speech_cache.synthesize_voice(voice_provider, synthetic_voice, "Reply 1 to consent")
+
+    assert synthesize.call_count == 2
+    assert audio.audio.getvalue() == b"audio:Reply 1 to consent"
+    assert audio.duration == 1.5
+    assert audio.format == "mp3"
+    entry = SynthesizedAudioCacheEntry.objects.get()
+    assert entry.team_id == voice_provider.team_id
+    assert entry.hit_count == 1
+
+
+@pytest.mark.django_db()
+def test_single_use_text_is_not_stored(voice_provider, synthetic_voice, synthesize):
+    speech_cache.synthesize_voice(voice_provider, synthetic_voice, "A one-off reply")
+    assert not SynthesizedAudioCacheEntry.objects.exists()
+
+
+@pytest.mark.django_db()
+def test_long_text_bypasses_cache(settings, voice_provider, synthetic_voice, synthesize):
+    settings.TTS_CACHE_ADMIT_AFTER = 1
+    speech_cache.synthesize_voice(voice_provider, synthetic_voice, "x" * 101)
+    assert not SynthesizedAudioCacheEntry.objects.exists()
+
+
+@pytest.mark.django_db()
+def test_cache_is_keyed_on_voice_and_provider_config(settings, voice_provider, synthetic_voice, synthesize):
+    settings.TTS_CACHE_ADMIT_AFTER = 1
+    speech_cache.synthesize_voice(voice_provider, synthetic_voice, "Hello")
+    speech_cache.synthesize_voice(voice_provider, SyntheticVoiceFactory(), "Hello")
+    assert synthesize.call_count == 2
+
+    voice_provider.config = {**voice_provider.config, "aws_region": "eu-west-1"}
+    voice_provider.save()
+    speech_cache.synthesize_voice(voice_provider, synthetic_voice, "Hello")
+    assert synthesize.call_count == 3
+
+
+@pytest.mark.django_db()
+def test_missing_blob_is_resynthesized(settings, voice_provider, synthetic_voice, synthesize):
+    settings.TTS_CACHE_ADMIT_AFTER = 1
+    speech_cache.synthesize_voice(voice_provider, synthetic_voice, "Hello")
+    entry = SynthesizedAudioCacheEntry.objects.get()
+    entry.file.storage.delete(entry.file.name)
+
+    audio = speech_cache.synthesize_voice(voice_provider, synthetic_voice, "Hello")
+
+    assert audio.audio.getvalue() == b"audio:Hello"
+    assert synthesize.call_count == 2
+
+
+@pytest.mark.django_db()
+def test_disabled_cache(settings, voice_provider, synthetic_voice, synthesize):
+    settings.TTS_CACHE_ENABLED = False
+    settings.TTS_CACHE_ADMIT_AFTER = 1
+    for _ in range(2):
+        speech_cache.synthesize_voice(voice_provider, synthetic_voice, "Hello")
+    assert synthesize.call_count == 2
+    assert not SynthesizedAudioCacheEntry.objects.exists()
+
+
+@pytest.mark.django_db()
+def test_eviction(settings, voice_provider, synthetic_voice, synthesize):
+    settings.TTS_CACHE_ADMIT_AFTER = 1
+    settings.TTS_CACHE_TTL_DAYS = 30
+    settings.TTS_CACHE_MAX_ENTRIES_PER_TEAM = 2
+    for text in ["expired", "oldest", "older", "newest"]:
+        speech_cache.synthesize_voice(voice_provider, synthetic_voice, text)
+
+    now = timezone.now()
+    last_used = {
+        "expired": now - timedelta(days=31),
+        "oldest": now - timedelta(days=3),
+        "older": now - timedelta(days=2),
+    }
+    for text, last_used_at in last_used.items():
+        key = speech_cache.get_cache_key(voice_provider, synthetic_voice, text)
+        SynthesizedAudioCacheEntry.objects.filter(cache_key=key).update(last_used_at=last_used_at)
+
+    assert speech_cache.evict_expired_entries() == 2
+
+    remaining = SynthesizedAudioCacheEntry.objects.values_list("cache_key", flat=True)
+    assert set(remaining) == {
+        speech_cache.get_cache_key(voice_provider, synthetic_voice, text) for text in ["older", "newest"]
+    }
@@ -5,12 +5,13 @@ import factory
 import pytest
 from django.db import IntegrityError
 
-from apps.chat.exceptions import AudioSynthesizeException
+from apps.channels.audio import AudioConversionError
+from apps.chat.exceptions import AudioSynthesizeException, UserReportableError
 from apps.experiments.models import SyntheticVoice
 from apps.files.models import File
 from apps.service_providers.exceptions import ServiceProviderConfigError
 from apps.service_providers.models import VoiceProvider, VoiceProviderType, _map_elevenlabs_gender
-from apps.service_providers.speech_service import SynthesizedAudio
+from apps.service_providers.speech_service import OpenAISpeechService, SynthesizedAudio
 from apps.utils.factories.files import FileFactory
 from apps.utils.factories.service_provider_factories import VoiceProviderFactory
 
@@ -349,6 +350,18 @@ def test_elevenlabs_transcribe_audio(team_with_users):
     )
 
 
+def test_transcribe_audio_reports_conversion_errors():
+    speech_service = OpenAISpeechService(openai_api_key="test_key")
+    with (
+        mock.patch(
+            "apps.service_providers.speech_service.prepare_audio_for_transcription",
+            side_effect=AudioConversionError("Unable to convert audio"),
+        ),
+        pytest.raises(UserReportableError, match="Unable to transcribe audio"),
+    ):
+        speech_service.transcribe_audio(BytesIO(b"fake audio data"))
+
+
 @pytest.mark.parametrize("config_key", ["elevenlabs_api_key"])
 def test_elevenlabs_voice_provider_error(config_key):
     """Test that missing API key causes failure"""
@@ -7,3 +7,6 @@ OCS_TRACE_PROVIDER = "ocs"
 USAGE_ONLY_TRACE_PROVIDER = "ocs_usage"
 
 SpanLevel = Literal["DEBUG", "DEFAULT", "WARNING", "ERROR"]
+
+# Custom event dispatched by the collection search tools; `data` is {"collection_id": int, "hit": bool}.
+RETRIEVAL_CACHE_EVENT = "Retrieval Cache"
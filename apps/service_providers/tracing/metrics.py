@@ -12,6 +12,7 @@ from langchain_core.messages.utils import count_tokens_approximately
 from apps.cost_tracking.models import Confidence, ServiceKind
 from apps.cost_tracking.services.estimation import has_usage_metadata, response_text, tiktoken_count
 from apps.cost_tracking.services.recorder import UsageEvent
+from apps.service_providers.tracing.const import RETRIEVAL_CACHE_EVENT
 
 # Providers we can tiktoken-estimate (exact, OpenAI-specific encodings) when
 # usage_metadata is missing. Everything else falls back to the chars/4
@@ -31,6 +32,8 @@ class TraceMetrics:
 
     n_turns: int | None = None
     n_toolcalls: int | None = None
+    retrieval_cache_hits: int = 0
+    retrieval_cache_misses: int = 0
 
 
 class MetricsCollector(BaseCallbackHandler):
@@ -62,6 +65,8 @@ class MetricsCollector(BaseCallbackHandler):
         self._counter_lock = threading.Lock()
         self._turns = 0
         self._toolcalls = 0
+        self._retrieval_cache_hits = 0
+        self._retrieval_cache_misses = 0
         # Cost-tracking state. All access guarded by `_counter_lock`.
         self._pending_calls: dict[UUID, dict[str, Any]] = {}
         self._exact_usage: dict[tuple[str, str], dict[str, Any]] = {}
@@ -159,6 +164,15 @@ class MetricsCollector(BaseCallbackHandler):
         with self._counter_lock:
             self._toolcalls += 1
 
+    def on_custom_event(self, name: str, data: Any, **kwargs: Any) -> None:
+        if name != RETRIEVAL_CACHE_EVENT:
+            return
+        with self._counter_lock:
+            if data.get("hit"):
+                self._retrieval_cache_hits += 1
+            else:
+                self._retrieval_cache_misses += 1
+
     def get_metrics(self) -> TraceMetrics:
         """Return collected metrics, converting zero counts to None.
 
@@ -168,7 +182,14 @@ class MetricsCollector(BaseCallbackHandler):
         with self._counter_lock:
             turns = self._turns
             toolcalls = self._toolcalls
-        return TraceMetrics(n_turns=turns or None, n_toolcalls=toolcalls or None)
+            retrieval_cache_hits = self._retrieval_cache_hits
+            retrieval_cache_misses = self._retrieval_cache_misses
+        return TraceMetrics(
+            n_turns=turns or None,
+            n_toolcalls=toolcalls or None,
+            retrieval_cache_hits=retrieval_cache_hits,
+            retrieval_cache_misses=retrieval_cache_misses,
+        )
 
 
 def _estimate_tokens(provider: str, model: str, prompts: list[str], response) -> tuple[int, int]:
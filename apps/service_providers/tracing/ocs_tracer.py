@@ -6,17 +6,19 @@ from collections.abc import Iterator
 from contextlib import contextmanager
 from typing import Any
 
+from django.conf import settings
 from django.core.cache import cache
 from langchain_core.callbacks.base import BaseCallbackHandler
 from langchain_core.outputs import LLMResult
 
 from apps.channels.models import ChannelPlatform
 from apps.cost_tracking.models import UsageSource
-from apps.cost_tracking.services.recorder import UsageContext, record_usage_bulk
+from apps.cost_tracking.services.recorder import UsageContext, UsageEvent, record_usage_bulk
 from apps.experiments.models import Experiment, ExperimentSession
 from apps.ocs_notifications.notifications import trace_error_notification
 from apps.service_providers.tracing.const import OCS_TRACE_PROVIDER, SpanLevel
 from apps.service_providers.tracing.metrics import MetricsCollector
+from apps.trace import buffer as trace_buffer
 from apps.trace.models import Trace, TraceStatus
 
 from .base import SpanNotificationConfig, TraceContext, Tracer
@@ -35,6 +37,7 @@ class OCSTracer(Tracer):
         self.team_id = team_id
         self.start_time: float | None = None
         self.trace_record = None
+        self.buffered = False
         self.session: ExperimentSession | None = None
         self.error_detected = False
         self.error_message: str = ""
@@ -58,7 +61,9 @@ class OCSTracer(Tracer):
         """Context manager for OCS trace lifecycle.
 
         Creates a database Trace record on entry and updates it with
-        duration and status on exit.
+        duration and status on exit. With ``TRACE_BUFFERING_ENABLED`` both
+        writes are queued and persisted in batches instead (see
+        `apps.trace.buffer`).
 
         ``session`` may be None (e.g. an inbound email that has not yet been
         routed to a session). In that case the record is created without
@@ -79,7 +84,9 @@ class OCSTracer(Tracer):
             experiment_version_number = self.experiment.version_number
 
         # Create database trace record
-        self.trace_record = Trace.objects.create(
+        self.buffered = settings.TRACE_BUFFERING_ENABLED
+        create_trace = trace_buffer.start_trace if self.buffered else Trace.objects.create
+        self.trace_record = create_trace(
             trace_id=trace_context.id,
             experiment_id=experiment_id,
             experiment_version_number=experiment_version_number,
@@ -123,8 +130,11 @@ class OCSTracer(Tracer):
                 self.trace_record.status = TraceStatus.SUCCESS
 
             self._update_trace_metrics()
-            self.trace_record.save()
-            self._record_costs()
+            if self.buffered:
+                trace_buffer.finish_trace(self.trace_record, self._get_usage_events(), self._get_usage_context())
+            else:
+                self.trace_record.save()
+                self._record_costs()
 
             session_id = self.session.id if self.session else None
             logger.debug(
@@ -149,6 +159,17 @@ class OCSTracer(Tracer):
         metrics = self.metrics_collector.get_metrics()
         self.trace_record.n_turns = metrics.n_turns
         self.trace_record.n_toolcalls = metrics.n_toolcalls
+        if lookups := metrics.retrieval_cache_hits + metrics.retrieval_cache_misses:
+            # Kept in the metadata rather than columns of their own: only traces that searched a
+            # collection have them.
+            self.trace_record.trace_metadata = {
+                **(self.trace_record.trace_metadata or {}),
+                "retrieval_cache": {
+                    "hits": metrics.retrieval_cache_hits,
+                    "misses": metrics.retrieval_cache_misses,
+                    "hit_rate": round(metrics.retrieval_cache_hits / lookups, 2),
+                },
+            }
 
     def _record_costs(self) -> None:
         """Drain the collector's accumulated usage into UsageRecord rows.
@@ -157,24 +178,29 @@ class OCSTracer(Tracer):
         swallows DB errors internally; the outer `_finalize_trace` try/except
         catches anything else (e.g. an unexpected helper failure).
         """
-        if not self.metrics_collector:
-            return
         if not self.trace_record:
             return
 
-        events = list(self.metrics_collector.iter_cost_events())
+        events = self._get_usage_events()
         if not events:
             return
-        record_usage_bulk(
-            events,
-            UsageContext(
-                team_id=self.team_id,
-                source=self._usage_source(),
-                trace_id=self.trace_record.id,
-                experiment_id=self.trace_record.experiment_id,
-                session_id=self.session.id if self.session else None,
-                participant_id=self.trace_record.participant_id,
-            ),
+        record_usage_bulk(events, self._get_usage_context())
+
+    def _get_usage_events(self) -> list[UsageEvent]:
+        if not self.metrics_collector:
+            return []
+        return list(self.metrics_collector.iter_cost_events())
+
+    def _get_usage_context(self) -> UsageContext | None:
+        if not self.trace_record:
+            return None
+        return UsageContext(
+            team_id=self.team_id,
+            source=self._usage_source(),
+            trace_id=self.trace_record.id,
+            experiment_id=self.trace_record.experiment_id,
+            session_id=self.session.id if self.session else None,
+            participant_id=self.trace_record.participant_id,
         )
 
     def _usage_source(self) -> UsageSource:
@@ -210,6 +236,7 @@ class OCSTracer(Tracer):
     def _reset_trace_state(self) -> None:
         """Reset all trace-scoped state."""
         self.trace_record = None
+        self.buffered = False
         self.error_detected = False
         self.error_message = ""
         self.trace_name = None
@@ -349,6 +376,10 @@ class OCSCallbackHandler(BaseCallbackHandler):
         if self.tracer.metrics_collector:
             self.tracer.metrics_collector.on_tool_start(serialized, input_str, **kwargs)
 
+    def on_custom_event(self, name: str, data: Any, **kwargs: Any) -> None:
+        if self.tracer.metrics_collector:
+            self.tracer.metrics_collector.on_custom_event(name, data, **kwargs)
+
     def on_llm_error(self, *args, **kwargs) -> None:
         error = kwargs.get("error") or (args[0] if args else None)
         self._capture_error(str(error) if error else "LLM error occurred", "LLM Error")
@@ -7,6 +7,7 @@ from langchain_core.messages import AIMessage
 from langchain_core.outputs import ChatGeneration, LLMResult
 
 from apps.cost_tracking.models import Confidence, ServiceKind
+from apps.service_providers.tracing.const import RETRIEVAL_CACHE_EVENT
 from apps.service_providers.tracing.metrics import MetricsCollector, _split_buckets
 
 
@@ -66,6 +67,19 @@ class TestMetricsCollectorToolCalls:
         assert metrics.n_toolcalls is None
 
 
+class TestMetricsCollectorRetrievalCache:
+    def test_retrieval_cache_events_are_counted(self):
+        collector = MetricsCollector(start_time=time.time())
+        collector.on_custom_event(RETRIEVAL_CACHE_EVENT, {"collection_id": 1, "hit": True})
+        collector.on_custom_event(RETRIEVAL_CACHE_EVENT, {"collection_id": 1, "hit": False})
+        collector.on_custom_event(RETRIEVAL_CACHE_EVENT, {"collection_id": 2, "hit": True})
+        collector.on_custom_event("OpenAI Assistant Run Created", {"run_id": "run_1"})
+
+        metrics = collector.get_metrics()
+        assert metrics.retrieval_cache_hits == 2
+        assert metrics.retrieval_cache_misses == 1
+
+
 class TestMetricsCollectorThreadSafety:
     def test_concurrent_increments(self):
         collector = MetricsCollector(start_time=time.time())
@@ -4,3 +4,6 @@ from django.apps import AppConfig
 class SlackConfig(AppConfig):
     name = "apps.slack"
     label = "slack"
+
+    def ready(self):
+        from . import signals  # noqa: F401, PLC0415 - lazy: signal registration belongs in ready()
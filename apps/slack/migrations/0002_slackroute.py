@@ -0,0 +1,29 @@
+# Generated by Django 5.2.16 on 2026-10-18 23:51
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('bot_channels', '0033_experimentchannel_credential_mode_and_more'),
+        ('slack', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SlackRoute',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('slack_team_id', models.CharField(max_length=32)),
+                ('channel_id', models.CharField(max_length=32)),
+                ('keyword', models.CharField(blank=True, max_length=100)),
+                ('is_default', models.BooleanField(default=False)),
+                ('experiment_channel', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='slack_routes', to='bot_channels.experimentchannel')),
+            ],
+            options={
+                'indexes': [models.Index(fields=['slack_team_id', 'channel_id', 'keyword'], name='slack_slack_slack_t_b1bbda_idx')],
+            },
+        ),
+    ]
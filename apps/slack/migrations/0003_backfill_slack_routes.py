@@ -0,0 +1,45 @@
+from django.db import migrations
+
+SLACK_ALL_CHANNELS = "*"
+
+
+def _backfill_routes(apps, schema_editor):
+    """Build the routes of existing Slack channels (mirrors `apps.slack.routing.build_routes`)."""
+    ExperimentChannel = apps.get_model("bot_channels", "ExperimentChannel")
+    SlackRoute = apps.get_model("slack", "SlackRoute")
+    channels = ExperimentChannel.objects.filter(
+        platform="slack", deleted=False, messaging_provider__isnull=False
+    ).select_related("messaging_provider")
+    routes = []
+    for channel in channels.iterator(chunk_size=500):
+        slack_team_id = channel.messaging_provider.config.get("slack_team_id")
+        channel_id = channel.extra_data.get("slack_channel_id")
+        if not slack_team_id or not channel_id:
+            continue
+        is_default = channel_id == SLACK_ALL_CHANNELS and bool(channel.extra_data.get("is_default"))
+        routes.append(
+            SlackRoute(slack_team_id=slack_team_id, channel_id=channel_id, is_default=is_default, experiment_channel=channel)
+        )
+        if channel_id == SLACK_ALL_CHANNELS and not is_default:
+            keywords = {keyword.lower() for keyword in channel.extra_data.get("keywords", [])}
+            routes.extend(
+                SlackRoute(slack_team_id=slack_team_id, channel_id=channel_id, keyword=keyword, experiment_channel=channel)
+                for keyword in sorted(keywords)
+            )
+    SlackRoute.objects.bulk_create(routes, batch_size=500)
+
+
+def _remove_routes(apps, schema_editor):
+    apps.get_model("slack", "SlackRoute").objects.all().delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('slack', '0002_slackroute'),
+        ('service_providers', '0074_synthesizedaudiocacheentry'),
+    ]
+
+    operations = [
+        migrations.RunPython(_backfill_routes, reverse_code=_remove_routes),
+    ]
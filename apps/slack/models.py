@@ -102,3 +102,29 @@ class SlackOAuthState(BaseTeamModel):
         """Additional context to add to the request which can be used elsewhere
         in the installation process."""
         return {"team": self.team, INSTALLATION_CONFIG: self.config}
+
+
+class SlackRoute(models.Model):
+    """Which Slack channel handles an event, by Slack workspace, channel and routing keyword.
+
+    Denormalized from `ExperimentChannel.extra_data` and the workspace ID in the channel's (encrypted)
+    messaging provider config, so routing an event doesn't read and decrypt the config of every Slack
+    channel on the server. Kept up to date by `apps.slack.routing.sync_channel_routes`.
+    """
+
+    slack_team_id = models.CharField(max_length=32)
+    # A Slack channel ID, or SLACK_ALL_CHANNELS for bots listening in all channels
+    channel_id = models.CharField(max_length=32)
+    keyword = models.CharField(max_length=100, blank=True)
+    is_default = models.BooleanField(default=False)
+    experiment_channel = models.ForeignKey(
+        "bot_channels.ExperimentChannel", on_delete=models.CASCADE, related_name="slack_routes"
+    )
+
+    class Meta:
+        indexes = [
+            models.Index(fields=["slack_team_id", "channel_id", "keyword"]),
+        ]
+
+    def __str__(self):
+        return f"{self.slack_team_id}/{self.channel_id}/{self.keyword or '-'} -> {self.experiment_channel_id}"
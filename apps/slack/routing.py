@@ -0,0 +1,134 @@
+"""Routing of inbound Slack events to the `ExperimentChannel` that handles them.
+
+A Slack channel is addressed by the workspace (Slack team) it belongs to, which is only stored in the
+encrypted config of the channel's messaging provider. Rather than decrypting the config of every Slack
+channel on each event, the routes of each channel are denormalized into `SlackRoute` whenever the
+channel or its messaging provider is saved (see `apps.slack.signals`).
+
+Each process keeps the routes of the workspaces it has seen in memory. They are versioned per workspace
+by a random token in the shared cache, which `invalidate_routes` replaces whenever a workspace's routes
+change, so every process reloads them on its next event for that workspace.
+"""
+
+import threading
+import uuid
+from dataclasses import dataclass
+
+from django.core.cache import cache
+from django.db import transaction
+
+from apps.channels.const import SLACK_ALL_CHANNELS
+from apps.channels.models import ChannelPlatform, ExperimentChannel
+from apps.slack.models import SlackRoute
+
+CACHE_KEY_VERSION = 1
+
+
+@dataclass(frozen=True)
+class Route:
+    channel_id: str
+    keyword: str
+    is_default: bool
+    experiment_channel_id: int
+
+
+_local_routes: dict[str, tuple[str, list[Route]]] = {}
+_local_routes_lock = threading.Lock()
+
+
+def find_channel(slack_team_id: str, channel_id: str, keyword: str | None = None) -> ExperimentChannel | None:
+    """The channel that handles a message in the given Slack channel: the bot assigned to that channel,
+    else the "all channels" bot with the message's keyword, else the workspace's default bot."""
+    routes = get_routes(slack_team_id)
+    all_channels = [route for route in routes if route.channel_id == SLACK_ALL_CHANNELS]
+    candidates = (
+        [route for route in routes if route.channel_id == channel_id and not route.keyword]
+        or [route for route in all_channels if keyword and route.keyword == keyword]
+        or [route for route in all_channels if route.is_default]
+    )
+    if not candidates:
+        return None
+    return (
+        ExperimentChannel.objects.filter(id__in=[route.experiment_channel_id for route in candidates])
+        .select_related("experiment", "messaging_provider")
+        .first()
+    )
+
+
+def get_routes(slack_team_id: str) -> list[Route]:
+    # Read the token before the database so that an invalidation racing with this lookup can't leave
+    # stale routes behind under the new token.
+    token = _get_token(slack_team_id)
+    with _local_routes_lock:
+        entry = _local_routes.get(slack_team_id)
+    if entry and entry[0] == token:
+        return entry[1]
+
+    routes = [
+        Route(*values)
+        for values in SlackRoute.objects.filter(slack_team_id=slack_team_id)
+        .order_by("id")
+        .values_list("channel_id", "keyword", "is_default", "experiment_channel_id")
+    ]
+    with _local_routes_lock:
+        _local_routes[slack_team_id] = (token, routes)
+    return routes
+
+
+def sync_channel_routes(channel: ExperimentChannel):
+    """Replace the stored routes of a channel with ones built from its current state."""
+    existing = SlackRoute.objects.filter(experiment_channel_id=channel.id)
+    slack_team_ids = set(existing.values_list("slack_team_id", flat=True))
+    existing.delete()
+    routes = build_routes(channel)
+    SlackRoute.objects.bulk_create(routes)
+    invalidate_routes(slack_team_ids | {route.slack_team_id for route in routes})
+
+
+def build_routes(channel: ExperimentChannel) -> list[SlackRoute]:
+    if channel.platform != ChannelPlatform.SLACK or channel.deleted or not channel.messaging_provider_id:
+        return []
+    slack_team_id = channel.messaging_provider.config.get("slack_team_id")
+    channel_id = channel.extra_data.get("slack_channel_id")
+    if not slack_team_id or not channel_id:
+        return []
+
+    is_default = channel_id == SLACK_ALL_CHANNELS and bool(channel.extra_data.get("is_default"))
+    routes = [
+        SlackRoute(
+            slack_team_id=slack_team_id, channel_id=channel_id, is_default=is_default, experiment_channel=channel
+        )
+    ]
+    if channel_id == SLACK_ALL_CHANNELS and not is_default:
+        keywords = {keyword.lower() for keyword in channel.extra_data.get("keywords", [])}
+        routes.extend(
+            SlackRoute(slack_team_id=slack_team_id, channel_id=channel_id, keyword=keyword, experiment_channel=channel)
+            for keyword in sorted(keywords)
+        )
+    return routes
+
+
+def invalidate_routes(slack_team_ids):
+    """Make every process reload the routes of the given workspaces."""
+    slack_team_ids = list(slack_team_ids)
+    if not slack_team_ids:
+        return
+    _replace_tokens(slack_team_ids)
+    # Again once committed, in case another process re-cached the old routes in the meantime
+    transaction.on_commit(lambda: _replace_tokens(slack_team_ids))
+
+
+def _replace_tokens(slack_team_ids):
+    cache.set_many({_get_token_cache_key(slack_team_id): uuid.uuid4().hex for slack_team_id in slack_team_ids}, None)
+
+
+def _get_token(slack_team_id: str) -> str:
+    key = _get_token_cache_key(slack_team_id)
+    if token := cache.get(key):
+        return token
+    cache.add(key, uuid.uuid4().hex, None)
+    return cache.get(key)
+
+
+def _get_token_cache_key(slack_team_id: str) -> str:
+    return f"SLACK_ROUTES:{CACHE_KEY_VERSION}:token:{slack_team_id}"
@@ -0,0 +1,32 @@
+from django.db.models.signals import post_save, pre_delete
+from django.dispatch import receiver
+
+from apps.channels.models import ChannelPlatform, ExperimentChannel
+from apps.service_providers.models import MessagingProvider, MessagingProviderType
+from apps.slack.routing import invalidate_routes, sync_channel_routes
+
+
+@receiver(post_save, sender=ExperimentChannel)
+def update_channel_routes(sender, instance: ExperimentChannel, **kwargs):
+    if instance.platform == ChannelPlatform.SLACK:
+        sync_channel_routes(instance)
+
+
+@receiver(pre_delete, sender=ExperimentChannel)
+def invalidate_deleted_channel_routes(sender, instance: ExperimentChannel, **kwargs):
+    """The channel's routes are deleted along with it; make sure no process keeps routing to it."""
+    if instance.platform == ChannelPlatform.SLACK:
+        invalidate_routes(set(instance.slack_routes.values_list("slack_team_id", flat=True)))
+
+
+@receiver(post_save, sender=MessagingProvider)
+def update_messaging_provider_routes(sender, instance: MessagingProvider, **kwargs):
+    """A provider's Slack workspace is part of the routes of every channel using it."""
+    if instance.type != MessagingProviderType.slack:
+        return
+    channels = ExperimentChannel.objects.get_unfiltered_queryset().filter(
+        messaging_provider_id=instance.id, platform=ChannelPlatform.SLACK
+    )
+    for channel in channels:
+        channel.messaging_provider = instance
+        sync_channel_routes(channel)
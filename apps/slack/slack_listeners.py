@@ -10,12 +10,10 @@ Manage event subscriptions at:
 import logging
 import re
 
-from django.db.models import Q
 from slack_bolt import BoltContext, BoltResponse
 
-from apps.channels.const import SLACK_ALL_CHANNELS
 from apps.channels.datamodels import SlackMessage
-from apps.channels.models import ChannelPlatform, ExperimentChannel
+from apps.channels.models import ExperimentChannel
 from apps.channels.rate_limiting import count_channel_message
 from apps.channels.slack_channel import SlackChannel
 from apps.chatbots.version_resolver import resolve_published_or_working
@@ -23,6 +21,7 @@ from apps.experiments.models import ExperimentSession
 from apps.service_providers.messaging_service import SlackService
 from apps.slack.exceptions import TeamAccessException
 from apps.slack.models import SlackInstallation
+from apps.slack.routing import find_channel
 from apps.slack.utils import make_session_external_id
 from apps.teams.utils import current_team
 
@@ -139,31 +138,8 @@ def get_experiment_channel(channel_id, message_text, bolt_context) -> Experiment
     """Get the experiment channel for the given team and channel_id. This searches for exact matches
     on the channel ID and also for the special case of bots that are listening in all channels.
     For DM channels, it also supports keyword-based routing."""
-
-    base_queryset = ExperimentChannel.objects.filter(platform=ChannelPlatform.SLACK, deleted=False).select_related(
-        "experiment", "messaging_provider"
-    )
-
-    # First, try to find exact channel match (specific channel assignment)
-    exact_channels_qs = base_queryset.filter(extra_data__contains={"slack_channel_id": channel_id})
-    if exact_channel := _get_first_channel_for_slack_team(exact_channels_qs, bolt_context.team_id):
-        return exact_channel
-
-    # If no exact match, check for "all channels" bots (including keyword-based routing)
-    all_channels = base_queryset.filter(extra_data__contains={"slack_channel_id": SLACK_ALL_CHANNELS})
-    default_filter = Q(extra_data__is_default=True)
     keyword = _get_keyword(bolt_context, message_text)
-    if not keyword:
-        return all_channels.filter(default_filter).first()
-
-    # handle keywords and default channel together to avoid another DB query
-    default_keyword_channels = all_channels.filter(default_filter | Q(extra_data__contains={"keywords": [keyword]}))
-    matching_channels = _filter_channels_for_slack_team(default_keyword_channels, bolt_context.team_id)
-    for channel in matching_channels:
-        if not channel.extra_data.get("is_default") and channel.extra_data.get("keywords"):
-            return channel
-    default_channel = [channel for channel in matching_channels if channel.extra_data.get("is_default")]
-    return default_channel[0] if default_channel else None
+    return find_channel(bolt_context.team_id, channel_id, keyword)
 
 
 def _is_dm_channel(channel_id: str) -> bool:
@@ -185,12 +161,3 @@ def _get_keyword(context, message_text: str) -> str | None:
 
     keyword = match.group(1).lower()
     return keyword if len(keyword) > 1 else None
-
-
-def _get_first_channel_for_slack_team(channels, slack_team_id):
-    matches = _filter_channels_for_slack_team(channels, slack_team_id)
-    return matches[0] if matches else None
-
-
-def _filter_channels_for_slack_team(channels, slack_team_id):
-    return [channel for channel in channels if channel.messaging_provider.config.get("slack_team_id") == slack_team_id]
@@ -0,0 +1,73 @@
+import pytest
+
+from apps.channels.const import SLACK_ALL_CHANNELS
+from apps.channels.models import ChannelPlatform
+from apps.service_providers.models import MessagingProviderType
+from apps.slack.models import SlackRoute
+from apps.slack.routing import find_channel, get_routes
+from apps.utils.factories.channels import ExperimentChannelFactory
+from apps.utils.factories.service_provider_factories import MessagingProviderFactory
+
+
+@pytest.fixture()
+def messaging_provider():
+    return MessagingProviderFactory.create(type=MessagingProviderType.slack, config={"slack_team_id": "T1"})
+
+
+def _slack_channel(messaging_provider, **extra_data):
+    return ExperimentChannelFactory.create(
+        platform=ChannelPlatform.SLACK, extra_data=extra_data, messaging_provider=messaging_provider
+    )
+
+
+@pytest.mark.django_db()
+def test_routes_are_built_when_a_channel_is_saved(messaging_provider):
+    channel = _slack_channel(messaging_provider, slack_channel_id=SLACK_ALL_CHANNELS, keywords=["Health", "pay"])
+
+    routes = SlackRoute.objects.filter(experiment_channel=channel)
+    assert sorted(routes.values_list("slack_team_id", "channel_id", "keyword")) == [
+        ("T1", "*", ""),
+        ("T1", "*", "health"),
+        ("T1", "*", "pay"),
+    ]
+
+    channel.extra_data = {"slack_channel_id": SLACK_ALL_CHANNELS, "is_default": True}
+    channel.save()
+    assert list(routes.values_list("keyword", "is_default")) == [("", True)]
+
+    channel.soft_delete()
+    assert not routes.exists()
+
+
+@pytest.mark.django_db()
+def test_channels_are_only_routed_within_their_workspace(messaging_provider):
+    channel = _slack_channel(messaging_provider, slack_channel_id="C1")
+    default = _slack_channel(messaging_provider, slack_channel_id=SLACK_ALL_CHANNELS, is_default=True)
+
+    assert find_channel("T1", "C1") == channel
+    assert find_channel("T1", "C2", keyword="health") == default
+    assert find_channel("T2", "C1") is None
+
+
+@pytest.mark.django_db()
+def test_changing_the_providers_workspace_moves_its_routes(messaging_provider):
+    channel = _slack_channel(messaging_provider, slack_channel_id="C1")
+    assert find_channel("T1", "C1") == channel
+
+    messaging_provider.config = {"slack_team_id": "T2"}
+    messaging_provider.save()
+
+    assert find_channel("T1", "C1") is None
+    assert find_channel("T2", "C1") == channel
+
+
+@pytest.mark.django_db()
+def test_routes_are_served_from_memory_until_they_change(messaging_provider, django_assert_num_queries):
+    _slack_channel(messaging_provider, slack_channel_id="C1")
+    get_routes("T1")
+
+    with django_assert_num_queries(0):
+        assert len(get_routes("T1")) == 1
+
+    _slack_channel(messaging_provider, slack_channel_id="C2")
+    assert len(get_routes("T1")) == 2
@@ -1,7 +1,10 @@
-from django.contrib import admin
+from django.contrib import admin, messages
+from django.db.models import Q
+from django.utils import timezone
 from waffle.admin import FlagAdmin as WaffleFlagAdmin
 
-from .models import Flag, Invitation, Membership, Team
+from .models import DeletionJob, DeletionJobStatus, Flag, Invitation, Membership, Team
+from .tasks import DELETION_JOB_STALE_AFTER, run_deletion_job
 
 
 @admin.register(Membership)
@@ -21,6 +24,36 @@ class MembershipInlineAdmin(admin.TabularInline):
     list_display = ["user"]
 
 
+@admin.register(DeletionJob)
+class DeletionJobAdmin(admin.ModelAdmin):
+    list_display = ["model_label", "object_id", "object_name", "status", "progress", "created_at", "updated_at"]
+    list_filter = ["status", "model_label"]
+    readonly_fields = ["progress"]
+    actions = ["resume"]
+
+    @admin.action(description="Resume the selected jobs")
+    def resume(self, request, queryset):
+        """Restart the selected jobs that failed or whose worker went away. A job that is still running is
+        left alone, since a second worker would delete the same batches alongside it."""
+        resumable = Q(status=DeletionJobStatus.FAILED) | Q(
+            status=DeletionJobStatus.RUNNING, updated_at__lt=timezone.now() - DELETION_JOB_STALE_AFTER
+        )
+        resumed = 0
+        for job_id in queryset.values_list("id", flat=True):
+            # Conditional, in case the job was picked up again since it was listed
+            if DeletionJob.objects.filter(resumable, id=job_id).update(
+                status=DeletionJobStatus.PENDING, error="", updated_at=timezone.now()
+            ):
+                run_deletion_job.delay(job_id)
+                resumed += 1
+        skipped = queryset.count() - resumed
+        self.message_user(request, f"Resumed {resumed} job(s)")
+        if skipped:
+            self.message_user(
+                request, f"Skipped {skipped} job(s) that are pending, completed or still running", messages.WARNING
+            )
+
+
 @admin.register(Team)
 class TeamAdmin(admin.ModelAdmin):
     list_display = ["name", "slug"]
@@ -4,12 +4,15 @@ plain functions plus a thin loop so the transforms can be unit-tested without a
 
 import contextlib
 import functools
+import itertools
+import operator
 from collections.abc import Callable, Iterable
 
 from django.contrib.auth.models import Group
 from django.contrib.contenttypes.models import ContentType
 from django.core.files.base import ContentFile
-from django.db import models, transaction
+from django.db import IntegrityError, models, transaction
+from django.db.models import Q
 from django.db.models.signals import m2m_changed, post_delete, post_save, pre_delete, pre_save
 from django.utils.dateparse import parse_datetime
 from field_audit.models import AuditAction, AuditingQuerySet
@@ -37,6 +40,9 @@ from .translation import FKTranslationStore
 # target -- include it so FKs pointing at it resolve to the imported team instead of being nulled.
 MANIFEST_LABELS = {entry.model for entry in _ENTRIES} | {TEAM_MODEL}
 
+# Rows are imported a page at a time (see Importer._import_page).
+IMPORT_BATCH_SIZE = 500
+
 SIGNALS_TO_MUTE = (pre_save, post_save, pre_delete, post_delete, m2m_changed)
 
 
@@ -189,6 +195,26 @@ _MATCH_EXISTING = {
 _NO_UPDATE_MODELS = {"users.customuser"}
 
 
+@functools.cache
+def _supports_bulk_import(model_label: str) -> bool:
+    """Whether a page of the model's rows can be written with bulk queries rather than a save() each.
+    bulk_create/bulk_update skip save(), so models whose save() does work of its own (tag slugs, file
+    sizes, annotation scores), rows matched onto pre-existing target rows, name-linked models and
+    audited models (field_audit can't audit a bulk_update) keep the per-row path."""
+    if model_label in _MATCH_EXISTING or model_label in _NAMED_LINK_FIELDS:
+        return False
+    model = entry_model(model_label)
+    if any("save" in vars(klass) for klass in model.__mro__[: model.__mro__.index(models.Model)]):
+        return False
+    if isinstance(model._default_manager.all(), AuditingQuerySet):
+        return False
+    return all(field.remote_field.through._meta.auto_created for field in model._meta.many_to_many)
+
+
+def _natural_key(spec: GlobalSpec, row: dict) -> tuple:
+    return tuple(row[key] for key in spec.natural_key)
+
+
 class Importer:
     def __init__(
         self,
@@ -209,20 +235,115 @@ class Importer:
         # The single team every resource is imported into. Captured from the team row (first in the
         # manifest) and assigned to every team-scoped row, since the per-row team FK isn't exported.
         self.target_team = None
+        # model label -> natural key -> target pk of the shared global rows matched so far this run
+        self._global_matches: dict[str, dict[tuple, int]] = {}
 
-    def import_rows(self, model_label: str, rows: Iterable[dict]) -> int:
-        """Import every row for one model, unsealing its secret fields first when we hold the key.
-        Returns the number of rows imported this pass (for the sync's progress report)."""
+    def import_rows(self, model_label: str, rows: Iterable[dict], batch_size: int = IMPORT_BATCH_SIZE) -> int:
+        """Import every row for one model, ``batch_size`` rows at a time, unsealing their secret fields
+        first when we hold the key. Returns the number of rows imported this pass (for the sync's
+        progress report)."""
         model = entry_model(model_label)
         secret_fields = SECRET_REGISTRY.get(model_label, [])
         count = 0
-        for row in rows:
+        for page in itertools.batched(rows, batch_size, strict=False):
             if self.private_key and secret_fields:
-                row = unseal_secrets(row, secret_fields, self.private_key)
-            self._import_row(model_label, model, row)
-            count += 1
+                page = [unseal_secrets(row, secret_fields, self.private_key) for row in page]
+            if _supports_bulk_import(model_label):
+                self._import_page(model_label, model, page)
+            else:
+                for row in page:
+                    self._import_row(model_label, model, row)
+            count += len(page)
         return count
 
+    def _import_page(self, model_label: str, model: type[models.Model], rows: list[dict]) -> None:
+        """Import a page of a bulk-importable model's rows (see ``_supports_bulk_import``) with a fixed
+        number of queries rather than several per row. Global rows are matched together; rows already on
+        the target are updated with one ``bulk_update`` and the rest created with one ``bulk_create``. As
+        in ``_import_team_owned_row``, the writes, m2m links, timestamp restore and checkpoint fill share
+        one transaction. A page that hits a conflict is rolled back and imported row by row instead, so
+        the offending row is matched or fails on its own."""
+        global_spec = GLOBAL_CONFIG.get(model_label)
+        if global_spec:
+            if global_rows := [row for row in rows if row.get("is_global")]:
+                self._import_global_rows(model_label, model, global_spec, global_rows)
+            rows = [row for row in rows if not row.get("is_global")]
+        if not rows:
+            return
+
+        existing = self._existing_targets(model_label, model, rows)
+        built = {row["id"]: self._build_values(model_label, model, row) for row in rows}
+        # checkpoint markers before the rows exist
+        self.store.record_many(model_label, [(row["id"], None) for row in rows if row["id"] not in existing])
+        try:
+            with transaction.atomic():
+                instances = self._bulk_write(model, existing, built)
+                self._bulk_set_m2m(model, instances, built)
+                self.store.record_many(model_label, [(source_pk, obj.pk) for source_pk, obj in instances.items()])
+        except IntegrityError:
+            for row in rows:
+                self._import_row(model_label, model, row)
+
+    def _existing_targets(self, model_label: str, model: type[models.Model], rows: list[dict]) -> dict:
+        """The page's rows that a previous run already created, as {source pk: target instance}. Looked
+        up through ``_base_manager`` for the same reason as in ``_get_or_create``."""
+        target_pks = {}
+        for row in rows:
+            if (target_pk := self.store.get_target(model_label, row["id"])) is not None:
+                target_pks[row["id"]] = target_pk
+        found = model._base_manager.in_bulk(target_pks.values())
+        return {source_pk: found[pk] for source_pk, pk in target_pks.items() if pk in found}
+
+    def _bulk_write(self, model: type[models.Model], existing: dict, built: dict) -> dict:
+        """Update the existing rows and create the new ones, then write the source timestamps back over
+        what ``auto_now``/``auto_now_add`` set on insert. Returns {source pk: target instance}."""
+        update_fields, timestamp_fields = set(), set()
+        for source_pk, instance in existing.items():
+            for key, value in built[source_pk][0].items():
+                setattr(instance, key, value)
+                update_fields.add(key)
+        created = {
+            source_pk: model(**field_values)
+            for source_pk, (field_values, _, _) in built.items()
+            if source_pk not in existing
+        }
+        model._default_manager.bulk_create(list(created.values()))
+
+        instances = existing | created
+        for source_pk, instance in instances.items():
+            for key, value in built[source_pk][2].items():
+                setattr(instance, key, value)
+                timestamp_fields.add(key)
+        # bulk_update writes the attributes as they are (no auto_now), so it also restores the timestamps
+        if existing and (update_fields or timestamp_fields):
+            model._default_manager.bulk_update(list(existing.values()), update_fields | timestamp_fields)
+        if created and timestamp_fields:
+            model._default_manager.bulk_update(list(created.values()), timestamp_fields)
+        return instances
+
+    def _bulk_set_m2m(self, model: type[models.Model], instances: dict, built: dict) -> None:
+        """``.set()`` each m2m field for the whole page: delete the rows' current through-rows and insert
+        the translated ones in one query per field."""
+        for field in model._meta.many_to_many:
+            members = {
+                instances[source_pk].pk: [pk for pk in m2m_values[field.name] if pk is not None]
+                for source_pk, (_, m2m_values, _) in built.items()
+                if field.name in m2m_values
+            }
+            if not members:
+                continue
+            through = field.remote_field.through
+            source_column, target_column = f"{field.m2m_field_name()}_id", f"{field.m2m_reverse_field_name()}_id"
+            through.objects.filter(**{f"{source_column}__in": list(members)}).delete()
+            through.objects.bulk_create(
+                [
+                    through(**{source_column: pk, target_column: target_pk})
+                    for pk, target_pks in members.items()
+                    for target_pk in dict.fromkeys(target_pks)
+                ],
+                ignore_conflicts=True,
+            )
+
     def _import_row(self, model_label: str, model: type[models.Model], row: dict) -> None:
         """Import a single row. A global row is matched to its shared target and only its id
         translation is recorded; a team-owned row is created or updated, then its m2m and named
@@ -233,10 +354,7 @@ class Importer:
         # Global row (flagged by the export): match the existing target row by natural key and just
         # record the id translation -- these are shared, never recreated.
         if global_spec and row.get("is_global"):
-            match = self._match_global(model, global_spec, row)
-            if match is None:
-                raise MissingGlobalRow(model_label, global_spec, row)
-            self.store.record(model_label, source_pk, match.pk)
+            self._import_global_rows(model_label, model, global_spec, [row])
             return
 
         # Team-owned row. The create, its m2m/named links, the timestamp restore, and the checkpoint
@@ -436,11 +554,32 @@ class Importer:
             raise UnresolvedForeignKey(f"{field.model._meta.label_lower}.{field.name} (m2m) -> {label}:{source_pk}")
         return target
 
-    def _match_global(self, model: type[models.Model], spec: GlobalSpec, row: dict) -> models.Model | None:
-        """Find the shared global row on the target by its natural key (scoping field null)."""
-        lookup = {f"{spec.null_field}__isnull": True}
-        lookup.update({key: row[key] for key in spec.natural_key})
-        return model.objects.filter(**lookup).first()
+    def _import_global_rows(self, model_label: str, model: type[models.Model], spec: GlobalSpec, rows: list[dict]):
+        """Match each global row to the shared target row and record the id translations."""
+        matches = self._match_globals(model_label, model, spec, rows)
+        mappings = []
+        for row in rows:
+            target_pk = matches.get(_natural_key(spec, row))
+            if target_pk is None:
+                raise MissingGlobalRow(model_label, spec, row)
+            mappings.append((row["id"], target_pk))
+        self.store.record_many(model_label, mappings)
+
+    def _match_globals(self, model_label: str, model: type[models.Model], spec: GlobalSpec, rows: list[dict]) -> dict:
+        """Find the shared global rows on the target by natural key (scoping field null). Matches are
+        kept for the rest of the run, so only keys not seen before are queried, all in one query.
+        Returns {natural key: target pk}."""
+        matches = self._global_matches.setdefault(model_label, {})
+        wanted = {_natural_key(spec, row) for row in rows} - matches.keys()
+        if wanted:
+            condition = functools.reduce(
+                operator.or_, (Q(**dict(zip(spec.natural_key, key, strict=True))) for key in wanted)
+            )
+            queryset = model.objects.filter(condition, **{f"{spec.null_field}__isnull": True})
+            queryset = queryset.order_by(*(model._meta.ordering or ["pk"]))
+            for pk, *key in queryset.values_list("pk", *spec.natural_key):
+                matches.setdefault(tuple(key), pk)  # the first match, as .first() would pick
+        return matches
 
     def _apply_named_links(self, model_label: str, instance: models.Model, row: dict) -> None:
         """Re-link the m2m fields serialized as names (see ``_NAMED_LINK_FIELDS``). Their targets --
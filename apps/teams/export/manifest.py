@@ -138,6 +138,8 @@ EXCLUDE_REGISTRY: dict[str, list[str]] = {
     # re-indexing the collection on the target repopulates it, and until that happens imported
     # chunks are invisible to keyword search while dense retrieval works normally.
     "files.filechunkembedding": ["search_vector"],
+    # Generated by Postgres from content and search_language, which are both exported.
+    "chat.chatmessage": ["search_vector"],
 }
 
 # ORM lookup path from a model to its owning team, applied as Model.objects.filter(<path>=team).
@@ -19,7 +19,7 @@ from apps.experiments.models import ConsentForm, ExperimentSession
 from apps.files.models import File
 from apps.human_annotations.models import Annotation, AnnotationQueue
 from apps.pipelines.models import Node, Pipeline
-from apps.service_providers.models import LlmProvider
+from apps.service_providers.models import LlmProvider, LlmProviderModel
 from apps.teams.export import seal as seal_mod
 from apps.teams.export.client import FileContentNotFound
 from apps.teams.export.importer import Importer, MissingGlobalRow, UnresolvedForeignKey, mute_signals
@@ -707,6 +707,60 @@ def test_m2m_member_with_untranslated_target_raises(store):
         importer.import_rows("human_annotations.annotationqueue", [_annotation_queue_row(600, assignees=[71, 72])])
 
 
+def test_a_page_of_rows_is_imported_in_bulk(store, django_assert_max_num_queries):
+    """A bulk-importable model's page is written with a fixed number of queries, not several per row,
+    with its m2m links, timestamps and checkpoints all in place."""
+    importer = Importer(store)
+    importer.import_rows("teams.team", [_team_row()])
+    user = UserFactory()
+    store.record("users.customuser", 71, user.id)
+    rows = [_annotation_queue_row(600 + i, assignees=[71], name=f"Queue {i}") for i in range(20)]
+
+    with django_assert_max_num_queries(10):
+        assert importer.import_rows("human_annotations.annotationqueue", rows) == 20
+
+    queues = AnnotationQueue.objects.filter(
+        pk__in=store.committed_targets("human_annotations.annotationqueue").values()
+    )
+    assert queues.count() == 20
+    assert {queue.created_at for queue in queues} == {datetime(2020, 1, 2, 3, 4, 5, tzinfo=UTC)}
+    assert all(list(queue.assignees.all()) == [user] for queue in queues)
+    assert store.has_unfilled_targets() is False
+
+
+def test_reimporting_a_page_updates_the_existing_rows(store):
+    importer = Importer(store)
+    importer.import_rows("teams.team", [_team_row()])
+    user_a, user_b = UserFactory(), UserFactory()
+    store.record("users.customuser", 71, user_a.id)
+    store.record("users.customuser", 72, user_b.id)
+    importer.import_rows("human_annotations.annotationqueue", [_annotation_queue_row(600, assignees=[71])])
+
+    importer.import_rows(
+        "human_annotations.annotationqueue",
+        [_annotation_queue_row(600, assignees=[72], name="Renamed"), _annotation_queue_row(601, assignees=[])],
+    )
+
+    assert AnnotationQueue.objects.count() == 2
+    queue = AnnotationQueue.objects.get(pk=store.get_target("human_annotations.annotationqueue", 600))
+    assert queue.name == "Renamed"
+    assert list(queue.assignees.all()) == [user_b]
+
+
+def test_global_matches_are_reused_for_the_rest_of_the_run(store, django_assert_num_queries):
+    natural_key = _GLOBAL_MATCH_SAMPLES["service_providers.llmprovidermodel"]
+    global_row = LlmProviderModel.objects.create(team=None, **natural_key)
+    importer = Importer(store)
+    rows = [{"id": source_id, "is_global": True, **natural_key} for source_id in (77, 78)]
+
+    with django_assert_num_queries(1):
+        importer.import_rows("service_providers.llmprovidermodel", rows)
+    with django_assert_num_queries(0):
+        importer.import_rows("service_providers.llmprovidermodel", [{"id": 79, "is_global": True, **natural_key}])
+
+    assert {store.get_target("service_providers.llmprovidermodel", pk) for pk in (77, 78, 79)} == {global_row.pk}
+
+
 def test_importing_a_score_maps_onto_the_annotation_side_effect_row(store):
     """Regression for the sync_team UniqueViolation on ``score_unique_per_review_field``.
 
@@ -33,6 +33,7 @@ def _first_party_models():
 # newly added model forces a sync/ignore decision.
 IGNORED_MODELS = frozenset(
     {
+        "analysis.analysissessionresult",
         "api.userapikey",
         "assistants.openaiassistant",
         "assistants.toolresources",
@@ -51,11 +52,14 @@ IGNORED_MODELS = frozenset(
         "oauth.oauth2grant",
         "oauth.oauth2idtoken",
         "oauth.oauth2refreshtoken",
+        "service_providers.synthesizedaudiocacheentry",
         "site_admin.ocsconfiguration",
         "slack.slackbot",
         "slack.slackinstallation",
         "slack.slackoauthstate",
+        "slack.slackroute",
         "sso.ssosession",
+        "teams.deletionjob",
         "teams.flag",
         "teams.invitation",
     }
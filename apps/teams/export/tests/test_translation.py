@@ -33,6 +33,16 @@ def test_null_target_is_a_checkpoint_until_filled(tmp_path):
     assert store.get_target("chat.chat", 7) == 42
 
 
+def test_record_many_writes_a_page_of_mappings(tmp_path):
+    path = tmp_path / "team.sqlite"
+    store = FKTranslationStore(path)
+    store.record("chat.chat", 1)
+    store.record_many("chat.chat", [(1, 10), (2, None)])
+    assert store.get_target("chat.chat", 1) == 10
+    assert store.has_target("chat.chat", 2) is False
+    assert FKTranslationStore(path).committed_targets("chat.chat") == {1: 10}
+
+
 def test_max_source_key_ignores_uncommitted_rows(tmp_path):
     store = FKTranslationStore(tmp_path / "team.sqlite")
     store.record("chat.chat", 1, 10)
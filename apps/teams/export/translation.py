@@ -39,6 +39,16 @@ class FKTranslationStore:
         self._conn.commit()
         self._index.setdefault(content_type, {})[source_key] = target_key
 
+    def record_many(self, content_type: str, mappings: list[tuple[int, int | None]]) -> None:
+        """``record`` for a page of ``(source_key, target_key)`` pairs, in a single SQLite commit."""
+        self._conn.executemany(
+            "INSERT INTO fk_translation (content_type, source_key, target_key) VALUES (?, ?, ?) "
+            "ON CONFLICT (content_type, source_key) DO UPDATE SET target_key = excluded.target_key",
+            [(content_type, source_key, target_key) for source_key, target_key in mappings],
+        )
+        self._conn.commit()
+        self._index.setdefault(content_type, {}).update(mappings)
+
     def get_target(self, content_type: str, source_key: int) -> int | None:
         """The target pk for a source row, or None if it's unrecorded or not yet created."""
         return self._index.get(content_type, {}).get(source_key)
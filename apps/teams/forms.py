@@ -134,14 +134,31 @@ class TeamMetadataForm(forms.Form):
 class TeamChangeForm(forms.ModelForm):
     class Meta:
         model = Team
-        fields = ("name",)
+        fields = ("name", "message_search_language", "chat_history_retention_days")
         labels = {
             "name": _("Team Name"),
+            "message_search_language": _("Message Search Language"),
+            "chat_history_retention_days": _("Chat History Retention (days)"),
         }
         help_texts = {
             "name": _("Your team name."),
+            "message_search_language": _(
+                "The language of the team's conversations, used to match different forms of the same word "
+                "when searching messages. Changing it re-indexes existing messages in the background."
+            ),
+            "chat_history_retention_days": _(
+                "Chat messages and traces older than this are deleted permanently. Leave empty to keep them."
+            ),
         }
 
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.fields["message_search_language"].required = False
+
+    def clean_message_search_language(self):
+        # Keep the current language when the field isn't submitted
+        return self.cleaned_data["message_search_language"] or self.instance.message_search_language
+
 
 class TeamPublicKeyForm(forms.ModelForm):
     class Meta:
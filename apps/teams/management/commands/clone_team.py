@@ -486,21 +486,25 @@ class Command(BaseCommand):
                 status=dataset.status,
             )
 
-            # Clone messages (not team-scoped, so we create new copies)
-            new_messages = []
-            for msg in dataset.messages.all():
-                new_msg = EvaluationMessage.objects.create(
-                    input=msg.input,
-                    output=msg.output,
-                    context=msg.context,
-                    history=msg.history,
-                    participant_data=msg.participant_data,
-                    session_state=msg.session_state,
-                    metadata=msg.metadata,
-                    # input_chat_message and expected_output_chat_message are not cloned
-                    # as they reference chat messages from the source team
-                )
-                new_messages.append(new_msg)
+            # Clone messages (not team-scoped, so we create new copies). Datasets can hold thousands of
+            # messages, so they're inserted in bulk rather than one query each.
+            new_messages = EvaluationMessage.objects.bulk_create(
+                [
+                    EvaluationMessage(
+                        input=msg.input,
+                        output=msg.output,
+                        context=msg.context,
+                        history=msg.history,
+                        participant_data=msg.participant_data,
+                        session_state=msg.session_state,
+                        metadata=msg.metadata,
+                        # input_chat_message and expected_output_chat_message are not cloned
+                        # as they reference chat messages from the source team
+                    )
+                    for msg in dataset.messages.all()
+                ],
+                batch_size=1000,
+            )
 
             if new_messages:
                 new_dataset.messages.set(new_messages)
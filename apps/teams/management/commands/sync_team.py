@@ -21,6 +21,8 @@ from pathlib import Path
 import requests
 from django.core.management.base import BaseCommand, CommandError
 
+from apps.channels.models import ChannelPlatform, ExperimentChannel
+from apps.slack.routing import sync_channel_routes
 from apps.teams.export.client import ResourceFetcher
 from apps.teams.export.emails import send_password_reset_email
 from apps.teams.export.importer import Importer, mute_signals
@@ -221,6 +223,14 @@ def load_team(importer, client, store, write):
     write("synced team")
 
 
+def _build_slack_routes(team: Team) -> None:
+    """Build the Slack routing index for the imported channels. It's maintained by signal receivers,
+    which are muted during the import."""
+    channels = ExperimentChannel.objects.get_unfiltered_queryset().filter(team=team, platform=ChannelPlatform.SLACK)
+    for channel in channels.select_related("messaging_provider"):
+        sync_channel_routes(channel)
+
+
 def _enable_target_migration_mode(team: Team) -> None:
     """Freeze the freshly imported team on this server by turning on migration mode. The source team is
     already migrating; without this the target would start firing the team's events and scheduled
@@ -260,6 +270,7 @@ def run_sync(
                     model_label, client.iter_rows(resource, start_cursor=cursor, limit=page_limit)
                 )
                 write(_style_synced_line(f"synced {count} {resource} rows", count, style))
+            _build_slack_routes(importer.target_team)
     except requests.HTTPError as exc:
         friendly = _friendly_http_error_message(exc)
         if friendly is None:
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.16 on 2026-10-18 22:40
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('teams', '0015_team_created_by'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='team',
+            name='message_search_language',
+            field=models.CharField(choices=[('simple', 'Simple (no stemming, exact tokens)'), ('arabic', 'Arabic'), ('armenian', 'Armenian'), ('basque', 'Basque'), ('catalan', 'Catalan'), ('danish', 'Danish'), ('dutch', 'Dutch'), ('english', 'English'), ('finnish', 'Finnish'), ('french', 'French'), ('german', 'German'), ('greek', 'Greek'), ('hindi', 'Hindi'), ('hungarian', 'Hungarian'), ('indonesian', 'Indonesian'), ('irish', 'Irish'), ('italian', 'Italian'), ('lithuanian', 'Lithuanian'), ('nepali', 'Nepali'), ('norwegian', 'Norwegian'), ('portuguese', 'Portuguese'), ('romanian', 'Romanian'), ('russian', 'Russian'), ('serbian', 'Serbian'), ('spanish', 'Spanish'), ('swedish', 'Swedish'), ('tamil', 'Tamil'), ('turkish', 'Turkish'), ('yiddish', 'Yiddish')], default='simple', help_text="Postgres text search configuration used to index and search the team's chat messages. Picking the language of the conversations enables stemming and stopword removal. 'Simple' does neither and matches exact words only, so it suits mixed-language teams.", max_length=32),
+        ),
+    ]
@@ -0,0 +1,35 @@
+# Generated by Django 5.2.16 on 2026-10-18 23:33
+
+import apps.utils.models
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('teams', '0016_team_message_search_language'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='DeletionJob',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('model_label', models.CharField(max_length=100)),
+                ('object_id', models.CharField(max_length=64)),
+                ('object_name', models.CharField(max_length=255)),
+                ('status', models.CharField(choices=[('pending', 'Pending'), ('running', 'Running'), ('completed', 'Completed'), ('failed', 'Failed')], default='pending', max_length=20)),
+                ('plan', models.JSONField(default=list, help_text='[model label, lookup] for each step, in order')),
+                ('current_step', models.PositiveIntegerField(default=0)),
+                ('deleted_counts', models.JSONField(default=dict, help_text='Number of rows deleted so far, per model')),
+                ('notify_emails', models.JSONField(default=list, help_text='Sent a notification once the job has completed')),
+                ('error', models.TextField(blank=True)),
+            ],
+            options={
+                'indexes': [models.Index(fields=['model_label', 'object_id'], name='teams_delet_model_l_d1b95f_idx')],
+            },
+            bases=(models.Model, apps.utils.models.VersioningMixin),
+        ),
+    ]
@@ -0,0 +1,19 @@
+# Generated by Django 5.2.16 on 2026-10-18 23:59
+
+import django.core.validators
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('teams', '0017_deletionjob'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='team',
+            name='chat_history_retention_days',
+            field=models.PositiveIntegerField(blank=True, help_text='Chat messages and traces older than this many days are deleted (see `apps.chat.retention`). Empty keeps them indefinitely.', null=True, validators=[django.core.validators.MinValueValidator(1)]),
+        ),
+    ]
@@ -1,3 +1,12 @@
-TEAM_FIELDS = ["name", "slug", "created_by", "public_key", "metadata", "is_migrating"]
+TEAM_FIELDS = [
+    "name",
+    "slug",
+    "created_by",
+    "public_key",
+    "metadata",
+    "is_migrating",
+    "message_search_language",
+    "chat_history_retention_days",
+]
 MEMBERSHIP_FIELDS = ["team", "user"]
 FLAG_FIELDS = ["name", "everyone", "percent", "testing", "superusers", "rollout", "teams", "users"]
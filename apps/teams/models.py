@@ -3,6 +3,7 @@ import uuid
 from django.conf import settings
 from django.contrib.auth.models import Group, Permission
 from django.core.exceptions import ValidationError
+from django.core.validators import MinValueValidator
 from django.db import models
 from django.urls import reverse
 from django.utils.translation import gettext
@@ -16,6 +17,7 @@ from waffle.utils import get_cache, keyfmt
 from apps.teams import model_audit_fields
 from apps.utils.fields import SanitizedJSONField
 from apps.utils.models import BaseModel
+from apps.utils.search import SearchLanguage
 from apps.web.meta import absolute_url
 
 
@@ -76,6 +78,25 @@ class Team(BaseModel):
         db_default=False,
         help_text="When set, the team's outbound message firing is frozen while its data is migrated.",
     )
+    message_search_language = models.CharField(
+        max_length=32,
+        choices=SearchLanguage.choices,
+        default=SearchLanguage.SIMPLE,
+        help_text=(
+            "Postgres text search configuration used to index and search the team's chat messages. "
+            "Picking the language of the conversations enables stemming and stopword removal. "
+            "'Simple' does neither and matches exact words only, so it suits mixed-language teams."
+        ),
+    )
+    chat_history_retention_days = models.PositiveIntegerField(
+        null=True,
+        blank=True,
+        validators=[MinValueValidator(1)],
+        help_text=(
+            "Chat messages and traces older than this many days are deleted (see `apps.chat.retention`). "
+            "Empty keeps them indefinitely."
+        ),
+    )
 
     def save(self, *args, **kwargs):
         from .helpers import get_next_unique_team_slug  # noqa: PLC0415 - circular: teams.helpers imports teams.models
@@ -194,6 +215,52 @@ class Invitation(BaseModel):
         return absolute_url(reverse("teams:accept_invitation", args=[self.id]))
 
 
+class DeletionJobStatus(models.TextChoices):
+    PENDING = "pending", gettext("Pending")
+    RUNNING = "running", gettext("Running")
+    COMPLETED = "completed", gettext("Completed")
+    FAILED = "failed", gettext("Failed")
+
+
+class DeletionJobManager(models.Manager):
+    def active(self):
+        return self.filter(status__in=[DeletionJobStatus.PENDING, DeletionJobStatus.RUNNING])
+
+    def active_for(self, obj):
+        return self.active().filter(model_label=obj._meta.label_lower, object_id=str(obj.pk))
+
+
+class DeletionJob(BaseModel):
+    """The deletion of an object, e.g. a team, and everything that cascades from it, in batches.
+
+    The job stores its plan (see `apps.utils.deletion.plan_deletion`) and the step it has got to, so a
+    job that is interrupted resumes where it stopped. It isn't related to the object being deleted,
+    since it has to outlive it.
+    """
+
+    model_label = models.CharField(max_length=100)
+    object_id = models.CharField(max_length=64)
+    object_name = models.CharField(max_length=255)
+    status = models.CharField(max_length=20, choices=DeletionJobStatus.choices, default=DeletionJobStatus.PENDING)
+    plan = models.JSONField(default=list, help_text="[model label, lookup] for each step, in order")
+    current_step = models.PositiveIntegerField(default=0)
+    deleted_counts = models.JSONField(default=dict, help_text="Number of rows deleted so far, per model")
+    notify_emails = models.JSONField(default=list, help_text="Sent a notification once the job has completed")
+    error = models.TextField(blank=True)
+
+    objects = DeletionJobManager()
+
+    class Meta:
+        indexes = [models.Index(fields=["model_label", "object_id"])]
+
+    def __str__(self):
+        return f"DeletionJob({self.model_label} {self.object_id})"
+
+    @property
+    def progress(self) -> str:
+        return f"{min(self.current_step, len(self.plan))} of {len(self.plan)} steps"
+
+
 class BaseTeamModel(BaseModel):
     """
     Abstract model for objects that are part of a team.
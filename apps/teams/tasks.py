@@ -6,24 +6,32 @@ from uuid import uuid4
 
 from celery import shared_task
 from celery_progress.backend import ProgressRecorder
+from django.apps import apps
 from django.core.files import File as DjangoFile
+from django.db import transaction
+from django.db.models import Q
 from django.utils import timezone
 
+from apps.chat.search import reindex_team_messages
 from apps.files.models import File, FilePurpose
 from apps.teams.invitations import send_invitation_accepted
-from apps.teams.models import Invitation, Membership, Team
+from apps.teams.models import DeletionJob, DeletionJobStatus, Invitation, Membership, Team
 from apps.teams.utils import current_team
 from apps.utils.celery import Queues
 from apps.utils.deletion import (
     chunk_list,
-    delete_object_with_auditing_of_related_objects,
+    delete_batch_with_auditing,
     get_admin_emails_with_delete_permission,
+    plan_deletion,
     send_team_deleted_notification,
 )
 
 logger = logging.getLogger("ocs.teams")
 
 CHUNK_SIZE = 64 * 1024
+DELETION_BATCH_SIZE = 500  # rows deleted per transaction by a deletion job
+# A running deletion job that hasn't made progress for this long is assumed to have lost its worker
+DELETION_JOB_STALE_AFTER = timedelta(minutes=15)
 
 
 @shared_task(ignore_result=True, queue=Queues.BACKGROUND)
@@ -32,21 +40,115 @@ def send_invitation_accepted_notification(invitation_id):
     send_invitation_accepted(invitation)
 
 
+@shared_task(ignore_result=True, queue=Queues.BACKGROUND)
+def reindex_team_message_search(team_id):
+    team = Team.objects.get(id=team_id)
+    language = team.message_search_language
+    updated = reindex_team_messages(team.id, language)
+    logger.info("Re-indexed %s messages of team %s for search in '%s'", updated, team.slug, language)
+
+
 @shared_task(queue=Queues.BACKGROUND)
 def delete_team_async(team_id, user_email, notify_recipients="self"):
+    """Delete a team in the worker that picks this up. The team page starts a `run_deletion_job` instead."""
     team = Team.objects.get(id=team_id)
+    job = create_team_deletion_job(team, user_email, notify_recipients)
+    run_deletion_job(job.id)
+
+
+def create_team_deletion_job(team, user_email, notify_recipients="self") -> DeletionJob:
     emails = [user_email]  # default case: user sends email just to themselves
     if notify_recipients == "admins":
         emails = get_admin_emails_with_delete_permission(team)
     elif notify_recipients == "all":
         emails = list(Membership.objects.filter(team__name=team.name).values_list("user__email", flat=True))
-    team_name = team.name
-    chunk_size = 50
-    chunked_emails = chunk_list(emails, chunk_size)
-    with current_team(team):
-        delete_object_with_auditing_of_related_objects(team)
-        for chunk_emails in chunked_emails:
-            send_team_deleted_notification(team_name, chunk_emails)
+    return create_deletion_job(team, notify_emails=emails)
+
+
+def create_deletion_job(obj, notify_emails=()) -> DeletionJob:
+    """Plan the deletion of `obj` in batches. The job is run by `run_deletion_job`."""
+    steps = plan_deletion(obj)
+    if isinstance(obj, Team):
+        # Nothing references a membership, so they can go first, which locks everyone out of the team
+        # while the rest of it is deleted.
+        steps.sort(key=lambda step: step[0] is not Membership)
+    return DeletionJob.objects.create(
+        model_label=obj._meta.label_lower,
+        object_id=str(obj.pk),
+        object_name=str(obj)[:255],
+        plan=[[model._meta.label_lower, lookup] for model, lookup in steps],
+        notify_emails=list(notify_emails),
+    )
+
+
+@shared_task(acks_late=True, ignore_result=True, queue=Queues.BACKGROUND)
+def run_deletion_job(job_id):
+    """Work through the steps of a deletion job, a batch of rows at a time.
+
+    Each batch is deleted (and audited) in its own short transaction together with the job's checkpoint,
+    so locks on busy tables are only held briefly and a job whose worker dies resumes from the batch it
+    was on (see `resume_stalled_deletion_jobs`).
+    """
+    job = _claim_deletion_job(job_id)
+    if job is None:
+        return
+
+    team = Team.objects.filter(id=job.object_id).first() if job.model_label == Team._meta.label_lower else None
+    try:
+        with current_team(team):
+            while job.current_step < len(job.plan):
+                model_label, lookup = job.plan[job.current_step]
+                with transaction.atomic():
+                    stats = delete_batch_with_auditing(
+                        apps.get_model(model_label), lookup, job.object_id, DELETION_BATCH_SIZE
+                    )
+                    if stats:
+                        for label, count in stats.items():
+                            job.deleted_counts[label] = job.deleted_counts.get(label, 0) + count
+                    else:
+                        job.current_step += 1
+                    job.save(update_fields=["deleted_counts", "current_step", "updated_at"])
+    except Exception as e:
+        logger.exception("Deletion job %s failed", job_id)
+        job.status = DeletionJobStatus.FAILED
+        job.error = str(e)
+        job.save(update_fields=["status", "error", "updated_at"])
+        return
+
+    job.status = DeletionJobStatus.COMPLETED
+    job.save(update_fields=["status", "updated_at"])
+    logger.info("Deleted %s %s: %s", job.model_label, job.object_id, job.deleted_counts)
+    if job.model_label == Team._meta.label_lower:
+        for chunk_emails in chunk_list(job.notify_emails, 50):
+            send_team_deleted_notification(job.object_name, chunk_emails)
+
+
+def _claim_deletion_job(job_id) -> DeletionJob | None:
+    """Mark the job as running, unless another worker is already running it. Pending jobs can be claimed,
+    as can running jobs that have stalled.
+
+    The claim is a single conditional update, so when the same job is delivered to two workers (e.g. a
+    redelivered task and a resumed one) only one of them runs it.
+    """
+    claimable = Q(status=DeletionJobStatus.PENDING) | Q(
+        status=DeletionJobStatus.RUNNING, updated_at__lt=timezone.now() - DELETION_JOB_STALE_AFTER
+    )
+    claimed = DeletionJob.objects.filter(claimable, id=job_id).update(
+        status=DeletionJobStatus.RUNNING, updated_at=timezone.now()
+    )
+    return DeletionJob.objects.get(id=job_id) if claimed else None
+
+
+@shared_task(ignore_result=True, queue=Queues.BACKGROUND)
+def resume_stalled_deletion_jobs():
+    """Restart running deletion jobs whose worker went away, e.g. during a deploy. Pending jobs are left
+    alone, since they are still waiting in the queue."""
+    stalled = DeletionJob.objects.filter(
+        status=DeletionJobStatus.RUNNING, updated_at__lt=timezone.now() - DELETION_JOB_STALE_AFTER
+    )
+    for job_id in stalled.values_list("id", flat=True):
+        logger.info("Resuming stalled deletion job %s", job_id)
+        run_deletion_job.delay(job_id)
 
 
 def get_team_files_queryset(team):
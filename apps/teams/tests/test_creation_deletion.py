@@ -1,12 +1,22 @@
+from unittest import mock
+
 import pytest
 from django.test import override_settings
 from django.urls import reverse
+from django.utils import timezone
 from field_audit import enable_audit
 from field_audit.models import AuditEvent
 
+from apps.teams.admin import DeletionJobAdmin
 from apps.teams.backends import SUPER_ADMIN_GROUP
 from apps.teams.helpers import create_default_team_for_user
-from apps.teams.models import Membership, Team
+from apps.teams.models import DeletionJob, DeletionJobStatus, Membership, Team
+from apps.teams.tasks import (
+    DELETION_JOB_STALE_AFTER,
+    create_team_deletion_job,
+    resume_stalled_deletion_jobs,
+    run_deletion_job,
+)
 from apps.users.models import CustomUser
 from apps.utils.factories.team import TeamWithUsersFactory
 from apps.utils.factories.user import UserFactory
@@ -93,10 +103,106 @@ def test_delete_team(client):
         # make sure there are audit events for related models
         assert AuditEvent.objects.by_model(Membership).filter(is_delete=True).count() == 2
 
-        # make sure that all events have the same transaction ID
+        # the team is deleted in batches, each in its own transaction
         transaction_ids = {
             context["transaction_id"]
             for context in AuditEvent.objects.filter(is_delete=True).values_list("change_context", flat=True)
         }
-        assert len(transaction_ids) == 1
         assert all(transaction_id is not None for transaction_id in transaction_ids)
+
+        job = DeletionJob.objects.get(model_label="teams.team", object_id=str(team_with_users.id))
+        assert job.status == DeletionJobStatus.COMPLETED
+        assert job.deleted_counts["teams.Membership"] == 2
+
+
+@pytest.mark.django_db()
+def test_delete_team_resumes_from_the_checkpoint():
+    team = TeamWithUsersFactory.create()
+    job = create_team_deletion_job(team, "admin@example.com")
+    assert job.plan[0] == ["teams.membership", "team__pk"]
+    assert job.plan[-1] == ["teams.team", "pk"]
+
+    # The memberships are deleted, then the job fails
+    batches = [{"teams.Membership": 2}, {}, RuntimeError("connection lost")]
+    with mock.patch("apps.teams.tasks.delete_batch_with_auditing", side_effect=batches):
+        run_deletion_job(job.id)
+    job.refresh_from_db()
+    assert job.status == DeletionJobStatus.FAILED
+    assert job.current_step == 1
+    assert job.deleted_counts == {"teams.Membership": 2}
+
+    job.status = DeletionJobStatus.PENDING
+    job.save(update_fields=["status"])
+    run_deletion_job(job.id)
+
+    job.refresh_from_db()
+    assert job.status == DeletionJobStatus.COMPLETED
+    assert not Team.objects.filter(id=team.id).exists()
+
+
+@pytest.mark.django_db()
+def test_running_deletion_job_is_only_claimed_once_stalled():
+    team = TeamWithUsersFactory.create()
+    job = create_team_deletion_job(team, "admin@example.com")
+    DeletionJob.objects.filter(id=job.id).update(status=DeletionJobStatus.RUNNING, updated_at=timezone.now())
+
+    with mock.patch("apps.teams.tasks.delete_batch_with_auditing") as delete_batch:
+        run_deletion_job(job.id)
+    delete_batch.assert_not_called()
+
+    DeletionJob.objects.filter(id=job.id).update(updated_at=timezone.now() - DELETION_JOB_STALE_AFTER * 2)
+    run_deletion_job(job.id)
+    job.refresh_from_db()
+    assert job.status == DeletionJobStatus.COMPLETED
+
+
+@pytest.mark.django_db()
+def test_only_stalled_running_deletion_jobs_are_resumed():
+    stale = timezone.now() - DELETION_JOB_STALE_AFTER * 2
+    queued, stalled, running = [
+        create_team_deletion_job(TeamWithUsersFactory.create(), "admin@example.com") for _ in range(3)
+    ]
+    DeletionJob.objects.filter(id=queued.id).update(updated_at=stale)
+    DeletionJob.objects.filter(id=stalled.id).update(status=DeletionJobStatus.RUNNING, updated_at=stale)
+    DeletionJob.objects.filter(id=running.id).update(status=DeletionJobStatus.RUNNING)
+
+    with mock.patch("apps.teams.tasks.run_deletion_job") as run_job:
+        resume_stalled_deletion_jobs()
+
+    run_job.delay.assert_called_once_with(stalled.id)
+
+
+@pytest.mark.django_db()
+def test_admin_only_resumes_failed_and_stalled_jobs():
+    stale = timezone.now() - DELETION_JOB_STALE_AFTER * 2
+    failed, stalled, running = [
+        create_team_deletion_job(TeamWithUsersFactory.create(), "admin@example.com") for _ in range(3)
+    ]
+    DeletionJob.objects.filter(id=failed.id).update(status=DeletionJobStatus.FAILED, error="boom")
+    DeletionJob.objects.filter(id=stalled.id).update(status=DeletionJobStatus.RUNNING, updated_at=stale)
+    DeletionJob.objects.filter(id=running.id).update(status=DeletionJobStatus.RUNNING)
+
+    model_admin = DeletionJobAdmin(DeletionJob, admin_site=None)
+    with (
+        mock.patch("apps.teams.admin.run_deletion_job") as run_job,
+        mock.patch.object(DeletionJobAdmin, "message_user"),
+    ):
+        model_admin.resume(None, DeletionJob.objects.all())
+
+    assert sorted(call.args[0] for call in run_job.delay.call_args_list) == sorted([failed.id, stalled.id])
+    assert DeletionJob.objects.get(id=running.id).status == DeletionJobStatus.RUNNING
+    assert DeletionJob.objects.get(id=failed.id).error == ""
+
+
+@pytest.mark.django_db()
+def test_delete_team_while_already_being_deleted(client):
+    team = TeamWithUsersFactory.create()
+    create_team_deletion_job(team, "admin@example.com")
+    client.force_login(team.members.first())
+
+    with mock.patch("apps.teams.views.manage_team_views.run_deletion_job") as run_deletion_job:
+        response = client.post(reverse("single_team:delete_team", args=[team.slug]))
+
+    assert response.status_code == 302
+    run_deletion_job.delay.assert_not_called()
+    assert DeletionJob.objects.count() == 1
@@ -99,3 +99,25 @@ def get_slug_for_team(team_id: int):
         # Cache for 24 hours
         cache.set(cache_key, slug, 24 * 3600)
     return slug
+
+
+def _message_search_language_cache_key(team_id: int) -> str:
+    return f"team_message_search_language:{team_id}"
+
+
+def get_message_search_language(team_id: int) -> str:
+    """The text search configuration new chat messages of the team are indexed with.
+
+    This is read every time a message is saved, so it is cached. Call `clear_message_search_language_cache`
+    after changing the team's setting.
+    """
+    cache_key = _message_search_language_cache_key(team_id)
+    language = cache.get(cache_key)
+    if language is None:
+        language = Team.objects.values_list("message_search_language", flat=True).get(id=team_id)
+        cache.set(cache_key, language, 3600)
+    return language
+
+
+def clear_message_search_language_cache(team_id: int):
+    cache.delete(_message_search_language_cache_key(team_id))
@@ -21,9 +21,14 @@ from apps.teams.forms import (
     TeamPublicKeyForm,
 )
 from apps.teams.invitations import send_invitation
-from apps.teams.models import Invitation
-from apps.teams.tasks import delete_team_async, start_team_files_export
-from apps.teams.utils import current_team
+from apps.teams.models import DeletionJob, Invitation
+from apps.teams.tasks import (
+    create_team_deletion_job,
+    reindex_team_message_search,
+    run_deletion_job,
+    start_team_files_export,
+)
+from apps.teams.utils import clear_message_search_language_cache, current_team
 from apps.web.forms import set_form_fields_disabled
 
 _ACTIVE_EXPORT_STATES = {"PENDING", "STARTED", PROGRESS_STATE}
@@ -73,10 +78,14 @@ def manage_team(request, team_slug):
     is_team_admin = request.team_membership.is_team_admin()
     if request.method == "POST":
         if is_team_admin:
+            search_language = team.message_search_language
             team_form = TeamChangeForm(request.POST, instance=team)
             if team_form.is_valid():
                 messages.success(request, _("Team details saved!"))
                 team_form.save()
+                if team.message_search_language != search_language:
+                    clear_message_search_language_cache(team.id)
+                    reindex_team_message_search.delay(team.id)
                 if request.team.slug != team_slug:
                     return HttpResponseRedirect(reverse("single_team:manage_team", args=[request.team.slug]))
         else:
@@ -116,8 +125,13 @@ def create_team(request):
 @require_POST
 @permission_required("teams.delete_team", raise_exception=True)
 def delete_team(request, team_slug):
+    if DeletionJob.objects.active_for(request.team).exists():
+        messages.info(request, _('The "{team}" team is already being deleted.').format(team=request.team.name))
+        return HttpResponseRedirect(reverse("prelogin:home"))
+
     notify_recipients = request.POST.get("notification_recipients", "self")
-    delete_team_async.delay(request.team.id, request.user.email, notify_recipients)
+    job = create_team_deletion_job(request.team, request.user.email, notify_recipients)
+    run_deletion_job.delay(job.id)
 
     notify_recipients_text = {"self": "you", "admins": "admins", "all": "all team members"}
 
@@ -0,0 +1,222 @@
+"""Buffered, batched persistence of `Trace` rows.
+
+With ``TRACE_BUFFERING_ENABLED`` the OCS tracer doesn't write to the database during the chat turn:
+
+* The trace's primary key is reserved up front from the table's sequence (a block of IDs per round
+  trip), so the trace URL and the message linkage are available mid-turn exactly as with a saved row.
+* Start and end events are collected in an in-process buffer and pushed to a Redis stream in one
+  pipelined round trip when the trace ends.
+* `write_buffered_traces` (a beat task) reads the stream in batches, keeps the latest state of each
+  trace, upserts them in one ``INSERT ... ON CONFLICT`` statement and then inserts the usage records
+  of the finished traces.
+
+If Redis is unavailable the buffered events are written inline through the same code path, so the
+tracer degrades to synchronous writes rather than dropping traces.
+"""
+
+import dataclasses
+import json
+import logging
+import os
+import socket
+import threading
+from collections import deque
+from decimal import Decimal
+
+from django.conf import settings
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import IntegrityError, connection, transaction
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+from django_redis import get_redis_connection
+from redis.exceptions import ResponseError
+
+from apps.cost_tracking.models import UsageRecord
+from apps.cost_tracking.services.recorder import UsageContext, UsageEvent, build_usage_records
+from apps.trace.models import Trace
+
+logger = logging.getLogger("ocs.tracing")
+
+TRACE_STREAM_KEY = "ocs:trace-writes"
+WRITER_GROUP = "trace-writers"
+# Entries read by a writer that never acknowledged them (e.g. it was killed) are reclaimed after this long
+RECLAIM_IDLE_MS = 60_000
+# Bounds the time a single run of the writer task spends draining the stream
+MAX_BATCHES_PER_RUN = 20
+
+_UPDATE_FIELDS = [field.name for field in Trace._meta.concrete_fields if not field.primary_key]
+
+_lock = threading.Lock()
+_reserved_ids: deque[int] = deque()
+_pending_events: list[str] = []
+
+
+def start_trace(**fields) -> Trace:
+    """Build an unsaved trace with a reserved primary key and buffer its start event."""
+    trace = Trace(id=_reserve_id(), **fields)
+    _buffer_event(trace)
+    return trace
+
+
+def finish_trace(trace: Trace, usage_events: list[UsageEvent], usage_context: UsageContext | None) -> None:
+    """Buffer the final state of `trace` along with its usage, and flush the buffer."""
+    usage = None
+    if usage_events and usage_context:
+        usage = {
+            "events": [dataclasses.asdict(event) for event in usage_events],
+            "context": dataclasses.asdict(usage_context),
+            "at": timezone.now(),
+        }
+    _buffer_event(trace, usage)
+    flush()
+
+
+def flush() -> None:
+    """Push the buffered events to the stream, or write them inline if the stream can't be reached."""
+    with _lock:
+        events = _pending_events[:]
+        _pending_events.clear()
+    if not events:
+        return
+
+    try:
+        redis = get_redis_connection("default")
+        pipe = redis.pipeline(transaction=False)
+        for event in events:
+            pipe.xadd(TRACE_STREAM_KEY, {"event": event}, maxlen=settings.TRACE_BUFFER_MAX_LENGTH, approximate=True)
+        pipe.execute()
+    except Exception:
+        logger.warning("Trace buffer unavailable, writing %s trace events inline", len(events), exc_info=True)
+        write_trace_events(events)
+
+
+def drain_stream() -> int:
+    """Write buffered trace events to the database in batches. Returns the number of events written."""
+    redis = get_redis_connection("default")
+    if not redis.exists(TRACE_STREAM_KEY):
+        return 0
+
+    try:
+        redis.xgroup_create(TRACE_STREAM_KEY, WRITER_GROUP, id="0", mkstream=True)
+    except ResponseError as e:
+        if "BUSYGROUP" not in str(e):
+            raise
+
+    consumer = f"{socket.gethostname()}:{os.getpid()}"
+    batch_size = settings.TRACE_BUFFER_BATCH_SIZE
+    claimed = redis.xautoclaim(TRACE_STREAM_KEY, WRITER_GROUP, consumer, RECLAIM_IDLE_MS, count=batch_size)
+    written = _write_and_acknowledge(redis, claimed[1])
+    for _ in range(MAX_BATCHES_PER_RUN):
+        response = redis.xreadgroup(WRITER_GROUP, consumer, {TRACE_STREAM_KEY: ">"}, count=batch_size)
+        if not response:
+            break
+        messages = response[0][1]
+        written += _write_and_acknowledge(redis, messages)
+        if len(messages) < batch_size:
+            break
+    return written
+
+
+def write_trace_events(events: list[str | bytes]):
+    """Upsert the latest state of each trace in `events` and insert the usage of the finished ones."""
+    traces = {}
+    usage = {}
+    for event in events:
+        data = json.loads(event)
+        trace_fields = data["trace"]
+        # Events are in stream order, so the last one for a trace is its latest state
+        traces[trace_fields["id"]] = trace_fields
+        if data.get("usage"):
+            usage[trace_fields["id"]] = data["usage"]
+
+    written_ids = _upsert_traces([Trace(**fields) for fields in traces.values()])
+    _insert_usage({trace_id: trace_usage for trace_id, trace_usage in usage.items() if trace_id in written_ids})
+
+
+def _reserve_id() -> int:
+    with _lock:
+        if not _reserved_ids:
+            _reserved_ids.extend(_next_sequence_values(settings.TRACE_BUFFER_ID_BLOCK_SIZE))
+        return _reserved_ids.popleft()
+
+
+def _next_sequence_values(count: int) -> list[int]:
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT nextval(pg_get_serial_sequence(%s, 'id')) FROM generate_series(1, %s)",
+            [Trace._meta.db_table, count],
+        )
+        return [row[0] for row in cursor.fetchall()]
+
+
+def _buffer_event(trace: Trace, usage: dict | None = None):
+    # Serialized now: the tracer keeps mutating `trace` after its start event is buffered.
+    trace_fields = {field.attname: field.value_from_object(trace) for field in Trace._meta.concrete_fields}
+    event = json.dumps({"trace": trace_fields, "usage": usage}, cls=DjangoJSONEncoder)
+    with _lock:
+        _pending_events.append(event)
+
+
+def _write_and_acknowledge(redis, messages) -> int:
+    if not messages:
+        return 0
+    write_trace_events([fields[b"event"] for _message_id, fields in messages])
+    message_ids = [message_id for message_id, _fields in messages]
+    pipe = redis.pipeline(transaction=False)
+    pipe.xack(TRACE_STREAM_KEY, WRITER_GROUP, *message_ids)
+    pipe.xdel(TRACE_STREAM_KEY, *message_ids)
+    pipe.execute()
+    return len(messages)
+
+
+def _upsert_traces(traces: list[Trace]) -> set[int]:
+    try:
+        with transaction.atomic():
+            _upsert(traces)
+        return {trace.id for trace in traces}
+    except IntegrityError:
+        pass
+
+    # Typically a reference to a row deleted since the event was queued; keep the rest of the batch.
+    written = set()
+    for trace in traces:
+        try:
+            with transaction.atomic():
+                _upsert([trace])
+            written.add(trace.id)
+        except IntegrityError:
+            logger.exception("Unable to write buffered trace %s", trace.id)
+    return written
+
+
+def _upsert(traces: list[Trace]):
+    Trace.objects.bulk_create(traces, update_conflicts=True, unique_fields=["id"], update_fields=_UPDATE_FIELDS)
+    # Foreign keys are checked at commit; check them now so that a bad row fails the savepoint it's in
+    connection.check_constraints()
+
+
+def _insert_usage(usage_by_trace: dict[int, dict]):
+    """Never raises, like `record_usage_bulk`: a bad usage row must not hold up the trace stream."""
+    if not usage_by_trace:
+        return
+
+    try:
+        # A batch is replayed if its writer died before acknowledging it; don't bill those traces twice.
+        recorded = set(
+            UsageRecord.objects.filter(trace_id__in=usage_by_trace).values_list("trace_id", flat=True).distinct()
+        )
+        rows = []
+        for trace_id, usage in usage_by_trace.items():
+            if trace_id in recorded:
+                continue
+            events = [
+                UsageEvent(
+                    **{**event, "quantity": Decimal(event["quantity"]) if event["quantity"] is not None else None}
+                )
+                for event in usage["events"]
+            ]
+            rows.extend(build_usage_records(events, UsageContext(**usage["context"]), at=parse_datetime(usage["at"])))
+        with transaction.atomic():
+            UsageRecord.objects.bulk_create(rows)
+    except Exception:
+        logger.exception("cost_tracking.bulk_insert_failed", extra={"n_traces": len(usage_by_trace)})
@@ -0,0 +1,19 @@
+# Generated by Django 5.2.16 on 2026-10-18 21:53
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('trace', '0015_remove_trace_n_completion_tokens_and_more'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='trace',
+            name='timestamp',
+            field=models.DateTimeField(default=django.utils.timezone.now),
+        ),
+    ]
@@ -5,6 +5,7 @@ import uuid
 from django.db import models
 from django.db.models import Q
 from django.urls import reverse
+from django.utils import timezone
 
 from apps.teams.utils import get_slug_for_team
 from apps.utils.fields import SanitizedJSONField
@@ -17,7 +18,9 @@ class TraceStatus(models.TextChoices):
 
 
 class Trace(models.Model):
-    timestamp = models.DateTimeField(auto_now_add=True)
+    # A default rather than `auto_now_add` so that the buffered writer (`apps.trace.buffer`) can
+    # insert the time the trace actually started.
+    timestamp = models.DateTimeField(default=timezone.now)
     trace_id = models.UUIDField(default=uuid.uuid4, editable=False)
     status = models.CharField(max_length=32, choices=TraceStatus.choices, default=TraceStatus.PENDING, db_index=True)
     experiment = models.ForeignKey(
@@ -0,0 +1,14 @@
+from celery import shared_task
+from celery.utils.log import get_task_logger
+
+from apps.trace import buffer
+from apps.utils.celery import Queues
+
+logger = get_task_logger("ocs.tracing")
+
+
+@shared_task(ignore_result=True, queue=Queues.BACKGROUND)
+def write_buffered_traces():
+    # Runs regardless of TRACE_BUFFERING_ENABLED so that switching buffering off still drains the stream.
+    if written := buffer.drain_stream():
+        logger.info(f"Wrote {written} buffered trace events")
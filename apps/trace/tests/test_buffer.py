@@ -0,0 +1,111 @@
+from unittest.mock import Mock, patch
+from uuid import uuid4
+
+import pytest
+from langchain_core.messages import AIMessage
+from langchain_core.outputs import ChatGeneration, LLMResult
+
+from apps.cost_tracking.models import UsageRecord
+from apps.service_providers.tracing.base import TraceContext
+from apps.service_providers.tracing.ocs_tracer import OCSTracer
+from apps.trace import buffer
+from apps.trace.models import Trace, TraceStatus
+from apps.utils.factories.experiment import ExperimentSessionFactory
+
+
+@pytest.fixture(autouse=True)
+def _buffering(settings):
+    settings.TRACE_BUFFERING_ENABLED = True
+    buffer._pending_events.clear()
+
+
+@pytest.fixture()
+def stream():
+    """Capture the events pushed to the Redis stream."""
+    redis = Mock()
+    with patch("apps.trace.buffer.get_redis_connection", return_value=redis):
+        yield redis.pipeline.return_value.xadd
+
+
+def _run_trace(experiment, session):
+    tracer = OCSTracer(experiment, experiment.team_id)
+    run_id = uuid4()
+    with tracer.trace(trace_context=TraceContext(id=uuid4(), name="t"), session=session):
+        trace_id = tracer.get_trace_metadata()["trace_id"]
+        tracer.metrics_collector.on_llm_start(
+            {},
+            ["hello"],
+            run_id=run_id,
+            invocation_params={"model": "test-model"},
+            metadata={"ocs_provider_type": "openai"},
+        )
+        message = AIMessage(content="hi", usage_metadata={"input_tokens": 10, "output_tokens": 5, "total_tokens": 15})
+        tracer.metrics_collector.on_llm_end(
+            LLMResult(generations=[[ChatGeneration(message=message, text="hi")]]), run_id=run_id
+        )
+    return trace_id
+
+
+def _stream_events(xadd):
+    return [call.args[1]["event"] for call in xadd.call_args_list]
+
+
+@pytest.mark.django_db()
+def test_trace_is_queued_instead_of_written(experiment, stream):
+    session = ExperimentSessionFactory.create(experiment=experiment, team=experiment.team)
+
+    trace_id = _run_trace(experiment, session)
+
+    assert not Trace.objects.exists()
+    events = _stream_events(stream)
+    # The start and end events are pushed together when the trace ends
+    assert len(events) == 2
+
+    buffer.write_trace_events(events)
+
+    trace = Trace.objects.get()
+    assert trace.id == trace_id
+    assert trace.session_id == session.id
+    assert trace.status == TraceStatus.SUCCESS
+    assert trace.n_turns == 1
+    assert UsageRecord.objects.filter(trace=trace).count() == 2
+
+
+@pytest.mark.django_db()
+def test_replayed_events_are_not_billed_twice(experiment, stream):
+    session = ExperimentSessionFactory.create(experiment=experiment, team=experiment.team)
+    _run_trace(experiment, session)
+    events = _stream_events(stream)
+
+    buffer.write_trace_events(events)
+    buffer.write_trace_events(events)
+
+    assert Trace.objects.count() == 1
+    assert UsageRecord.objects.count() == 2
+
+
+@pytest.mark.django_db()
+def test_writes_inline_when_stream_is_unavailable(experiment):
+    """The test cache isn't Redis, so `get_redis_connection` fails just as it would with Redis down."""
+    session = ExperimentSessionFactory.create(experiment=experiment, team=experiment.team)
+
+    trace_id = _run_trace(experiment, session)
+
+    trace = Trace.objects.get()
+    assert trace.id == trace_id
+    assert trace.status == TraceStatus.SUCCESS
+    assert UsageRecord.objects.filter(trace=trace).count() == 2
+    assert not buffer._pending_events
+
+
+@pytest.mark.django_db()
+def test_trace_for_deleted_session_does_not_block_batch(experiment, stream):
+    sessions = ExperimentSessionFactory.create_batch(2, experiment=experiment, team=experiment.team)
+    for session in sessions:
+        _run_trace(experiment, session)
+    events = _stream_events(stream)
+    sessions[0].delete()
+
+    buffer.write_trace_events(events)
+
+    assert list(Trace.objects.values_list("session_id", flat=True)) == [sessions[1].id]
@@ -10,6 +10,7 @@ from waffle import flag_is_active
 
 from apps.annotations.models import CustomTaggedItem
 from apps.cost_tracking.services.reporting import trace_token_usage
+from apps.generics.pagination import KeysetPaginator
 from apps.service_providers.tracing.langfuse import get_langfuse_api_client
 from apps.teams.mixins import LoginAndTeamRequiredMixin
 from apps.trace.filters import TraceFilter, get_trace_filter_context_data
@@ -40,13 +41,15 @@ class TraceTableView(LoginAndTeamRequiredMixin, PermissionRequiredMixin, SingleT
     model = Trace
     table_class = TraceTable
     permission_required = "trace.view_trace"
+    paginator_class = KeysetPaginator
 
     def get_queryset(self):
         queryset = (
             Trace.objects.select_related("participant", "experiment", "session")
             .filter(team=self.request.team)
             .exclude(status=TraceStatus.PENDING)
-            .order_by("-timestamp")
+            # The unique tiebreaker lets `KeysetPaginator` seek to the next page instead of using OFFSET
+            .order_by("-timestamp", "-id")
         )
 
         timezone = self.request.session.get("detected_tz", None)
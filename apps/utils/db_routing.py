@@ -0,0 +1,162 @@
+"""Routing of reporting reads to the read replica.
+
+When a replica is configured (``DATABASE_REPLICA_URL``, see ``config/db.py``), the ``replica``
+connection is available alongside ``default``. Nothing is read from it implicitly: reads are only sent
+there inside an explicit ``reporting_reads`` context, which is applied to the heavy aggregate and export
+code paths (dashboards, the usage API, admin reports, cost reporting and session exports) so that they
+don't compete with live chat traffic on the primary::
+
+    @reporting_reads("dashboard")
+    def get_overview_stats(...): ...
+
+    with reporting_reads("session_export"):
+        chunk = list(messages[:1000])
+
+Only queries that are *executed* inside the context are routed, so a queryset built inside it and
+evaluated after it has exited reads from the primary.
+
+Reads fall back to the primary when the replica is behind by more than
+``DATABASE_REPLICA_MAX_LAG_SECONDS``, when its lag can't be determined, and inside a transaction on
+the primary (which may have written rows the replica hasn't seen). Writes always go to the primary.
+
+Every query run inside the context is prefixed with a ``/* reporting:<label> */`` comment so that
+reporting load can be told apart in ``pg_stat_activity`` and the slow query log, whichever database
+served it.
+"""
+
+import logging
+import re
+import time
+from contextlib import ExitStack, contextmanager
+from contextvars import ContextVar
+from typing import TypedDict
+
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS, DatabaseError, connections
+
+logger = logging.getLogger("ocs.db")
+
+# Must match `config.db.REPLICA_DB_ALIAS`
+REPLICA_DB_ALIAS = "replica"
+# How long a replication lag measurement is trusted before the replica is checked again
+LAG_CHECK_INTERVAL = 15
+
+_LABEL_RE = re.compile(r"^[\w.-]+$")
+_reporting_label: ContextVar[str | None] = ContextVar("reporting_label", default=None)
+
+
+class _ReplicaLag(TypedDict):
+    checked_at: float | None
+    acceptable: bool
+
+
+_replica_lag: _ReplicaLag = {"checked_at": None, "acceptable": False}
+
+# Zero when the replica has replayed everything it received: an idle primary sends nothing, so the
+# time since the last replayed transaction keeps growing without the replica falling behind.
+_LAG_SQL = """
+    SELECT CASE
+        WHEN NOT pg_is_in_recovery() OR pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0
+        ELSE COALESCE(EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()), 0)
+    END
+"""
+
+
+@contextmanager
+def reporting_reads(label: str):
+    """Send the reads run inside the block (or decorated function) to the replica, tagged with `label`.
+
+    Nested contexts keep the outermost label, since that names the workload the queries are run for.
+    """
+    if not _LABEL_RE.match(label):
+        raise ValueError(f"Invalid reporting label: {label!r}")
+    if _reporting_label.get() is not None:
+        yield
+        return
+
+    token = _reporting_label.set(label)
+    try:
+        with ExitStack() as stack:
+            for alias in {DEFAULT_DB_ALIAS, REPLICA_DB_ALIAS} & set(settings.DATABASES):
+                stack.enter_context(connections[alias].execute_wrapper(_tag_query))
+            yield
+    finally:
+        _reporting_label.reset(token)
+
+
+def get_reporting_label() -> str | None:
+    """The label of the current reporting context, or None outside of one."""
+    return _reporting_label.get()
+
+
+class ReportingRouter:
+    """Routes reads made inside `reporting_reads` to the replica, if there is a usable one."""
+
+    def db_for_read(self, model, **hints):
+        if _reporting_label.get() is None:
+            return None
+        return get_reporting_db()
+
+    def db_for_write(self, model, **hints):
+        return None
+
+    def allow_relation(self, obj1, obj2, **hints):
+        # The replica holds the same rows, so objects read from either database can be related
+        databases = {DEFAULT_DB_ALIAS, REPLICA_DB_ALIAS}
+        if obj1._state.db in databases and obj2._state.db in databases:
+            return True
+        return None
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        if db == REPLICA_DB_ALIAS:
+            return False
+        return None
+
+
+def get_reporting_db() -> str | None:
+    """The alias reporting reads should use right now: the replica, or None for the primary."""
+    if REPLICA_DB_ALIAS not in settings.DATABASES:
+        return None
+    if connections[DEFAULT_DB_ALIAS].in_atomic_block:
+        return None
+    if not _replica_lag_is_acceptable():
+        return None
+    return REPLICA_DB_ALIAS
+
+
+def _replica_lag_is_acceptable() -> bool:
+    checked_at = _replica_lag["checked_at"]
+    now = time.monotonic()
+    if checked_at is not None and now - checked_at < LAG_CHECK_INTERVAL:
+        return _replica_lag["acceptable"]
+
+    max_lag = settings.DATABASE_REPLICA_MAX_LAG_SECONDS
+    lag = _get_replica_lag()
+    acceptable = lag is not None and lag <= max_lag
+    if lag is not None and not acceptable:
+        logger.warning("The replica is %.1fs behind (max %ss), reading reports from the primary", lag, max_lag)
+
+    _replica_lag.update(checked_at=now, acceptable=acceptable)
+    return acceptable
+
+
+def _get_replica_lag() -> float | None:
+    """The replica's lag in seconds, or None if it can't be determined."""
+    try:
+        with connections[REPLICA_DB_ALIAS].cursor() as cursor:
+            cursor.execute(_LAG_SQL)
+            row = cursor.fetchone()
+    except DatabaseError:
+        logger.warning("Unable to check the replication lag, reading reports from the primary", exc_info=True)
+        return None
+    if row is None:
+        logger.warning("The replica returned no replication lag, reading reports from the primary")
+        return None
+    return float(row[0])
+
+
+def _tag_query(execute, sql, params, many, context):
+    label = _reporting_label.get()
+    if label is not None:
+        sql = f"/* reporting:{label} */ {sql}"
+    return execute(sql, params, many, context)
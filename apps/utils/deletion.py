@@ -19,17 +19,67 @@ from field_audit.field_audit import get_audited_models
 def delete_object_with_auditing_of_related_objects(obj):
     """Deletes the given object and its related objects, auditing the deletion of each object.
 
+    Everything is collected into memory and deleted in one transaction, so this is only suitable for
+    small object graphs. Large ones (e.g. a team) should be deleted in batches with a `DeletionJob`.
+
     Args:
         obj: The object to delete.
     """
+    return dict(_delete_with_auditing([obj]))
+
+
+def plan_deletion(obj) -> list[tuple[type[models.Model], str]]:
+    """The steps for deleting everything that cascades from `obj` in batches, without collecting it first.
+
+    Each step is a model and a lookup from that model to the primary key of `obj`. The steps are in a
+    safe deletion order (see `_deletion_order`), ending with `obj` itself, so deleting the rows of each
+    step before moving on to the next leaves each batch with little or nothing to cascade to.
+
+    A model is only reached through its shortest CASCADE paths from `obj`: rows that are only related
+    through a longer path are still cascaded to by the batch that deletes their parent.
+    """
+    root = obj._meta.model
+    lookups = {root: ["pk"]}
+    level = [root]
+    while level:
+        next_level = {}
+        for parent in level:
+            for related in get_candidate_relations_to_delete(parent._meta):
+                model = related.related_model
+                if (
+                    model in lookups
+                    or model._meta.auto_created
+                    or related.field.remote_field.on_delete != models.CASCADE
+                ):
+                    continue
+                next_level.setdefault(model, []).extend(f"{related.field.name}__{lookup}" for lookup in lookups[parent])
+        lookups |= next_level
+        level = list(next_level)
+
+    return [(model, lookup) for model in _deletion_order(lookups) for lookup in lookups[model]]
+
+
+def delete_batch_with_auditing(model: type[models.Model], lookup: str, value, batch_size: int) -> dict[str, int]:
+    """Delete the first `batch_size` rows (by primary key) of `model` that match ``lookup=value``, along with
+    anything that cascades from them, in one transaction.
+
+    Returns the number of rows deleted per model, which is empty once there are no more matching rows.
+    """
+    with transaction.atomic():
+        instances = list(model._base_manager.filter(**{lookup: value}).order_by("pk")[:batch_size])
+        if not instances:
+            return {}
+        return dict(_delete_with_auditing(instances))
+
 
+def _delete_with_auditing(objs) -> Counter:
     from field_audit.models import (  # noqa: PLC0415 - init-order: apps.py loads before app registry is ready
         AuditAction,
         AuditingManager,
     )
 
     collector = NestedObjects(using="default")
-    collector.collect([obj])
+    collector.collect(objs)
 
     models_to_delete = set(collector.data)
 
@@ -56,7 +106,7 @@ def delete_object_with_auditing_of_related_objects(obj):
 
             _, stats = model.objects.filter(pk__in=[instance.pk for instance in instances]).delete(**audit_kwargs)
             counter.update(stats)
-    return dict(counter)
+    return counter
 
 
 def _deletion_order(collector_data):
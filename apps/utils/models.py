@@ -48,3 +48,28 @@ class BaseModel(models.Model, VersioningMixin):
 
     class Meta:
         abstract = True
+
+
+class DenormalizedCountersMixin(models.Model):
+    """
+    For models with counters maintained by atomic ``UPDATE`` statements elsewhere (e.g. from signals).
+
+    The counters on an instance are usually stale, so a full save of an existing row leaves them out
+    rather than overwriting the current values.
+    """
+
+    counter_fields: tuple[str, ...] = ()
+
+    class Meta:
+        abstract = True
+
+    def save(self, *args, **kwargs):
+        if not self._state.adding and kwargs.get("update_fields") is None and not kwargs.get("force_insert"):
+            # Like Django's own save of a partially loaded instance, deferred fields are left alone
+            deferred = self.get_deferred_fields()
+            kwargs["update_fields"] = [
+                field.name
+                for field in self._meta.concrete_fields
+                if not field.primary_key and field.name not in self.counter_fields and field.attname not in deferred
+            ]
+        super().save(*args, **kwargs)
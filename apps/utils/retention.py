@@ -0,0 +1,84 @@
+"""Batched deletion of expired rows for the beat housekeeping tasks.
+
+An unbounded ``QuerySet.delete()`` collects every row it cascades to into memory and deletes them all
+in a single transaction, which after a backlog ties up a worker for a long time and holds locks on busy
+tables (e.g. ``chat_chatmessage``) throughout. `run_retention_policy` instead deletes the rows of a
+`RetentionPolicy` a batch of primary keys at a time, each batch in its own transaction. Django deletes
+the rows a batch cascades to with a single set-based ``DELETE ... WHERE fk IN (...)`` wherever that is
+safe (no signal receivers, nothing cascading further), so only the cascades that need it are collected,
+and only for one batch.
+
+A run stops once it has used up its time budget (``RETENTION_TIME_BUDGET_SECONDS``); whatever is left
+is deleted on the next tick. The outcome of each run is logged as a structured ``retention.policy_run``
+record.
+"""
+
+import logging
+import time
+from collections import Counter
+from collections.abc import Callable
+from dataclasses import dataclass, field
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import QuerySet
+
+logger = logging.getLogger("ocs.retention")
+
+
+@dataclass
+class RetentionPolicy:
+    name: str
+    get_queryset: Callable[[], QuerySet]
+    """The rows to delete. Called once per run, so relative cut-off dates are resolved at the start of it."""
+    batch_size: int = 500
+    before_delete: Callable[[QuerySet], None] | None = None
+    """Called with each batch, inside its transaction, before it is deleted."""
+
+
+@dataclass
+class RetentionResult:
+    policy: str
+    deleted: Counter = field(default_factory=Counter)
+    batches: int = 0
+    seconds: float = 0.0
+    complete: bool = False
+
+    @property
+    def total_deleted(self) -> int:
+        return sum(self.deleted.values())
+
+
+def run_retention_policy(policy: RetentionPolicy, time_budget: float | None = None) -> RetentionResult:
+    """Delete the policy's rows in batches until there are none left or the time budget is used up."""
+    if time_budget is None:
+        time_budget = settings.RETENTION_TIME_BUDGET_SECONDS
+    result = RetentionResult(policy=policy.name)
+    start = time.monotonic()
+    queryset = policy.get_queryset()
+    while time.monotonic() - start < time_budget:
+        with transaction.atomic():
+            ids = list(queryset.order_by("pk").values_list("pk", flat=True)[: policy.batch_size])
+            if not ids:
+                result.complete = True
+                break
+            batch = queryset.filter(pk__in=ids)
+            if policy.before_delete:
+                policy.before_delete(batch)
+            _, stats = batch.delete()
+        result.deleted.update(stats)
+        result.batches += 1
+
+    result.seconds = round(time.monotonic() - start, 3)
+    logger.info(
+        "retention.policy_run",
+        extra={
+            "policy": result.policy,
+            "deleted": dict(result.deleted),
+            "total_deleted": result.total_deleted,
+            "batches": result.batches,
+            "seconds": result.seconds,
+            "complete": result.complete,
+        },
+    )
+    return result
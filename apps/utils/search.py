@@ -1,5 +1,48 @@
 from django.contrib.postgres.search import TrigramSimilarity
+from django.db import models
 from django.db.models import Q, QuerySet
+from django.utils.translation import gettext_lazy as _
+
+
+class SearchLanguage(models.TextChoices):
+    """Postgres text search configurations available for lexical search.
+
+    These are the configurations shipped by Postgres (`select cfgname from pg_ts_config`).
+    `SIMPLE` applies no stemming and strips no stopwords, so it matches exact tokens only; every
+    other entry stems and strips stopwords for its language. The same configuration must be used
+    to build a search vector (a chunk's or a chat message's `search_vector`) and to parse the query,
+    or the two never match.
+    """
+
+    SIMPLE = "simple", _("Simple (no stemming, exact tokens)")
+    ARABIC = "arabic", _("Arabic")
+    ARMENIAN = "armenian", _("Armenian")
+    BASQUE = "basque", _("Basque")
+    CATALAN = "catalan", _("Catalan")
+    DANISH = "danish", _("Danish")
+    DUTCH = "dutch", _("Dutch")
+    ENGLISH = "english", _("English")
+    FINNISH = "finnish", _("Finnish")
+    FRENCH = "french", _("French")
+    GERMAN = "german", _("German")
+    GREEK = "greek", _("Greek")
+    HINDI = "hindi", _("Hindi")
+    HUNGARIAN = "hungarian", _("Hungarian")
+    INDONESIAN = "indonesian", _("Indonesian")
+    IRISH = "irish", _("Irish")
+    ITALIAN = "italian", _("Italian")
+    LITHUANIAN = "lithuanian", _("Lithuanian")
+    NEPALI = "nepali", _("Nepali")
+    NORWEGIAN = "norwegian", _("Norwegian")
+    PORTUGUESE = "portuguese", _("Portuguese")
+    ROMANIAN = "romanian", _("Romanian")
+    RUSSIAN = "russian", _("Russian")
+    SERBIAN = "serbian", _("Serbian")
+    SPANISH = "spanish", _("Spanish")
+    SWEDISH = "swedish", _("Swedish")
+    TAMIL = "tamil", _("Tamil")
+    TURKISH = "turkish", _("Turkish")
+    YIDDISH = "yiddish", _("Yiddish")
 
 
 def similarity_search(
@@ -0,0 +1,113 @@
+from unittest import mock
+
+import pytest
+from django.conf import settings
+from django.db import DatabaseError
+
+from apps.utils import db_routing
+from apps.utils.db_routing import REPLICA_DB_ALIAS, ReportingRouter, get_reporting_label, reporting_reads
+
+
+@pytest.fixture()
+def replica():
+    """A configured replica whose lag is reported by `replica.lag`."""
+    databases = {**settings.DATABASES, REPLICA_DB_ALIAS: settings.DATABASES["default"]}
+    connection = mock.MagicMock()
+    cursor = connection.cursor.return_value.__enter__.return_value
+    cursor.fetchone.side_effect = lambda: (connection.lag,)
+    connection.lag = 0
+    default = mock.MagicMock(in_atomic_block=False)
+    connections = {"default": default, REPLICA_DB_ALIAS: connection}
+
+    with (
+        mock.patch.object(settings, "DATABASES", databases),
+        mock.patch.object(db_routing, "connections", connections),
+        mock.patch.dict(db_routing._replica_lag, checked_at=None),
+    ):
+        yield connection
+
+
+def test_reads_outside_a_reporting_context_are_not_routed(replica):
+    assert ReportingRouter().db_for_read(None) is None
+
+
+def test_reporting_reads_use_the_replica(replica):
+    with reporting_reads("dashboard"):
+        assert ReportingRouter().db_for_read(None) == REPLICA_DB_ALIAS
+        assert ReportingRouter().db_for_write(None) is None
+
+
+def test_reporting_reads_use_the_primary_without_a_replica():
+    with reporting_reads("dashboard"):
+        assert ReportingRouter().db_for_read(None) is None
+
+
+def test_reporting_reads_use_the_primary_in_a_transaction(replica):
+    db_routing.connections["default"].in_atomic_block = True
+    with reporting_reads("dashboard"):
+        assert ReportingRouter().db_for_read(None) is None
+
+
+@pytest.mark.parametrize(("lag", "alias"), [(10, REPLICA_DB_ALIAS), (600, None)])
+def test_reporting_reads_fall_back_to_the_primary_when_the_replica_lags(replica, lag, alias):
+    replica.lag = lag
+    with reporting_reads("dashboard"):
+        assert ReportingRouter().db_for_read(None) == alias
+
+
+def test_replication_lag_check_is_cached(replica):
+    with reporting_reads("dashboard"):
+        ReportingRouter().db_for_read(None)
+        replica.lag = 600
+        assert ReportingRouter().db_for_read(None) == REPLICA_DB_ALIAS
+
+    assert replica.cursor.call_count == 1
+
+
+def test_reporting_reads_use_the_primary_when_the_lag_is_unknown(replica):
+    replica.cursor.side_effect = DatabaseError("connection refused")
+    with reporting_reads("dashboard"):
+        assert ReportingRouter().db_for_read(None) is None
+
+
+def test_reporting_reads_use_the_primary_when_no_lag_is_returned(replica):
+    replica.cursor.return_value.__enter__.return_value.fetchone.side_effect = lambda: None
+    with reporting_reads("dashboard"):
+        assert ReportingRouter().db_for_read(None) is None
+
+
+def test_the_replica_is_never_migrated():
+    router = ReportingRouter()
+    assert router.allow_migrate(REPLICA_DB_ALIAS, "chat") is False
+    assert router.allow_migrate("default", "chat") is None
+
+
+def test_nested_contexts_keep_the_outer_label():
+    with reporting_reads("dashboard"):
+        with reporting_reads("cost_reporting"):
+            assert get_reporting_label() == "dashboard"
+    assert get_reporting_label() is None
+
+
+@reporting_reads("usage_api")
+def _decorated():
+    return get_reporting_label()
+
+
+def test_reporting_reads_as_a_decorator():
+    assert _decorated() == "usage_api"
+    assert get_reporting_label() is None
+
+
+def test_queries_are_tagged_with_the_label():
+    execute = mock.Mock()
+    with reporting_reads("session_export"):
+        db_routing._tag_query(execute, "SELECT 1", None, False, {})
+    db_routing._tag_query(execute, "SELECT 2", None, False, {})
+
+    assert [call.args[0] for call in execute.call_args_list] == ["/* reporting:session_export */ SELECT 1", "SELECT 2"]
+
+
+def test_labels_are_validated():
+    with pytest.raises(ValueError, match="Invalid reporting label"), reporting_reads("*/ DROP TABLE"):
+        pass
@@ -3,10 +3,12 @@ from field_audit import enable_audit
 from field_audit.models import AuditEvent
 
 from apps.annotations.models import Tag
+from apps.chat.models import Chat, ChatMessage
 from apps.documents.models import DocumentSource
 from apps.evaluations.models import EvaluatorTagRule
 from apps.service_providers.models import AuthProvider
-from apps.utils.deletion import _deletion_order, delete_object_with_auditing_of_related_objects
+from apps.teams.models import Team
+from apps.utils.deletion import _deletion_order, delete_object_with_auditing_of_related_objects, plan_deletion
 from apps.utils.factories.assistants import OpenAiAssistantFactory
 from apps.utils.factories.documents import DocumentSourceFactory
 from apps.utils.factories.evaluations import EvaluatorTagRuleFactory
@@ -152,3 +154,13 @@ def test_deletion_order_protect_cycle_falls_back_to_base_order():
     )
 
     assert _deletion_order({CycleA: [], CycleB: []}) == [CycleB, CycleA]
+
+
+def test_plan_deletion_deletes_children_before_their_parents():
+    steps = plan_deletion(Team(id=1))
+    models = [model for model, _lookup in steps]
+
+    assert steps[-1] == (Team, "pk")
+    assert (ChatMessage, "chat__team__pk") in steps
+    assert models.index(ChatMessage) < models.index(Chat)
+    assert models.index(DocumentSource) < models.index(AuthProvider)
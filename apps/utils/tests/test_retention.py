@@ -0,0 +1,45 @@
+import pytest
+
+from apps.files.models import File
+from apps.utils.factories.files import FileFactory
+from apps.utils.retention import RetentionPolicy, run_retention_policy
+
+
+@pytest.fixture()
+def policy():
+    return RetentionPolicy(name="test", get_queryset=lambda: File.objects.filter(name="expired"), batch_size=2)
+
+
+@pytest.mark.django_db()
+def test_rows_are_deleted_in_batches(policy):
+    FileFactory.create_batch(5, name="expired")
+    kept = FileFactory.create(name="kept")
+
+    result = run_retention_policy(policy)
+
+    assert result.complete
+    assert result.batches == 3
+    assert result.deleted["files.File"] == 5
+    assert list(File.objects.all()) == [kept]
+
+
+@pytest.mark.django_db()
+def test_a_run_stops_when_its_time_budget_is_used_up(policy):
+    FileFactory.create_batch(3, name="expired")
+
+    result = run_retention_policy(policy, time_budget=0)
+
+    assert not result.complete
+    assert result.total_deleted == 0
+    assert File.objects.count() == 3
+
+
+@pytest.mark.django_db()
+def test_before_delete_is_called_with_each_batch(policy):
+    FileFactory.create_batch(3, name="expired")
+    batch_sizes = []
+    policy.before_delete = lambda batch: batch_sizes.append(batch.count())
+
+    run_retention_policy(policy)
+
+    assert batch_sizes == [2, 1]
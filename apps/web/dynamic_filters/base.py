@@ -3,7 +3,9 @@ from __future__ import annotations
 import json
 import logging
 from collections.abc import Sequence
+from dataclasses import dataclass
 from enum import StrEnum
+from functools import lru_cache
 from typing import Any, ClassVar, Literal
 
 from django.db.models import Q, QuerySet
@@ -13,6 +15,9 @@ from .datastructures import ColumnFilterData, FilterParams
 
 logger = logging.getLogger("ocs.filters")
 
+# Distinct filter queries whose compiled plans are kept, per process
+FILTER_PLAN_CACHE_SIZE = 512
+
 
 class Operators(StrEnum):
     """Enum for filter operators used in dynamic filters."""
@@ -102,6 +107,12 @@ class MultiColumnFilter:
         """Hook for subclasses to modify the queryset before applying filters."""
         return queryset
 
+    @classmethod
+    def compile(cls, filter_params: FilterParams) -> FilterPlan:
+        """The plan for applying ``filter_params``. Plans are cached per process, so a filter query that
+        is applied over and over (a saved filter, a paginated table) is only parsed once."""
+        return _compile_plan(cls, tuple((f.column, f.operator, f.value) for f in filter_params.filters))
+
     def apply(self, queryset: QuerySet, filter_params: FilterParams, timezone=None) -> QuerySet:
         """Applies the filters to the given queryset based on the `self.filter_params`.
 
@@ -115,13 +126,51 @@ class MultiColumnFilter:
         traversal, and ``ChatMessageTagsFilter`` for the chat-or-message tag check.
         """
         queryset = self.prepare_queryset(queryset)
+        return self.compile(filter_params).apply(queryset, timezone)
+
+
+@dataclass(frozen=True)
+class FilterStep:
+    """One filter of a plan: an ``apply_<operator>`` method of a column filter and its parsed value."""
+
+    column_filter: ColumnFilter
+    method_name: str
+    value: Any
+
+    def apply(self, queryset: QuerySet, timezone=None) -> QuerySet:
+        return getattr(self.column_filter, self.method_name)(queryset, self.value, timezone)
+
 
-        for filter_component in self.filters:
-            queryset = filter_component.apply(queryset, filter_params, timezone)
+@dataclass(frozen=True)
+class FilterPlan:
+    """A filter query compiled against a `MultiColumnFilter`: its filters, validated and parsed, in the
+    order they are applied. Filters with an unknown operator or an empty value are dropped at compile time.
 
+    A plan holds no state of its own beyond that, so it can be shared between requests and teams: what
+    depends on the team or the current time (tag IDs, relative date ranges) is resolved when it is applied.
+    The parsed values are shared too and must not be modified.
+    """
+
+    steps: tuple[FilterStep, ...]
+
+    def apply(self, queryset: QuerySet, timezone=None) -> QuerySet:
+        for step in self.steps:
+            queryset = step.apply(queryset, timezone)
         return queryset
 
 
+@lru_cache(maxsize=FILTER_PLAN_CACHE_SIZE)
+def _compile_plan(filter_class: type[MultiColumnFilter], filters: tuple[tuple[str, str, str], ...]) -> FilterPlan:
+    filter_params = FilterParams(
+        column_filters=[
+            ColumnFilterData(column=column, operator=operator, value=value) for column, operator, value in filters
+        ]
+    )
+    return FilterPlan(
+        steps=tuple(step for column_filter in filter_class.filters for step in column_filter.compile(filter_params))
+    )
+
+
 class ColumnFilter(BaseModel):
     """
     Abstract base class for a single column filter.
@@ -168,18 +217,28 @@ class ColumnFilter(BaseModel):
         ``after X`` plus ``before Y`` on the same column — so each one narrows the
         queryset further.
         """
-        for column_filter in filter_params.get_all(self.query_param):
-            if column_filter:
-                queryset = self._apply_one(queryset, column_filter, timezone)
+        for step in self.compile(filter_params):
+            queryset = step.apply(queryset, timezone)
         return queryset
 
-    def _apply_one(self, queryset: QuerySet, column_filter: ColumnFilterData, timezone=None) -> QuerySet:
-        operator = column_filter.operator.replace(" ", "_").lower()
-        if method := getattr(self, f"apply_{operator}", None):
-            parsed_value = self.parse_query_value(column_filter.value)
-            if parsed_value not in (None, "", []):
-                return method(queryset, parsed_value, timezone)
-        return queryset
+    def compile(self, filter_params: FilterParams) -> list[FilterStep]:
+        """The steps that apply the filters targeting this column, with their values parsed."""
+        steps = []
+        for column_filter in filter_params.get_all(self.query_param):
+            if step := self._compile_one(column_filter):
+                steps.append(step)
+        return steps
+
+    def _compile_one(self, column_filter: ColumnFilterData) -> FilterStep | None:
+        if not column_filter:
+            return None
+        method_name = f"apply_{column_filter.operator.replace(' ', '_').lower()}"
+        if not hasattr(self, method_name):
+            return None
+        parsed_value = self.parse_query_value(column_filter.value)
+        if parsed_value in (None, "", []):
+            return None
+        return FilterStep(self, method_name, parsed_value)
 
 
 class ChoiceColumnFilter(ColumnFilter):
@@ -268,7 +327,7 @@ def get_filter_schema(filter_class: type[MultiColumnFilter]) -> dict[str, dict]:
             "label": f.label,
             "type": f.type,
             "description": f.description,
-            "operators": [op.value for op in FIELD_TYPE_FILTERS[f.type]],
+            "operators": [op.value for op in f.operators],
         }
         if isinstance(f, ChoiceColumnFilter) and f.options:
             entry["options"] = [
@@ -2,7 +2,7 @@ import pytest
 
 from apps.experiments.filters import ExperimentSessionFilter
 from apps.utils.factories.experiment import ExperimentSessionFactory
-from apps.web.dynamic_filters.datastructures import FilterParams
+from apps.web.dynamic_filters.datastructures import ColumnFilterData, FilterParams
 
 
 @pytest.mark.django_db()
@@ -13,3 +13,31 @@ def test_apply_does_not_emit_distinct_when_no_filters_applied():
     filtered = ExperimentSessionFilter().apply(queryset, FilterParams())
     sql = str(filtered.query).upper()
     assert "DISTINCT" not in sql, sql
+
+
+def _params(pairs) -> FilterParams:
+    return FilterParams(column_filters=[ColumnFilterData(column=c, operator=o, value=v) for c, o, v in pairs])
+
+
+def test_compile_reuses_the_plan_of_an_identical_query():
+    pairs = [("state", "any of", '["active"]'), ("participant", "contains", "alice")]
+    plan = ExperimentSessionFilter.compile(_params(pairs))
+    assert ExperimentSessionFilter.compile(_params(pairs)) is plan
+    assert ExperimentSessionFilter.compile(_params(pairs[:1])) is not plan
+
+
+def test_compile_parses_values_and_drops_unusable_filters():
+    plan = ExperimentSessionFilter.compile(
+        _params(
+            [
+                ("versions", "any of", '["v1", "v2", "latest"]'),
+                ("participant", "matches", "alice"),  # no such operator
+                ("experiment", "any of", '["not an id"]'),  # no usable value
+                ("remote_id", "any of", '["r1"]'),
+            ]
+        )
+    )
+    assert [(step.column_filter.query_param, step.method_name, step.value) for step in plan.steps] == [
+        ("versions", "apply_any_of", [1, 2]),
+        ("remote_id", "apply_any_of", ["r1"]),
+    ]
@@ -56,6 +56,7 @@ class TestExperimentSessionFilterSchema:
             "last_message",
             "first_message",
             "message_date",
+            "message_content",
             "tags",
             "versions",
             "channels",
@@ -66,6 +67,10 @@ class TestExperimentSessionFilterSchema:
         }
         assert set(schema.keys()) == expected_keys
 
+    def test_message_content_only_offers_search_operators(self):
+        schema = get_filter_schema(ExperimentSessionFilter)
+        assert schema["message_content"]["operators"] == ["contains", "does not contain"]
+
     def test_all_columns_have_descriptions(self):
 
         schema = get_filter_schema(ExperimentSessionFilter)
@@ -0,0 +1,171 @@
+"""Harness for the offline benchmark suite. See README.md for how to run it.
+
+Each benchmark times a callable over a number of rounds (after one warm-up round) and counts the
+queries its last round ran. The results are compared with the ones stored in ``baselines.json``:
+running more queries than the baseline fails the benchmark, as does (with
+``--benchmark-compare-timings``) a median time that is more than the given factor slower. A benchmark
+without a baseline fails too, unless baselines are being saved.
+"""
+
+import json
+import os
+import statistics
+import time
+from dataclasses import asdict, dataclass
+from pathlib import Path
+
+import pytest
+from django.core.cache import cache
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from apps.teams.utils import unset_current_team
+from apps.utils.factories.service_provider_factories import LlmProviderFactory, LlmProviderModelFactory
+from apps.utils.factories.team import TeamFactory
+
+BASELINES_PATH = Path(__file__).parent / "baselines.json"
+
+_results_key = pytest.StashKey[dict]()
+
+
+@dataclass
+class BenchmarkResult:
+    name: str
+    scale: int
+    rounds: int
+    queries: int
+    median_ms: float
+    min_ms: float
+    max_ms: float
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup("benchmark")
+    group.addoption("--benchmark-rounds", type=int, default=5, help="Timed rounds per benchmark (default: 5)")
+    group.addoption(
+        "--benchmark-scale", type=int, default=1, help="Multiplier for the size of the synthetic data sets (default: 1)"
+    )
+    group.addoption("--benchmark-save", action="store_true", help="Store the results as the new baselines")
+    group.addoption(
+        "--benchmark-compare-timings",
+        type=float,
+        metavar="FACTOR",
+        help=(
+            "Also fail benchmarks whose median time is more than FACTOR times their baseline's. Only meaningful "
+            "against baselines saved on the same machine, so it is off by default."
+        ),
+    )
+
+
+def pytest_terminal_summary(terminalreporter, config):
+    results = config.stash.get(_results_key, {})
+    if not results:
+        return
+    baselines = _load_baselines()
+    terminalreporter.section("benchmarks")
+    terminalreporter.write_line(f"{'benchmark':<50} {'queries':>8} {'baseline':>8} {'median ms':>10} {'min ms':>10}")
+    for result in sorted(results.values(), key=lambda r: r.name):
+        baseline = baselines.get(result.name, {}).get("queries", "-")
+        terminalreporter.write_line(
+            f"{result.name:<50} {result.queries:>8} {baseline:>8} {result.median_ms:>10.2f} {result.min_ms:>10.2f}"
+        )
+    if config.getoption("benchmark_save"):
+        baselines.update({name: asdict(result) for name, result in results.items()})
+        BASELINES_PATH.write_text(json.dumps(baselines, indent=2, sort_keys=True) + "\n")
+        terminalreporter.write_line(f"Saved {len(results)} baseline(s) to {BASELINES_PATH}")
+
+
+@pytest.fixture(autouse=True, scope="session")
+def _set_env():
+    os.environ["UNIT_TESTING"] = "True"
+
+
+@pytest.fixture(autouse=True)
+def _reset_state():
+    cache.clear()
+    unset_current_team()
+    yield
+    unset_current_team()
+
+
+@pytest.fixture()
+def benchmark_scale(request) -> int:
+    return request.config.getoption("benchmark_scale")
+
+
+@pytest.fixture()
+def benchmark(request):
+    return Benchmark(request.config)
+
+
+@pytest.fixture()
+def team(db):
+    return TeamFactory.create()
+
+
+@pytest.fixture()
+def llm_ids(team) -> tuple[str, str]:
+    """The ids of an LLM provider and model, as pipeline node params take them."""
+    provider = LlmProviderFactory.create(team=team)
+    provider_model = LlmProviderModelFactory.create(team=team)
+    return str(provider.id), str(provider_model.id)
+
+
+class Benchmark:
+    def __init__(self, config):
+        self.config = config
+
+    def __call__(self, name: str, func, *, setup=None, rounds: int | None = None):
+        """Time ``func`` and check the result against its baseline. ``setup`` is called before every
+        round, untimed, e.g. to clear caches the benchmark shouldn't hit. Returns what the last round of
+        ``func`` returned."""
+        rounds = rounds or self.config.getoption("benchmark_rounds")
+        timings = []
+        value = None
+        query_count = 0
+        for round_number in range(rounds + 1):
+            if setup:
+                setup()
+            with CaptureQueriesContext(connection) as queries:
+                start = time.perf_counter()
+                value = func()
+                elapsed = time.perf_counter() - start
+            query_count = len(queries)
+            if round_number:  # the first round is a warm-up
+                timings.append(elapsed * 1000)
+
+        result = BenchmarkResult(
+            name=name,
+            scale=self.config.getoption("benchmark_scale"),
+            rounds=rounds,
+            queries=query_count,
+            median_ms=round(statistics.median(timings), 3),
+            min_ms=round(min(timings), 3),
+            max_ms=round(max(timings), 3),
+        )
+        self.config.stash.setdefault(_results_key, {})[name] = result
+        self._check(result)
+        return value
+
+    def _check(self, result: BenchmarkResult):
+        if self.config.getoption("benchmark_save"):
+            return
+        baseline = _load_baselines().get(result.name)
+        if not baseline:
+            pytest.fail(f"{result.name} has no baseline, record one with `inv benchmark --save`")
+        if baseline["scale"] != result.scale:
+            return
+        if result.queries > baseline["queries"]:
+            pytest.fail(f"{result.name} ran {result.queries} queries, {baseline['queries']} in its baseline")
+        factor = self.config.getoption("benchmark_compare_timings")
+        if factor and result.median_ms > baseline["median_ms"] * factor:
+            pytest.fail(
+                f"{result.name} took {result.median_ms:.2f}ms (median), more than {factor}x its baseline of "
+                f"{baseline['median_ms']:.2f}ms"
+            )
+
+
+def _load_baselines() -> dict:
+    if not BASELINES_PATH.exists():
+        return {}
+    return json.loads(BASELINES_PATH.read_text())
@@ -0,0 +1,52 @@
+"""Synthetic data sets for the benchmarks, inserted in bulk so that large ones stay quick to build."""
+
+from datetime import datetime, timedelta
+
+from apps.chat.models import Chat, ChatMessage, ChatMessageType
+from apps.experiments.models import ExperimentSession, Participant, SessionStatus
+from apps.utils.factories.channels import ExperimentChannelFactory
+
+
+def create_sessions(experiment, count: int, messages_per_session: int, started_at: datetime) -> list[ExperimentSession]:
+    """Active sessions of the experiment, each with a conversation of alternating human and AI messages
+    a minute apart. The sessions start ten minutes apart, going forward from ``started_at``, and are
+    spread over a Telegram and a WhatsApp channel."""
+    team = experiment.team
+    channels = [
+        ExperimentChannelFactory.create(team=team, experiment=experiment, platform=platform)
+        for platform in ("telegram", "whatsapp")
+    ]
+    participants = Participant.objects.bulk_create(
+        Participant(team=team, identifier=f"participant-{experiment.id}-{i}", platform=channels[i % 2].platform)
+        for i in range(count)
+    )
+    chats = Chat.objects.bulk_create(Chat(team=team, name=experiment.name) for _ in range(count))
+    sessions = ExperimentSession.objects.bulk_create(
+        ExperimentSession(
+            team=team,
+            experiment=experiment,
+            chat=chat,
+            participant=participant,
+            experiment_channel=channels[i % 2],
+            platform=channels[i % 2].platform,
+            status=SessionStatus.ACTIVE,
+        )
+        for i, (chat, participant) in enumerate(zip(chats, participants, strict=True))
+    )
+    ExperimentSession.objects.filter(id__in=[session.id for session in sessions]).update(created_at=started_at)
+
+    messages = []
+    for i, chat in enumerate(chats):
+        session_start = started_at + timedelta(minutes=10 * i)
+        messages.extend(
+            ChatMessage(
+                chat=chat,
+                message_type=ChatMessageType.HUMAN if n % 2 == 0 else ChatMessageType.AI,
+                content=f"Message {n}",
+                created_at=session_start + timedelta(minutes=n),
+            )
+            for n in range(messages_per_session)
+        )
+    ChatMessage.objects.bulk_create(messages, batch_size=2000)
+    Chat.objects.refresh_message_counters([chat.id for chat in chats])
+    return sessions
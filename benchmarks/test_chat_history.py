@@ -0,0 +1,41 @@
+"""Loading a long chat history back to the last compression marker, as the LLM nodes do for every message."""
+
+from datetime import timedelta
+
+import pytest
+from django.utils import timezone
+
+from apps.chat.models import ChatMessage, ChatMessageMetadataKeys, ChatMessageType
+from apps.pipelines.models import PipelineChatHistoryModes
+from apps.utils.factories.experiment import ChatFactory
+
+pytestmark = [pytest.mark.benchmark, pytest.mark.django_db()]
+
+
+@pytest.fixture()
+def chat(team, benchmark_scale):
+    chat = ChatFactory.create(team=team)
+    count = 1000 * benchmark_scale
+    start = timezone.now() - timedelta(seconds=count)
+    messages = [
+        ChatMessage(
+            chat=chat,
+            message_type=ChatMessageType.HUMAN if i % 2 == 0 else ChatMessageType.AI,
+            content=f"Message {i} of a long conversation about nothing in particular",
+            created_at=start + timedelta(seconds=i),
+        )
+        for i in range(count)
+    ]
+    # A summary a tenth of the way in, so the summarizing history mode has most of the history to read
+    summarized = messages[count // 10]
+    summarized.summary = "A summary of the conversation so far"
+    summarized.metadata = {ChatMessageMetadataKeys.COMPRESSION_MARKER: PipelineChatHistoryModes.SUMMARIZE}
+    ChatMessage.objects.bulk_create(messages, batch_size=1000)
+    return chat
+
+
+@pytest.mark.parametrize("mode", [PipelineChatHistoryModes.SUMMARIZE, PipelineChatHistoryModes.TRUNCATE_TOKENS])
+def test_get_langchain_messages_until_marker(benchmark, chat, mode):
+    messages = benchmark(f"chat_history.until_marker.{mode}", lambda: chat.get_langchain_messages_until_marker(mode))
+
+    assert messages
@@ -0,0 +1,48 @@
+"""The team dashboard's aggregates, computed from scratch (not from `DashboardCache`)."""
+
+from datetime import timedelta
+
+import pytest
+from django.utils import timezone
+
+from apps.dashboard.models import DashboardCache
+from apps.dashboard.services import DashboardService
+from apps.utils.factories.experiment import ExperimentFactory
+
+from .data import create_sessions
+
+pytestmark = [pytest.mark.benchmark, pytest.mark.django_db()]
+
+
+@pytest.fixture()
+def service(team, benchmark_scale):
+    for _ in range(2):
+        experiment = ExperimentFactory.create(team=team)
+        create_sessions(
+            experiment,
+            count=250 * benchmark_scale,
+            messages_per_session=8,
+            started_at=timezone.now() - timedelta(days=7),
+        )
+    return DashboardService(team)
+
+
+@pytest.mark.parametrize(
+    "method",
+    [
+        "get_overview_stats",
+        "get_active_participants_data",
+        "get_session_analytics_data",
+        "get_message_volume_data",
+        "get_bot_performance_summary",
+        "get_user_engagement_data",
+        "get_channel_breakdown_data",
+        "get_average_response_time_data",
+    ],
+)
+def test_dashboard_aggregate(benchmark, service, method):
+    benchmark(
+        f"dashboard.{method}",
+        getattr(service, method),
+        setup=lambda: DashboardCache.objects.filter(team=service.team).delete(),
+    )
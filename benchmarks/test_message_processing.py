@@ -0,0 +1,34 @@
+"""A user message through every stage of `MessageProcessingPipeline`, with a fake channel and LLM."""
+
+import pytest
+
+from apps.channels.tests.channels.conftest import StubChannel
+from apps.channels.tests.message_examples import base_messages
+from apps.pipelines.tests.utils import create_pipeline_model, end_node, llm_response_with_prompt_node, start_node
+from apps.utils.factories.experiment import ExperimentFactory, ExperimentSessionFactory
+from apps.utils.factories.pipelines import PipelineFactory
+from apps.utils.tests.langchain import mock_llm
+
+pytestmark = [pytest.mark.benchmark, pytest.mark.django_db()]
+
+
+@pytest.fixture()
+def session(team, llm_ids):
+    pipeline = PipelineFactory.create(team=team)
+    create_pipeline_model(
+        [start_node(), llm_response_with_prompt_node(*llm_ids, history_type="global"), end_node()], pipeline=pipeline
+    )
+    pipeline.save()
+    experiment = ExperimentFactory.create(team=team, pipeline=pipeline)
+    return ExperimentSessionFactory.create(experiment=experiment)
+
+
+def test_new_user_message(benchmark, session):
+    def handle_message():
+        channel = StubChannel(session.experiment, session.experiment_channel, session)
+        return channel.new_user_message(base_messages.text_message(participant_id=session.participant.identifier))
+
+    with mock_llm(["Hello! How can I help?"]):
+        response = benchmark("message_processing.new_user_message", handle_message)
+
+    assert response.content == "Hello! How can I help?"
@@ -0,0 +1,58 @@
+"""Building the runnable graph of a pipeline, which happens for every message a pipeline bot handles."""
+
+import pytest
+
+from apps.pipelines.graph import PipelineGraph
+from apps.pipelines.tests.utils import (
+    create_pipeline_model,
+    end_node,
+    llm_response_with_prompt_node,
+    passthrough_node,
+    render_template_node,
+    router_node,
+    start_node,
+)
+from apps.utils.factories.pipelines import PipelineFactory
+
+pytestmark = [pytest.mark.benchmark, pytest.mark.django_db()]
+
+
+@pytest.fixture()
+def pipeline(team):
+    return PipelineFactory.create(team=team)
+
+
+def test_build_linear_llm_pipeline(benchmark, pipeline, llm_ids):
+    create_pipeline_model([start_node(), llm_response_with_prompt_node(*llm_ids), end_node()], pipeline=pipeline)
+
+    benchmark("pipeline_build.linear_llm", lambda: PipelineGraph.build_from_pipeline(pipeline).build_runnable())
+
+
+def test_build_router_pipeline(benchmark, pipeline, llm_ids):
+    nodes = [
+        start_node(),
+        router_node(*llm_ids, keywords=["a", "b", "c"], name="router"),
+        render_template_node("A: {{ input }}", name="a"),
+        render_template_node("B: {{ input }}", name="b"),
+        render_template_node("C: {{ input }}", name="c"),
+        end_node(),
+    ]
+    edges = [
+        "start - router",
+        "router:0 - a",
+        "router:1 - b",
+        "router:2 - c",
+        "a - end",
+        "b - end",
+        "c - end",
+    ]
+    create_pipeline_model(nodes, edges, pipeline)
+
+    benchmark("pipeline_build.router", lambda: PipelineGraph.build_from_pipeline(pipeline).build_runnable())
+
+
+def test_build_long_pipeline(benchmark, benchmark_scale, pipeline):
+    nodes = [start_node(), *(passthrough_node() for _ in range(20 * benchmark_scale)), end_node()]
+    create_pipeline_model(nodes, pipeline=pipeline)
+
+    benchmark("pipeline_build.long", lambda: PipelineGraph.build_from_pipeline(pipeline).build_runnable())
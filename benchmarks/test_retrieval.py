@@ -0,0 +1,60 @@
+"""Hybrid (dense + full-text) retrieval from a seeded local pgvector collection."""
+
+import random
+
+import pytest
+from django.conf import settings
+from waffle.testutils import override_flag
+
+from apps.documents.models import CollectionFile, FileStatus
+from apps.documents.retrieval import search_collection
+from apps.files.models import FileChunkEmbedding
+from apps.service_providers.llm_service.index_managers import LocalIndexManager
+from apps.utils.factories.documents import CollectionFactory
+from apps.utils.factories.files import FileFactory
+
+pytestmark = [pytest.mark.benchmark, pytest.mark.django_db()]
+
+WORDS = ["water", "vaccine", "clinic", "malaria", "fever", "nutrition", "harvest", "mother", "child", "village"]
+
+
+def _random_vector(rng: random.Random) -> list[float]:
+    return [rng.uniform(-1, 1) for _ in range(settings.EMBEDDING_VECTOR_SIZE)]
+
+
+@pytest.fixture()
+def collection(team, benchmark_scale):
+    rng = random.Random(42)  # The same data set on every run
+    collection = CollectionFactory.create(team=team, is_index=True, is_remote_index=False)
+    file = FileFactory.create(team=team)
+    CollectionFile.objects.create(collection=collection, file=file, status=FileStatus.COMPLETED)
+    chunks = FileChunkEmbedding.objects.bulk_create(
+        [
+            FileChunkEmbedding(
+                team=team,
+                collection=collection,
+                file=file,
+                chunk_number=i,
+                page_number=1,
+                text=" ".join(rng.choices(WORDS, k=60)),
+                embedding=_random_vector(rng),
+            )
+            for i in range(2000 * benchmark_scale)
+        ],
+        batch_size=500,
+    )
+    LocalIndexManager._build_search_vectors(chunks, collection)
+    return collection
+
+
+@pytest.mark.parametrize("hybrid", [True, False], ids=["hybrid", "dense"])
+def test_search_collection(benchmark, collection, hybrid):
+    query_vector = _random_vector(random.Random(7))
+
+    with override_flag("flag_hybrid_search", active=hybrid):
+        chunks = benchmark(
+            f"retrieval.search_collection.{'hybrid' if hybrid else 'dense'}",
+            lambda: search_collection(collection, "malaria fever in the village", top_k=5, query_vector=query_vector),
+        )
+
+    assert len(chunks) == 5
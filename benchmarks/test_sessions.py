@@ -0,0 +1,28 @@
+"""Finding the sessions a timeout trigger fires for, which the events beat task does for every trigger."""
+
+from datetime import timedelta
+
+import pytest
+from django.utils import timezone
+
+from apps.events.models import TimeoutTrigger
+from apps.utils.factories.events import TimeoutTriggerFactory
+from apps.utils.factories.experiment import ExperimentFactory
+
+from .data import create_sessions
+
+pytestmark = [pytest.mark.benchmark, pytest.mark.django_db()]
+
+
+def test_timed_out_sessions(benchmark, team, benchmark_scale):
+    experiment = ExperimentFactory.create(team=team)
+    count = 500 * benchmark_scale
+    started_at = timezone.now() - timedelta(days=30)
+    create_sessions(experiment, count=count, messages_per_session=6, started_at=started_at)
+    trigger = TimeoutTriggerFactory.create(experiment=experiment, delay=60 * 60)
+    TimeoutTrigger.objects.filter(id=trigger.id).update(config_changed_at=started_at - timedelta(days=1))
+    trigger.refresh_from_db()
+
+    sessions = benchmark("sessions.timed_out_sessions", lambda: list(trigger.timed_out_sessions()))
+
+    assert len(sessions) == count
@@ -7,13 +7,21 @@ The two must agree on the Django-level keys. ``env.db()`` only ever emits
 engine/name/user/password/host/port, so any other key has to be applied to whichever config
 the branch produced: a key set inside the ``else`` branch alone is dead in every environment
 that uses ``DATABASE_URL``, which is all of them except a bare local checkout.
+
+A read replica can be configured with ``DATABASE_REPLICA_URL``. It gets the same Django-level keys
+and pool settings as the primary and is only read from inside ``reporting_reads`` (see
+``apps/utils/db_routing.py``). Tests mirror it to ``default``.
 """
 
 import environ
 
+# Must match the alias used by `apps.utils.db_routing`
+REPLICA_DB_ALIAS = "replica"
+
 
 def get_database_config(env: environ.Env, *, debug: bool) -> dict:
-    """Build the ``DATABASES`` setting for the ``default`` connection."""
+    """Build the ``DATABASES`` setting for the ``default`` connection and, if one is configured, the
+    read replica."""
     if "DATABASE_URL" in env:
         config = env.db()
     else:
@@ -25,7 +33,18 @@ def get_database_config(env: environ.Env, *, debug: bool) -> dict:
             "HOST": env("DJANGO_DATABASE_HOST", default="localhost"),
             "PORT": env("DJANGO_DATABASE_PORT", default="5432"),
         }
+    databases = {"default": _apply_connection_settings(config, env, debug=debug)}
+
+    if "DATABASE_REPLICA_URL" in env:
+        replica = _apply_connection_settings(env.db("DATABASE_REPLICA_URL"), env, debug=debug)
+        # There is no replication in tests, so the alias is pointed at the test database
+        replica["TEST"] = {"MIRROR": "default"}
+        databases[REPLICA_DB_ALIAS] = replica
 
+    return databases
+
+
+def _apply_connection_settings(config: dict, env: environ.Env, *, debug: bool) -> dict:
     config["CONN_HEALTH_CHECKS"] = True
     # Server-side cursors (Django's implementation of `QuerySet.iterator()` on Postgres) are
     # declared `WITH HOLD` outside an atomic block, which makes RDS Proxy pin the session to a
@@ -34,7 +53,7 @@ def get_database_config(env: environ.Env, *, debug: bool) -> dict:
     # in through the DATABASE_URL query string.
     config["DISABLE_SERVER_SIDE_CURSORS"] = env.bool("DJANGO_DISABLE_SERVER_SIDE_CURSORS", default=False)
 
-    options: dict = config.setdefault("OPTIONS", {})  # ty: ignore[invalid-assignment]
+    options: dict = config.setdefault("OPTIONS", {})
     if env.bool("DJANGO_DATABASE_USE_POOL", True):
         config.pop("CONN_MAX_AGE", None)
         # See https://www.psycopg.org/psycopg3/docs/api/pool.html#psycopg_pool.ConnectionPool
@@ -51,5 +70,4 @@ def get_database_config(env: environ.Env, *, debug: bool) -> dict:
     # without the non-SSL fallback. Override with DJANGO_DATABASE_SSLMODE if needed
     # (e.g. set to "prefer" for local dev without TLS).
     options["sslmode"] = env("DJANGO_DATABASE_SSLMODE", default="prefer" if debug else "require")
-
-    return {"default": config}
+    return config
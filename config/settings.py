@@ -64,6 +64,7 @@ DJANGO_APPS = [
     "django.contrib.sessions",
     "django.contrib.sitemaps",
     "django.contrib.messages",
+    "django.contrib.postgres",
     "django.contrib.staticfiles",
     "django.contrib.sites",
     "django.forms",
@@ -232,6 +233,9 @@ FORMS_URLFIELD_ASSUME_HTTPS = True
 # https://docs.djangoproject.com/en/3.2/ref/settings/#databases
 
 DATABASES = get_database_config(env, debug=DEBUG)
+DATABASE_ROUTERS = ["apps.utils.db_routing.ReportingRouter"]
+# Reporting reads go to the primary while the replica is further behind than this
+DATABASE_REPLICA_MAX_LAG_SECONDS = env.int("DATABASE_REPLICA_MAX_LAG_SECONDS", default=60)
 
 # Auth / login stuff
 
@@ -569,7 +573,7 @@ CELERY_TASK_QUEUES = _celery_task_queues()
 SCHEDULED_TASKS = {
     "files.tasks.clean_up_expired_files": {
         "task": "apps.files.tasks.clean_up_expired_files",
-        "schedule": timedelta(days=1),
+        "schedule": timedelta(hours=1),
     },
     "events.tasks.poll_scheduled_messages": {
         "task": "apps.events.tasks.poll_scheduled_messages",
@@ -585,11 +589,11 @@ SCHEDULED_TASKS = {
     },
     "evaluations.tasks.cleanup_old_evaluation_data": {
         "task": "apps.evaluations.tasks.cleanup_old_evaluation_data",
-        "schedule": timedelta(days=1),
+        "schedule": timedelta(hours=1),
     },
     "evaluations.tasks.cleanup_old_preview_evaluation_runs": {
         "task": "apps.evaluations.tasks.cleanup_old_preview_evaluation_runs",
-        "schedule": timedelta(days=1),
+        "schedule": timedelta(hours=1),
     },
     "documents.tasks.sync_all_document_sources_task": {
         # sync doc sources once per week
@@ -608,18 +612,34 @@ SCHEDULED_TASKS = {
         "task": "apps.channels.tasks.ratchet_widget_auth_levels",
         "schedule": crontab(minute="0", hour="2"),
     },
+    "chat.tasks.delete_expired_chat_history": {
+        "task": "apps.chat.tasks.delete_expired_chat_history",
+        "schedule": timedelta(hours=1),
+    },
     "ocs_notifications.tasks.cleanup_old_notification_events": {
         "task": "apps.ocs_notifications.tasks.cleanup_old_notification_events",
-        "schedule": timedelta(days=1),
+        "schedule": timedelta(hours=1),
     },
     "evaluations.auto_population.auto_populate_eval_datasets": {
         "task": "apps.evaluations.auto_population.auto_populate_eval_datasets",
         "schedule": timedelta(minutes=5),
     },
+    "service_providers.tasks.evict_synthesized_audio_cache": {
+        "task": "apps.service_providers.tasks.evict_synthesized_audio_cache",
+        "schedule": timedelta(days=1),
+    },
+    "trace.tasks.write_buffered_traces": {
+        "task": "apps.trace.tasks.write_buffered_traces",
+        "schedule": 5,
+    },
     "evaluations.tasks.coordinate_evaluation_runs": {
         "task": "apps.evaluations.tasks.coordinate_evaluation_runs",
         "schedule": 30,
     },
+    "teams.tasks.resume_stalled_deletion_jobs": {
+        "task": "apps.teams.tasks.resume_stalled_deletion_jobs",
+        "schedule": timedelta(minutes=15),
+    },
 }
 
 CACHES = {
@@ -998,6 +1018,9 @@ EMBEDDING_VECTOR_SIZE = 1024
 # This one is read on every call, so it is a genuine runtime knob.
 # RRF smoothing constant. 60 is the value from the original RRF paper and the common default.
 DOCUMENT_SEARCH_RRF_K = 60
+# How long the chat search tools reuse the results of a search (see apps/documents/search_cache.py).
+# 0 disables the cache.
+DOCUMENT_SEARCH_CACHE_TTL = env.int("DOCUMENT_SEARCH_CACHE_TTL", default=3600)
 SUPPORTED_FILE_TYPES = {
     "file_search": (
         ".c,.cs,.cpp,.doc,.docx,.html,.java,.json,.md,.pdf,.php,.pptx,.py,.py,.rb,.tex,.txt,.css,.js,.sh,.ts"
@@ -1165,6 +1188,42 @@ RESTRICTED_HTTP_MAX_RESPONSE_BYTES = 5 * MB
 RESTRICTED_HTTP_MAX_REQUEST_BYTES = MB
 RESTRICTED_HTTP_MAX_FILE_UPLOAD_BYTES = 25 * MB
 
+# Inbound voice notes are rejected above these limits before any decoding happens (0 disables a limit).
+VOICE_NOTE_MAX_BYTES = env.int("VOICE_NOTE_MAX_BYTES", default=16 * MB)
+VOICE_NOTE_MAX_DURATION_SECONDS = env.int("VOICE_NOTE_MAX_DURATION_SECONDS", default=15 * 60)
+
+# Synthesized speech cache (see apps/service_providers/speech_cache.py)
+TTS_CACHE_ENABLED = env.bool("TTS_CACHE_ENABLED", default=True)
+# Longer replies are almost always unique LLM output and not worth storing
+TTS_CACHE_MAX_TEXT_LENGTH = env.int("TTS_CACHE_MAX_TEXT_LENGTH", default=1000)
+# Text is only stored once it has been synthesized this many times within the TTL
+TTS_CACHE_ADMIT_AFTER = env.int("TTS_CACHE_ADMIT_AFTER", default=2)
+TTS_CACHE_TTL_DAYS = env.int("TTS_CACHE_TTL_DAYS", default=30)
+TTS_CACHE_MAX_ENTRIES_PER_TEAM = env.int("TTS_CACHE_MAX_ENTRIES_PER_TEAM", default=5000)
+
+# Buffered trace persistence (see apps/trace/buffer.py). When enabled, traces are queued on a Redis stream
+# and written in batches by `apps.trace.tasks.write_buffered_traces` instead of inline in the chat turn.
+TRACE_BUFFERING_ENABLED = env.bool("TRACE_BUFFERING_ENABLED", default=False)
+# Trace IDs reserved from the database sequence per round trip
+TRACE_BUFFER_ID_BLOCK_SIZE = env.int("TRACE_BUFFER_ID_BLOCK_SIZE", default=20)
+TRACE_BUFFER_BATCH_SIZE = env.int("TRACE_BUFFER_BATCH_SIZE", default=500)
+# Upper bound on the stream length so that a stalled writer can't exhaust Redis memory
+TRACE_BUFFER_MAX_LENGTH = env.int("TRACE_BUFFER_MAX_LENGTH", default=200_000)
+
+# How long a run of a retention policy (e.g. expired files) may spend deleting rows. What's left is
+# deleted on the next run.
+RETENTION_TIME_BUDGET_SECONDS = env.int("RETENTION_TIME_BUDGET_SECONDS", default=120)
+
+# Human annotations settings
+# How long a queue must go without aggregate updates before its aggregates are fully recomputed in the
+# background, as a backstop to the incremental updates made on each submission.
+ANNOTATION_AGGREGATE_RECONCILE_DELAY = env.int("ANNOTATION_AGGREGATE_RECONCILE_DELAY", default=600)
+
 # Evaluations settings
 # How far back the auto-populate-eval-datasets task scans for new sessions per rule.
 EVALUATIONS_AUTO_POPULATION_LOOKBACK_DAYS = env.int("EVALUATIONS_AUTO_POPULATION_LOOKBACK_DAYS", default=30)
+# Sessions this far behind a rule's watermark are re-checked each tick, to catch sessions that only
+# match the rule's filter once they have more messages, tags, etc.
+EVALUATIONS_AUTO_POPULATION_OVERLAP_HOURS = env.int("EVALUATIONS_AUTO_POPULATION_OVERLAP_HOURS", default=24)
+# Maximum number of sessions past a rule's watermark that a single tick considers.
+EVALUATIONS_AUTO_POPULATION_BATCH_SIZE = env.int("EVALUATIONS_AUTO_POPULATION_BATCH_SIZE", default=1000)
@@ -88,3 +88,22 @@ def test_sslmode_can_be_overridden(env):
     env.ENVIRON["DJANGO_DATABASE_SSLMODE"] = "disable"
 
     assert get_database_config(env, debug=False)["default"]["OPTIONS"]["sslmode"] == "disable"
+
+
+def test_replica_is_not_configured_by_default(env):
+    assert list(get_database_config(env, debug=False)) == ["default"]
+
+
+def test_replica_is_configured_like_the_primary(env):
+    env.ENVIRON["DATABASE_REPLICA_URL"] = "postgres://user:pw@replicahost:5432/ocs"
+    env.ENVIRON["DJANGO_DISABLE_SERVER_SIDE_CURSORS"] = "True"
+
+    databases = get_database_config(env, debug=False)
+
+    replica = databases["replica"]
+    assert replica["HOST"] == "replicahost"
+    assert replica["CONN_HEALTH_CHECKS"] is True
+    assert replica["DISABLE_SERVER_SIDE_CURSORS"] is True
+    assert replica["OPTIONS"] == databases["default"]["OPTIONS"]
+    # Tests have no replication, so reads from the replica must see the test database
+    assert replica["TEST"] == {"MIRROR": "default"}
@@ -0,0 +1,91 @@
+import logging
+import os
+import resource
+from contextlib import ExitStack
+
+from django.apps import AppConfig
+
+from webhook_harness import constants
+
+logger = logging.getLogger("ocs.load_test")
+
+# The Celery tasks that handle one inbound message each
+MESSAGE_TASKS = {
+    "apps.channels.tasks.handle_telegram_message",
+    "apps.channels.tasks.handle_twilio_message",
+    "apps.channels.tasks.handle_turn_message",
+    "apps.channels.tasks.handle_meta_cloud_api_message",
+}
+
+
+class WebhookHarnessConfig(AppConfig):
+    name = "webhook_harness"
+    label = "webhook_harness"
+
+    def ready(self):
+        point_messaging_clients_at_stub()
+
+        from celery.signals import task_postrun, task_prerun  # noqa: PLC0415 - only needed once apps are ready
+
+        task_prerun.connect(_start_counting_queries, weak=False)
+        task_postrun.connect(_record_task_stats, weak=False)
+
+
+def point_messaging_clients_at_stub():
+    """Send every outbound platform API call to the local messaging stub instead of the real service."""
+    from telebot import apihelper  # noqa: PLC0415
+    from turn.request_types import TurnRequest  # noqa: PLC0415
+    from twilio.base.domain import Domain  # noqa: PLC0415
+
+    from apps.service_providers.messaging_service import MetaCloudAPIService  # noqa: PLC0415
+
+    apihelper.API_URL = f"{constants.STUB_URL}/telegram/bot{{0}}/{{1}}"
+    TurnRequest.base_url = f"{constants.STUB_URL}/turn/v1/"
+    MetaCloudAPIService.META_API_BASE_URL = f"{constants.STUB_URL}/meta"
+
+    original_init = Domain.__init__
+
+    def _stubbed_domain_init(self, twilio, base_url):
+        original_init(self, twilio, base_url.replace("https://api.twilio.com", f"{constants.STUB_URL}/twilio"))
+
+    Domain.__init__ = _stubbed_domain_init
+
+
+_query_counters: dict[str, tuple[ExitStack, list[int]]] = {}
+
+
+def _start_counting_queries(sender=None, task_id=None, **kwargs):
+    if sender is None or sender.name not in MESSAGE_TASKS:
+        return
+
+    from django.db import connection  # noqa: PLC0415
+
+    count = [0]
+
+    def _count(execute, sql, params, many, context):
+        count[0] += 1
+        return execute(sql, params, many, context)
+
+    stack = ExitStack()
+    stack.enter_context(connection.execute_wrapper(_count))
+    _query_counters[task_id] = (stack, count)
+
+
+def _record_task_stats(sender=None, task_id=None, **kwargs):
+    counter = _query_counters.pop(task_id, None)
+    if counter is None:
+        return
+
+    stack, count = counter
+    stack.close()
+    try:
+        from django_redis import get_redis_connection  # noqa: PLC0415
+
+        redis = get_redis_connection("default")
+        pipe = redis.pipeline(transaction=False)
+        pipe.rpush(constants.QUERIES_KEY, count[0])
+        # ru_maxrss is the peak resident set size of this worker process, in KB on Linux
+        pipe.hset(constants.WORKER_MEMORY_KEY, str(os.getpid()), resource.getrusage(resource.RUSAGE_SELF).ru_maxrss)
+        pipe.execute()
+    except Exception:
+        logger.exception("Unable to record load test stats")
@@ -0,0 +1,35 @@
+"""
+Fixed identifiers shared by the seed command (Django side) and the locust file (load generator side).
+
+Both sides import this module, so the seeded channels and the webhook payloads always agree without
+passing IDs around through environment variables. Nothing here is a real credential.
+"""
+
+import os
+
+STUB_URL = os.getenv("LOAD_TEST_STUB_URL", "http://127.0.0.1:8765")
+
+TEAM_SLUG = "webhook-load-test"
+CHATBOT_PUBLIC_ID = "6b7a3c0e-2f4d-4b8e-9a51-0c3d2e1f4a00"
+# A real model name so that token counting and cost tracking behave as they do in production
+STUB_MODEL = "gpt-4o-mini"
+
+TELEGRAM_CHANNEL_EXTERNAL_ID = "6b7a3c0e-2f4d-4b8e-9a51-0c3d2e1f4a01"
+TELEGRAM_BOT_TOKEN = "123456:load-test"
+
+TWILIO_ACCOUNT_SID = "ACloadtest00000000000000000000000"
+TWILIO_AUTH_TOKEN = "load-test-twilio-token"
+TWILIO_NUMBER = "+15550000001"
+
+TURN_NUMBER = "+15550000002"
+TURN_AUTH_TOKEN = "load-test-turn-token"
+TURN_HMAC_SECRET = "load-test-turn-secret"
+
+META_BUSINESS_ID = "100000000000001"
+META_PHONE_NUMBER_ID = "200000000000001"
+META_NUMBER = "+15550000003"
+META_APP_SECRET = "load-test-meta-secret"
+
+# Redis keys the worker hooks write to and the locust file reads from
+QUERIES_KEY = "load-test:queries-per-message"
+WORKER_MEMORY_KEY = "load-test:worker-max-rss-kb"
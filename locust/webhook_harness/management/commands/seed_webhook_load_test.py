@@ -0,0 +1,122 @@
+"""
+Seed the team, chatbot and channels that the webhook load test posts to.
+
+The chatbot is a single LLM pipeline backed by an OpenAI provider whose base URL is the local LLM stub,
+and there is one channel per platform, using the fixed identifiers in `webhook_harness.constants`.
+Running the command again is safe: existing objects are reused.
+
+Usage:
+    PYTHONPATH=locust DJANGO_SETTINGS_MODULE=webhook_harness.settings python manage.py seed_webhook_load_test
+"""
+
+from uuid import UUID
+
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand
+
+from apps.channels.models import ChannelPlatform, ExperimentChannel
+from apps.experiments.models import Experiment
+from apps.pipelines.models import Pipeline
+from apps.service_providers.models import (
+    LlmProvider,
+    LlmProviderModel,
+    LlmProviderTypes,
+    MessagingProvider,
+    MessagingProviderType,
+)
+from apps.teams import backends
+from apps.teams.models import Team
+from webhook_harness import constants
+
+
+class Command(BaseCommand):
+    help = "Seed the chatbot and channels used by the webhook load test"
+
+    def handle(self, *args, **options):
+        backends.create_default_groups()
+        user, _ = get_user_model().objects.get_or_create(
+            username="webhook-load-test@example.com", defaults={"email": "webhook-load-test@example.com"}
+        )
+        team, created = Team.objects.get_or_create(slug=constants.TEAM_SLUG, defaults={"name": "Webhook Load Test"})
+        if created:
+            backends.make_user_team_owner(team, user)
+
+        chatbot = self._get_or_create_chatbot(team, user)
+        self._get_or_create_channels(team, chatbot)
+        self.stdout.write(self.style.SUCCESS(f"Seeded chatbot {chatbot.public_id} in team '{team.slug}'"))
+
+    def _get_or_create_chatbot(self, team, user) -> Experiment:
+        chatbot = Experiment.objects.filter(public_id=UUID(constants.CHATBOT_PUBLIC_ID)).first()
+        if chatbot:
+            return chatbot
+
+        llm_provider, _ = LlmProvider.objects.get_or_create(
+            team=team,
+            name="LLM stub",
+            defaults={
+                "type": str(LlmProviderTypes.openai),
+                "config": {"openai_api_key": "load-test", "openai_api_base": f"{constants.STUB_URL}/v1"},
+            },
+        )
+        llm_model, _ = LlmProviderModel.objects.get_or_create(
+            team=team, type=str(LlmProviderTypes.openai), name=constants.STUB_MODEL
+        )
+        pipeline = Pipeline.create_default(
+            team=team, name="Webhook load test", llm_provider_id=llm_provider.id, llm_provider_model=llm_model
+        )
+        return Experiment.objects.create(
+            team=team,
+            owner=user,
+            name="Webhook load test",
+            pipeline=pipeline,
+            public_id=UUID(constants.CHATBOT_PUBLIC_ID),
+        )
+
+    def _get_or_create_channels(self, team, chatbot):
+        ExperimentChannel.objects.get_or_create(
+            external_id=UUID(constants.TELEGRAM_CHANNEL_EXTERNAL_ID),
+            defaults={
+                "team": team,
+                "experiment": chatbot,
+                "name": "Telegram",
+                "platform": ChannelPlatform.TELEGRAM,
+                "extra_data": {"bot_token": constants.TELEGRAM_BOT_TOKEN},
+            },
+        )
+
+        whatsapp_channels = [
+            (
+                MessagingProviderType.twilio,
+                {"account_sid": constants.TWILIO_ACCOUNT_SID, "auth_token": constants.TWILIO_AUTH_TOKEN},
+                {"number": constants.TWILIO_NUMBER},
+            ),
+            (
+                MessagingProviderType.turnio,
+                {"auth_token": constants.TURN_AUTH_TOKEN, "hmac_secret": constants.TURN_HMAC_SECRET},
+                {"number": constants.TURN_NUMBER},
+            ),
+            (
+                MessagingProviderType.meta_cloud_api,
+                {
+                    "business_id": constants.META_BUSINESS_ID,
+                    "access_token": "load-test",
+                    "app_secret": constants.META_APP_SECRET,
+                    "verify_token": "load-test",
+                },
+                {"number": constants.META_NUMBER, "phone_number_id": constants.META_PHONE_NUMBER_ID},
+            ),
+        ]
+        for provider_type, provider_config, extra_data in whatsapp_channels:
+            provider, _ = MessagingProvider.objects.get_or_create(
+                team=team, type=provider_type, defaults={"name": provider_type.label, "config": provider_config}
+            )
+            ExperimentChannel.objects.get_or_create(
+                team=team,
+                messaging_provider=provider,
+                defaults={
+                    "experiment": chatbot,
+                    "name": provider_type.label,
+                    "platform": ChannelPlatform.WHATSAPP,
+                    "extra_data": extra_data,
+                },
+            )
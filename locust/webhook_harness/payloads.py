@@ -0,0 +1,111 @@
+"""
+Builders for realistic, correctly signed webhook deliveries from each messaging platform.
+
+Each builder returns ``(path, kwargs)`` where ``kwargs`` are passed straight to the HTTP client's ``post``.
+"""
+
+import base64
+import hashlib
+import hmac
+import json
+import random
+import time
+import uuid
+
+from webhook_harness import constants
+
+
+def telegram_message(chat_id: int, text: str) -> tuple[str, dict]:
+    update = {
+        "update_id": random.randint(1, 2**31),
+        "message": {
+            "message_id": random.randint(1, 2**31),
+            "date": int(time.time()),
+            "chat": {"id": chat_id, "type": "private", "first_name": "Load"},
+            "from": {"id": chat_id, "is_bot": False, "first_name": "Load", "language_code": "en"},
+            "text": text,
+        },
+    }
+    return f"/channels/telegram/{constants.TELEGRAM_CHANNEL_EXTERNAL_ID}", {"json": update}
+
+
+def twilio_message(host: str, from_number: str, text: str) -> tuple[str, dict]:
+    path = "/channels/whatsapp/incoming_message"
+    data = {
+        "SmsMessageSid": f"SM{uuid.uuid4().hex}",
+        "MessageSid": f"SM{uuid.uuid4().hex}",
+        "AccountSid": constants.TWILIO_ACCOUNT_SID,
+        "From": f"whatsapp:{from_number}",
+        "To": f"whatsapp:{constants.TWILIO_NUMBER}",
+        "Body": text,
+        "NumMedia": "0",
+        "MessageType": "text",
+        "ProfileName": "Load",
+        "WaId": from_number.lstrip("+"),
+    }
+    signature = twilio_signature(f"{host.rstrip('/')}{path}", data, constants.TWILIO_AUTH_TOKEN)
+    return path, {"data": data, "headers": {"X-Twilio-Signature": signature}}
+
+
+def turn_message(from_number: str, text: str) -> tuple[str, dict]:
+    wa_id = from_number.lstrip("+")
+    body = _dumps(
+        {
+            "contacts": [{"profile": {"name": "Load"}, "wa_id": wa_id}],
+            "messages": [_whatsapp_text_message(wa_id, text)],
+        }
+    )
+    signature = base64.b64encode(hmac.new(constants.TURN_HMAC_SECRET.encode(), body, hashlib.sha256).digest())
+    headers = {"Content-Type": "application/json", "X-Turn-Hook-Signature": signature.decode()}
+    return f"/channels/whatsapp/turn/{constants.CHATBOT_PUBLIC_ID}/incoming_message", {"data": body, "headers": headers}
+
+
+def meta_message(from_number: str, text: str) -> tuple[str, dict]:
+    wa_id = from_number.lstrip("+")
+    body = _dumps(
+        {
+            "object": "whatsapp_business_account",
+            "entry": [
+                {
+                    "id": constants.META_BUSINESS_ID,
+                    "changes": [
+                        {
+                            "field": "messages",
+                            "value": {
+                                "messaging_product": "whatsapp",
+                                "metadata": {
+                                    "display_phone_number": constants.META_NUMBER.lstrip("+"),
+                                    "phone_number_id": constants.META_PHONE_NUMBER_ID,
+                                },
+                                "contacts": [{"profile": {"name": "Load"}, "wa_id": wa_id}],
+                                "messages": [_whatsapp_text_message(wa_id, text)],
+                            },
+                        }
+                    ],
+                }
+            ],
+        }
+    )
+    signature = hmac.new(constants.META_APP_SECRET.encode(), body, hashlib.sha256).hexdigest()
+    headers = {"Content-Type": "application/json", "X-Hub-Signature-256": f"sha256={signature}"}
+    return "/channels/whatsapp/meta/incoming_message", {"data": body, "headers": headers}
+
+
+def twilio_signature(url: str, params: dict, auth_token: str) -> str:
+    """The X-Twilio-Signature Twilio would send for a form POST of `params` to `url`."""
+    payload = url + "".join(f"{key}{params[key]}" for key in sorted(params))
+    return base64.b64encode(hmac.new(auth_token.encode(), payload.encode(), hashlib.sha1).digest()).decode()
+
+
+def _whatsapp_text_message(wa_id: str, text: str) -> dict:
+    return {
+        "from": wa_id,
+        "id": f"wamid.{uuid.uuid4().hex}",
+        "timestamp": str(int(time.time())),
+        "type": "text",
+        "text": {"body": text},
+    }
+
+
+def _dumps(data: dict) -> bytes:
+    return json.dumps(data).encode()
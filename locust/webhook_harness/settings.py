@@ -0,0 +1,16 @@
+"""
+Settings for running the web server and Celery workers under the webhook load test.
+
+Usage (with ``locust`` on the python path):
+    PYTHONPATH=locust DJANGO_SETTINGS_MODULE=webhook_harness.settings python manage.py runserver
+"""
+
+from config.settings import *  # noqa: F403
+
+# DEBUG keeps a copy of every query in memory, which would skew the worker memory figures
+DEBUG = False
+
+INSTALLED_APPS = [*INSTALLED_APPS, "webhook_harness"]  # noqa: F405
+
+# Webhook deliveries are signed with the secrets in `webhook_harness.constants`; Telegram's is optional
+TELEGRAM_SECRET_TOKEN = ""
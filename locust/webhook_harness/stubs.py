@@ -0,0 +1,263 @@
+"""
+Local stand-ins for the LLM provider and the messaging platform APIs used by the webhook load test.
+
+One threaded HTTP server handles:
+    POST /v1/responses, /v1/chat/completions   OpenAI-compatible LLM with configurable latency and token counts
+    GET|POST /telegram/bot<token>/<method>     Telegram Bot API
+    POST /twilio/2010-04-01/Accounts/<sid>/Messages.json
+    POST /turn/v1/messages                     Turn.io
+    POST /meta/<phone_number_id>/messages      Meta Cloud API
+    GET  /replies/<recipient>?timeout=<s>      Long-polls for the next reply sent to <recipient>
+    GET  /stats                                Request counts per route
+
+Every outbound message is recorded against its recipient so that the load generator can measure the time
+from posting a webhook to the reply reaching the "platform".
+
+Configuration via environment variables (or the equivalent command line flags):
+    STUB_PORT: Port to listen on (default: 8765)
+    LLM_LATENCY_MS: Time the LLM takes to respond, in milliseconds (default: 500)
+    LLM_JITTER_MS: Random extra latency of up to this many milliseconds (default: 250)
+    LLM_OUTPUT_TOKENS: Number of tokens (words) in each LLM response (default: 50)
+    MESSAGING_LATENCY_MS: Time each messaging API call takes, in milliseconds (default: 50)
+
+Example usage:
+    python locust/webhook_harness/stubs.py --llm-latency-ms 1500 --llm-output-tokens 200
+"""
+
+import argparse
+import contextlib
+import json
+import logging
+import os
+import random
+import re
+import threading
+import time
+import uuid
+from collections import Counter, defaultdict, deque
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+logger = logging.getLogger(__name__)
+
+TELEGRAM_ROUTE = re.compile(r"^/telegram/bot(?P<token>[^/]+)/(?P<method>\w+)$")
+TWILIO_ROUTE = re.compile(r"^/twilio/2010-04-01/Accounts/(?P<sid>\w+)/Messages\.json$")
+META_ROUTE = re.compile(r"^/meta/(?P<phone_number_id>\w+)/messages$")
+REPLIES_ROUTE = re.compile(r"^/replies/(?P<recipient>[^/]+)$")
+
+
+class ReplyLog:
+    """Replies sent to each recipient, waiting to be collected by the load generator."""
+
+    def __init__(self):
+        self._replies = defaultdict(deque)
+        self._condition = threading.Condition()
+
+    def add(self, recipient: str, text: str):
+        with self._condition:
+            self._replies[recipient.lstrip("+")].append({"text": text, "sent_at": time.time()})
+            self._condition.notify_all()
+
+    def wait_for_reply(self, recipient: str, timeout: float) -> dict | None:
+        recipient = recipient.lstrip("+")
+        with self._condition:
+            if not self._condition.wait_for(lambda: self._replies[recipient], timeout=timeout):
+                return None
+            reply = self._replies[recipient].popleft()
+            if not self._replies[recipient]:
+                del self._replies[recipient]
+            return reply
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    server: "StubServer"
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        url = urlparse(self.path)
+        if match := REPLIES_ROUTE.match(url.path):
+            timeout = float(parse_qs(url.query).get("timeout", ["60"])[0])
+            reply = self.server.replies.wait_for_reply(match["recipient"], timeout)
+            if reply is None:
+                return self._send_json({"error": "no reply"}, status=404)
+            return self._send_json(reply)
+        if url.path == "/stats":
+            return self._send_json(dict(self.server.request_counts))
+        if TELEGRAM_ROUTE.match(url.path):
+            # The Telegram client sends some methods as GET requests
+            return self.do_POST()
+        self._send_json({"error": "not found"}, status=404)
+
+    def do_POST(self):
+        url = urlparse(self.path)
+        body = self._read_body(url)
+        path = url.path
+
+        if path.endswith(("/v1/responses", "/v1/chat/completions")):
+            self._count("llm")
+            return self._handle_llm(path, body)
+
+        time.sleep(self.server.messaging_latency)
+        if match := TELEGRAM_ROUTE.match(path):
+            self._count(f"telegram.{match['method']}")
+            return self._handle_telegram(match["method"], body)
+        if TWILIO_ROUTE.match(path):
+            self._count("twilio.messages")
+            self.server.replies.add(body["To"].removeprefix("whatsapp:"), body.get("Body", ""))
+            return self._send_json({"sid": f"SM{uuid.uuid4().hex}", "status": "queued", "to": body["To"]}, status=201)
+        if path == "/turn/v1/messages" or META_ROUTE.match(path):
+            self._count("turn.messages" if path.startswith("/turn") else "meta.messages")
+            recipient = body.get("to") or body.get("recipient")
+            self.server.replies.add(recipient, body.get("text", {}).get("body", ""))
+            return self._send_json({"messages": [{"id": f"wamid.{uuid.uuid4().hex}"}]})
+
+        logger.warning("Unhandled stub request: %s %s", self.command, self.path)
+        self._send_json({"error": "not found"}, status=404)
+
+    def _handle_llm(self, path: str, body: dict):
+        latency = self.server.llm_latency + random.uniform(0, self.server.llm_jitter)
+        time.sleep(latency)
+
+        output_tokens = self.server.llm_output_tokens
+        text = " ".join(random.choice(WORDS) for _ in range(output_tokens))
+        # A rough but stable estimate; real tokenisation is not the point of the stub
+        input_tokens = len(json.dumps(body)) // 4
+        model = body.get("model", "stub")
+        created = int(time.time())
+
+        if path.endswith("/responses"):
+            return self._send_json(
+                {
+                    "id": f"resp_{uuid.uuid4().hex}",
+                    "object": "response",
+                    "created_at": created,
+                    "status": "completed",
+                    "model": model,
+                    "error": None,
+                    "incomplete_details": None,
+                    "instructions": None,
+                    "metadata": {},
+                    "parallel_tool_calls": True,
+                    "tool_choice": "auto",
+                    "tools": [],
+                    "output": [
+                        {
+                            "type": "message",
+                            "id": f"msg_{uuid.uuid4().hex}",
+                            "status": "completed",
+                            "role": "assistant",
+                            "content": [{"type": "output_text", "text": text, "annotations": []}],
+                        }
+                    ],
+                    "usage": {
+                        "input_tokens": input_tokens,
+                        "input_tokens_details": {"cached_tokens": 0},
+                        "output_tokens": output_tokens,
+                        "output_tokens_details": {"reasoning_tokens": 0},
+                        "total_tokens": input_tokens + output_tokens,
+                    },
+                }
+            )
+
+        return self._send_json(
+            {
+                "id": f"chatcmpl-{uuid.uuid4().hex}",
+                "object": "chat.completion",
+                "created": created,
+                "model": model,
+                "choices": [{"index": 0, "message": {"role": "assistant", "content": text}, "finish_reason": "stop"}],
+                "usage": {
+                    "prompt_tokens": input_tokens,
+                    "completion_tokens": output_tokens,
+                    "total_tokens": input_tokens + output_tokens,
+                },
+            }
+        )
+
+    def _handle_telegram(self, method: str, params: dict):
+        if method != "sendMessage":
+            return self._send_json({"ok": True, "result": True})
+
+        chat_id = int(params["chat_id"])
+        self.server.replies.add(str(chat_id), params.get("text", ""))
+        message = {
+            "message_id": random.randint(1, 2**31),
+            "date": int(time.time()),
+            "chat": {"id": chat_id, "type": "private"},
+            "from": {"id": 1, "is_bot": True, "first_name": "Load test bot"},
+            "text": params.get("text", ""),
+        }
+        return self._send_json({"ok": True, "result": message})
+
+    def _read_body(self, url) -> dict:
+        """The request's parameters, whether they were sent as JSON, a form or in the query string."""
+        params = {key: values[0] for key, values in parse_qs(url.query).items()}
+        length = int(self.headers.get("Content-Length") or 0)
+        if not length:
+            return params
+
+        raw = self.rfile.read(length)
+        if "json" in self.headers.get("Content-Type", ""):
+            return {**params, **json.loads(raw)}
+        return {**params, **{key: values[0] for key, values in parse_qs(raw.decode()).items()}}
+
+    def _count(self, route: str):
+        with self.server.lock:
+            self.server.request_counts[route] += 1
+
+    def _send_json(self, data, status=200):
+        body = json.dumps(data).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        logger.debug(format, *args)
+
+
+class StubServer(ThreadingHTTPServer):
+    daemon_threads = True
+    # Many webhook replies are long-polled at once
+    request_queue_size = 1024
+
+    def __init__(self, address, llm_latency_ms, llm_jitter_ms, llm_output_tokens, messaging_latency_ms):
+        super().__init__(address, StubHandler)
+        self.llm_latency = llm_latency_ms / 1000
+        self.llm_jitter = llm_jitter_ms / 1000
+        self.llm_output_tokens = llm_output_tokens
+        self.messaging_latency = messaging_latency_ms / 1000
+        self.replies = ReplyLog()
+        self.request_counts = Counter()
+        self.lock = threading.Lock()
+
+
+WORDS = ["the", "quick", "brown", "fox", "jumps", "over", "a", "lazy", "dog", "while", "some", "patient"]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=int(os.getenv("STUB_PORT", "8765")))
+    parser.add_argument("--llm-latency-ms", type=int, default=int(os.getenv("LLM_LATENCY_MS", "500")))
+    parser.add_argument("--llm-jitter-ms", type=int, default=int(os.getenv("LLM_JITTER_MS", "250")))
+    parser.add_argument("--llm-output-tokens", type=int, default=int(os.getenv("LLM_OUTPUT_TOKENS", "50")))
+    parser.add_argument("--messaging-latency-ms", type=int, default=int(os.getenv("MESSAGING_LATENCY_MS", "50")))
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    server = StubServer(
+        (args.host, args.port),
+        llm_latency_ms=args.llm_latency_ms,
+        llm_jitter_ms=args.llm_jitter_ms,
+        llm_output_tokens=args.llm_output_tokens,
+        messaging_latency_ms=args.messaging_latency_ms,
+    )
+    logger.info("Stub server listening on http://%s:%s", args.host, args.port)
+    with contextlib.suppress(KeyboardInterrupt):
+        server.serve_forever()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,185 @@
+"""
+Locust load test for the messaging channel webhooks.
+
+Each simulated participant posts signed Telegram, Twilio, Turn.io or Meta Cloud API webhooks to a chatbot
+and waits for its reply to reach the local messaging stub (see `webhook_harness.stubs`). The LLM provider is
+a stub too, so the test runs on one machine without any outside services and measures Open Chat Studio
+itself: web workers, Celery chat workers, the database and Redis.
+
+Reported, besides the usual locust statistics:
+    * "<platform> reply": time from posting the webhook to the reply being sent (its percentiles are in the
+      locust report alongside the webhook requests)
+    * Celery queue depth, sampled every second
+    * DB queries per handled message and peak worker memory, recorded by the `webhook_harness` app
+      in the Celery workers
+
+Configuration via environment variables:
+    REDIS_URL: Redis used by Celery and the Django cache (default: redis://localhost:6379/0)
+    CELERY_QUEUES: Comma-separated queues to sample (default: celery)
+    REPLY_TIMEOUT: Seconds to wait for a reply before counting it as failed (default: 120)
+    MIN_WAIT / MAX_WAIT: Wait time between messages in seconds (default: 1-3)
+    LOAD_TEST_STUB_URL: Base URL of the stub server (default: http://127.0.0.1:8765)
+
+Example usage (see the README for starting the server, workers and stubs):
+    locust -f locust/webhook_load_test.py --host http://localhost:8000 --users 50 --spawn-rate 5 \
+        --run-time 5m --headless
+    locust -f locust/webhook_load_test.py --host http://localhost:8000 TelegramUser
+"""
+
+import logging
+import os
+import random
+import statistics
+import time
+
+import gevent
+import redis
+import requests
+from webhook_harness import constants, payloads
+
+from locust import HttpUser, between, events, task
+
+logger = logging.getLogger(__name__)
+
+REDIS_URL = os.getenv("REDIS_URL", "redis://localhost:6379/0")
+CELERY_QUEUES = os.getenv("CELERY_QUEUES", "celery").split(",")
+REPLY_TIMEOUT = int(os.getenv("REPLY_TIMEOUT", "120"))
+
+MESSAGES = [
+    "Hello, can you help me?",
+    "What services do you offer?",
+    "Tell me more about that.",
+    "How much does it cost?",
+    "What are the next steps?",
+    "Can you explain in more detail?",
+    "Thanks, that's helpful.",
+]
+
+_queue_depths: list[int] = []
+_sampler: gevent.Greenlet | None = None
+
+
+class WebhookUser(HttpUser):
+    """A participant chatting to the chatbot through one messaging platform."""
+
+    abstract = True
+    platform = ""
+    wait_time = between(int(os.getenv("MIN_WAIT", "1")), int(os.getenv("MAX_WAIT", "3")))
+
+    def on_start(self):
+        self.stub = requests.Session()
+        self.recipient = self.new_recipient()
+
+    def new_recipient(self) -> str:
+        return f"+1555{random.randint(0, 9_999_999):07d}"
+
+    def build_webhook(self, text: str) -> tuple[str, dict]:
+        raise NotImplementedError
+
+    @task
+    def send_message(self):
+        path, kwargs = self.build_webhook(random.choice(MESSAGES))
+        start = time.perf_counter()
+        with self.client.post(path, name=f"{self.platform} webhook", catch_response=True, **kwargs) as response:
+            if response.status_code != 200:
+                response.failure(f"Webhook rejected: {response.status_code} {response.text[:200]}")
+                return
+
+        reply = self.stub.get(
+            f"{constants.STUB_URL}/replies/{self.recipient}",
+            params={"timeout": REPLY_TIMEOUT},
+            timeout=REPLY_TIMEOUT + 10,
+        )
+        exception = None if reply.status_code == 200 else Exception(f"No reply within {REPLY_TIMEOUT}s")
+        self.environment.events.request.fire(
+            request_type="REPLY",
+            name=f"{self.platform} reply",
+            response_time=(time.perf_counter() - start) * 1000,
+            response_length=len(reply.content),
+            exception=exception,
+            context={},
+        )
+
+
+class TelegramUser(WebhookUser):
+    platform = "telegram"
+
+    def new_recipient(self) -> str:
+        return str(random.randint(10**8, 10**10))
+
+    def build_webhook(self, text):
+        return payloads.telegram_message(int(self.recipient), text)
+
+
+class TwilioUser(WebhookUser):
+    platform = "twilio"
+
+    def build_webhook(self, text):
+        return payloads.twilio_message(self.host, self.recipient, text)
+
+
+class TurnUser(WebhookUser):
+    platform = "turn"
+
+    def build_webhook(self, text):
+        return payloads.turn_message(self.recipient, text)
+
+
+class MetaUser(WebhookUser):
+    platform = "meta"
+
+    def build_webhook(self, text):
+        return payloads.meta_message(self.recipient, text)
+
+
+@events.test_start.add_listener
+def on_test_start(environment, **kwargs):
+    client = redis.Redis.from_url(REDIS_URL)
+    client.delete(constants.QUERIES_KEY, constants.WORKER_MEMORY_KEY)
+    _queue_depths.clear()
+    global _sampler
+    _sampler = gevent.spawn(_sample_queue_depth, client)
+
+
+@events.test_stop.add_listener
+def on_test_stop(environment, **kwargs):
+    if _sampler:
+        _sampler.kill()
+    client = redis.Redis.from_url(REDIS_URL)
+    queries = [int(count) for count in client.lrange(constants.QUERIES_KEY, 0, -1)]
+    worker_memory = {pid.decode(): int(kb) for pid, kb in client.hgetall(constants.WORKER_MEMORY_KEY).items()}
+
+    lines = ["", "Webhook load test summary", "-" * 40]
+    if _queue_depths:
+        lines.append(
+            f"Celery queue depth: max {max(_queue_depths)}, mean {statistics.mean(_queue_depths):.1f}, "
+            f"final {_queue_depths[-1]}"
+        )
+    if queries:
+        lines.append(
+            f"DB queries per message ({len(queries)} messages): median {statistics.median(queries)}, "
+            f"p95 {_percentile(queries, 95)}, max {max(queries)}"
+        )
+    else:
+        lines.append("DB queries per message: no data (are the workers using webhook_harness.settings?)")
+    for pid, kb in sorted(worker_memory.items()):
+        lines.append(f"Worker {pid} peak memory: {kb / 1024:.0f} MB")
+    try:
+        lines.append(f"Stub requests: {requests.get(f'{constants.STUB_URL}/stats', timeout=5).json()}")
+    except requests.RequestException:
+        lines.append("Stub requests: stub server unreachable")
+    logger.info("\n".join(lines))
+
+
+def _sample_queue_depth(client):
+    while True:
+        try:
+            _queue_depths.append(sum(client.llen(queue) for queue in CELERY_QUEUES))
+        except redis.RedisError:
+            logger.warning("Unable to sample the Celery queue depth", exc_info=True)
+        gevent.sleep(1)
+
+
+def _percentile(values: list[int], percent: int) -> int:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * percent / 100))]
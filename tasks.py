@@ -270,6 +270,25 @@ def ruff(c: Context, no_fix=False, unsafe_fixes=False, paths=""):
     c.run(f"ruff format {target_paths}", echo=True, pty=True)
 
 
+@task(
+    help={
+        "scale": "Multiplier for the size of the synthetic data sets",
+        "save": "Store the results as the new baselines",
+        "compare_timings": "Also fail benchmarks more than this many times slower than their baseline",
+        "paths": "Specific benchmark files to run (space-separated)",
+    }
+)
+def benchmark(c: Context, scale=1, save=False, compare_timings="", paths=""):
+    """Run the offline benchmark suite in benchmarks/."""
+    args = [f"--benchmark-scale={scale}"]
+    if save:
+        args.append("--benchmark-save")
+    if compare_timings:
+        args.append(f"--benchmark-compare-timings={compare_timings}")
+    target_paths = paths if paths else "benchmarks"
+    c.run(f"pytest {target_paths} -m benchmark {' '.join(args)}", echo=True, pty=True)
+
+
 def _ensure_pnpm(c: Context):
     """Ensure pnpm is available via Corepack (pinned in package.json), failing clearly if it cannot be."""
     if shutil.which("pnpm"):